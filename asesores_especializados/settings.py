@@ -7,11 +7,16 @@ import os
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+
+def _env_bool(nombre: str, defecto: bool) -> bool:
+    return os.environ.get(nombre, str(defecto)).lower() in {"1", "true", "yes"}
+
+
 # Seguridad
 SECRET_KEY = os.environ.get(
     "DJANGO_SECRET_KEY", "django-insecure-sec-licencias-demo"
 )
-DEBUG = os.environ.get("DJANGO_DEBUG", "true").lower() in {"1", "true", "yes"}
+DEBUG = _env_bool("DJANGO_DEBUG", True)
 # Dominios permitidos
 ALLOWED_HOSTS = [
     '.ngrok-free.app',  # Cubre cualquier subdominio generado por ngrok
@@ -53,6 +58,10 @@ INSTALLED_APPS = [
 
 # Middleware
 MIDDLEWARE = [
+    "tramites.metricas.MetricasMiddleware",
+    "tramites.consultas.DetectorConsultasMiddleware",
+    "tramites.replicas.ReplicaMiddleware",
+    "tramites.cache.MemoPeticionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -65,7 +74,22 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "asesores_especializados.urls"
 
+# Métricas por petición (tramites.metricas): encabezado Server-Timing y /metrics en
+# formato Prometheus, accesible para personal o con `Authorization: Bearer METRICAS_TOKEN`.
+METRICAS_ACTIVAS = _env_bool("DJANGO_METRICAS", True)
+METRICAS_SERVER_TIMING = _env_bool("DJANGO_SERVER_TIMING", True)
+METRICAS_TOKEN = os.environ.get("DJANGO_METRICAS_TOKEN", "")
+
+# Detector de N+1 y consultas lentas (tramites.consultas), pensado para desarrollo y
+# staging: registra en el logger `tramites.consultas` la línea y la plantilla de origen.
+DETECTOR_CONSULTAS = _env_bool("DJANGO_DETECTOR_CONSULTAS", DEBUG)
+DETECTOR_REPETICIONES = int(os.environ.get("DJANGO_DETECTOR_REPETICIONES", "5"))
+DETECTOR_CONSULTA_LENTA_MS = int(os.environ.get("DJANGO_DETECTOR_LENTA_MS", "100"))
+DETECTOR_ESTRICTO = _env_bool("DJANGO_DETECTOR_ESTRICTO", False)
+
 # Templates con soporte básico para HTMX
+# Sin OPTIONS["loaders"], Django usa el cargador en caché (cached.Loader): cada
+# plantilla se compila una vez por proceso, y en DEBUG se recarga al editarla.
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -82,10 +106,24 @@ TEMPLATES = [
     },
 ]
 
+# Inputs, textareas y selects se arman en Python con el mismo HTML (tramites.renderizador).
+FORM_RENDERER = "tramites.renderizador.RenderizadorFormularios"
+
 WSGI_APPLICATION = "asesores_especializados.wsgi.application"
 ASGI_APPLICATION = "asesores_especializados.asgi.application"
 
 # Base de datos (PostgreSQL por defecto)
+#
+# Reutilización de conexiones (python manage.py carga_conexiones mide el efecto):
+# - DB_CONN_MAX_AGE: segundos que un worker conserva su conexión entre peticiones
+#   (0 = abrir y cerrar una por petición; "none" = sin límite).
+# - DB_CONN_HEALTH_CHECKS: antes de reutilizarla se verifica que siga viva, para
+#   no fallar tras un reinicio de PostgreSQL o un corte del pooler.
+# - DB_PGBOUNCER: detrás de PgBouncer en modo transacción; desactiva los cursores
+#   del lado del servidor, que no sobreviven entre transacciones.
+# - DB_POOL: pool de psycopg 3 dentro del proceso (requiere Django 5.1+); tamaño
+#   con DB_POOL_MIN / DB_POOL_MAX. Con Django 4.2 usa PgBouncer.
+_conn_max_age = os.environ.get("DB_CONN_MAX_AGE", "60").strip().lower()
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -94,8 +132,93 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "cejei"),
         "HOST": os.environ.get("POSTGRES_HOST", "127.0.0.1"),
         "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        "CONN_MAX_AGE": None if _conn_max_age == "none" else int(_conn_max_age),
+        "CONN_HEALTH_CHECKS": _env_bool("DB_CONN_HEALTH_CHECKS", True),
+        "DISABLE_SERVER_SIDE_CURSORS": _env_bool("DB_PGBOUNCER", False),
+        "OPTIONS": {
+            "connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", "5")),
+            "application_name": os.environ.get("DB_APPLICATION_NAME", "asesores_especializados"),
+        },
     }
 }
+if _env_bool("DB_POOL", False):
+    import django
+    from django.core.exceptions import ImproperlyConfigured
+
+    if django.VERSION < (5, 1):
+        raise ImproperlyConfigured("DB_POOL requiere Django 5.1+ con psycopg 3; con Django 4.2 usa PgBouncer.")
+    # El pool administra las conexiones: Django exige CONN_MAX_AGE=0 en este modo.
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.environ.get("DB_POOL_MIN", "2")),
+        "max_size": int(os.environ.get("DB_POOL_MAX", "10")),
+        "timeout": int(os.environ.get("DB_POOL_TIMEOUT", "10")),
+    }
+
+# Réplica de lectura opcional (tramites.replicas). Con DB_REPLICA_HOST y/o
+# DB_REPLICA_NAME (los demás datos se heredan de la primaria) los listados,
+# detalles, API list/retrieve, tableros y exportaciones leen de la réplica. Tras
+# una escritura, ese navegador lee de la primaria durante DB_REPLICA_PEGAJOSA
+# segundos. En local basta una copia de la base en el mismo servidor
+# (DB_REPLICA_NAME=cejei_licencias_replica).
+if os.environ.get("DB_REPLICA_HOST") or os.environ.get("DB_REPLICA_NAME"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.environ.get("DB_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "USER": os.environ.get("DB_REPLICA_USER", DATABASES["default"]["USER"]),
+        "PASSWORD": os.environ.get("DB_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]),
+        "HOST": os.environ.get("DB_REPLICA_HOST", DATABASES["default"]["HOST"]),
+        "PORT": os.environ.get("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        # En pruebas la réplica apunta a la misma base que default.
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_LECTURA = "replica" in DATABASES
+REPLICA_PEGAJOSA_SEGUNDOS = int(os.environ.get("DB_REPLICA_PEGAJOSA", "10"))
+DATABASE_ROUTERS = ["tramites.replicas.RouterReplica"] if REPLICA_LECTURA else []
+
+# Caché (tramites.cache): DJANGO_CACHE elige el backend compartido por todos los
+# espacios: "locmem" (por omisión, por proceso), "file" (DJANGO_CACHE_DIR) o
+# "redis" (DJANGO_CACHE_URL, requiere `pip install redis`). Cada espacio es un
+# alias con su prefijo y vigencia; `python manage.py cache_stats` muestra sus aciertos.
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE", "locmem").strip().lower()
+# Solo redis es visible para todos los workers; locmem es por proceso y file, por máquina.
+CACHE_COMPARTIDA = CACHE_BACKEND == "redis"
+CACHE_PREFIJO = os.environ.get("DJANGO_CACHE_PREFIJO", "cejei")
+CACHE_VIGENCIAS = {
+    "default": 300,
+    # Sin caché compartida, borrar una entrada solo llega al worker que guardó; los demás
+    # ven el catálogo nuevo cuando la suya caduca.
+    "catalogos": 3600 if CACHE_COMPARTIDA else 60,
+    "ccts": 900,
+    "tablero": 60,
+    "sesiones": 60 * 60 * 24 * 14,
+    # Las claves de los fragmentos cambian con los datos; la vigencia solo libera espacio.
+    "fragmentos": 60 * 60 * 24,
+}
+
+
+def _cache(alias: str, vigencia: int) -> dict:
+    if CACHE_BACKEND == "locmem":
+        ubicacion = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": alias}
+    elif CACHE_BACKEND == "file":
+        directorio = Path(os.environ.get("DJANGO_CACHE_DIR", BASE_DIR / "var" / "cache"))
+        ubicacion = {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(directorio / alias),
+        }
+    elif CACHE_BACKEND == "redis":
+        ubicacion = {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("DJANGO_CACHE_URL", "redis://127.0.0.1:6379/1"),
+        }
+    else:
+        from django.core.exceptions import ImproperlyConfigured
+
+        raise ImproperlyConfigured(f"DJANGO_CACHE desconocido: {CACHE_BACKEND!r} (locmem, file o redis).")
+    return {**ubicacion, "KEY_PREFIX": f"{CACHE_PREFIJO}:{alias}", "TIMEOUT": vigencia}
+
+
+CACHES = {alias: _cache(alias, vigencia) for alias, vigencia in CACHE_VIGENCIAS.items()}
 
 # Zona y lenguaje
 LANGUAGE_CODE = "es-mx"
@@ -108,9 +231,49 @@ STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [BASE_DIR / "tramites" / "static"]
 
+# Fuera de DEBUG, collectstatic genera nombres con hash y variantes .gz/.br
+# (tramites.estaticos). Django los sirve con caché inmutable salvo que un
+# proxy (nginx) se encargue de /static/: en ese caso DJANGO_SERVIR_ESTATICOS=false.
+ESTATICOS_CON_HASH = _env_bool("DJANGO_ESTATICOS_HASH", not DEBUG)
+SERVIR_ESTATICOS = _env_bool("DJANGO_SERVIR_ESTATICOS", not DEBUG)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "tramites.estaticos.EstaticosComprimidosStorage"
+            if ESTATICOS_CON_HASH
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+}
+
+# Bundles de JavaScript (npm run build:js); sin compilar se sirven los módulos fuente.
+JS_USAR_BUNDLES = _env_bool("DJANGO_JS_BUNDLES", not DEBUG)
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Expedientes en PDF (WeasyPrint): caché en disco y procesos para el modo por lotes
+EXPEDIENTES_PDF_ROOT = MEDIA_ROOT / "expedientes"
+EXPEDIENTES_PDF_WORKERS = int(os.environ.get("EXPEDIENTES_PDF_WORKERS", "0")) or None
+
+# Consulta de CCT en lote (POST /api/ccts/buscar/)
+CCT_LOTE_MAXIMO = int(os.environ.get("CCT_LOTE_MAXIMO", "500"))
+
+# Evaluación de elegibilidad en lote (POST /api/elegibilidad/)
+ELEGIBILIDAD_LOTE_MAXIMO = int(os.environ.get("ELEGIBILIDAD_LOTE_MAXIMO", "5000"))
+
+# Cambio de estatus masivo (POST /api/casos/estatus/)
+ESTATUS_MASIVO_MAXIMO = int(os.environ.get("ESTATUS_MASIVO_MAXIMO", "5000"))
+
+# Cola de tareas en segundo plano (python manage.py procesar_tareas)
+TAREAS_CONCURRENCIA = int(os.environ.get("TAREAS_CONCURRENCIA", "2"))
+TAREAS_INTERVALO = float(os.environ.get("TAREAS_INTERVALO", "2"))
+TAREAS_TIEMPO_MAXIMO = timedelta(minutes=int(os.environ.get("TAREAS_TIEMPO_MAXIMO_MIN", "30")))
+TAREAS_MAXIMO_INTENTOS = 3
+# Las tareas terminadas y sus archivos en MEDIA_ROOT/tareas/ se borran pasado este plazo.
+TAREAS_CONSERVAR = timedelta(days=int(os.environ.get("TAREAS_CONSERVAR_DIAS", "7")))
+
 # DRF + SimpleJWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -129,6 +292,20 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 25,
 }
 
+# Con caché compartida, sesiones en caché con respaldo en base de datos (cached_db sobre
+# el espacio `sesiones`): la mayoría de las peticiones no consultan django_session. Con una
+# caché por proceso, cerrar sesión solo borraría la copia del worker que atendió la
+# petición y los demás seguirían aceptando la sesión, así que se usa la base directamente.
+# `python manage.py limpiar_autenticacion` borra en lotes las sesiones y los tokens JWT
+# vencidos (programarlo en cron).
+SESSION_ENGINE = "tramites.sesiones" if CACHE_COMPARTIDA else "django.contrib.sessions.backends.db"
+SESSION_CACHE_ALIAS = "sesiones"
+# Segundos que se recuerda que un refresh token NO está en la lista negra (tramites.tokens).
+# Sin caché compartida no se recuerda: otro worker no vería un token recién agregado.
+JWT_LISTA_NEGRA_CACHE_NEGATIVO = int(
+    os.environ.get("JWT_LISTA_NEGRA_CACHE_NEGATIVO", "30" if CACHE_COMPARTIDA else "0")
+)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -138,6 +315,8 @@ SIMPLE_JWT = {
     "SIGNING_KEY": SECRET_KEY,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "TOKEN_OBTAIN_SERIALIZER": "tramites.tokens.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "tramites.tokens.TokenRefreshSerializer",
 }
 
 # Internacionalización de fechas
@@ -5,18 +5,24 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.auth import views as auth_views
-from django.urls import include, path
+from django.urls import include, path, re_path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from tramites.estaticos import servir_estatico
+from tramites.metricas import metricas_prometheus
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("accounts/login/", auth_views.LoginView.as_view(), name="login"),
     path("accounts/logout/", auth_views.LogoutView.as_view(), name="logout"),
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("metrics", metricas_prometheus, name="metricas"),
     path("", include("tramites.urls", namespace="tramites")),
     path("api/", include("tramites.api_urls", namespace="tramites_api")),
 ]
 
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+if settings.SERVIR_ESTATICOS:
+    urlpatterns += [re_path(rf"^{settings.STATIC_URL.strip('/')}/(?P<ruta>.+)$", servir_estatico)]
@@ -0,0 +1,51 @@
+// Compila los módulos de tramites/static/js en bundles minificados con hash en el nombre.
+// Uso: npm run build:js   (requiere `npm install`; al final revisa el presupuesto de tamaño)
+//
+// Salida en tramites/static/dist/: un archivo por entrada, los módulos que app.js carga con
+// import() como fragmentos en dist/chunks/ y manifest.json, que lee el template tag
+// `modulo_js` para apuntar a los bundles en lugar de a los módulos fuente.
+import { mkdirSync, rmSync, writeFileSync } from "node:fs";
+import { join, relative, resolve, sep } from "node:path";
+import { fileURLToPath } from "node:url";
+
+import { build } from "esbuild";
+
+import { DESTINO, imprimirPresupuesto, revisarPresupuesto } from "./presupuesto_js.mjs";
+
+const RAIZ = resolve(fileURLToPath(import.meta.url), "..", "..");
+const ESTATICOS = join(RAIZ, "tramites", "static");
+const ENTRADAS = ["js/app.js", "js/analizador-tramites.js"];
+
+const aEstatico = (ruta) => relative(ESTATICOS, resolve(RAIZ, ruta)).split(sep).join("/");
+
+rmSync(DESTINO, { recursive: true, force: true });
+mkdirSync(DESTINO, { recursive: true });
+
+const { metafile } = await build({
+  entryPoints: ENTRADAS.map((entrada) => join(ESTATICOS, entrada)),
+  outdir: DESTINO,
+  absWorkingDir: RAIZ,
+  bundle: true,
+  splitting: true,
+  format: "esm",
+  target: ["es2020"],
+  minify: true,
+  sourcemap: "linked",
+  entryNames: "[name]-[hash]",
+  chunkNames: "chunks/[name]-[hash]",
+  metafile: true,
+  logLevel: "info",
+});
+
+const manifiesto = {};
+Object.entries(metafile.outputs).forEach(([salida, info]) => {
+  if (info.entryPoint) {
+    manifiesto[aEstatico(info.entryPoint)] = aEstatico(salida);
+  }
+});
+writeFileSync(join(DESTINO, "manifest.json"), `${JSON.stringify(manifiesto, null, 2)}\n`);
+
+if (!imprimirPresupuesto(revisarPresupuesto())) {
+  console.error("Algún bundle excede el presupuesto de tamaño (package.json → presupuestoJs).");
+  process.exit(1);
+}
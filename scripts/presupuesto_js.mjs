@@ -0,0 +1,62 @@
+// Verifica el presupuesto de tamaño de los bundles generados por build_js.mjs.
+// Uso: node scripts/presupuesto_js.mjs   (sale con código 1 si algún archivo lo excede)
+import { existsSync, readFileSync, readdirSync } from "node:fs";
+import { join, resolve } from "node:path";
+import { fileURLToPath } from "node:url";
+import { gzipSync } from "node:zlib";
+
+const RAIZ = resolve(fileURLToPath(import.meta.url), "..", "..");
+export const DESTINO = join(RAIZ, "tramites", "static", "dist");
+
+export function leerPresupuesto() {
+  const paquete = JSON.parse(readFileSync(join(RAIZ, "package.json"), "utf-8"));
+  return paquete.presupuestoJs;
+}
+
+function medir(ruta) {
+  const contenido = readFileSync(ruta);
+  return { bytes: contenido.length, gzip: gzipSync(contenido, { level: 9 }).length };
+}
+
+// Devuelve una fila por archivo con su tamaño, su límite y si lo excede.
+// Las entradas salen del manifiesto; los fragmentos cargados con import() de dist/chunks.
+export function revisarPresupuesto(destino = DESTINO, presupuesto = leerPresupuesto()) {
+  const manifiesto = JSON.parse(readFileSync(join(destino, "manifest.json"), "utf-8"));
+  const filas = Object.values(manifiesto).map((salida) => ({
+    archivo: salida,
+    tipo: "entrada",
+    ...medir(join(destino, "..", salida)),
+  }));
+  const chunks = join(destino, "chunks");
+  if (existsSync(chunks)) {
+    readdirSync(chunks)
+      .filter((nombre) => nombre.endsWith(".js"))
+      .sort()
+      .forEach((nombre) => {
+        filas.push({ archivo: `dist/chunks/${nombre}`, tipo: "fragmento", ...medir(join(chunks, nombre)) });
+      });
+  }
+  return filas.map((fila) => {
+    const limite = presupuesto[fila.tipo];
+    return { ...fila, limite, excedido: fila.bytes > limite.bytes || fila.gzip > limite.gzip };
+  });
+}
+
+export function imprimirPresupuesto(filas) {
+  const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+  filas.forEach((fila) => {
+    const marca = fila.excedido ? "✗" : "✓";
+    console.log(
+      `${marca} ${fila.archivo.padEnd(48)} ${kb(fila.bytes).padStart(9)} (gzip ${kb(fila.gzip)})` +
+        `  límite ${kb(fila.limite.bytes)} / gzip ${kb(fila.limite.gzip)}`,
+    );
+  });
+  return filas.every((fila) => !fila.excedido);
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  if (!imprimirPresupuesto(revisarPresupuesto())) {
+    console.error("Algún bundle excede el presupuesto de tamaño (package.json → presupuestoJs).");
+    process.exit(1);
+  }
+}
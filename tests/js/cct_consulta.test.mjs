@@ -0,0 +1,106 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+
+import { createCCTLookup, LRUCache } from "../../tramites/static/js/modulos/cct_consulta.js";
+
+const RESPUESTA = {
+  found: true,
+  cct: "31EES0001A",
+  c_nombre: "Secundaria Uno",
+  sostenimiento_c_subcontrol: "ESTATAL",
+  tiponivelsub_c_servicion3: "GENERAL",
+  asesor: "Asesor 1",
+};
+
+function memoria() {
+  const datos = new Map();
+  return { getItem: (k) => datos.get(k) ?? null, setItem: (k, v) => datos.set(k, v) };
+}
+
+// fetch simulado: responde al liberar `soltar()` y respeta AbortSignal.
+function fetchSimulado(cuerpo = RESPUESTA) {
+  const llamadas = [];
+  const fn = (url, { signal }) =>
+    new Promise((resolve, reject) => {
+      const llamada = {
+        url,
+        soltar: () => resolve({ ok: true, status: 200, json: async () => cuerpo }),
+      };
+      llamadas.push(llamada);
+      signal.addEventListener("abort", () => reject(new DOMException("abortada", "AbortError")));
+    });
+  return { fn, llamadas };
+}
+
+test("LRUCache descarta la entrada usada hace más tiempo", () => {
+  const cache = new LRUCache(2);
+  cache.set("a", 1);
+  cache.set("b", 2);
+  cache.get("a");
+  cache.set("c", 3);
+  assert.deepEqual(cache.toJSON(), [["a", 1], ["c", 3]]);
+});
+
+test("el catálogo de la página y el caché evitan volver a consultar", async () => {
+  const red = fetchSimulado();
+  const consulta = createCCTLookup({
+    url: "/cct/lookup/",
+    catalog: [{ cct: "31ees0002b", nombre: "Secundaria Dos" }],
+    storage: memoria(),
+    fetchFn: red.fn,
+  });
+  assert.equal((await consulta.lookup("31EES0002B")).nombre, "Secundaria Dos");
+  assert.equal(red.llamadas.length, 0);
+
+  const primera = consulta.lookup("31ees0001a");
+  const repetida = consulta.lookup("31EES0001A ");
+  assert.equal(red.llamadas.length, 1);
+  assert.equal(red.llamadas[0].url, "/cct/lookup/?cct=31EES0001A");
+  red.llamadas[0].soltar();
+  assert.equal((await primera).nombre, "Secundaria Uno");
+  assert.equal(await repetida, await primera);
+
+  await consulta.lookup("31EES0001A");
+  assert.equal(red.llamadas.length, 1);
+  assert.deepEqual(consulta.stats, { requests: 1, catalogHits: 1, cacheHits: 1, aborted: 0 });
+});
+
+test("una consulta nueva cancela la que sigue en vuelo", async () => {
+  const red = fetchSimulado();
+  const consulta = createCCTLookup({ url: "/cct/lookup/", storage: memoria(), fetchFn: red.fn });
+  const vieja = consulta.lookup("31EES0009Z");
+  const nueva = consulta.lookup("31EES0001A");
+  await assert.rejects(vieja, { name: "AbortError" });
+  red.llamadas[1].soltar();
+  assert.equal((await nueva).cct, "31EES0001A");
+  assert.equal(consulta.stats.aborted, 1);
+});
+
+test("el caché se comparte en la sesión, expira y guarda los no encontrados", async () => {
+  const sesion = memoria();
+  let ahora = 0;
+  const red = fetchSimulado({ found: false });
+  const opciones = { url: "/cct/lookup/", storage: sesion, fetchFn: red.fn, ttlMs: 1000, now: () => ahora };
+
+  const primera = createCCTLookup(opciones).lookup("31EES0404X");
+  red.llamadas[0].soltar();
+  assert.equal(await primera, null);
+
+  const otraPagina = createCCTLookup(opciones);
+  assert.equal(await otraPagina.lookup("31EES0404X"), null);
+  assert.equal(red.llamadas.length, 1);
+
+  ahora = 2000;
+  void otraPagina.lookup("31EES0404X");
+  assert.equal(red.llamadas.length, 2);
+});
+
+test("remember y forget mantienen el caché al día tras editar o borrar un CCT", async () => {
+  const red = fetchSimulado();
+  const consulta = createCCTLookup({ url: "/cct/lookup/", storage: memoria(), fetchFn: red.fn });
+  consulta.remember({ cct: "31EES0003C", nombre: "Nueva" });
+  assert.equal((await consulta.lookup("31EES0003C")).nombre, "Nueva");
+  consulta.forget("31ees0003c");
+  void consulta.lookup("31EES0003C");
+  assert.equal(red.llamadas.length, 1);
+});
@@ -0,0 +1,56 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+import { readFileSync } from "node:fs";
+
+import {
+  parseISODate,
+  calculateValidDays,
+  evaluateLicensesRequirement,
+  evaluateYearsRequirement,
+  mergeLicenseIntervals,
+} from "../../tramites/static/js/analizador_core.js";
+
+// Los mismos casos se verifican en tests/test_elegibilidad.py contra el motor NumPy.
+const casos = JSON.parse(readFileSync(new URL("../fixtures/elegibilidad_paridad.json", import.meta.url)));
+const DIAS_REQUERIDOS = { issste: 60, imss: 90 };
+
+test("calculateValidDays coincide con los casos compartidos", () => {
+  for (const caso of casos.dias_validos) {
+    const dias = calculateValidDays(parseISODate(caso.inicio), parseISODate(caso.fin), parseISODate(caso.ingreso));
+    assert.equal(dias, caso.esperado, `${caso.inicio} – ${caso.fin}`);
+  }
+});
+
+test("evaluaciones por persona coinciden con los casos compartidos", () => {
+  for (const persona of casos.personas) {
+    const ingreso = parseISODate(persona.ingreso);
+    const anios = evaluateYearsRequirement(ingreso, parseISODate(persona.analisis), 15);
+    const licencias = evaluateLicensesRequirement(
+      ingreso,
+      persona.licencias.map((licencia) => ({ start: licencia.inicio, end: licencia.fin })),
+      DIAS_REQUERIDOS[persona.regimen],
+    );
+    const faltan = /Faltan (\d+)/.exec(anios.description);
+    assert.equal(anios.valid, persona.esperado.cumple_anios, persona.id);
+    assert.equal(faltan ? Number(faltan[1]) : 0, persona.esperado.dias_faltantes_anios, persona.id);
+    assert.equal(licencias.validDays, persona.esperado.dias_validos, persona.id);
+    assert.equal(licencias.valid, persona.esperado.cumple_licencias, persona.id);
+  }
+});
+
+test("mergeLicenseIntervals une traslapes y cuenta cada día una vez", () => {
+  const iso = (date) => date.toISOString().slice(0, 10);
+  for (const caso of casos.union) {
+    const union = mergeLicenseIntervals(
+      caso.licencias.map((licencia) => ({ start: licencia.inicio, end: licencia.fin })),
+      parseISODate(caso.ingreso),
+    );
+    assert.equal(union.validDays, caso.esperado.dias_validos, caso.id);
+    assert.deepEqual(union.overlappingIndexes, caso.esperado.traslapadas, caso.id);
+    assert.deepEqual(
+      union.periods.map((periodo) => [iso(periodo.start), iso(periodo.end)]),
+      caso.esperado.periodos,
+      caso.id,
+    );
+  }
+});
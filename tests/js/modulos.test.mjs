@@ -0,0 +1,52 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+import { mkdtempSync, mkdirSync, readFileSync, writeFileSync } from "node:fs";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
+
+import { revisarPresupuesto } from "../../scripts/presupuesto_js.mjs";
+
+const JS = new URL("../../tramites/static/js/", import.meta.url);
+
+test("app.js solo importa de forma estática las utilidades comunes", () => {
+  const fuente = readFileSync(new URL("app.js", JS), "utf-8");
+  const estaticos = [...fuente.matchAll(/^import .* from "([^"]+)";$/gm)].map((m) => m[1]);
+  const dinamicos = [...fuente.matchAll(/import\("([^"]+)"\)/g)].map((m) => m[1]);
+  assert.deepEqual(estaticos, ["./modulos/comun.js"]);
+  assert.deepEqual(dinamicos, [
+    "./modulos/caso_interno.js",
+    "./modulos/tramite_detalle.js",
+    "./modulos/estatus.js",
+  ]);
+});
+
+test("los módulos de página se resuelven y exportan su inicializador", async () => {
+  const esperados = {
+    "caso_interno.js": "initCasoInternoForm",
+    "tramite_detalle.js": "initTramiteCasoDetail",
+    "estatus.js": "initEstatusCasoCrud",
+    "cct.js": "setupCCTForm",
+    "receptores.js": "initReceptoresAdicionales",
+  };
+  for (const [archivo, funcion] of Object.entries(esperados)) {
+    const modulo = await import(new URL(`modulos/${archivo}`, JS));
+    assert.equal(typeof modulo[funcion], "function", archivo);
+  }
+});
+
+test("el presupuesto marca las entradas y fragmentos que lo exceden", () => {
+  // Igual que en static/: el manifiesto guarda rutas relativas al padre de dist/.
+  const destino = join(mkdtempSync(join(tmpdir(), "static-")), "dist");
+  mkdirSync(join(destino, "chunks"), { recursive: true });
+  writeFileSync(join(destino, "app-ABC.js"), "x".repeat(100));
+  writeFileSync(join(destino, "chunks", "catalogos-DEF.js"), "y".repeat(300));
+  writeFileSync(join(destino, "manifest.json"), JSON.stringify({ "js/app.js": "dist/app-ABC.js" }));
+  const filas = revisarPresupuesto(destino, {
+    entrada: { bytes: 200, gzip: 200 },
+    fragmento: { bytes: 200, gzip: 200 },
+  }).map(({ archivo, tipo, excedido }) => ({ archivo: archivo.split("/").pop(), tipo, excedido }));
+  assert.deepEqual(filas, [
+    { archivo: "app-ABC.js", tipo: "entrada", excedido: false },
+    { archivo: "catalogos-DEF.js", tipo: "fragmento", excedido: true },
+  ]);
+});
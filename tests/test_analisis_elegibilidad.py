@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+
+from tramites import models, replicas
+from tramites.services import elegibilidad
+
+
+class AnalisisElegibilidadTests(TestCase):
+    """Los análisis guardados reutilizan su resultado mientras no cambien las entradas."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.user.user_permissions.set(
+            Permission.objects.filter(
+                codename__in=(
+                    "view_analisiselegibilidad",
+                    "add_analisiselegibilidad",
+                    "change_analisiselegibilidad",
+                ),
+                content_type__app_label="licencias",
+            )
+        )
+        self.client.force_login(self.user)
+        self.lista_url = reverse("tramites_api:analisis-elegibilidad-list")
+        self.datos = {
+            "docente": "Docente Uno",
+            "identificador": "ABCD800101XXX",
+            "fecha_ingreso": "2010-01-01",
+            "fecha_analisis": "2025-01-02",
+            "regimen": "issste",
+            "licencias": [
+                {"inicio": "2020-01-10", "fin": "2020-02-20"},
+                {"inicio": "2020-02-01", "fin": "2020-03-10"},
+            ],
+        }
+
+    def _detalle_url(self, pk: int) -> str:
+        return reverse("tramites_api:analisis-elegibilidad-detail", kwargs={"pk": pk})
+
+    def test_resultado_se_guarda_y_se_reutiliza(self):
+        response = self.client.post(self.lista_url, self.datos, content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        resultado = response.json()["resultado"]
+        self.assertEqual(resultado["dias_validos"], 61)
+        self.assertEqual(resultado["licencias_traslapadas"], [0, 1])
+        self.assertTrue(resultado["cumple"])
+
+        analisis = models.AnalisisElegibilidad.objects.get()
+        self.assertEqual(analisis.creado_por, self.user)
+        self.assertEqual(analisis.huella_resultado, elegibilidad.huella_analisis(analisis))
+
+        with mock.patch.object(elegibilidad, "evaluar_lote", side_effect=AssertionError("no debe recalcular")):
+            response = self.client.get(self._detalle_url(analisis.pk))
+        self.assertEqual(response.json()["resultado"], resultado)
+
+    def test_cambiar_entradas_invalida_el_resultado(self):
+        pk = self.client.post(self.lista_url, self.datos, content_type="application/json").json()["id"]
+        self.datos["regimen"] = "imss"
+        response = self.client.put(self._detalle_url(pk), self.datos, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["resultado"]["dias_requeridos"], 90)
+        self.assertFalse(response.json()["resultado"]["cumple"])
+
+        recalculado = self.client.post(reverse("tramites_api:analisis-elegibilidad-recalcular", kwargs={"pk": pk}))
+        self.assertEqual(recalculado.status_code, 200)
+        self.assertEqual(recalculado.json()["resultado"]["dias_validos"], 61)
+
+    def test_licencias_invalidas(self):
+        self.datos["licencias"] = [{"inicio": "2020-03-01", "fin": "2020-02-01"}, {"inicio": "10/01/2020"}]
+        response = self.client.post(self.lista_url, self.datos, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()["licencias"]), 2)
+
+    def test_herramienta_precarga_el_analisis(self):
+        pk = self.client.post(self.lista_url, self.datos, content_type="application/json").json()["id"]
+        response = self.client.get(reverse("tramites:analizador-tramite"), {"analisis": pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'id="analisis-guardado"')
+        self.assertContains(response, "ABCD800101XXX")
+
+    def test_leer_no_escribe_y_reporta_entradas_invalidas(self):
+        self.datos["fecha_analisis"] = None
+        pk = self.client.post(self.lista_url, self.datos, content_type="application/json").json()["id"]
+        # Un día después la huella ya no coincide: se calcula para la respuesta, sin guardar.
+        models.AnalisisElegibilidad.objects.filter(pk=pk).update(huella_resultado="desfasada")
+        with self.assertNumQueries(5):  # sesión, usuario, permisos (2) y análisis; ningún UPDATE
+            response = self.client.get(self._detalle_url(pk))
+        self.assertEqual(response.json()["resultado"]["dias_validos"], 61)
+        self.assertNotIn(replicas.REPLICA_COOKIE, response.cookies)
+        self.assertEqual(models.AnalisisElegibilidad.objects.get(pk=pk).huella_resultado, "desfasada")
+
+        models.AnalisisElegibilidad.objects.filter(pk=pk).update(licencias=["x"], huella_resultado="")
+        response = self.client.get(self._detalle_url(pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["resultado"])
+        self.assertEqual(len(response.json()["errores_resultado"]), 1)
+
+    def test_recalcular_requiere_permiso_de_edicion(self):
+        analisis = models.AnalisisElegibilidad.objects.create(
+            docente="Docente", fecha_ingreso="2010-01-01", regimen="issste", licencias=[]
+        )
+        self.user.user_permissions.remove(
+            Permission.objects.get(codename="change_analisiselegibilidad", content_type__app_label="licencias")
+        )
+        url = reverse("tramites_api:analisis-elegibilidad-recalcular", kwargs={"pk": analisis.pk})
+        self.assertEqual(self.client.post(url).status_code, 403)
+
+    def test_leer_analisis_requiere_permiso_de_consulta(self):
+        pk = self.client.post(self.lista_url, self.datos, content_type="application/json").json()["id"]
+        otro = get_user_model().objects.create_user(username="otro", password="password")
+        self.client.force_login(otro)
+        self.assertEqual(self.client.get(self.lista_url).status_code, 403)
+        self.assertEqual(self.client.get(self._detalle_url(pk)).status_code, 403)
+
+        herramienta = reverse("tramites:analizador-tramite")
+        self.assertEqual(self.client.get(herramienta).status_code, 200)
+        self.assertEqual(self.client.get(herramienta, {"analisis": pk}).status_code, 403)
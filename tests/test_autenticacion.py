@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+from unittest import skipIf
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from tramites import cache, sesiones, tokens
+
+
+class AutenticacionTests(TestCase):
+    def setUp(self):
+        caches["sesiones"].clear()
+        cache.cache_de("sesiones").reiniciar_metricas()
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+
+    def _refresh(self):
+        respuesta = self.client.post(
+            reverse("token_obtain_pair"), {"username": "tester", "password": "password"}, content_type="application/json"
+        )
+        return respuesta.json()["refresh"]
+
+    def test_token_rotado_se_rechaza_sin_consultar_la_lista_negra(self):
+        refresh = self._refresh()
+        rotado = self.client.post(reverse("token_refresh"), {"refresh": refresh}, content_type="application/json")
+        self.assertEqual(rotado.status_code, 200)
+        with self.assertNumQueries(0):
+            repetido = self.client.post(reverse("token_refresh"), {"refresh": refresh}, content_type="application/json")
+        self.assertEqual(repetido.status_code, 401)
+
+    def test_lista_negra_desde_el_admin_invalida_el_cache(self):
+        refresh = tokens.RefreshToken(self._refresh())
+        refresh.check_blacklist()  # Deja en caché que no está en la lista negra.
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=refresh["jti"]))
+        with self.assertNumQueries(0), self.assertRaises(TokenError):
+            refresh.check_blacklist()
+
+    @override_settings(JWT_LISTA_NEGRA_CACHE_NEGATIVO=0)
+    def test_sin_cache_negativo_ve_la_lista_negra_de_otro_worker(self):
+        refresh = tokens.RefreshToken(self._refresh())
+        refresh.check_blacklist()
+        # Otro worker lo agrega sin pasar por esta caché (bulk_create no dispara la señal).
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(token=OutstandingToken.objects.get(jti=refresh["jti"]))]
+        )
+        with self.assertRaises(TokenError):
+            refresh.check_blacklist()
+
+    @skipIf(settings.CACHE_COMPARTIDA, "Con redis todos los workers borran la misma copia.")
+    def test_sesion_cerrada_no_sirve_aunque_otro_worker_conserve_su_copia(self):
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(self.user)
+        clave = self.client.session.session_key
+        copia = dict(self.client.session.items())
+        otro_worker = Client()
+        otro_worker.cookies[settings.SESSION_COOKIE_NAME] = clave
+        self.assertEqual(otro_worker.get(reverse("tramites:casointerno-list")).status_code, 200)
+
+        self.client.post(reverse("logout"))
+        # Lo que otro worker seguiría teniendo en su caché local si las sesiones fueran cached_db.
+        caches["sesiones"].set(sesiones.SessionStore(clave).cache_key, copia)
+        response = otro_worker.get(reverse("tramites:casointerno-list"))
+        self.assertRedirects(response, f"{reverse('login')}?next={reverse('tramites:casointerno-list')}")
+
+    @override_settings(SESSION_ENGINE="tramites.sesiones")
+    def test_sesion_se_lee_del_cache(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse("tramites:casointerno-list"))
+        self.assertGreater(cache.cache_de("sesiones").metricas()["aciertos"], 0)
+
+    def test_limpieza_borra_vencidos_en_lotes(self):
+        ahora = timezone.now()
+        for indice in range(5):
+            token = OutstandingToken.objects.create(
+                jti=f"vencido-{indice}", token="t", expires_at=ahora - timedelta(days=1)
+            )
+            BlacklistedToken.objects.create(token=token)
+        OutstandingToken.objects.create(jti="vigente", token="t", expires_at=ahora + timedelta(days=1))
+        Session.objects.create(session_key="vencida", session_data="", expire_date=ahora - timedelta(days=1))
+
+        salida = StringIO()
+        call_command("limpiar_autenticacion", lote=2, stdout=salida)
+        self.assertIn("Tokens vencidos borrados: 5 · sesiones vencidas: 1", salida.getvalue())
+        self.assertEqual(list(OutstandingToken.objects.values_list("jti", flat=True)), ["vigente"])
+        self.assertFalse(BlacklistedToken.objects.exists())
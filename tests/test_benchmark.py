@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TransactionTestCase
+
+from tramites import models
+from tramites.services import benchmark, datos_sinteticos
+
+
+class DatosSinteticosTests(TransactionTestCase):
+    """Los hilos del benchmark necesitan ver datos confirmados, de ahí TransactionTestCase."""
+
+    def test_seed_genera_volumen_e_historial(self):
+        call_command("seed_benchmark", ccts=3, casos=5, tramites_por_caso=2, cambios_por_caso=3, stdout=StringIO())
+        casos = models.CasoInterno.objects.filter(cct__cct__startswith=datos_sinteticos.PREFIJO_CCT)
+        self.assertEqual(models.CCTSecundaria.objects.filter(cct__startswith=datos_sinteticos.PREFIJO_CCT).count(), 3)
+        self.assertEqual(casos.count(), 5)
+        self.assertEqual(models.TramiteCaso.objects.filter(caso__in=casos).count(), 10)
+        self.assertEqual(models.HistorialEstatusCaso.objects.filter(caso__in=casos).count(), 15)
+        self.assertEqual(models.CasoInterno.history.count(), 5)
+        ultimo = models.HistorialEstatusCaso.objects.filter(caso=casos.first()).order_by("-pk").first()
+        self.assertEqual(ultimo.estatus_nuevo, casos.first().estatus)
+
+    def test_limpiar_borra_solo_los_sinteticos(self):
+        models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Ermilo Abreu Gómez")
+        call_command("seed_benchmark", ccts=2, casos=3, stdout=StringIO())
+        call_command("seed_benchmark", ccts=1, casos=1, limpiar=True, stdout=StringIO())
+        self.assertEqual(models.CasoInterno.objects.count(), 1)
+        self.assertEqual(
+            sorted(models.CCTSecundaria.objects.values_list("cct", flat=True)),
+            ["31EES0001H", f"{datos_sinteticos.PREFIJO_CCT}000000X"],
+        )
+
+    def test_benchmark_reporta_percentiles_por_escenario(self):
+        get_user_model().objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        call_command("seed_benchmark", ccts=2, casos=4, stdout=StringIO())
+        with tempfile.TemporaryDirectory() as directorio:
+            destino = Path(directorio) / "resumen.json"
+            call_command(
+                "benchmark_tramites",
+                peticiones=12,
+                concurrencia=2,
+                mezcla="listado=1,detalle=1,consulta_cct=1,api_listado=1",
+                json=str(destino),
+                stdout=StringIO(),
+            )
+            resumen = json.loads(destino.read_text(encoding="utf-8"))
+        self.assertEqual(resumen["total"]["peticiones"], 12)
+        self.assertEqual(resumen["total"]["errores"], 0)
+        self.assertLessEqual(set(resumen) - {"total"}, {"listado", "detalle", "consulta_cct", "api_listado"})
+
+    def test_benchmark_sin_datos_falla(self):
+        get_user_model().objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        with self.assertRaises(CommandError):
+            call_command("benchmark_tramites", peticiones=1, stdout=StringIO())
+
+
+class BenchmarkUtilidadesTests(SimpleTestCase):
+    def test_percentil_por_rango_mas_cercano(self):
+        valores = [float(numero) for numero in range(1, 101)]
+        self.assertEqual(benchmark.percentil(valores, 50), 50.0)
+        self.assertEqual(benchmark.percentil(valores, 95), 95.0)
+        self.assertEqual(benchmark.percentil([], 99), 0.0)
+
+    def test_mezcla_rechaza_escenarios_desconocidos(self):
+        self.assertEqual(benchmark.parsear_mezcla("listado=3, detalle"), {"listado": 3, "detalle": 1})
+        with self.assertRaises(ValueError):
+            benchmark.parsear_mezcla("listado=1,inexistente=2")
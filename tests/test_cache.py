@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase
+
+from tramites import cache, models
+from tramites.services import catalogo_cct, catalogos
+
+
+class EspaciosCacheTests(TestCase):
+    def setUp(self):
+        for espacio in cache.ESPACIOS:
+            caches[espacio].clear()
+            cache.cache_de(espacio).reiniciar_metricas()
+        models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Ermilo Abreu Gómez", sostenimiento="ESTATAL")
+
+    def test_espacios_no_comparten_claves(self):
+        cache.cache_de("ccts").set("clave", "cct")
+        self.assertIsNone(cache.cache_de("tablero").get("clave"))
+        self.assertEqual(cache.cache_de("ccts").get("clave"), "cct")
+
+    def test_consulta_de_cct_se_guarda_e_invalida_al_editar(self):
+        self.assertEqual(catalogo_cct.consultar_cct("31ees0001h")["c_nombre"], "Ermilo Abreu Gómez")
+        with self.assertNumQueries(0):
+            catalogo_cct.consultar_cct("31EES0001H")
+
+        cct = models.CCTSecundaria.objects.get(pk="31EES0001H")
+        cct.nombre = "Justo Sierra"
+        cct.save()
+        self.assertEqual(catalogo_cct.consultar_cct("31EES0001H")["c_nombre"], "Justo Sierra")
+        self.assertEqual(cache.cache_de("ccts").metricas(), {"aciertos": 1, "fallos": 2, "tasa": 1 / 3})
+
+    def test_cct_inexistente_tambien_se_guarda(self):
+        self.assertIsNone(catalogo_cct.consultar_cct("31EES0404X"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(catalogo_cct.consultar_cct("31EES0404X"))
+
+    def test_catalogos_activos_se_invalidan_al_guardar(self):
+        models.PrefijoOficio.objects.create(nombre="SEGEY/DJ")
+        self.assertEqual([p.nombre for p in catalogos.activos(models.PrefijoOficio)], ["SEGEY/DJ"])
+        with self.assertNumQueries(0):
+            catalogos.activos(models.PrefijoOficio)
+        models.PrefijoOficio.objects.create(nombre="SEGEY/AE")
+        self.assertEqual([p.nombre for p in catalogos.activos(models.PrefijoOficio)], ["SEGEY/AE", "SEGEY/DJ"])
+
+    def test_cache_stats_reporta_tasa_por_espacio(self):
+        for _ in range(3):
+            catalogo_cct.catalogo_formulario()
+        salida = StringIO()
+        call_command("cache_stats", reiniciar=True, stdout=salida)
+        self.assertRegex(salida.getvalue(), r"catalogos\s+2\s+1\s+66\.7%")
+        self.assertEqual(cache.cache_de("catalogos").metricas()["aciertos"], 0)
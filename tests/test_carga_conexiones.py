@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import re
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connections
+from django.test import TransactionTestCase
+
+from tramites import models
+
+
+class CargaConexionesTests(TransactionTestCase):
+    """Los hilos del servidor de prueba necesitan ver datos confirmados, de ahí TransactionTestCase."""
+
+    def setUp(self):
+        models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Ermilo Abreu Gómez")
+        get_user_model().objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        configuracion = connections.settings["default"]
+        self.addCleanup(configuracion.__setitem__, "CONN_MAX_AGE", configuracion["CONN_MAX_AGE"])
+        configuracion["CONN_MAX_AGE"] = 60
+
+    def test_conexiones_persistentes_se_reutilizan_entre_peticiones(self):
+        salida = StringIO()
+        call_command("carga_conexiones", peticiones=30, concurrencia=4, hilos=2, stdout=salida)
+        linea = salida.getvalue()
+        self.assertIn("CONN_MAX_AGE=60s · peticiones=30 (errores=0)", linea)
+        conexiones = int(re.search(r"conexiones=(\d+)", linea).group(1))
+        self.assertLessEqual(conexiones, 2)
+
+    def test_comparar_incluye_escenario_sin_reutilizacion(self):
+        salida = StringIO()
+        call_command("carga_conexiones", peticiones=5, comparar=True, stdout=salida)
+        escenarios = [linea.split(" · ")[0] for linea in salida.getvalue().splitlines()]
+        self.assertEqual(escenarios, ["CONN_MAX_AGE=0s", "CONN_MAX_AGE=60s"])
+
+    def test_sin_usuario_activo_falla(self):
+        with self.assertRaises(CommandError):
+            call_command("carga_conexiones", usuario="nadie")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tramites import models
+from tramites.services import catalogo_cct
+
+
+class BuscarCCTLoteTests(TestCase):
+    def setUp(self):
+        for cct, nombre in (("31EES0001H", "Ermilo Abreu Gómez"), ("31EES0002G", "Justo Sierra")):
+            models.CCTSecundaria.objects.create(cct=cct, nombre=nombre, sostenimiento="FEDERAL TRANSFERIDO")
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.url = reverse("tramites_api:cct-buscar")
+
+    def test_una_sola_consulta_conserva_orden_y_descarta_repetidos(self):
+        with self.assertNumQueries(1):
+            resultado = catalogo_cct.buscar_ccts([" 31ees0002g", "31EES9999X", "31EES0002G", "", "31EES0001H"])
+        self.assertEqual(list(resultado), ["31EES0002G", "31EES9999X", "31EES0001H"])
+        self.assertIsNone(resultado["31EES9999X"])
+        self.assertEqual(resultado["31EES0001H"].nombre, "Ermilo Abreu Gómez")
+
+    def test_api_devuelve_encontrados_y_no_encontrados(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            self.url, {"ccts": ["31ees0001h", "31EES9999X"]}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        datos = response.json()
+        self.assertEqual(datos["total"], 2)
+        self.assertEqual(datos["no_encontrados"], ["31EES9999X"])
+        self.assertEqual(datos["encontrados"]["31EES0001H"]["sostenimiento"], "FEDERAL")
+
+    @override_settings(CCT_LOTE_MAXIMO=2)
+    def test_api_rechaza_lotes_mayores_al_maximo(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            self.url, {"ccts": ["31EES0001H", "31EES0002G", "31EES0003F"]}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Máximo 2", response.json()["ccts"][0])
+
+    def test_api_requiere_sesion(self):
+        response = self.client.post(self.url, {"ccts": ["31EES0001H"]}, content_type="application/json")
+        self.assertIn(response.status_code, {401, 403})
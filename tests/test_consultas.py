@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tramites import consultas, models
+
+
+class DetectorConsultasTests(TestCase):
+    def setUp(self):
+        self.cct = models.CCTSecundaria.objects.create(cct="ABC1234567", nombre="Secundaria Uno", asesor="Asesor 1")
+        estatus = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        tipo = models.TipoProceso.objects.create(nombre="Tipo A")
+        for numero in range(6):
+            models.CasoInterno.objects.create(
+                cct=self.cct,
+                cct_nombre=self.cct.nombre,
+                asesor_cct=self.cct.asesor,
+                fecha_apertura=date.today(),
+                estatus=estatus,
+                tipo_inicial=tipo,
+                asunto=f"Caso {numero}",
+            )
+
+    def test_huella_ignora_literales_y_tamano_de_listas(self):
+        self.assertEqual(
+            consultas.huella_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND  nombre = 'x''y' LIMIT 21"),
+            consultas.huella_sql("SELECT * FROM t WHERE id IN (%s, %s) AND nombre = 'z' LIMIT 5"),
+        )
+
+    def test_ciclo_en_plantilla_falla_con_origen(self):
+        plantilla = Template("{% for caso in casos %}\n{{ caso.estatus.nombre }}\n{% endfor %}")
+        with self.assertRaises(consultas.ConsultasRepetidas) as error:
+            with consultas.sin_n_mas_1():
+                plantilla.render(Context({"casos": models.CasoInterno.objects.all()}))
+        self.assertIn("N+1: 6 consultas", str(error.exception))
+        self.assertIn("licencias_estatuscaso", str(error.exception))
+        self.assertRegex(str(error.exception), r"desde \? · .*:2")
+
+    def test_select_related_pasa(self):
+        with consultas.sin_n_mas_1() as detector:
+            [caso.estatus.nombre for caso in models.CasoInterno.objects.select_related("estatus")]
+        self.assertEqual(detector.repetidas(), {})
+
+    @override_settings(DETECTOR_CONSULTAS=True, DETECTOR_ESTRICTO=True, DETECTOR_CONSULTA_LENTA_MS=10_000)
+    def test_vistas_de_tramites_sin_n_mas_1(self):
+        user = get_user_model().objects.create_superuser(username="admin", email="a@example.com", password="x")
+        self.client.force_login(user)
+        caso = models.CasoInterno.objects.first()
+        for nombre, kwargs in (("tramites:casointerno-list", {}), ("tramites:casointerno-detail", {"pk": caso.pk})):
+            with self.subTest(nombre):
+                self.assertEqual(self.client.get(reverse(nombre, kwargs=kwargs)).status_code, 200)
+
+    @override_settings(DETECTOR_CONSULTAS=True, DETECTOR_CONSULTA_LENTA_MS=0.000001)
+    def test_middleware_registra_consultas_lentas(self):
+        self.client.force_login(get_user_model().objects.create_user(username="u", password="x"))
+        with self.assertLogs("tramites.consultas", "WARNING") as logs:
+            self.client.get(reverse("tramites_api:cct-list"))
+        self.assertIn("Lenta:", logs.output[-1])
+        self.assertIn("tramites_api:cct-list", logs.output[-1])
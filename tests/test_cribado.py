@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import csv
+import io
+import tempfile
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from tramites import models
+from tramites.services import cribado, elegibilidad, tareas
+
+CSV_RRHH = (
+    "id,nombre,ingreso,regimen,licencia_inicio,licencia_fin\n"
+    "A,Ana,2010-01-01,issste,2020-01-10,2020-02-20\n"
+    "A,Ana,2010-01-01,issste,2020-02-01,2020-03-15\n"
+    "B,Beto,15/05/2012,imss,,\n"
+    "C,Carla,2005-03-01,,2009-12-28,2010-01-25\n"
+    "C,Carla,2005-03-01,,2011-06-01,2011-08-31\n"
+)
+
+
+def _leer_resultado(contenido: bytes) -> dict[str, dict[str, str]]:
+    filas = csv.DictReader(io.StringIO(contenido.decode("utf-8-sig")))
+    return {fila["Id"]: fila for fila in filas}
+
+
+class CribadoTests(SimpleTestCase):
+    def test_bloques_pequenos_dan_el_mismo_resultado_que_el_lote(self):
+        contenido, total = cribado.cribar_archivo(
+            io.BytesIO(CSV_RRHH.encode()), "rrhh.csv", fecha_analisis=date(2025, 6, 1), tamano_bloque=2
+        )
+        self.assertEqual(total, 3)
+        filas = _leer_resultado(contenido)
+
+        personas = elegibilidad.personas_desde_datos(
+            [
+                {
+                    "id": "A",
+                    "ingreso": "2010-01-01",
+                    "licencias": [
+                        {"inicio": "2020-01-10", "fin": "2020-02-20"},
+                        {"inicio": "2020-02-01", "fin": "2020-03-15"},
+                    ],
+                },
+                {"id": "B", "ingreso": "2012-05-15", "regimen": "imss"},
+                {
+                    "id": "C",
+                    "ingreso": "2005-03-01",
+                    "licencias": [
+                        {"inicio": "2009-12-28", "fin": "2010-01-25"},
+                        {"inicio": "2011-06-01", "fin": "2011-08-31"},
+                    ],
+                },
+            ]
+        )
+        for resultado in elegibilidad.evaluar_lote(personas, fecha_analisis=date(2025, 6, 1)):
+            fila = filas[resultado.id]
+            self.assertEqual(int(fila["Días válidos"]), resultado.dias_validos)
+            self.assertEqual(fila["Cumple"], "Sí" if resultado.cumple else "No")
+        self.assertEqual(filas["A"]["Licencias traslapadas"], "2")
+        self.assertEqual(filas["B"]["Régimen"], "IMSS")
+
+    def test_filas_no_consecutivas_se_rechazan(self):
+        contenido = "id,ingreso,licencia_inicio,licencia_fin\nA,2010-01-01,,\nB,2010-01-01,,\nA,2010-01-01,,\n"
+        with self.assertRaises(cribado.ArchivoCribadoInvalido) as error:
+            cribado.cribar_archivo(io.BytesIO(contenido.encode()), "rrhh.csv", fecha_analisis=date(2025, 6, 1))
+        self.assertIn("'A'", str(error.exception))
+
+    def test_excel(self):
+        from openpyxl import Workbook
+
+        libro = Workbook()
+        hoja = libro.active
+        for fila in csv.reader(io.StringIO(CSV_RRHH)):
+            hoja.append(fila)
+        archivo = io.BytesIO()
+        libro.save(archivo)
+        archivo.seek(0)
+        contenido, total = cribado.cribar_archivo(archivo, "rrhh.xlsx", fecha_analisis=date(2025, 6, 1))
+        self.assertEqual(total, 3)
+        self.assertEqual(_leer_resultado(contenido)["C"]["Cumple"], "Sí")
+
+
+class CribadoVistaTests(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(MEDIA_ROOT=self.tmpdir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename="view_analisiselegibilidad", content_type__app_label="licencias")
+        )
+        self.client.force_login(self.user)
+        self.url = reverse("tramites:analizador-cribado")
+
+    def test_archivo_se_encola_y_el_worker_genera_el_csv(self):
+        archivo = SimpleUploadedFile("rrhh.csv", CSV_RRHH.encode(), content_type="text/csv")
+        response = self.client.post(
+            self.url,
+            {"archivo": archivo, "regimen": "issste", "fecha_analisis": "2025-06-01"},
+            HTTP_ACCEPT="application/json",
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(tareas.procesar_pendientes(), 1)
+
+        estado = self.client.get(response.json()["estado_url"]).json()
+        self.assertEqual(estado["estatus"], models.TAREA_COMPLETADA)
+        descarga = self.client.get(estado["resultado_url"])
+        filas = _leer_resultado(b"".join(descarga.streaming_content))
+        self.assertEqual(set(filas), {"A", "B", "C"})
+        self.assertEqual(filas["C"]["Fecha de análisis"], "2025-06-01")
+
+    def test_extension_no_soportada_responde_400(self):
+        archivo = SimpleUploadedFile("rrhh.pdf", b"%PDF", content_type="application/pdf")
+        response = self.client.post(self.url, {"archivo": archivo}, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(models.TareaSegundoPlano.objects.exists())
+
+    def test_xls_no_se_acepta(self):
+        archivo = SimpleUploadedFile("rrhh.xls", b"\xd0\xcf\x11\xe0", content_type="application/vnd.ms-excel")
+        response = self.client.post(self.url, {"archivo": archivo}, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_requiere_permiso(self):
+        self.user.user_permissions.clear()
+        archivo = SimpleUploadedFile("rrhh.csv", CSV_RRHH.encode(), content_type="text/csv")
+        response = self.client.post(self.url, {"archivo": archivo}, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(models.TareaSegundoPlano.objects.exists())
+        herramienta = self.client.get(reverse("tramites:analizador-tramite"))
+        self.assertNotContains(herramienta, reverse("tramites:analizador-cribado"))
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import subprocess
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from tramites.services import elegibilidad
+
+RAIZ = Path(__file__).resolve().parent.parent
+CASOS = json.loads((RAIZ / "tests" / "fixtures" / "elegibilidad_paridad.json").read_text(encoding="utf-8"))
+
+# Evalúa los mismos casos aleatorios con analizador_core.js.
+SCRIPT_NODE = """
+import { readFileSync } from "node:fs";
+import { pathToFileURL } from "node:url";
+const core = await import(pathToFileURL(process.argv[1]).href);
+const casos = JSON.parse(readFileSync(0, "utf-8"));
+const salida = casos.map((caso) => {
+  const ingreso = core.parseISODate(caso.ingreso);
+  const anios = core.evaluateYearsRequirement(ingreso, core.parseISODate(caso.analisis), 15);
+  const licencias = core.evaluateLicensesRequirement(
+    ingreso,
+    caso.licencias.map((l) => ({ start: l.inicio, end: l.fin })),
+    caso.regimen === "imss" ? 90 : 60,
+  );
+  return {
+    cumple_anios: anios.valid,
+    dias_validos: licencias.validDays,
+    cumple_licencias: licencias.valid,
+    licencias_traslapadas: licencias.overlappingIndexes,
+  };
+});
+process.stdout.write(JSON.stringify(salida));
+"""
+
+
+class ElegibilidadParidadTests(SimpleTestCase):
+    """El motor NumPy debe dar los mismos resultados que analizador_core.js."""
+
+    def test_dias_validos_casos_compartidos(self):
+        casos = CASOS["dias_validos"]
+        dias = elegibilidad.dias_validos(
+            elegibilidad.a_fechas(caso["inicio"] for caso in casos),
+            elegibilidad.a_fechas(caso["fin"] for caso in casos),
+            elegibilidad.a_fechas(caso["ingreso"] for caso in casos),
+        )
+        self.assertEqual(dias.tolist(), [caso["esperado"] for caso in casos])
+
+    def test_evaluacion_por_persona_casos_compartidos(self):
+        personas = elegibilidad.personas_desde_datos(CASOS["personas"])
+        for caso, resultado in zip(CASOS["personas"], elegibilidad.evaluar_lote(personas)):
+            obtenido = {clave: getattr(resultado, clave) for clave in caso["esperado"]}
+            self.assertEqual(obtenido, caso["esperado"], caso["id"])
+
+    def test_union_de_periodos_casos_compartidos(self):
+        for caso in CASOS["union"]:
+            periodos, dias, traslapadas = elegibilidad.unir_periodos(
+                ((licencia["inicio"], licencia["fin"]) for licencia in caso["licencias"]), caso["ingreso"]
+            )
+            self.assertEqual(dias, caso["esperado"]["dias_validos"], caso["id"])
+            self.assertEqual(traslapadas, caso["esperado"]["traslapadas"], caso["id"])
+            self.assertEqual(
+                [[periodo.inicio.isoformat(), periodo.fin.isoformat()] for periodo in periodos],
+                caso["esperado"]["periodos"],
+                caso["id"],
+            )
+
+    def test_union_por_lote_no_mezcla_personas(self):
+        personas = elegibilidad.personas_desde_datos(
+            [{"id": caso["id"], "ingreso": caso["ingreso"], "licencias": caso["licencias"]} for caso in CASOS["union"]]
+        )
+        resultados = elegibilidad.evaluar_lote(personas, fecha_analisis=date(2025, 1, 1))
+        self.assertEqual(
+            [resultado.dias_validos for resultado in resultados],
+            [caso["esperado"]["dias_validos"] for caso in CASOS["union"]],
+        )
+        self.assertEqual(
+            [resultado.licencias_traslapadas for resultado in resultados],
+            [caso["esperado"]["traslapadas"] for caso in CASOS["union"]],
+        )
+
+    @unittest.skipUnless(shutil.which("node"), "Node.js no está disponible")
+    def test_paridad_aleatoria_contra_javascript(self):
+        azar = random.Random(2024)
+        base = date(1995, 1, 1)
+
+        def fecha(desde: date, dias: int) -> str:
+            return (desde + timedelta(days=azar.randint(0, dias))).isoformat()
+
+        casos = []
+        for indice in range(300):
+            ingreso = date.fromisoformat(fecha(base, 9000))
+            casos.append(
+                {
+                    "id": str(indice),
+                    "ingreso": ingreso.isoformat(),
+                    "analisis": fecha(ingreso - timedelta(days=400), 9000),
+                    "regimen": azar.choice(["issste", "imss"]),
+                    "licencias": [
+                        {"inicio": inicio, "fin": fecha(date.fromisoformat(inicio) - timedelta(days=20), 120)}
+                        for inicio in (fecha(ingreso - timedelta(days=60), 400) for _ in range(azar.randint(0, 8)))
+                    ],
+                }
+            )
+        proceso = subprocess.run(
+            ["node", "--input-type=module", "-e", SCRIPT_NODE, str(RAIZ / "tramites/static/js/analizador_core.js")],
+            input=json.dumps(casos),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        esperados = json.loads(proceso.stdout)
+        resultados = elegibilidad.evaluar_lote(elegibilidad.personas_desde_datos(casos))
+        for caso, esperado, resultado in zip(casos, esperados, resultados):
+            obtenido = {clave: getattr(resultado, clave) for clave in esperado}
+            self.assertEqual(obtenido, esperado, caso)
+
+
+class ElegibilidadLoteAPITests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="tester", password="password")
+        self.client.force_login(user)
+        self.url = reverse("tramites_api:elegibilidad-lote")
+
+    def test_lote_json(self):
+        response = self.client.post(
+            self.url,
+            {"fecha_analisis": "2025-06-01", "personas": CASOS["personas"][:3]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        datos = response.json()
+        self.assertEqual(datos["total"], 3)
+        self.assertEqual(datos["cumplen"], 1)
+        self.assertEqual(datos["resultados"][0]["fecha_minima"], "2025-01-01")
+
+    def test_lote_csv_agrupa_licencias_por_persona(self):
+        contenido = (
+            "id,ingreso,analisis,regimen,licencia_inicio,licencia_fin\n"
+            "A,2010-01-01,2025-01-02,issste,2020-01-10,2020-02-20\n"
+            "A,2010-01-01,2025-01-02,issste,2009-12-28,2010-01-25\n"
+            "B,2012-05-01,2025-01-02,imss,,\n"
+        )
+        archivo = SimpleUploadedFile("lote.csv", contenido.encode("utf-8"), content_type="text/csv")
+        response = self.client.post(self.url, {"archivo": archivo})
+        self.assertEqual(response.status_code, 200)
+        resultados = {fila["id"]: fila for fila in response.json()["resultados"]}
+        self.assertEqual(resultados["A"]["dias_validos"], 66)
+        self.assertEqual(resultados["B"]["licencias"], 0)
+        self.assertFalse(resultados["B"]["cumple"])
+
+    def test_fechas_invalidas_responden_400(self):
+        response = self.client.post(
+            self.url,
+            {"personas": [{"id": "X", "ingreso": "01/02/2010", "regimen": "otro"}]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()["errores"]), 2)
+
+    def test_tipos_inesperados_responden_400_con_el_registro(self):
+        casos = [
+            {"personas": [1]},
+            {"personas": [{"id": "X", "ingreso": "2010-01-01", "regimen": 5}]},
+            {"regimen": 5, "personas": [{"id": "X", "ingreso": "2010-01-01"}]},
+            {"personas": [{"id": "X", "ingreso": "2010-01-01", "licencias": ["x"]}]},
+            {"personas": [{"id": "X", "ingreso": "2010-01-01", "licencias": {"inicio": "2020-01-01"}}]},
+        ]
+        for datos in casos:
+            with self.subTest(datos=datos):
+                response = self.client.post(self.url, datos, content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(len(response.json()["errores"]), 1)
+        datos = {"personas": [{"id": "A", "ingreso": "2010-01-01"}, 1]}
+        response = self.client.post(self.url, datos, content_type="application/json")
+        self.assertIn("Registro 2", response.json()["errores"][0])
+
+    def test_csv_que_no_es_utf8_responde_400(self):
+        contenido = "id,ingreso\nÑ,2010-01-01\n".encode("latin-1")
+        archivo = SimpleUploadedFile("lote.csv", contenido, content_type="text/csv")
+        response = self.client.post(self.url, {"archivo": archivo})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("UTF-8", response.json()["errores"][0])
+
+    @override_settings(ELEGIBILIDAD_LOTE_MAXIMO=2)
+    def test_lote_limitado(self):
+        personas = [{"id": str(numero), "ingreso": "2010-01-01"} for numero in range(3)]
+        response = self.client.post(self.url, {"personas": personas}, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        archivo = SimpleUploadedFile(
+            "lote.csv", b"id,ingreso\nA,2010-01-01\nB,2010-01-01\nC,2010-01-01\n", content_type="text/csv"
+        )
+        self.assertEqual(self.client.post(self.url, {"archivo": archivo}).status_code, 400)
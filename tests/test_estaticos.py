@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils.http import http_date
+
+from tramites import estaticos
+
+
+class EstaticosTests(SimpleTestCase):
+    """collectstatic con hash y variantes comprimidas, y su entrega con caché inmutable."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(
+            STATIC_ROOT=self.tmpdir.name,
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+            STORAGES={**settings.STORAGES, "staticfiles": {"BACKEND": "tramites.estaticos.EstaticosComprimidosStorage"}},
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        estaticos.nombres_versionados.cache_clear()
+        self.addCleanup(estaticos.nombres_versionados.cache_clear)
+        call_command("collectstatic", interactive=False, verbosity=0)
+        self.raiz = Path(self.tmpdir.name)
+        self.css = staticfiles_storage.stored_name("css/components.css")
+        self.factory = RequestFactory()
+
+    def _get(self, ruta, **encabezados):
+        return estaticos.servir_estatico(self.factory.get(f"/static/{ruta}", **encabezados), ruta)
+
+    def test_collectstatic_genera_hash_y_variantes_comprimidas(self):
+        self.assertRegex(self.css, r"^css/components\.[0-9a-f]{12}\.css$")
+        original = (self.raiz / self.css).read_bytes()
+        self.assertEqual(gzip.decompress((self.raiz / f"{self.css}.gz").read_bytes()), original)
+        if estaticos.brotli is not None:
+            self.assertEqual(estaticos.brotli.decompress((self.raiz / f"{self.css}.br").read_bytes()), original)
+        self.assertFalse((self.raiz / "img/segey-logo-320.png.gz").exists())
+
+    def test_archivo_con_hash_se_sirve_comprimido_e_inmutable(self):
+        response = self._get(self.css, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertEqual(response["Cache-Control"], estaticos.CACHE_INMUTABLE)
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        contenido = b"".join(response.streaming_content)
+        self.assertEqual(gzip.decompress(contenido), (self.raiz / self.css).read_bytes())
+
+        revalidacion = self._get(self.css, HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(revalidacion.status_code, 304)
+
+    def test_nombre_sin_hash_se_revalida(self):
+        response = self._get("css/components.css", HTTP_ACCEPT_ENCODING="br;q=0")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response["Cache-Control"], estaticos.CACHE_SIN_HASH)
+
+        ultima = (self.raiz / "css/components.css").stat().st_mtime
+        self.assertEqual(self._get("css/components.css", HTTP_IF_MODIFIED_SINCE=http_date(ultima)).status_code, 304)
+
+    def test_rutas_fuera_de_static_root_dan_404(self):
+        with self.assertRaises(Http404):
+            self._get("../settings.py")
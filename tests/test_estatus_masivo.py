@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tramites import models
+from tramites.services import estatus_masivo
+
+
+class EstatusMasivoTests(TestCase):
+    def setUp(self):
+        self.cct = models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Secundaria Uno")
+        self.abierto = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        self.cerrado = models.EstatusCaso.objects.create(nombre="Cerrado", orden=2, es_cierre=True)
+        self.tipo = models.TipoProceso.objects.create(nombre="Queja")
+        self.usuario = get_user_model().objects.create_superuser(
+            username="admin", email="a@example.com", password="x"
+        )
+
+    def _casos(self, cantidad, estatus=None):
+        return [
+            models.CasoInterno.objects.create(
+                cct=self.cct,
+                fecha_apertura=date(2025, 3, 10),
+                estatus=estatus or self.abierto,
+                tipo_inicial=self.tipo,
+            )
+            for _ in range(cantidad)
+        ]
+
+    def test_actualiza_casos_bitacora_historial_y_tablero(self):
+        casos = self._casos(3) + self._casos(1, estatus=self.cerrado)
+        antes = {caso.pk: caso.actualizado_en for caso in casos}
+        resultado = estatus_masivo.cambiar_estatus(
+            models.CasoInterno.objects.all(), self.cerrado, usuario=self.usuario, comentario="Fin de ciclo"
+        )
+        self.assertEqual((resultado.actualizados, resultado.sin_cambio), (3, 1))
+        for caso in models.CasoInterno.objects.all():
+            self.assertEqual(caso.estatus, self.cerrado)
+            if caso.pk != casos[-1].pk:
+                self.assertGreater(caso.actualizado_en, antes[caso.pk])
+        cambios = models.HistorialEstatusCaso.objects.filter(comentario="Fin de ciclo")
+        self.assertEqual(cambios.count(), 3)
+        self.assertEqual(set(cambios.values_list("estatus_anterior", "usuario")), {(self.abierto.pk, self.usuario.pk)})
+        self.assertEqual(models.CasoInterno.history.filter(history_type="~", history_user=self.usuario).count(), 3)
+        self.assertTrue(
+            models.ConteoTablero.objects.filter(dimension=models.DIMENSION_ESTATUS, valor=str(self.cerrado.pk))
+            .filter(total=4, abiertos=0)
+            .exists()
+        )
+
+    def test_las_consultas_no_crecen_con_el_numero_de_casos(self):
+        self._casos(3)
+        with CaptureQueriesContext(connection) as pocos:
+            estatus_masivo.cambiar_estatus(models.CasoInterno.objects.all(), self.cerrado)
+        models.CasoInterno.objects.all().delete()
+        # En SQLite el historial (muchas columnas) se parte en más INSERT pasados ~20 casos.
+        self._casos(15)
+        with CaptureQueriesContext(connection) as muchos:
+            estatus_masivo.cambiar_estatus(models.CasoInterno.objects.all(), self.cerrado)
+        self.assertEqual(len(pocos), len(muchos))
+
+    def test_api_reporta_no_encontrados_y_valida_permisos(self):
+        caso = self._casos(1)[0]
+        url = reverse("tramites_api:casos-estatus-masivo")
+        lector = get_user_model().objects.create_user(username="lector", password="x")
+        lector.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(lector)
+        datos = {"casos": [caso.pk, 999999], "estatus": self.cerrado.pk}
+        self.assertEqual(self.client.post(url, datos, content_type="application/json").status_code, 403)
+
+        self.client.force_login(self.usuario)
+        response = self.client.post(url, datos, content_type="application/json")
+        self.assertEqual(response.json(), {"actualizados": 1, "sin_cambio": 0, "no_encontrados": [999999]})
+        with override_settings(ESTATUS_MASIVO_MAXIMO=1):
+            self.assertEqual(self.client.post(url, datos, content_type="application/json").status_code, 400)
+
+    def test_listado_aplica_a_los_seleccionados_o_a_todos_los_filtrados(self):
+        uno, dos = self._casos(2)
+        otro_estatus = models.EstatusCaso.objects.create(nombre="En espera", orden=3)
+        tercero = self._casos(1, estatus=otro_estatus)[0]
+        self.client.force_login(self.usuario)
+        url = reverse("tramites:casointerno-estatus-masivo")
+        self.assertContains(self.client.get(reverse("tramites:casointerno-list")), 'id="estatus-masivo-form"')
+
+        response = self.client.post(url, {"estatus": self.cerrado.pk, "casos": [uno.pk]})
+        self.assertRedirects(response, reverse("tramites:casointerno-list"), fetch_redirect_response=False)
+        dos.refresh_from_db()
+        self.assertEqual(dos.estatus, self.abierto)
+
+        response = self.client.post(f"{url}?estatus={self.abierto.pk}", {"estatus": self.cerrado.pk, "todos": "on"})
+        self.assertRedirects(
+            response, f"{reverse('tramites:casointerno-list')}?estatus={self.abierto.pk}", fetch_redirect_response=False
+        )
+        dos.refresh_from_db()
+        tercero.refresh_from_db()
+        self.assertEqual(dos.estatus, self.cerrado)
+        self.assertEqual(tercero.estatus, otro_estatus)
+
+        self.client.post(url, {"estatus": self.cerrado.pk})
+        self.assertEqual(models.CasoInterno.objects.filter(estatus=self.cerrado).count(), 2)
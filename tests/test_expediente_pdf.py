@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tramites import models
+from tramites.services import expediente_pdf, tareas
+
+
+class ExpedientePDFTests(TestCase):
+    """Expediente en PDF con caché en disco por versión del caso."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(EXPEDIENTES_PDF_ROOT=Path(self.tmpdir.name))
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(self.user)
+
+        cct = models.CCTSecundaria.objects.create(cct="ABC1234567", nombre="Secundaria Uno")
+        self.abierto = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        self.cerrado = models.EstatusCaso.objects.create(nombre="Cerrado", orden=2)
+        self.caso = models.CasoInterno.objects.create(
+            cct=cct,
+            cct_nombre=cct.nombre,
+            fecha_apertura=date.today(),
+            estatus=self.abierto,
+            tipo_inicial=models.TipoProceso.objects.create(nombre="Tipo A"),
+            asunto="Expediente",
+        )
+
+    def test_html_incluye_tramites_y_linea_de_tiempo(self):
+        models.HistorialEstatusCaso.objects.create(
+            caso=self.caso, estatus_anterior=self.abierto, estatus_nuevo=self.cerrado, comentario="Cierre"
+        )
+        html = expediente_pdf.render_expediente_html(self.caso)
+        self.assertIn("ABC1234567", html)
+        self.assertIn("Cierre", html)
+        self.assertIn("No hay trámites asociados al caso.", html)
+
+    def _pdf(self, url: str) -> bytes:
+        """Sin PDF en caché se solicita su generación; el worker lo genera y la descarga lo sirve."""
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        if response.status_code == 202:
+            response = self.client.post(response.json()["solicitar_url"], HTTP_ACCEPT="application/json")
+            tareas.procesar_pendientes()
+            estado = self.client.get(response.json()["estado_url"]).json()
+            response = self.client.get(estado["resultado_url"])
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        return b"".join(response.streaming_content)
+
+    @mock.patch.object(expediente_pdf, "_html_a_pdf", return_value=b"%PDF-1.7 prueba")
+    def test_vista_encola_y_reutiliza_pdf_hasta_que_cambia_el_caso(self, html_a_pdf):
+        url = reverse("tramites:casointerno-expediente-pdf", kwargs={"pk": self.caso.pk})
+        solicitar = reverse("tramites:casointerno-expediente-solicitar", kwargs={"pk": self.caso.pk})
+
+        # Un GET sin PDF no escribe: ofrece solicitarlo.
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 202)
+        self.assertContains(response, f'action="{solicitar}"', status_code=202)
+        self.assertFalse(models.TareaSegundoPlano.objects.exists())
+
+        self.client.post(solicitar)
+        # Pedirlo otra vez mientras sigue en cola no duplica la tarea.
+        self.client.post(solicitar)
+        self.assertEqual(models.TareaSegundoPlano.objects.count(), 1)
+        self.assertEqual(html_a_pdf.call_count, 0)
+
+        self.assertEqual(self._pdf(url), b"%PDF-1.7 prueba")
+        self.assertEqual(self._pdf(url), b"%PDF-1.7 prueba")
+        self.assertEqual(html_a_pdf.call_count, 1)
+        # El PDF no se copia a MEDIA_ROOT/tareas/.
+        self.assertFalse(models.TareaSegundoPlano.objects.get().resultado)
+
+        models.HistorialEstatusCaso.objects.create(
+            caso=self.caso, estatus_anterior=self.abierto, estatus_nuevo=self.cerrado
+        )
+        self._pdf(url)
+        self.assertEqual(html_a_pdf.call_count, 2)
+        # Solo se conserva la versión vigente del expediente.
+        self.assertEqual(len(list(Path(self.tmpdir.name).glob("caso-*/expediente-*.pdf"))), 1)
+
+    @mock.patch.object(expediente_pdf, "_html_a_pdf", side_effect=lambda html: html.encode("utf-8"))
+    def test_agregar_tramite_o_editar_comentario_renueva_el_pdf(self, html_a_pdf):
+        url = reverse("tramites:casointerno-expediente-pdf", kwargs={"pk": self.caso.pk})
+        cambio = models.HistorialEstatusCaso.objects.create(
+            caso=self.caso, estatus_anterior=self.abierto, estatus_nuevo=self.cerrado, comentario="Primera nota"
+        )
+        self.assertIn(b"Primera nota", self._pdf(url))
+
+        models.TramiteCaso.objects.create(
+            caso=self.caso, tipo=self.caso.tipo_inicial, fecha=date.today(), asunto="Oficio agregado"
+        )
+        self.assertIn(b"Oficio agregado", self._pdf(url))
+
+        self.user.user_permissions.add(
+            Permission.objects.get(codename="change_casointerno", content_type__app_label="licencias")
+        )
+        editar = reverse("tramites:casointerno-estatus-update", args=[self.caso.pk, cambio.pk])
+        self.client.post(editar, {"estatus_nuevo": self.cerrado.pk, "comentario": "Nota corregida"})
+        self.assertIn(b"Nota corregida", self._pdf(url))
+        self.assertEqual(html_a_pdf.call_count, 3)
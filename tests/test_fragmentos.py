@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tramites import models
+from tramites.cache import cache_de
+from tramites.services import fragmentos
+
+
+class FragmentosTests(TestCase):
+    def setUp(self):
+        caches["fragmentos"].clear()
+        cache_de("fragmentos").reiniciar_metricas()
+        cct = models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Secundaria Uno")
+        self.estatus = models.EstatusCaso.objects.create(nombre="Abierto")
+        self.tipo = models.TipoProceso.objects.create(nombre="Queja")
+        self.caso = models.CasoInterno.objects.create(
+            cct=cct, fecha_apertura=date(2025, 3, 10), estatus=self.estatus, tipo_inicial=self.tipo
+        )
+        models.TramiteCaso.objects.create(caso=self.caso, tipo=self.tipo, fecha=date(2025, 3, 11), asunto="Oficio 1")
+        self.client.force_login(
+            get_user_model().objects.create_superuser(username="admin", email="a@example.com", password="x")
+        )
+
+    def test_detalle_reutiliza_bitacora_y_tramites_hasta_que_cambian(self):
+        url = reverse("tramites:casointerno-detail", args=[self.caso.pk])
+        self.assertContains(self.client.get(url), "Oficio 1")
+        self.assertEqual(cache_de("fragmentos").metricas()["fallos"], 2)
+        # Dos menos: bitácora y trámites salen del fragmento. La generación se consulta una sola vez
+        # para el ETag y los dos fragmentos.
+        with CaptureQueriesContext(connection) as consultas, self.assertNumQueries(13):
+            self.assertContains(self.client.get(url), "Oficio 1")
+        self.assertEqual(cache_de("fragmentos").metricas()["aciertos"], 2)
+        self.assertEqual(sum("UNION ALL" in consulta["sql"] for consulta in consultas), 1)
+
+        models.TramiteCaso.objects.create(caso=self.caso, tipo=self.tipo, fecha=date(2025, 3, 12), asunto="Oficio 2")
+        self.assertContains(self.client.get(url), "Oficio 2")
+
+    @override_settings(CACHE_COMPARTIDA=True)
+    def test_con_cache_compartida_la_generacion_no_consulta_la_base(self):
+        url = reverse("tramites:casointerno-detail", args=[self.caso.pk])
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as consultas:
+            self.client.get(url)
+        self.assertFalse(any("UNION ALL" in consulta["sql"] for consulta in consultas))
+
+    @override_settings(CACHE_COMPARTIDA=True)
+    def test_renombrar_un_catalogo_invalida_los_fragmentos(self):
+        url = reverse("tramites:casointerno-list")
+        self.assertContains(self.client.get(url), "Queja")
+        self.tipo.nombre = "Denuncia"
+        self.tipo.save()
+        response = self.client.get(url)
+        self.assertContains(response, "Denuncia")
+        self.assertNotContains(response, "Queja")
+
+    @override_settings(CACHE_COMPARTIDA=False)
+    def test_sin_cache_compartida_la_generacion_sale_de_la_base(self):
+        url = reverse("tramites:casointerno-list")
+        self.assertContains(self.client.get(url), "Queja")
+        generacion = fragmentos._backend().get(fragmentos.CLAVE_GENERACION)
+        self.tipo.nombre = "Denuncia"
+        self.tipo.save()
+        # Otro worker con caché local no ve la generación renovada por la señal.
+        fragmentos._backend().set(fragmentos.CLAVE_GENERACION, generacion, timeout=None)
+        self.assertContains(self.client.get(url), "Denuncia")
+
+    def test_las_filas_del_listado_cambian_con_el_caso(self):
+        url = reverse("tramites:casointerno-list")
+        self.client.get(url)
+        self.caso.asesor_cct = "Asesor nuevo"
+        self.caso.save()
+        self.assertContains(self.client.get(url), "Asesor nuevo")
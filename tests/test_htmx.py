@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tramites import models
+
+HTMX = {"HTTP_HX_REQUEST": "true"}
+
+
+class ParcialesHtmxTests(TestCase):
+    def setUp(self):
+        cct = models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Secundaria Uno")
+        self.abierto = models.EstatusCaso.objects.create(nombre="Abierto")
+        self.cerrado = models.EstatusCaso.objects.create(nombre="Cerrado")
+        self.tipo = models.TipoProceso.objects.create(nombre="Queja")
+        self.estatus_tramite = models.EstatusTramite.objects.create(nombre="En revisión")
+        self.caso = models.CasoInterno.objects.create(
+            cct=cct, fecha_apertura=date(2025, 3, 10), estatus=self.abierto, tipo_inicial=self.tipo
+        )
+        self.usuario = get_user_model().objects.create_superuser(username="admin", email="a@example.com", password="x")
+        self.client.force_login(self.usuario)
+
+    def test_cambio_de_estatus_responde_solo_la_bitacora(self):
+        url = reverse("tramites:casointerno-estatus-create", args=[self.caso.pk])
+        response = self.client.post(url, {"estatus_nuevo": self.cerrado.pk, "comentario": "Se cierra"}, **HTMX)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "tramites/partials/respuesta_caso_historial.html")
+        self.assertTemplateNotUsed(response, "tramites/tramites/tramites_detail.html")
+        self.assertContains(response, 'id="caso-historial"')
+        self.assertContains(response, "Se cierra")
+        self.assertContains(response, 'id="caso-estatus" hx-swap-oob="true"')
+        self.assertContains(response, "Estatus del trámite actualizado.")
+
+        sin_htmx = self.client.post(url, {"estatus_nuevo": self.abierto.pk})
+        self.assertRedirects(
+            sin_htmx, reverse("tramites:casointerno-detail", args=[self.caso.pk]), fetch_redirect_response=False
+        )
+
+    def test_formulario_invalido_no_reemplaza_la_tabla(self):
+        url = reverse("tramites:casointerno-estatus-create", args=[self.caso.pk])
+        response = self.client.post(url, {"estatus_nuevo": ""}, **HTMX)
+        self.assertEqual(response["HX-Reswap"], "none")
+        self.assertContains(response, "No se pudo registrar el cambio de estatus.")
+        self.assertNotContains(response, 'id="caso-historial"')
+
+    def test_eliminar_el_ultimo_cambio_revierte_el_estatus(self):
+        cambio = models.HistorialEstatusCaso.objects.create(
+            caso=self.caso, usuario=self.usuario, estatus_anterior=self.abierto, estatus_nuevo=self.cerrado
+        )
+        self.caso.estatus = self.cerrado
+        self.caso.save()
+        url = reverse("tramites:casointerno-estatus-delete", args=[self.caso.pk, cambio.pk])
+        response = self.client.post(url, **HTMX)
+        self.assertContains(response, "No hay cambios de estatus registrados.")
+        self.caso.refresh_from_db()
+        self.assertEqual(self.caso.estatus, self.abierto)
+
+    def test_agregar_tramite_responde_la_tabla_y_avisa_al_modal(self):
+        url = reverse("tramites:tramite-caso-create", args=[self.caso.pk])
+        datos = {
+            "tramite_caso-tipo": self.tipo.pk,
+            "tramite_caso-estatus": self.estatus_tramite.pk,
+            "tramite_caso-fecha": "2025-03-11",
+            "tramite_caso-asunto": "Oficio 1",
+            "tramite_caso-receptores_adicionales": "[]",
+        }
+        response = self.client.post(url, datos, **HTMX)
+        self.assertEqual(response["HX-Trigger"], "tramite-caso-agregado")
+        self.assertContains(response, 'id="caso-tramites"')
+        self.assertContains(response, "Oficio 1")
+
+        response = self.client.post(url, {}, **HTMX)
+        self.assertEqual(response["HX-Reswap"], "none")
+        self.assertContains(response, "No se pudo agregar el trámite.")
+
+    def test_cambio_de_estatus_de_tramite(self):
+        tramite = models.TramiteCaso.objects.create(caso=self.caso, tipo=self.tipo, fecha=date(2025, 3, 11))
+        otro = models.EstatusTramite.objects.create(nombre="Concluido")
+        url = reverse("tramites:tramite-caso-estatus-create", args=[self.caso.pk, tramite.pk])
+        response = self.client.post(url, {"estatus_nuevo": otro.pk}, **HTMX)
+        self.assertContains(response, 'id="tramite-historial"')
+        self.assertContains(response, 'id="tramite-estatus" hx-swap-oob="true"')
+        self.assertContains(response, "Concluido")
+
+    def test_eliminar_tramite_y_caso_avisan_con_mensaje(self):
+        tramite = models.TramiteCaso.objects.create(caso=self.caso, tipo=self.tipo, fecha=date(2025, 3, 11))
+        response = self.client.post(
+            reverse("tramites:tramite-caso-delete", args=[self.caso.pk, tramite.pk]), follow=True
+        )
+        self.assertContains(response, "Trámite eliminado.")
+        self.assertFalse(models.TramiteCaso.objects.exists())
+
+        response = self.client.post(reverse("tramites:casointerno-delete", args=[self.caso.pk]), follow=True)
+        self.assertContains(response, "Trámite eliminado.")
+        self.assertFalse(models.CasoInterno.objects.exists())
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from tramites.templatetags import js_tags
+
+PLANTILLA = Template("{% load js_tags %}{% modulo_js 'js/app.js' %}")
+
+
+class ModuloJsTests(SimpleTestCase):
+    @override_settings(JS_USAR_BUNDLES=False)
+    def test_sin_bundles_apunta_al_modulo_fuente(self):
+        self.assertEqual(PLANTILLA.render(Context()), "/static/js/app.js")
+
+    @override_settings(JS_USAR_BUNDLES=True, DEBUG=True)
+    def test_con_manifiesto_apunta_al_bundle(self):
+        with mock.patch.object(js_tags, "_leer_manifiesto", return_value={"js/app.js": "dist/app-3F2A.js"}):
+            self.assertEqual(PLANTILLA.render(Context()), "/static/dist/app-3F2A.js")
+
+    @override_settings(JS_USAR_BUNDLES=True, DEBUG=True)
+    def test_sin_compilar_usa_el_modulo_fuente(self):
+        with mock.patch.object(js_tags, "_leer_manifiesto", return_value={}):
+            self.assertEqual(PLANTILLA.render(Context()), "/static/js/app.js")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tramites import metricas, models
+
+
+class MetricasTests(TestCase):
+    def setUp(self):
+        metricas.registro.reiniciar()
+        self.addCleanup(metricas.registro.reiniciar)
+        models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Ermilo Abreu Gómez")
+        self.staff = get_user_model().objects.create_user(username="staff", password="x", is_staff=True)
+
+    def test_server_timing_y_serie_por_nombre_de_ruta(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("tramites_api:cct-list"))
+        self.assertRegex(response["Server-Timing"], r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ consultas", tpl;dur=')
+
+        texto = self.client.get(reverse("metricas")).content.decode()
+        etiquetas = '{vista="tramites_api:cct-list",metodo="GET",codigo="2xx"}'
+        self.assertIn(f"tramites_peticiones_total{etiquetas} 1", texto)
+        self.assertIn("# TYPE tramites_peticion_segundos histogram", texto)
+        self.assertRegex(texto, r'tramites_consultas_db_total\{vista="tramites_api:cct-list".*\} [1-9]')
+        self.assertNotIn('vista="metricas"', texto)
+
+    def test_tiempo_de_plantilla_en_vistas_con_template_response(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("login"))
+        serie = metricas.registro.copia()[("login", "GET", "2xx")]
+        self.assertGreater(serie.plantilla_segundos, 0)
+        self.assertEqual(serie.bytes, len(response.content))
+
+    @override_settings(METRICAS_TOKEN="secreto")
+    def test_metrics_requiere_personal_o_token(self):
+        self.assertEqual(self.client.get(reverse("metricas")).status_code, 403)
+        response = self.client.get(reverse("metricas"), HTTP_AUTHORIZATION="Bearer secreto")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+
+    @override_settings(METRICAS_ACTIVAS=False)
+    def test_desactivado_no_mide_ni_publica(self):
+        response = self.client.get(reverse("login"))
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(metricas.registro.copia(), {})
+        self.assertEqual(self.client.get(reverse("metricas")).status_code, 404)
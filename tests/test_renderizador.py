@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django import forms as dj_forms
+from django.forms.renderers import DjangoTemplates
+from django.template import Context, Template
+from django.test import TestCase
+
+from tramites import forms, models
+from tramites.renderizador import RenderizadorFormularios
+
+
+class _Variado(dj_forms.Form):
+    texto = dj_forms.CharField(max_length=10, widget=dj_forms.TextInput(attrs={"data-x": '"<&>"', "disabled": True}))
+    numero = dj_forms.IntegerField()
+    clave = dj_forms.CharField(widget=dj_forms.PasswordInput)
+    notas = dj_forms.CharField(widget=dj_forms.Textarea)
+    grupo = dj_forms.ChoiceField(choices=[("A", [("1", "Uno & dos"), ("2", 2)]), ("3", "<tres>")])
+    activo = dj_forms.BooleanField(required=False)
+
+
+def _html(formulario_cls, renderer, **kwargs) -> str:
+    return "".join(str(campo) for campo in formulario_cls(renderer=renderer, **kwargs))
+
+
+class RenderizadorFormulariosTests(TestCase):
+    def test_mismo_html_que_django(self):
+        estatus = models.EstatusTramite.objects.create(nombre='En "revisión" <1>')
+        models.TipoProceso.objects.create(nombre="Queja & denuncia")
+        casos = [
+            (_Variado, {}),
+            (_Variado, {"data": {"texto": "<b>demasiado largo</b>", "numero": "x", "notas": "a\nb", "grupo": "2"}}),
+            (forms.CasoInternoForm, {}),
+            (forms.CasoInternoForm, {"data": {"cct_codigo": "31EES0001H", "asunto": "<script>"}}),
+            (
+                forms.TramiteCasoForm,
+                {"prefix": "tramite_caso", "initial": {"estatus": estatus.pk, "fecha": date(2025, 3, 1)}},
+            ),
+            (forms.HistorialEstatusCasoForm, {}),
+        ]
+        for formulario_cls, kwargs in casos:
+            with self.subTest(formulario=formulario_cls.__name__, datos="data" in kwargs):
+                self.assertEqual(
+                    _html(formulario_cls, RenderizadorFormularios(), **kwargs),
+                    _html(formulario_cls, DjangoTemplates(), **kwargs),
+                )
+
+    def test_clases_css_definidas_en_la_clase(self):
+        formulario = forms.TramiteCasoForm()
+        self.assertIn("form-input", formulario.fields["asunto"].widget.attrs["class"].split())
+        self.assertEqual(formulario.fields["estatus"].widget.attrs["data-estatus-api"], "/api/estatus-tramite/")
+        self.assertNotIn("form-input", forms.CasoInternoForm().fields["cct"].widget.attrs.get("class", ""))
+
+    def test_add_class_conserva_los_atributos_del_widget(self):
+        formulario = _Variado()
+        html = Template('{% load form_tags %}{{ form.texto|add_class:"form-input" }}').render(
+            Context({"form": formulario})
+        )
+        self.assertIn('class="form-input"', html)
+        self.assertIn('maxlength="10"', html)
+        self.assertIn("data-x=", html)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from tramites import models, views
+from tramites.replicas import REPLICA_COOKIE, ReplicaMiddleware, RouterReplica, lecturas_en_replica
+
+router = RouterReplica()
+
+
+@override_settings(REPLICA_LECTURA=True, REPLICA_PEGAJOSA_SEGUNDOS=15)
+@mock.patch("tramites.replicas.replica_utilizable", return_value=True)
+class RouterReplicaTests(SimpleTestCase):
+    def _peticion(self, request, vista, escribir=False):
+        """Pasa la petición por el middleware y devuelve (alias de lectura, respuesta)."""
+        leido = {}
+
+        def get_response(request):
+            middleware.process_view(request, vista, (), {})
+            if escribir:
+                router.db_for_write(models.CasoInterno)
+            leido["alias"] = router.db_for_read(models.CasoInterno)
+            return HttpResponse()
+
+        middleware = ReplicaMiddleware(get_response)
+        response = middleware(request)
+        return leido["alias"], response
+
+    def test_fuera_de_una_peticion_se_lee_de_la_primaria(self, _utilizable):
+        self.assertEqual(router.db_for_read(models.CasoInterno), "default")
+        with lecturas_en_replica():
+            self.assertEqual(router.db_for_read(models.CasoInterno), "replica")
+            self.assertEqual(router.db_for_write(models.CasoInterno), "default")
+            self.assertEqual(router.db_for_read(models.CasoInterno), "default")
+
+    def test_solo_get_de_vistas_marcadas_usa_la_replica(self, _utilizable):
+        factory = RequestFactory()
+        listado = views.CasoInternoListView.as_view()
+        self.assertEqual(self._peticion(factory.get("/"), listado)[0], "replica")
+        self.assertEqual(self._peticion(factory.post("/"), listado)[0], "default")
+        self.assertEqual(self._peticion(factory.get("/"), views.CasoInternoUpdateView.as_view())[0], "default")
+        api = views.TramiteCasoViewSet.as_view({"get": "list"})
+        self.assertEqual(self._peticion(factory.get("/"), api)[0], "replica")
+
+    def test_escritura_fija_la_primaria_un_momento(self, _utilizable):
+        factory = RequestFactory()
+        listado = views.CasoInternoListView.as_view()
+        alias, response = self._peticion(factory.get("/"), listado, escribir=True)
+        self.assertEqual(alias, "default")
+        self.assertEqual(response.cookies[REPLICA_COOKIE]["max-age"], 15)
+
+        request = factory.get("/")
+        request.COOKIES[REPLICA_COOKIE] = "1"
+        alias, response = self._peticion(request, listado)
+        self.assertEqual(alias, "default")
+        self.assertNotIn(REPLICA_COOKIE, response.cookies)
+
+
+class ReplicaNoUtilizableTests(SimpleTestCase):
+    def test_sin_alias_o_con_espejo_se_lee_de_la_primaria(self):
+        with lecturas_en_replica():
+            self.assertEqual(router.db_for_read(models.CasoInterno), "default")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tramites import models
+from tramites.services import versiones
+
+
+class RespuestasCondicionalesTests(TestCase):
+    def setUp(self):
+        self.cct = models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Secundaria Uno")
+        self.estatus = models.EstatusCaso.objects.create(nombre="Abierto")
+        self.tipo = models.TipoProceso.objects.create(nombre="Queja")
+        self.caso = models.CasoInterno.objects.create(
+            cct=self.cct, fecha_apertura=date(2025, 3, 10), estatus=self.estatus, tipo_inicial=self.tipo
+        )
+        self.tramite = models.TramiteCaso.objects.create(caso=self.caso, tipo=self.tipo, fecha=date(2025, 3, 11))
+        self.user = get_user_model().objects.create_superuser(username="admin", email="a@example.com", password="x")
+        self.client.force_login(self.user)
+
+    def test_detalle_de_caso_responde_304_con_solo_la_version(self):
+        url = reverse("tramites:casointerno-detail", args=[self.caso.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("private", response["Cache-Control"])
+        etag = response["ETag"]
+
+        # Sesión, usuario, versión y generación de catálogos (sin caché compartida sale de la base).
+        with self.assertNumQueries(4):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_la_version_cambia_con_tramites_y_bitacora(self):
+        inicial = versiones.version_caso(self.caso.pk)
+        self.tramite.delete()
+        sin_tramite = versiones.version_caso(self.caso.pk)
+        self.assertNotEqual(inicial.huella, sin_tramite.huella)
+        models.HistorialEstatusCaso.objects.create(caso=self.caso, estatus_nuevo=self.estatus)
+        self.assertNotEqual(sin_tramite.huella, versiones.version_caso(self.caso.pk).huella)
+        self.assertIsNone(versiones.version_caso(self.caso.pk + 100))
+
+    def test_detalle_de_tramite_y_otro_usuario(self):
+        url = reverse("tramites:tramite-caso-detail", args=[self.caso.pk, self.tramite.pk])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        models.HistorialEstatusTramiteCaso.objects.create(
+            tramite=self.tramite, estatus_nuevo=models.EstatusTramite.objects.create(nombre="En curso")
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        otro = get_user_model().objects.create_superuser(username="otro", email="o@example.com", password="x")
+        self.client.force_login(otro)
+        etag = self.client.get(url)["ETag"]
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_retrieve_de_la_api(self):
+        self.client.logout()
+        url = reverse("tramites_api:tramite-caso-detail", args=[self.tramite.pk])
+        autorizacion = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.user)}"}
+        response = self.client.get(url, **autorizacion)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        # Usuario del token y versión del registro; la API no depende de la generación de catálogos.
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag, **autorizacion).status_code, 304)
+
+        self.tramite.asunto = "Cambio"
+        self.tramite.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **autorizacion)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["asunto"], "Cambio")
+
+    def test_editar_un_catalogo_cambia_el_etag(self):
+        url = reverse("tramites:casointerno-detail", args=[self.caso.pk])
+        etag = self.client.get(url)["ETag"]
+        self.estatus.nombre = "Recibido"
+        self.estatus.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Recibido")
+
+    def test_con_mensajes_pendientes_no_responde_304(self):
+        url = reverse("tramites:casointerno-detail", args=[self.caso.pk])
+        etag = self.client.get(url)["ETag"]
+        # Sin JS, solicitar el expediente redirige al detalle con un mensaje.
+        self.client.post(reverse("tramites:casointerno-expediente-solicitar", args=[self.caso.pk]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+        self.assertTrue(list(response.context["messages"]))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+
+from tramites import models
+from tramites.services import tablero
+
+
+def _conteos():
+    return set(
+        models.ConteoTablero.objects.filter(total__gt=0).values_list("dimension", "valor", "total", "abiertos")
+    )
+
+
+class TableroTests(TestCase):
+    """Los conteos incrementales deben coincidir con un recálculo completo."""
+
+    def setUp(self):
+        self.cct = models.CCTSecundaria.objects.create(
+            cct="ABC1234567", nombre="Secundaria Uno", asesor="Asesor 1", sostenimiento="Estatal"
+        )
+        self.abierto = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        self.cerrado = models.EstatusCaso.objects.create(nombre="Cerrado", orden=2, es_cierre=True)
+        self.tipo = models.TipoProceso.objects.create(nombre="Tipo A")
+
+    def _crear_caso(self, **extra):
+        datos = {
+            "cct": self.cct,
+            "cct_nombre": self.cct.nombre,
+            "cct_sistema": "ESTATAL",
+            "asesor_cct": "Asesor 1",
+            "fecha_apertura": date(2025, 3, 10),
+            "estatus": self.abierto,
+            "tipo_inicial": self.tipo,
+        }
+        datos.update(extra)
+        return models.CasoInterno.objects.create(**datos)
+
+    def test_altas_cambios_y_bajas_mantienen_los_conteos(self):
+        primero = self._crear_caso()
+        segundo = self._crear_caso(asesor_cct="Asesor 2", fecha_apertura=date(2025, 4, 1))
+        self.assertIn(("asesor", "Asesor 1", 1, 1), _conteos())
+        self.assertIn(("mes", "2025-03", 1, 1), _conteos())
+
+        primero.estatus = self.cerrado
+        primero.save()
+        segundo.delete()
+        self.assertIn(("estatus", str(self.cerrado.pk), 1, 0), _conteos())
+        self.assertIn(("asesor", "Asesor 1", 1, 0), _conteos())
+        self.assertNotIn("Asesor 2", {valor for _d, valor, _t, _a in _conteos()})
+
+        incremental = _conteos()
+        tablero.recalcular_tablero()
+        self.assertEqual(incremental, _conteos())
+
+    def test_cambiar_es_cierre_reclasifica_los_casos(self):
+        self._crear_caso()
+        self.abierto.es_cierre = True
+        self.abierto.save()
+        self.assertIn(("asesor", "Asesor 1", 1, 0), _conteos())
+
+    def test_vista_tablero_lee_conteos_precalculados(self):
+        self._crear_caso()
+        user = get_user_model().objects.create_user(username="tester", password="password")
+        user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(user)
+        # Sesión, usuario, permisos (2), nombres de estatus y conteos; sin GROUP BY sobre los casos.
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse("tramites:tablero-resumen"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["estatus"][0]["etiqueta"], "Abierto")
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from tramites import models
+from tramites.services import tareas
+
+
+class TareasSegundoPlanoTests(TestCase):
+    """Cola de tareas: encolado desde la vista, worker y consulta de estado."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(MEDIA_ROOT=self.tmpdir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(self.user)
+
+        cct = models.CCTSecundaria.objects.create(cct="ABC1234567", nombre="Secundaria Uno")
+        estatus = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        tipo = models.TipoProceso.objects.create(nombre="Tipo A")
+        for asunto in ("Primero", "Segundo"):
+            models.CasoInterno.objects.create(
+                cct=cct,
+                cct_nombre=cct.nombre,
+                fecha_apertura=date.today(),
+                estatus=estatus,
+                tipo_inicial=tipo,
+                asunto=asunto,
+            )
+
+    def test_exportacion_se_encola_y_el_worker_genera_el_csv(self):
+        response = self.client.post(
+            reverse("tramites:casointerno-exportar") + "?buscar=Primero",
+            HTTP_ACCEPT="application/json",
+        )
+        self.assertEqual(response.status_code, 202)
+        estado_url = response.json()["estado_url"]
+        self.assertEqual(self.client.get(estado_url).json()["estatus"], models.TAREA_PENDIENTE)
+
+        self.assertEqual(tareas.procesar_pendientes(), 1)
+
+        estado = self.client.get(estado_url).json()
+        self.assertEqual(estado["estatus"], models.TAREA_COMPLETADA)
+        descarga = self.client.get(estado["resultado_url"])
+        contenido = b"".join(descarga.streaming_content).decode("utf-8-sig")
+        self.assertIn("Primero", contenido)
+        self.assertNotIn("Segundo", contenido)
+
+    def test_tarea_fallida_registra_el_error(self):
+        tarea = tareas.encolar_tarea("expediente_pdf", {"caso": 999999}, usuario=self.user)
+        tareas.procesar_pendientes()
+        tarea.refresh_from_db()
+        self.assertEqual(tarea.estatus, models.TAREA_FALLIDA)
+        self.assertIn("DoesNotExist", tarea.mensaje_error)
+
+    def test_estado_no_visible_para_otro_usuario(self):
+        tarea = tareas.encolar_tarea("exportar_tramites", usuario=self.user)
+        otro = get_user_model().objects.create_user(username="otro", password="password")
+        self.client.force_login(otro)
+        response = self.client.get(reverse("tramites:tarea-estado", kwargs={"pk": tarea.pk}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_tareas_terminadas_vencidas_se_borran_con_su_archivo(self):
+        vieja = tareas.encolar_tarea("exportar_tramites", {"filtros": ""}, usuario=self.user)
+        reciente = tareas.encolar_tarea("exportar_tramites", {"filtros": ""}, usuario=self.user)
+        pendiente_vieja = tareas.encolar_tarea("exportar_tramites", {"filtros": "buscar=x"}, usuario=self.user)
+        tareas.procesar_pendientes(limite=2)
+        vieja.refresh_from_db()
+        archivo = Path(vieja.resultado.path)
+        self.assertTrue(archivo.exists())
+        models.TareaSegundoPlano.objects.filter(pk=vieja.pk).update(terminado_en=timezone.now() - timedelta(days=8))
+        models.TareaSegundoPlano.objects.filter(pk=pendiente_vieja.pk).update(
+            creado_en=timezone.now() - timedelta(days=8)
+        )
+
+        with override_settings(TAREAS_CONSERVAR=timedelta(days=7)):
+            self.assertEqual(tareas.limpiar_tareas_terminadas(), 1)
+        self.assertFalse(archivo.exists())
+        self.assertEqual(
+            set(models.TareaSegundoPlano.objects.values_list("pk", flat=True)), {reciente.pk, pendiente_vieja.pk}
+        )
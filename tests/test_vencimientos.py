@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from tramites import models
+from tramites.services import vencimientos
+
+
+class VencimientosTests(TestCase):
+    """Las consultas de vencimiento filtran y calculan días en la base de datos."""
+
+    def setUp(self):
+        self.hoy = timezone.localdate()
+        self.cct = models.CCTSecundaria.objects.create(cct="ABC1234567", nombre="Secundaria Uno")
+        self.abierto = models.EstatusCaso.objects.create(nombre="Abierto", orden=1)
+        self.cerrado = models.EstatusCaso.objects.create(nombre="Cerrado", orden=2, es_cierre=True)
+        self.tipo = models.TipoProceso.objects.create(nombre="Tipo A")
+        self.vencido = self._crear_caso(-3, asesor_cct="Asesor 1")
+        self.hoy_caso = self._crear_caso(0, asesor_cct="Asesor 1")
+        self.proximo = self._crear_caso(5, asesor_cct="Asesor 2")
+        self._crear_caso(30, asesor_cct="Asesor 2")
+        self._crear_caso(2, asesor_cct="Asesor 1", estatus=self.cerrado)
+        self._crear_caso(None, asesor_cct="Asesor 1")
+
+    def _crear_caso(self, dias, **extra):
+        datos = {
+            "cct": self.cct,
+            "cct_nombre": self.cct.nombre,
+            "fecha_apertura": date(2025, 1, 10),
+            "fecha_termino": None if dias is None else self.hoy + timedelta(days=dias),
+            "estatus": self.abierto,
+            "tipo_inicial": self.tipo,
+        }
+        datos.update(extra)
+        return models.CasoInterno.objects.create(**datos)
+
+    def test_casos_por_vencer_calcula_dias_en_sql(self):
+        casos = list(vencimientos.casos_por_vencer(7, hoy=self.hoy))
+        self.assertEqual([caso.pk for caso in casos], [self.vencido.pk, self.hoy_caso.pk, self.proximo.pk])
+        self.assertEqual([caso.dias_restantes for caso in casos], [-3, 0, 5])
+        self.assertEqual([caso.dias_para_termino for caso in casos], [-3, 0, 5])
+
+        sin_vencidos = vencimientos.casos_por_vencer(7, hoy=self.hoy, incluir_vencidos=False)
+        self.assertEqual(sin_vencidos.count(), 2)
+
+    def test_resumen_por_asesor(self):
+        alertas = {alerta.asesor: alerta for alerta in vencimientos.resumen_por_asesor(7, hoy=self.hoy)}
+        self.assertEqual(
+            (alertas["Asesor 1"].vencidos, alertas["Asesor 1"].vencen_hoy, alertas["Asesor 1"].proximos), (1, 1, 0)
+        )
+        self.assertEqual(alertas["Asesor 2"].total, 1)
+
+    def test_vista_y_api(self):
+        user = get_user_model().objects.create_user(username="tester", password="password")
+        user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("tramites:vencimientos"), {"dias": 7, "asesor": "Asesor 1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([caso.pk for caso in response.context["casos"]], [self.vencido.pk, self.hoy_caso.pk])
+
+        datos = self.client.get(reverse("tramites_api:vencimiento-list"), {"dias": 7}).json()
+        filas = datos["results"] if isinstance(datos, dict) else datos
+        self.assertEqual([fila["dias_restantes"] for fila in filas], [-3, 0, 5])
+
+        resumen = self.client.get(reverse("tramites_api:vencimiento-resumen"), {"dias": 7}).json()
+        self.assertEqual(resumen["asesores"][0]["asesor"], "Asesor 1")
+
+    def test_tramites_por_vencer_en_la_api(self):
+        cerrado = models.EstatusTramite.objects.create(nombre="Concluido", es_cierre=True)
+        abierto = models.EstatusTramite.objects.create(nombre="En curso")
+        comunes = {"caso": self.vencido, "tipo": self.tipo, "fecha": date(2025, 1, 11)}
+        vence = models.TramiteCaso.objects.create(
+            fecha_termino=self.hoy + timedelta(days=1), estatus=abierto, **comunes
+        )
+        sin_estatus = models.TramiteCaso.objects.create(fecha_termino=self.hoy - timedelta(days=2), **comunes)
+        models.TramiteCaso.objects.create(fecha_termino=self.hoy, estatus=cerrado, **comunes)
+        models.TramiteCaso.objects.create(fecha_termino=self.hoy + timedelta(days=30), **comunes)
+        models.TramiteCaso.objects.create(
+            caso=self.proximo, tipo=self.tipo, fecha=date(2025, 1, 11), fecha_termino=self.hoy
+        )
+
+        user = get_user_model().objects.create_user(username="tester", password="password")
+        self.client.force_login(user)
+        url = reverse("tramites_api:vencimiento-tramites")
+        datos = self.client.get(url, {"dias": 7, "asesor": "Asesor 1"}).json()
+        filas = datos["results"] if isinstance(datos, dict) else datos
+        self.assertEqual([fila["id"] for fila in filas], [sin_estatus.pk, vence.pk])
+        self.assertEqual([fila["dias_restantes"] for fila in filas], [-2, 1])
+        self.assertEqual([fila["estatus"] for fila in filas], [None, "En curso"])
+
+    def test_enlace_sin_asesor_filtra_los_casos_sin_asesor(self):
+        sin_asesor = self._crear_caso(1, asesor_cct="")
+        user = get_user_model().objects.create_user(username="tester", password="password")
+        user.user_permissions.set(
+            Permission.objects.filter(codename="view_casointerno", content_type__app_label="licencias")
+        )
+        self.client.force_login(user)
+        response = self.client.get(reverse("tramites:vencimientos"), {"dias": 7})
+        alerta = next(alerta for alerta in response.context["alertas"] if alerta.asesor == "Sin asesor")
+        self.assertContains(response, f"asesor={alerta.clave}")
+
+        response = self.client.get(reverse("tramites:vencimientos"), {"dias": 7, "asesor": alerta.clave})
+        self.assertEqual([caso.pk for caso in response.context["casos"]], [sin_asesor.pk])
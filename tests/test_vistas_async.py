@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from datetime import date, timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tramites import metricas, models
+
+
+class VistasAsyncTests(TestCase):
+    def setUp(self):
+        for espacio in ("catalogos", "ccts"):
+            caches[espacio].clear()
+        self.cct = models.CCTSecundaria.objects.create(
+            cct="31EES0001H", nombre="Ermilo Abreu Gómez", sostenimiento="FEDERAL TRANSFERIDO", municipio="Mérida"
+        )
+        self.user = get_user_model().objects.create_user(username="tester", password="password")
+        self.user.user_permissions.set(
+            Permission.objects.filter(
+                codename__in=("add_casointerno", "view_casointerno"), content_type__app_label="licencias"
+            )
+        )
+        self.async_client.force_login(self.user)
+
+    async def test_consulta_de_cct(self):
+        response = await self.async_client.get(reverse("tramites:cct-lookup"), {"cct": "31ees0001h"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["c_nombre"], "Ermilo Abreu Gómez")
+        response = await self.async_client.get(reverse("tramites:cct-lookup"), {"cct": "31EES9999Z"})
+        self.assertEqual(response.json(), {"found": False})
+
+    async def test_sugerencias_por_clave_nombre_o_municipio(self):
+        for termino in ("31EES", "ermilo", "mérida"):
+            response = await self.async_client.get(reverse("tramites:cct-sugerencias"), {"search": termino})
+            self.assertEqual([fila["cct"] for fila in response.json()["results"]], ["31EES0001H"])
+        self.assertEqual(response.json()["results"][0]["sostenimiento"], "FEDERAL")
+
+    async def test_catalogo_activos(self):
+        await models.TipoViolencia.objects.acreate(nombre="Física")
+        await models.TipoViolencia.objects.acreate(nombre="Retirado", esta_activo=False)
+        response = await self.async_client.get(reverse("tramites:catalogo-activos", args=["tipoviolencia"]))
+        self.assertEqual([fila["nombre"] for fila in response.json()["results"]], ["Física"])
+        response = await self.async_client.get(reverse("tramites:catalogo-activos", args=["usuario"]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_resumen_de_vencimientos(self):
+        estatus = await models.EstatusCaso.objects.acreate(nombre="Abierto")
+        tipo = await models.TipoProceso.objects.acreate(nombre="Queja")
+        await models.CasoInterno.objects.acreate(
+            cct=self.cct,
+            asesor_cct="Asesor 1",
+            fecha_apertura=date.today(),
+            fecha_termino=date.today() + timedelta(days=2),
+            estatus=estatus,
+            tipo_inicial=tipo,
+        )
+        response = await self.async_client.get(reverse("tramites:vencimientos-resumen"), {"dias": "7"})
+        self.assertEqual(
+            response.json(),
+            {
+                "dias": 7,
+                "asesores": [
+                    {
+                        "asesor": "Asesor 1",
+                        "clave": "Asesor 1",
+                        "vencidos": 0,
+                        "vencen_hoy": 0,
+                        "proximos": 1,
+                        "total": 1,
+                    }
+                ],
+            },
+        )
+
+    async def test_metricas_cuentan_consultas_de_vistas_async(self):
+        metricas.registro.reiniciar()
+        response = await self.async_client.get(reverse("tramites:tablero-resumen"))
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* consultas"')
+
+
+class VistasAsyncPermisosTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="sin-permisos", password="password")
+
+    async def test_anonimo_va_al_login(self):
+        response = await self.async_client.get(reverse("tramites:cct-lookup"), {"cct": "31EES0001H"})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse("login"), response["Location"])
+
+    async def test_sin_permiso_responde_403(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        response = await self.async_client.get(reverse("tramites:tablero-resumen"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_acepta_jwt(self):
+        token = AccessToken.for_user(self.user)
+        response = self.client.get(
+            reverse("tramites:catalogo-activos", args=["solicitante"]), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"results": []})
+
+
+class CompararWsgiAsgiTests(TransactionTestCase):
+    """Los hilos de los servidores necesitan ver datos confirmados, de ahí TransactionTestCase."""
+
+    def setUp(self):
+        models.CCTSecundaria.objects.create(cct="31EES0001H", nombre="Ermilo Abreu Gómez")
+        get_user_model().objects.create_superuser(username="admin", email="admin@example.com", password="x")
+
+    def test_wsgi(self):
+        salida = StringIO()
+        call_command("comparar_wsgi_asgi", solo="wsgi", peticiones=10, concurrencia=4, hilos=2, stdout=salida)
+        self.assertIn("WSGI (2 hilos) · peticiones=10 (errores=0)", salida.getvalue())
+
+    @unittest.skipUnless(importlib.util.find_spec("uvicorn"), "uvicorn no está instalado")
+    def test_asgi(self):
+        salida = StringIO()
+        call_command("comparar_wsgi_asgi", solo="asgi", peticiones=10, concurrencia=4, stdout=salida)
+        self.assertIn("ASGI (uvicorn) · peticiones=10 (errores=0)", salida.getvalue())
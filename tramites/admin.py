@@ -41,8 +41,8 @@ class AreaProcesoAdmin(admin.ModelAdmin):
 
 @admin.register(models.EstatusCaso)
 class EstatusCasoAdmin(admin.ModelAdmin):
-    list_display = ("nombre", "orden", "esta_activo")
-    list_editable = ("orden", "esta_activo")
+    list_display = ("nombre", "orden", "es_cierre", "esta_activo")
+    list_editable = ("orden", "es_cierre", "esta_activo")
     search_fields = ("nombre",)
     ordering = ("orden",)
 
@@ -73,3 +73,27 @@ class CasoInternoAdmin(admin.ModelAdmin):
     )
     autocomplete_fields = ("cct", "estatus", "tipo_inicial", "area_origen_inicial")
     readonly_fields = ("fecha_registro", "actualizado_en")
+
+
+@admin.register(models.TareaSegundoPlano)
+class TareaSegundoPlanoAdmin(admin.ModelAdmin):
+    list_display = ("id", "tipo", "estatus", "creado_por", "creado_en", "terminado_en", "intentos")
+    list_filter = ("estatus", "tipo")
+    search_fields = ("tipo", "mensaje_error")
+    readonly_fields = ("creado_en", "iniciado_en", "terminado_en")
+
+
+@admin.register(models.ConteoTablero)
+class ConteoTableroAdmin(admin.ModelAdmin):
+    list_display = ("dimension", "valor", "abiertos", "total", "actualizado_en")
+    list_filter = ("dimension",)
+    search_fields = ("valor",)
+
+
+@admin.register(models.AnalisisElegibilidad)
+class AnalisisElegibilidadAdmin(admin.ModelAdmin):
+    list_display = ("docente", "identificador", "regimen", "fecha_ingreso", "caso", "calculado_en")
+    list_filter = ("regimen",)
+    search_fields = ("docente", "identificador")
+    raw_id_fields = ("caso",)
+    readonly_fields = ("resultado", "calculado_en", "creado_en", "actualizado_en")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from tramites import views
@@ -16,5 +17,11 @@ router.register("solicitantes", views.SolicitanteViewSet, basename="solicitante"
 router.register("destinatarios", views.DestinatarioViewSet, basename="destinatario")
 router.register("tramites-caso", views.TramiteCasoViewSet, basename="tramite-caso")
 router.register("estatus-tramite", views.EstatusTramiteViewSet, basename="estatus-tramite")
+router.register("vencimientos", views.VencimientoViewSet, basename="vencimiento")
+router.register("analisis-elegibilidad", views.AnalisisElegibilidadViewSet, basename="analisis-elegibilidad")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("elegibilidad/", views.ElegibilidadLoteAPIView.as_view(), name="elegibilidad-lote"),
+    path("casos/estatus/", views.EstatusMasivoAPIView.as_view(), name="casos-estatus-masivo"),
+    *router.urls,
+]
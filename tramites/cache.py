@@ -0,0 +1,198 @@
+"""Espacios de caché con nombre y métricas de aciertos.
+
+Cada espacio (`catalogos`, `ccts`, `tablero`, `sesiones`, `fragmentos`) es un alias de
+`settings.CACHES` con su propio `KEY_PREFIX` y vigencia, así que sus claves no
+chocan aunque todos compartan el mismo Redis. `cache_de()` envuelve el alias
+para contar aciertos y fallos; los contadores se acumulan en memoria y se vuelcan
+cada tanto al propio backend (`incr`), de modo que con Redis `manage.py cache_stats`
+reporta lo de todos los workers y con memoria local solo lo del proceso actual.
+
+Las variantes `aget`/`aset`/`aget_or_set`/`adelete` son para las vistas async:
+delegan en los métodos async del backend y no bloquean el event loop.
+
+`memo_peticion()` es un diccionario que dura una petición (lo abre
+`MemoPeticionMiddleware`), para valores que se leen varias veces al responder.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.http import HttpRequest, HttpResponse
+
+ESPACIOS = ("catalogos", "ccts", "tablero", "sesiones", "fragmentos")
+CLAVE_METRICAS = "__metricas__:{}"
+VOLCAR_CADA_OPERACIONES = 50
+VOLCAR_CADA_SEGUNDOS = 10.0
+
+_FALTA = object()
+
+
+class CacheConMetricas:
+    """Envoltura de un backend de caché que registra aciertos y fallos de lectura."""
+
+    def __init__(self, espacio: str):
+        if espacio not in ESPACIOS:
+            raise KeyError(f"Espacio de caché desconocido: {espacio}")
+        self.espacio = espacio
+        self._pendientes: Counter[str] = Counter()
+        self._ultimo_volcado = time.monotonic()
+        self._candado = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[self.espacio]
+
+    def _registrar(self, aciertos: int, fallos: int) -> bool:
+        """Acumula la lectura; True si ya toca volcar los contadores."""
+        with self._candado:
+            self._pendientes["aciertos"] += aciertos
+            self._pendientes["fallos"] += fallos
+            return (
+                sum(self._pendientes.values()) >= VOLCAR_CADA_OPERACIONES
+                or time.monotonic() - self._ultimo_volcado >= VOLCAR_CADA_SEGUNDOS
+            )
+
+    def volcar_metricas(self) -> None:
+        """Suma los contadores pendientes a los que guarda el backend."""
+        with self._candado:
+            pendientes, self._pendientes = self._pendientes, Counter()
+            self._ultimo_volcado = time.monotonic()
+        for nombre, valor in pendientes.items():
+            if not valor:
+                continue
+            clave = CLAVE_METRICAS.format(nombre)
+            self.backend.add(clave, 0, timeout=None)
+            try:
+                self.backend.incr(clave, valor)
+            except ValueError:  # Expulsada entre add e incr: se pierde esta muestra.
+                pass
+
+    def metricas(self) -> dict[str, Any]:
+        self.volcar_metricas()
+        valores = self.backend.get_many([CLAVE_METRICAS.format("aciertos"), CLAVE_METRICAS.format("fallos")])
+        aciertos = valores.get(CLAVE_METRICAS.format("aciertos"), 0)
+        fallos = valores.get(CLAVE_METRICAS.format("fallos"), 0)
+        total = aciertos + fallos
+        return {"aciertos": aciertos, "fallos": fallos, "tasa": aciertos / total if total else None}
+
+    def reiniciar_metricas(self) -> None:
+        with self._candado:
+            self._pendientes.clear()
+        self.backend.delete_many([CLAVE_METRICAS.format("aciertos"), CLAVE_METRICAS.format("fallos")])
+
+    def get(self, clave: str, default: Any = None) -> Any:
+        valor = self.backend.get(clave, _FALTA)
+        if self._registrar(valor is not _FALTA, valor is _FALTA):
+            self.volcar_metricas()
+        return default if valor is _FALTA else valor
+
+    def get_many(self, claves: list[str]) -> dict[str, Any]:
+        valores = self.backend.get_many(claves)
+        if self._registrar(len(valores), len(claves) - len(valores)):
+            self.volcar_metricas()
+        return valores
+
+    def get_or_set(self, clave: str, calcular: Callable[[], Any], timeout: Any = DEFAULT_TIMEOUT) -> Any:
+        valor = self.get(clave, _FALTA)
+        if valor is _FALTA:
+            valor = calcular()
+            self.set(clave, valor, timeout)
+        return valor
+
+    def set(self, clave: str, valor: Any, timeout: Any = DEFAULT_TIMEOUT) -> None:
+        self.backend.set(clave, valor, timeout)
+
+    def set_many(self, valores: dict[str, Any], timeout: Any = DEFAULT_TIMEOUT) -> None:
+        self.backend.set_many(valores, timeout)
+
+    def __contains__(self, clave: str) -> bool:
+        return self.backend.has_key(clave)
+
+    def delete(self, clave: str) -> None:
+        self.backend.delete(clave)
+
+    def delete_many(self, claves: list[str]) -> None:
+        self.backend.delete_many(claves)
+
+    async def aget(self, clave: str, default: Any = None) -> Any:
+        valor = await self.backend.aget(clave, _FALTA)
+        if self._registrar(valor is not _FALTA, valor is _FALTA):
+            await sync_to_async(self.volcar_metricas)()
+        return default if valor is _FALTA else valor
+
+    async def aget_or_set(
+        self, clave: str, calcular: Callable[[], Awaitable[Any]], timeout: Any = DEFAULT_TIMEOUT
+    ) -> Any:
+        valor = await self.aget(clave, _FALTA)
+        if valor is _FALTA:
+            valor = await calcular()
+            await self.aset(clave, valor, timeout)
+        return valor
+
+    async def aset(self, clave: str, valor: Any, timeout: Any = DEFAULT_TIMEOUT) -> None:
+        await self.backend.aset(clave, valor, timeout)
+
+    async def adelete(self, clave: str) -> None:
+        await self.backend.adelete(clave)
+
+    # Sin clear(): en Redis vaciaría la base completa, incluidos los demás espacios.
+
+
+_espacios: dict[str, CacheConMetricas] = {}
+_candado_espacios = threading.Lock()
+
+
+def cache_de(espacio: str) -> CacheConMetricas:
+    """Caché del espacio indicado; la instancia (y sus contadores) se comparte en el proceso."""
+    with _candado_espacios:
+        if espacio not in _espacios:
+            _espacios[espacio] = CacheConMetricas(espacio)
+        return _espacios[espacio]
+
+
+def estadisticas() -> dict[str, dict[str, Any]]:
+    return {espacio: cache_de(espacio).metricas() for espacio in ESPACIOS}
+
+
+_memo: ContextVar[dict[str, Any] | None] = ContextVar("memo_peticion", default=None)
+
+
+def memo_peticion() -> dict[str, Any] | None:
+    """Valores calculados durante la petición en curso; `None` fuera de una petición."""
+    return _memo.get()
+
+
+class MemoPeticionMiddleware:
+    """Abre un `memo_peticion()` vacío para cada petición."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _memo.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _memo.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # sync_to_async copia el contexto, pero el diccionario es el mismo en ambos lados.
+        token = _memo.set({})
+        try:
+            return await self.get_response(request)
+        finally:
+            _memo.reset(token)
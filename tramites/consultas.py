@@ -0,0 +1,177 @@
+"""Detector de consultas N+1 y lentas para desarrollo, staging y pruebas.
+
+Agrupa el SQL de cada petición por huella (la consulta sin valores literales ni
+listas `IN`). Una huella que se repite `DETECTOR_REPETICIONES` veces o más suele
+ser un ciclo que consulta por cada elemento (p. ej. `caso.historial_estatus` dentro
+de un `{% for %}`); una consulta que tarda más de `DETECTOR_CONSULTA_LENTA_MS` se
+reporta aparte. Cada hallazgo se registra en el logger `tramites.consultas` con la
+línea de código de la app y la plantilla (nombre y línea) que la originó.
+
+En pruebas, `sin_n_mas_1()` envuelve un bloque y falla con `ConsultasRepetidas` si
+detecta un N+1; `DETECTOR_ESTRICTO=True` hace lo mismo en el middleware.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from tramites.envolturas import envolver_consultas
+
+logger = logging.getLogger(__name__)
+
+RAIZ_APP = str(Path(__file__).resolve().parent)
+# Las envolturas de este módulo, de tramites.metricas y el despachador no son el origen de la consulta.
+_ARCHIVOS_IGNORADOS = {
+    str(Path(__file__).resolve().with_name(nombre)) for nombre in ("consultas.py", "metricas.py", "envolturas.py")
+}
+
+_CADENAS = re.compile(r"'(?:[^']|'')*'")
+_NUMEROS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LISTAS = re.compile(r"\((?:\s*(?:%s|\?|\d+)\s*,)+\s*(?:%s|\?|\d+)\s*\)")
+_ESPACIOS = re.compile(r"\s+")
+
+
+class ConsultasRepetidas(AssertionError):
+    """Se detectó un patrón N+1 con el detector en modo estricto."""
+
+
+def huella_sql(sql: str) -> str:
+    """SQL sin literales, con listas `IN (...)` colapsadas y espacios normalizados."""
+    sql = _CADENAS.sub("?", sql)
+    sql = _NUMEROS.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _LISTAS.sub("(...)", sql)
+    return _ESPACIOS.sub(" ", sql).strip()
+
+
+def _origen() -> tuple[str, str]:
+    """Primera línea de la app (fuera de este módulo) y nodo de plantilla en la pila."""
+    codigo = plantilla = ""
+    marco = sys._getframe(2)
+    while marco is not None and not (codigo and plantilla):
+        archivo = marco.f_code.co_filename
+        if not codigo and archivo.startswith(RAIZ_APP) and archivo not in _ARCHIVOS_IGNORADOS:
+            codigo = f"{Path(archivo).relative_to(Path(RAIZ_APP).parent)}:{marco.f_lineno} en {marco.f_code.co_name}"
+        if not plantilla and marco.f_code.co_name == "render_annotated":
+            nodo = marco.f_locals.get("self")
+            origen = getattr(nodo, "origin", None)
+            token = getattr(nodo, "token", None)
+            if origen is not None and token is not None:
+                plantilla = f"{origen.template_name}:{token.lineno}"
+        marco = marco.f_back
+    return codigo, plantilla
+
+
+@dataclass
+class ConsultaRegistrada:
+    sql: str
+    milisegundos: float
+    codigo: str
+    plantilla: str
+
+
+@dataclass
+class Detector:
+    """`execute_wrapper` que guarda cada consulta con su huella y origen."""
+
+    repeticiones: int = 5
+    lenta_ms: float = 100.0
+    por_huella: dict[str, list[ConsultaRegistrada]] = field(default_factory=lambda: defaultdict(list))
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            milisegundos = (time.perf_counter() - inicio) * 1000
+            self.por_huella[huella_sql(sql)].append(ConsultaRegistrada(sql, milisegundos, *_origen()))
+
+    @contextmanager
+    def activo(self) -> Iterator[Detector]:
+        with envolver_consultas(self):
+            yield self
+
+    def repetidas(self) -> dict[str, list[ConsultaRegistrada]]:
+        return {huella: lista for huella, lista in self.por_huella.items() if len(lista) >= self.repeticiones}
+
+    def lentas(self) -> list[ConsultaRegistrada]:
+        return [c for lista in self.por_huella.values() for c in lista if c.milisegundos > self.lenta_ms]
+
+    def reporte(self) -> str:
+        lineas = []
+        for huella, lista in sorted(self.repetidas().items(), key=lambda item: -len(item[1])):
+            origenes = sorted({f"{c.codigo or '?'}{' · ' + c.plantilla if c.plantilla else ''}" for c in lista})
+            lineas.append(f"N+1: {len(lista)} consultas «{huella[:200]}»")
+            lineas += [f"    desde {origen}" for origen in origenes]
+        for consulta in self.lentas():
+            lineas.append(f"Lenta: {consulta.milisegundos:.0f} ms «{consulta.sql[:200]}»")
+            lineas.append(f"    desde {consulta.codigo or '?'}{' · ' + consulta.plantilla if consulta.plantilla else ''}")
+        return "\n".join(lineas)
+
+
+def _detector_configurado(**kwargs) -> Detector:
+    return Detector(
+        repeticiones=kwargs.get("repeticiones") or getattr(settings, "DETECTOR_REPETICIONES", 5),
+        lenta_ms=kwargs.get("lenta_ms") or getattr(settings, "DETECTOR_CONSULTA_LENTA_MS", 100),
+    )
+
+
+@contextmanager
+def sin_n_mas_1(repeticiones: int | None = None) -> Iterator[Detector]:
+    """Para pruebas: falla si el bloque repite una misma consulta `repeticiones` veces o más."""
+    detector = _detector_configurado(repeticiones=repeticiones)
+    with detector.activo():
+        yield detector
+    if detector.repetidas():
+        raise ConsultasRepetidas(detector.reporte())
+
+
+class DetectorConsultasMiddleware:
+    """Reporta N+1 y consultas lentas de cada petición; activo con DETECTOR_CONSULTAS."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "DETECTOR_CONSULTAS", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        detector = _detector_configurado()
+        with detector.activo():
+            response = self.get_response(request)
+        self._reportar(request, detector)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        detector = _detector_configurado()
+        with detector.activo():
+            response = await self.get_response(request)
+        self._reportar(request, detector)
+        return response
+
+    def _reportar(self, request: HttpRequest, detector: Detector) -> None:
+        if detector.repetidas() or detector.lentas():
+            coincidencia = getattr(request, "resolver_match", None)
+            ruta = coincidencia.view_name if coincidencia else request.path
+            reporte = detector.reporte()
+            logger.warning("Consultas a revisar en %s %s:\n%s", request.method, ruta, reporte)
+            if getattr(settings, "DETECTOR_ESTRICTO", False) and detector.repetidas():
+                raise ConsultasRepetidas(f"{request.method} {ruta}\n{reporte}")
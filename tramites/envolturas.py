@@ -0,0 +1,50 @@
+"""`execute_wrapper` ligados al contexto de la petición y no al hilo.
+
+`connection.execute_wrapper()` solo envuelve la conexión del hilo actual; en una
+vista async el ORM consulta desde los hilos de `sync_to_async`, con otra conexión.
+`envolver_consultas()` guarda la envoltura en una `ContextVar` (que asgiref copia
+a esos hilos) y un único despachador, instalado en cada conexión al crearse, la
+aplica a las consultas del contexto activo.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Callable, Iterator
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_activas: ContextVar[tuple[Callable, ...]] = ContextVar("envolturas_consultas", default=())
+
+
+def _despachar(execute, sql, params, many, context):
+    activas = _activas.get()
+    # La primera envoltura registrada queda por fuera, como con execute_wrapper anidados.
+    for envoltura in reversed(activas):
+        execute = partial(envoltura, execute)
+    return execute(sql, params, many, context)
+
+
+def _instalar(connection) -> None:
+    if _despachar not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_despachar)
+
+
+@receiver(connection_created, dispatch_uid="tramites.envolturas")
+def _instalar_al_conectar(sender, connection, **kwargs) -> None:
+    _instalar(connection)
+
+
+@contextmanager
+def envolver_consultas(envoltura: Callable) -> Iterator[None]:
+    """Aplica `envoltura` a las consultas de este contexto, también las hechas vía sync_to_async."""
+    for conexion in connections.all(initialized_only=True):
+        _instalar(conexion)
+    token = _activas.set((*_activas.get(), envoltura))
+    try:
+        yield
+    finally:
+        _activas.reset(token)
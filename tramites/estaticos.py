@@ -0,0 +1,124 @@
+"""Archivos estáticos en producción: nombres con hash, variantes precomprimidas y caché larga.
+
+`EstaticosComprimidosStorage` extiende `ManifestStaticFilesStorage` para que
+`collectstatic` escriba, junto a cada CSS/JS/SVG, sus variantes `.gz` y `.br`.
+`servir_estatico` sirve STATIC_ROOT eligiendo la variante según `Accept-Encoding`
+y marca como `immutable` los archivos cuyo nombre cambia con su contenido, de modo
+que el navegador no vuelve a validarlos en cada página.
+"""
+from __future__ import annotations
+
+import gzip
+import mimetypes
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.http import FileResponse, Http404, HttpRequest, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:  # Brotli es opcional: sin él solo se generan variantes gzip.
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+EXTENSIONES_COMPRIMIBLES = {".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".html", ".xml", ".ico"}
+TAMANO_MINIMO_COMPRESION = 512
+CACHE_INMUTABLE = "public, max-age=31536000, immutable"
+CACHE_SIN_HASH = "public, max-age=60, must-revalidate"
+# Variantes en orden de preferencia: (codificación, sufijo).
+VARIANTES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def comprimir_archivo(ruta: Path) -> list[Path]:
+    """Escribe las variantes .gz/.br de `ruta` cuando reducen el tamaño; devuelve las creadas."""
+    datos = ruta.read_bytes()
+    if len(datos) < TAMANO_MINIMO_COMPRESION:
+        return []
+    compresores = [(".gz", lambda contenido: gzip.compress(contenido, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compresores.append((".br", lambda contenido: brotli.compress(contenido, quality=11)))
+    creadas = []
+    for sufijo, comprimir in compresores:
+        comprimido = comprimir(datos)
+        if len(comprimido) < len(datos) * 0.95:
+            destino = ruta.with_name(ruta.name + sufijo)
+            destino.write_bytes(comprimido)
+            creadas.append(destino)
+    return creadas
+
+
+class EstaticosComprimidosStorage(ManifestStaticFilesStorage):
+    """Manifest con hash en los nombres y variantes precomprimidas para cada archivo de texto."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        nombres = set(paths) | set(self.hashed_files.values())
+        for nombre in sorted(nombres):
+            if Path(nombre).suffix.lower() not in EXTENSIONES_COMPRIMIBLES or not self.exists(nombre):
+                continue
+            for variante in comprimir_archivo(Path(self.path(nombre))):
+                yield nombre, f"{nombre}{variante.suffix}", True
+
+
+@lru_cache(maxsize=1)
+def nombres_versionados() -> frozenset[str]:
+    """Nombres con hash del manifiesto de collectstatic (vacío si no se usa manifest)."""
+    return frozenset(getattr(staticfiles_storage, "hashed_files", {}).values())
+
+
+def es_versionado(ruta: str) -> bool:
+    # Los bundles de npm run build:js ya llevan el hash de esbuild en el nombre.
+    return ruta in nombres_versionados() or (ruta.startswith("dist/") and not ruta.endswith("manifest.json"))
+
+
+def _codificaciones_aceptadas(cabecera: str) -> set[str]:
+    aceptadas = set()
+    for parte in cabecera.split(","):
+        codificacion, _, parametros = parte.strip().partition(";")
+        if parametros.replace(" ", "") not in {"q=0", "q=0.0"}:
+            aceptadas.add(codificacion.strip().lower())
+    return aceptadas
+
+
+def servir_estatico(request: HttpRequest, ruta: str) -> FileResponse | HttpResponseNotModified:
+    """Sirve un archivo de STATIC_ROOT con su variante comprimida y los encabezados de caché."""
+    raiz = Path(settings.STATIC_ROOT).resolve()
+    archivo = (raiz / ruta).resolve()
+    if raiz not in archivo.parents or not archivo.is_file():
+        raise Http404("Archivo estático no encontrado")
+    modificado = archivo.stat().st_mtime
+    versionado = es_versionado(ruta)
+    cache_control = CACHE_INMUTABLE if versionado else CACHE_SIN_HASH
+    condicional = request.headers.get("If-Modified-Since")
+    # Un nombre con hash nunca cambia de contenido: cualquier revalidación es un 304.
+    if condicional and (versionado or not was_modified_since(condicional, modificado)):
+        respuesta = HttpResponseNotModified()
+        respuesta["Cache-Control"] = cache_control
+        return respuesta
+
+    aceptadas = _codificaciones_aceptadas(request.headers.get("Accept-Encoding", ""))
+    servido, codificacion = archivo, None
+    variantes = [(cod, archivo.with_name(archivo.name + sufijo)) for cod, sufijo in VARIANTES]
+    variantes = [(cod, variante) for cod, variante in variantes if variante.is_file()]
+    for cod, variante in variantes:
+        if cod in aceptadas:
+            servido, codificacion = variante, cod
+            break
+
+    tipo, _ = mimetypes.guess_type(archivo.name)
+    respuesta = FileResponse(
+        servido.open("rb"), content_type=tipo or "application/octet-stream", filename=archivo.name
+    )
+    if codificacion:
+        respuesta["Content-Encoding"] = codificacion
+    if variantes:
+        patch_vary_headers(respuesta, ("Accept-Encoding",))
+    respuesta["Last-Modified"] = http_date(modificado)
+    respuesta["Cache-Control"] = cache_control
+    return respuesta
@@ -14,6 +14,21 @@ def _add_css_class(widget: forms.Widget, classname: str) -> None:
     widget.attrs["class"] = " ".join(filter(None, clases))
 
 
+def _con_clase_css(classname: str, excluir: tuple[str, ...] = ()):
+    """Agrega `classname` a los widgets de la clase una sola vez, no en cada instancia.
+
+    Cada formulario copia `base_fields` al crearse, con los atributos ya puestos.
+    """
+
+    def decorar(form_class):
+        for name, field in form_class.base_fields.items():
+            if name not in excluir:
+                _add_css_class(field.widget, classname)
+        return form_class
+
+    return decorar
+
+
 class CCTReferenceFormMixin(forms.ModelForm):
     """Mixin para incorporar el patrón de captura y búsqueda de CCT."""
 
@@ -21,6 +36,7 @@ class CCTReferenceFormMixin(forms.ModelForm):
         label="CCT",
         max_length=12,
         help_text="Escribe la clave del centro de trabajo para autocompletar la información.",
+        widget=forms.TextInput(attrs={"list": "cct-options", "placeholder": "Ej. 31EES0001H", "autocomplete": "off"}),
     )
     cct_field_name = "cct"
     cct_nombre_field = "cct_nombre"
@@ -40,9 +56,6 @@ class CCTReferenceFormMixin(forms.ModelForm):
 
         cct_code_field = self.fields["cct_codigo"]
         cct_code_field.required = self.require_cct_codigo
-        cct_code_field.widget.attrs.setdefault("list", "cct-options")
-        cct_code_field.widget.attrs.setdefault("placeholder", "Ej. 31EES0001H")
-        cct_code_field.widget.attrs.setdefault("autocomplete", "off")
 
         if self.instance and getattr(self.instance, "cct_id", None):
             cct_code_field.initial = self.instance.cct_id
@@ -133,6 +146,7 @@ class CCTReferenceFormMixin(forms.ModelForm):
         return cleaned
 
 
+@_con_clase_css("form-input", excluir=("cct",))
 class CasoInternoForm(CCTReferenceFormMixin):
     """Formulario principal para registrar trámites."""
 
@@ -165,33 +179,32 @@ class CasoInternoForm(CCTReferenceFormMixin):
         widgets = {
             "fecha_apertura": forms.DateInput(attrs={"type": "date"}),
             "fecha_termino": forms.DateInput(attrs={"type": "date"}),
-            "asunto": forms.Textarea(attrs={"rows": 3}),
-            "observaciones_iniciales": forms.Textarea(attrs={"rows": 3}),
+            "asunto": forms.Textarea(attrs={"rows": 3, "placeholder": "Redacción libre del asunto del trámite."}),
+            "numero_oficio": forms.TextInput(
+                attrs={"placeholder": "Ej. SE/SEB/DES-EESP/001/2024", "list": "prefijo-oficio-options"}
+            ),
+            "observaciones_iniciales": forms.Textarea(
+                attrs={"rows": 3, "placeholder": "Observaciones generales (opcional)."}
+            ),
             "receptores_adicionales": forms.HiddenInput(),
         }
+        labels = {
+            "fecha_apertura": "Fecha del trámite",
+            "fecha_termino": "Fecha de término (opcional)",
+        }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields["estatus"].queryset = models.EstatusCaso.objects.order_by("orden", "nombre")
         self.fields["tipo_inicial"].queryset = models.TipoProceso.objects.order_by("nombre")
-        self.fields["fecha_apertura"].label = "Fecha del trámite"
         self.fields["fecha_termino"].required = False
-        self.fields["fecha_termino"].label = "Fecha de término (opcional)"
-        self.fields["numero_oficio"].widget.attrs.setdefault(
-            "placeholder", "Ej. SE/SEB/DES-EESP/001/2024"
-        )
-        self.fields["numero_oficio"].widget.attrs.setdefault("list", "prefijo-oficio-options")
         self.fields["tipo_violencia"].required = False
         self.fields["tipo_violencia"].queryset = models.TipoViolencia.objects.order_by("nombre")
         self.fields["solicitante"].required = False
         self.fields["solicitante"].queryset = models.Solicitante.objects.order_by("nombre")
         self.fields["dirigido_a"].required = False
         self.fields["dirigido_a"].queryset = models.Destinatario.objects.order_by("nombre")
-        self.fields["asunto"].widget.attrs.setdefault("placeholder", "Redacción libre del asunto del trámite.")
         self.fields["observaciones_iniciales"].required = False
-        self.fields["observaciones_iniciales"].widget.attrs.setdefault(
-            "placeholder", "Observaciones generales (opcional)."
-        )
         sexo_choices = models.SEXO_NNA_CHOICES
         for field_name in ("generador_sexo", "receptor_sexo"):
             self.fields[field_name].required = False
@@ -203,11 +216,6 @@ class CasoInternoForm(CCTReferenceFormMixin):
             "receptor_iniciales",
         ):
             self.fields[optional_field].required = False
-        for name, field in self.fields.items():
-            if name in {"cct", "cct_codigo"}:
-                continue
-            _add_css_class(field.widget, "form-input")
-        _add_css_class(self.fields["cct_codigo"].widget, "form-input")
         self.order_fields(
             [
                 "cct",
@@ -237,6 +245,7 @@ class CasoInternoForm(CCTReferenceFormMixin):
         )
 
 
+@_con_clase_css("form-input")
 class TramiteCasoForm(forms.ModelForm):
     class Meta:
         model = models.TramiteCaso
@@ -260,18 +269,24 @@ class TramiteCasoForm(forms.ModelForm):
             "receptores_adicionales",
         )
         widgets = {
+            "estatus": forms.Select(
+                attrs={"data-estatus-api": "/api/estatus-tramite/", "data-estatus-label": "estatus de trámite"}
+            ),
             "fecha": forms.DateInput(attrs={"type": "date"}),
             "fecha_termino": forms.DateInput(attrs={"type": "date"}),
+            "numero_oficio": forms.TextInput(
+                attrs={"list": "prefijo-oficio-options", "placeholder": "Ej. SE/SEB/DES-EESP/001/2024"}
+            ),
+            "asunto": forms.TextInput(attrs={"placeholder": "Descripción breve del trámite asociado."}),
             "observaciones": forms.Textarea(attrs={"rows": 3}),
             "receptores_adicionales": forms.HiddenInput(),
         }
+        labels = {"fecha_termino": "Fecha de término (opcional)"}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields["tipo"].queryset = models.TipoProceso.objects.order_by("nombre")
         self.fields["estatus"].queryset = models.EstatusTramite.objects.order_by("orden", "nombre")
-        self.fields["estatus"].widget.attrs.setdefault("data-estatus-api", "/api/estatus-tramite/")
-        self.fields["estatus"].widget.attrs.setdefault("data-estatus-label", "estatus de trámite")
         self.fields["tipo_violencia"].queryset = models.TipoViolencia.objects.order_by("nombre")
         self.fields["tipo_violencia"].required = False
         self.fields["solicitante"].queryset = models.Solicitante.objects.order_by("nombre")
@@ -279,8 +294,6 @@ class TramiteCasoForm(forms.ModelForm):
         self.fields["dirigido_a"].queryset = models.Destinatario.objects.order_by("nombre")
         self.fields["dirigido_a"].required = False
         self.fields["fecha_termino"].required = False
-        self.fields["fecha_termino"].label = "Fecha de término (opcional)"
-        self.fields["numero_oficio"].widget.attrs.setdefault("list", "prefijo-oficio-options")
         sexo_choices = models.SEXO_NNA_CHOICES
         for field_name in ("generador_sexo", "receptor_sexo"):
             self.fields[field_name].required = False
@@ -292,12 +305,9 @@ class TramiteCasoForm(forms.ModelForm):
             "receptor_iniciales",
         ):
             self.fields[optional_field].required = False
-        for name, field in self.fields.items():
-            _add_css_class(field.widget, "form-input")
-        self.fields["numero_oficio"].widget.attrs.setdefault("placeholder", "Ej. SE/SEB/DES-EESP/001/2024")
-        self.fields["asunto"].widget.attrs.setdefault("placeholder", "Descripción breve del trámite asociado.")
 
 
+@_con_clase_css("form-input")
 class HistorialEstatusTramiteCasoForm(forms.ModelForm):
     class Meta:
         model = models.HistorialEstatusTramiteCaso
@@ -307,21 +317,48 @@ class HistorialEstatusTramiteCasoForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields["estatus_nuevo"].queryset = models.EstatusTramite.objects.order_by("orden", "nombre")
-        self.fields["estatus_nuevo"].widget.attrs.setdefault("class", "form-input")
-        self.fields["comentario"].widget.attrs.setdefault("class", "form-input")
 
 
+@_con_clase_css("form-input")
 class HistorialEstatusCasoForm(forms.ModelForm):
     class Meta:
         model = models.HistorialEstatusCaso
         fields = ("estatus_nuevo", "comentario")
-        widgets = {"comentario": forms.Textarea(attrs={"rows": 2})}
+        widgets = {
+            "estatus_nuevo": forms.Select(
+                attrs={
+                    "data-estatus-caso-select": "true",
+                    "data-estatus-api": "/api/estatus-caso/",
+                    "data-estatus-label": "estatus",
+                }
+            ),
+            "comentario": forms.Textarea(attrs={"rows": 2}),
+        }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields["estatus_nuevo"].queryset = models.EstatusCaso.objects.order_by("orden", "nombre")
-        self.fields["estatus_nuevo"].widget.attrs.setdefault("class", "form-input")
-        self.fields["estatus_nuevo"].widget.attrs.setdefault("data-estatus-caso-select", "true")
-        self.fields["estatus_nuevo"].widget.attrs.setdefault("data-estatus-api", "/api/estatus-caso/")
-        self.fields["estatus_nuevo"].widget.attrs.setdefault("data-estatus-label", "estatus")
-        self.fields["comentario"].widget.attrs.setdefault("class", "form-input")
+
+
+@_con_clase_css("form-input", excluir=("casos", "todos"))
+class EstatusMasivoForm(forms.Form):
+    """Cambio de estatus de varios trámites desde el listado."""
+
+    estatus = forms.ModelChoiceField(
+        queryset=models.EstatusCaso.objects.order_by("orden", "nombre"), label="Estatus nuevo"
+    )
+    comentario = forms.CharField(
+        label="Comentario (opcional)",
+        required=False,
+        widget=forms.TextInput(attrs={"placeholder": "Ej. Cierre de ciclo escolar."}),
+    )
+    casos = forms.ModelMultipleChoiceField(
+        queryset=models.CasoInterno.objects.only("pk"), required=False, widget=forms.MultipleHiddenInput
+    )
+    todos = forms.BooleanField(label="Aplicar a todos los trámites filtrados", required=False)
+
+    def clean(self):
+        cleaned = super().clean()
+        if not cleaned.get("todos") and not cleaned.get("casos"):
+            raise forms.ValidationError("Selecciona al menos un trámite o aplica el cambio a todos los filtrados.")
+        return cleaned
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.forms.renderers import DjangoTemplates
+
+from tramites import forms
+from tramites.renderizador import RenderizadorFormularios
+from tramites.services.benchmark import percentil
+
+FORMULARIOS = {
+    "CasoInternoForm": lambda renderer: forms.CasoInternoForm(renderer=renderer),
+    "TramiteCasoForm": lambda renderer: forms.TramiteCasoForm(prefix="tramite_caso", renderer=renderer),
+}
+
+
+def _render(formulario) -> str:
+    return "".join(str(campo) for campo in formulario)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide cuánto tarda en crearse y renderizarse cada campo de los formularios grandes de trámites "
+        "con el renderizador de Django y con tramites.renderizador."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeticiones", type=int, default=200, help="Mediciones por formulario y renderizador.")
+
+    def handle(self, *args, **options):
+        repeticiones = options["repeticiones"]
+        if repeticiones < 1:
+            raise CommandError("--repeticiones debe ser mayor o igual a 1.")
+        renderizadores = {"django": DjangoTemplates(), "rapido": RenderizadorFormularios()}
+        self.stdout.write("Los selects consultan sus catálogos en cada render; ese tiempo es igual en ambos.")
+        for nombre, crear in FORMULARIOS.items():
+            html = {clave: _render(crear(renderer)) for clave, renderer in renderizadores.items()}  # Calentamiento.
+            instanciar = self._medir(lambda: crear(renderizadores["rapido"]), repeticiones)
+            render = {
+                clave: self._medir(lambda renderer=renderer: _render(crear(renderer)), repeticiones)
+                for clave, renderer in renderizadores.items()
+            }
+            mejora = render["django"][0] / render["rapido"][0] if render["rapido"][0] else 0.0
+            self.stdout.write(
+                f"{nombre} · instanciar p50={instanciar[0]:.2f} ms · "
+                f"Django p50={render['django'][0]:.2f} ms p95={render['django'][1]:.2f} ms · "
+                f"rápido p50={render['rapido'][0]:.2f} ms p95={render['rapido'][1]:.2f} ms · {mejora:.1f}x · "
+                + ("HTML idéntico" if html["django"] == html["rapido"] else "EL HTML DIFIERE")
+            )
+
+    @staticmethod
+    def _medir(funcion, repeticiones: int) -> tuple[float, float]:
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        tiempos.sort()
+        return percentil(tiempos, 50), percentil(tiempos, 95)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tramites.services import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Reproduce una mezcla de peticiones típicas (listado con filtros, búsqueda, detalle, cambio de "
+        "estatus, consulta de CCT, API) y reporta latencias p50/p95/p99 y peticiones por segundo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--peticiones", type=int, default=500, help="Peticiones medidas.")
+        parser.add_argument("--concurrencia", type=int, default=4, help="Hilos cliente simultáneos.")
+        parser.add_argument(
+            "--mezcla",
+            help="Pesos por escenario, p. ej. 'listado=5,detalle=3,consulta_cct=2'. Escenarios: "
+            + ", ".join(benchmark.ESCENARIOS),
+        )
+        parser.add_argument("--semilla", type=int, default=7, help="Semilla para elegir escenarios y datos.")
+        parser.add_argument("--usuario", help="Usuario con sesión (por defecto, el primer superusuario activo).")
+        parser.add_argument("--json", dest="salida_json", help="Guarda el resumen en este archivo JSON.")
+
+    def handle(self, *args, **options):
+        if options["peticiones"] < 1 or options["concurrencia"] < 1:
+            raise CommandError("--peticiones y --concurrencia deben ser mayores o iguales a 1.")
+        User = get_user_model()
+        if options["usuario"]:
+            usuario = User.objects.filter(username=options["usuario"], is_active=True).first()
+        else:
+            usuario = User.objects.filter(is_superuser=True, is_active=True).order_by("pk").first()
+        if usuario is None:
+            raise CommandError("No hay un usuario activo para iniciar sesión; usa --usuario.")
+        if settings.DEBUG or getattr(settings, "DETECTOR_CONSULTAS", False):
+            self.stdout.write(
+                self.style.WARNING(
+                    "DEBUG o el detector de consultas están activos: las latencias no representan producción "
+                    "(usa DJANGO_DEBUG=false)."
+                )
+            )
+        try:
+            mezcla = benchmark.parsear_mezcla(options["mezcla"]) if options["mezcla"] else None
+            resultado = benchmark.ejecutar(
+                usuario,
+                peticiones=options["peticiones"],
+                concurrencia=options["concurrencia"],
+                mezcla=mezcla,
+                semilla=options["semilla"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        resumen = resultado.resumen()
+        self.stdout.write(
+            f"{'Escenario':<18}{'Peticiones':>11}{'Errores':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        )
+        for nombre, fila in resumen.items():
+            self.stdout.write(
+                f"{nombre:<18}{fila['peticiones']:>11}{fila['errores']:>9}"
+                f"{fila['p50_ms']:>9.1f}{fila['p95_ms']:>9.1f}{fila['p99_ms']:>9.1f}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rendimiento: {resumen['total']['rps']:.1f} peticiones/s en {resultado.duracion_s:.1f} s")
+        )
+        if options["salida_json"]:
+            with open(options["salida_json"], "w", encoding="utf-8") as archivo:
+                json.dump(resumen, archivo, indent=2)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tramites.cache import ESPACIOS, cache_de, estadisticas
+
+
+class Command(BaseCommand):
+    help = (
+        "Aciertos y fallos por espacio de caché (catalogos, ccts, tablero, sesiones, fragmentos). "
+        "Con memoria local solo refleja el proceso actual; con Redis, a todos los workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+        parser.add_argument("--reiniciar", action="store_true", help="Pone los contadores en cero después de leerlos.")
+
+    def handle(self, *args, **options):
+        datos = estadisticas()
+        if options["json"]:
+            self.stdout.write(json.dumps(datos, indent=2))
+        else:
+            self.stdout.write(f"Backend: {settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]}")
+            self.stdout.write(f"{'Espacio':<12}{'Aciertos':>10}{'Fallos':>10}{'Tasa':>9}")
+            for espacio, metricas in datos.items():
+                tasa = "—" if metricas["tasa"] is None else f"{metricas['tasa']:.1%}"
+                self.stdout.write(f"{espacio:<12}{metricas['aciertos']:>10}{metricas['fallos']:>10}{tasa:>9}")
+        if options["reiniciar"]:
+            for espacio in ESPACIOS:
+                cache_de(espacio).reiniciar_metricas()
+            self.stdout.write(self.style.SUCCESS("Contadores reiniciados."))
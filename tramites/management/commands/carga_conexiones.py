@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import WSGIRequestHandler, WSGIServer
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class _ServidorConHilosFijos(WSGIServer):
+    """Atiende cada petición en un pool fijo de hilos, como los workers gthread de gunicorn.
+
+    Las conexiones de Django son por hilo: con hilos reutilizados, CONN_MAX_AGE decide
+    si la conexión sobrevive a la petición o se abre una nueva cada vez.
+    """
+
+    def __init__(self, *args, hilos: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="carga-worker")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._atender, request, client_address)
+
+    def _atender(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+        # Cada hilo cierra su propia conexión; las que quedaron abiertas las libera el GC.
+        connections.close_all()
+
+
+class _SinBitacora(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Prueba de carga en proceso que cuenta cuántas conexiones a la base de datos se abren "
+        "por petición con la configuración de reutilización actual (CONN_MAX_AGE)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ruta", default="/api/ccts/", help="Ruta a solicitar en cada petición.")
+        parser.add_argument("--peticiones", type=int, default=200, help="Total de peticiones a enviar.")
+        parser.add_argument("--concurrencia", type=int, default=8, help="Clientes simultáneos.")
+        parser.add_argument("--hilos", type=int, default=4, help="Hilos del servidor (workers).")
+        parser.add_argument(
+            "--usuario",
+            help="Usuario con el que se firma el token JWT (por defecto, el primer superusuario activo).",
+        )
+        parser.add_argument(
+            "--comparar",
+            action="store_true",
+            help="Ejecuta primero con CONN_MAX_AGE=0 (una conexión por petición) y luego con la configuración actual.",
+        )
+
+    def handle(self, *args, **options):
+        for opcion in ("peticiones", "concurrencia", "hilos"):
+            if options[opcion] < 1:
+                raise CommandError(f"--{opcion} debe ser mayor o igual a 1.")
+        token = self._token(options["usuario"])
+        configuracion = connections.settings["default"]
+        actual = configuracion["CONN_MAX_AGE"]
+        escenarios = [0, actual] if options["comparar"] and actual != 0 else [actual]
+
+        for conn_max_age in escenarios:
+            configuracion["CONN_MAX_AGE"] = conn_max_age
+            try:
+                resultado = self._ejecutar(token, options)
+            finally:
+                configuracion["CONN_MAX_AGE"] = actual
+            etiqueta = "sin límite" if conn_max_age is None else f"{conn_max_age}s"
+            self.stdout.write(
+                f"CONN_MAX_AGE={etiqueta} · peticiones={resultado['peticiones']} "
+                f"(errores={resultado['errores']}) · conexiones={resultado['conexiones']} "
+                f"({resultado['conexiones_por_peticion']:.2f}/petición) · "
+                f"p50={resultado['p50_ms']:.1f} ms · p95={resultado['p95_ms']:.1f} ms"
+            )
+
+    def _token(self, username: str | None) -> str:
+        User = get_user_model()
+        if username:
+            usuario = User.objects.filter(username=username, is_active=True).first()
+        else:
+            usuario = User.objects.filter(is_superuser=True, is_active=True).order_by("pk").first()
+        if usuario is None:
+            raise CommandError("No hay un usuario activo para autenticar las peticiones; usa --usuario.")
+        return str(AccessToken.for_user(usuario))
+
+    def _ejecutar(self, token: str, options) -> dict:
+        conteo = {"conexiones": 0}
+        candado = threading.Lock()
+
+        def contar(sender, connection, **kwargs):
+            if connection.alias == "default":
+                with candado:
+                    conteo["conexiones"] += 1
+
+        servidor = _ServidorConHilosFijos(("127.0.0.1", 0), _SinBitacora, hilos=options["hilos"])
+        servidor.set_app(WSGIHandler())
+        hilo_servidor = threading.Thread(target=servidor.serve_forever, daemon=True)
+        hilo_servidor.start()
+        url = f"http://127.0.0.1:{servidor.server_port}{options['ruta']}"
+        encabezados = {"Authorization": f"Bearer {token}"}
+
+        def pedir(_):
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, headers=encabezados), timeout=30) as respuesta:
+                    respuesta.read()
+                    correcto = respuesta.status < 400
+            except (urllib.error.URLError, OSError):
+                correcto = False
+            return correcto, (time.perf_counter() - inicio) * 1000
+
+        connection_created.connect(contar, dispatch_uid="carga_conexiones")
+        try:
+            with ThreadPoolExecutor(max_workers=options["concurrencia"]) as clientes:
+                resultados = list(clientes.map(pedir, range(options["peticiones"])))
+        finally:
+            servidor.shutdown()
+            servidor.server_close()
+            connection_created.disconnect(dispatch_uid="carga_conexiones")
+
+        tiempos = sorted(ms for _, ms in resultados)
+        total = len(resultados)
+        return {
+            "peticiones": total,
+            "errores": sum(1 for correcto, _ in resultados if not correcto),
+            "conexiones": conteo["conexiones"],
+            "conexiones_por_peticion": conteo["conexiones"] / total,
+            "p50_ms": statistics.median(tiempos),
+            "p95_ms": tiempos[min(total - 1, int(total * 0.95))],
+        }
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tramites.management.commands.carga_conexiones import _ServidorConHilosFijos, _SinBitacora
+from tramites.services.benchmark import percentil
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara la misma carga concurrente contra la aplicación servida por WSGI (pool fijo de hilos) "
+        "y por ASGI (uvicorn), por omisión sobre el autocompletado async de CCT."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ruta", help="Ruta a solicitar (por omisión, sugerencias de CCT con ?search=31).")
+        parser.add_argument("--peticiones", type=int, default=500, help="Total de peticiones por servidor.")
+        parser.add_argument("--concurrencia", type=int, default=32, help="Clientes simultáneos.")
+        parser.add_argument("--hilos", type=int, default=4, help="Hilos del servidor WSGI.")
+        parser.add_argument("--usuario", help="Usuario del token JWT (por defecto, el primer superusuario activo).")
+        parser.add_argument("--solo", choices=("wsgi", "asgi"), help="Mide solo uno de los dos servidores.")
+
+    def handle(self, *args, **options):
+        for opcion in ("peticiones", "concurrencia", "hilos"):
+            if options[opcion] < 1:
+                raise CommandError(f"--{opcion} debe ser mayor o igual a 1.")
+        servidores = {"wsgi": self._wsgi, "asgi": self._asgi}
+        if options["solo"]:
+            servidores = {options["solo"]: servidores[options["solo"]]}
+        if "asgi" in servidores:
+            try:
+                import uvicorn  # noqa: F401
+            except ImportError as exc:
+                raise CommandError("Para medir ASGI instala uvicorn: `pip install uvicorn`.") from exc
+        token = self._token(options["usuario"])
+        ruta = options["ruta"] or f"{reverse('tramites:cct-sugerencias')}?search=31"
+
+        for nombre, servir in servidores.items():
+            etiqueta, resultado = servir(ruta, token, options)
+            self.stdout.write(
+                f"{etiqueta} · peticiones={resultado['peticiones']} (errores={resultado['errores']}) · "
+                f"conexiones={resultado['conexiones']} · p50={resultado['p50_ms']:.1f} ms · "
+                f"p95={resultado['p95_ms']:.1f} ms · {resultado['rps']:.1f} peticiones/s"
+            )
+
+    def _token(self, username: str | None) -> str:
+        User = get_user_model()
+        if username:
+            usuario = User.objects.filter(username=username, is_active=True).first()
+        else:
+            usuario = User.objects.filter(is_superuser=True, is_active=True).order_by("pk").first()
+        if usuario is None:
+            raise CommandError("No hay un usuario activo para autenticar las peticiones; usa --usuario.")
+        return str(AccessToken.for_user(usuario))
+
+    def _wsgi(self, ruta: str, token: str, options) -> tuple[str, dict]:
+        servidor = _ServidorConHilosFijos(("127.0.0.1", 0), _SinBitacora, hilos=options["hilos"])
+        servidor.set_app(WSGIHandler())
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        try:
+            resultado = self._cargar(f"http://127.0.0.1:{servidor.server_port}{ruta}", token, options)
+        finally:
+            servidor.shutdown()
+            servidor.server_close()
+        return f"WSGI ({options['hilos']} hilos)", resultado
+
+    def _asgi(self, ruta: str, token: str, options) -> tuple[str, dict]:
+        import uvicorn
+
+        enchufe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        enchufe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        enchufe.bind(("127.0.0.1", 0))
+        configuracion = uvicorn.Config(ASGIHandler(), lifespan="off", log_level="warning", access_log=False)
+        servidor = uvicorn.Server(configuracion)
+        hilo = threading.Thread(target=servidor.run, kwargs={"sockets": [enchufe]}, daemon=True)
+        hilo.start()
+        while not servidor.started:
+            if not hilo.is_alive():
+                raise CommandError("uvicorn no pudo iniciar.")
+            time.sleep(0.01)
+        try:
+            resultado = self._cargar(f"http://127.0.0.1:{enchufe.getsockname()[1]}{ruta}", token, options)
+        finally:
+            servidor.should_exit = True
+            hilo.join(timeout=10)
+            enchufe.close()
+            connections.close_all()
+        return "ASGI (uvicorn)", resultado
+
+    def _cargar(self, url: str, token: str, options) -> dict:
+        conteo = {"conexiones": 0}
+        candado = threading.Lock()
+
+        def contar(sender, connection, **kwargs):
+            if connection.alias == "default":
+                with candado:
+                    conteo["conexiones"] += 1
+
+        encabezados = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+
+        def pedir(_):
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, headers=encabezados), timeout=30) as respuesta:
+                    respuesta.read()
+                    correcto = respuesta.status < 400
+            except (urllib.error.URLError, OSError):
+                correcto = False
+            return correcto, (time.perf_counter() - inicio) * 1000
+
+        connection_created.connect(contar, dispatch_uid="comparar_wsgi_asgi")
+        try:
+            with ThreadPoolExecutor(max_workers=options["concurrencia"]) as clientes:
+                list(clientes.map(pedir, range(min(options["concurrencia"], options["peticiones"]))))  # Calentamiento.
+                conteo["conexiones"] = 0
+                inicio = time.perf_counter()
+                resultados = list(clientes.map(pedir, range(options["peticiones"])))
+                duracion = time.perf_counter() - inicio
+        finally:
+            connection_created.disconnect(dispatch_uid="comparar_wsgi_asgi")
+
+        tiempos = sorted(ms for _, ms in resultados)
+        return {
+            "peticiones": len(resultados),
+            "errores": sum(1 for correcto, _ in resultados if not correcto),
+            "conexiones": conteo["conexiones"],
+            "p50_ms": percentil(tiempos, 50),
+            "p95_ms": percentil(tiempos, 95),
+            "rps": len(resultados) / duracion if duracion else 0.0,
+        }
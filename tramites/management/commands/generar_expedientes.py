@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tramites import models
+from tramites.services import generar_expedientes_lote
+
+
+class Command(BaseCommand):
+    help = "Genera (o reutiliza de la caché) los expedientes en PDF de varios trámites en paralelo."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "ids",
+            nargs="*",
+            type=int,
+            help="Ids de los trámites a generar. Si se omite, se usan los filtros.",
+        )
+        parser.add_argument(
+            "--estatus",
+            type=int,
+            help="Genera los expedientes de todos los trámites con este estatus (id).",
+        )
+        parser.add_argument(
+            "--todos",
+            action="store_true",
+            help="Genera los expedientes de todos los trámites registrados.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Número de procesos de render (por defecto EXPEDIENTES_PDF_WORKERS o núcleos disponibles).",
+        )
+        parser.add_argument(
+            "--forzar",
+            action="store_true",
+            help="Vuelve a renderizar aunque exista un PDF vigente en caché.",
+        )
+
+    def handle(self, *args, **options):
+        ids = options["ids"]
+        if not ids:
+            qs = models.CasoInterno.objects.all()
+            if options["estatus"]:
+                qs = qs.filter(estatus_id=options["estatus"])
+            elif not options["todos"]:
+                raise CommandError("Indica ids de trámites, --estatus o --todos.")
+            ids = list(qs.order_by("pk").values_list("pk", flat=True))
+
+        self.stdout.write(self.style.NOTICE(f"Generando {len(ids)} expedientes..."))
+        resultados = generar_expedientes_lote(ids, max_workers=options["workers"], forzar=options["forzar"])
+        for caso_pk, ruta in sorted(resultados.items()):
+            self.stdout.write(f"{caso_pk}: {ruta}")
+        self.stdout.write(self.style.SUCCESS(f"Expedientes listos: {len(resultados)}"))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tramites.services import limpieza
+
+
+class Command(BaseCommand):
+    help = (
+        "Borra en lotes las sesiones y los tokens JWT vencidos (con su entrada en la lista negra). "
+        "Programarlo en cron, por ejemplo cada noche."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lote", type=int, default=1000, help="Filas por cada DELETE.")
+        parser.add_argument("--pausa", type=float, default=0.0, help="Segundos de espera entre lotes.")
+
+    def handle(self, *args, **options):
+        lote = options["lote"]
+        if lote < 1:
+            raise CommandError("--lote debe ser mayor o igual a 1.")
+        tokens = limpieza.limpiar_tokens_vencidos(lote, options["pausa"])
+        sesiones = limpieza.limpiar_sesiones_vencidas(lote, options["pausa"])
+        self.stdout.write(self.style.SUCCESS(f"Tokens vencidos borrados: {tokens} · sesiones vencidas: {sesiones}"))
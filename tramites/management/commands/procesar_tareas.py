@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import multiprocessing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from tramites.services import tareas
+
+
+class Command(BaseCommand):
+    help = "Worker de la cola de tareas en segundo plano (exportaciones y expedientes en PDF)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrencia",
+            type=int,
+            default=getattr(settings, "TAREAS_CONCURRENCIA", 1),
+            help="Número de procesos worker que toman tareas en paralelo.",
+        )
+        parser.add_argument(
+            "--intervalo",
+            type=float,
+            default=getattr(settings, "TAREAS_INTERVALO", 2.0),
+            help="Segundos de espera cuando la cola está vacía.",
+        )
+        parser.add_argument(
+            "--una-vez",
+            action="store_true",
+            help="Procesa las tareas pendientes y termina (útil en cron o CI).",
+        )
+
+    def handle(self, *args, **options):
+        concurrencia = options["concurrencia"]
+        if concurrencia < 1:
+            raise CommandError("--concurrencia debe ser mayor o igual a 1.")
+        intervalo = options["intervalo"]
+        una_vez = options["una_vez"]
+
+        liberadas = tareas.liberar_tareas_vencidas()
+        if liberadas:
+            self.stdout.write(self.style.WARNING(f"Tareas vencidas reasignadas: {liberadas}"))
+        borradas = tareas.limpiar_tareas_terminadas()
+        if borradas:
+            self.stdout.write(f"Tareas terminadas borradas (con sus archivos): {borradas}")
+        self.stdout.write(
+            self.style.NOTICE(
+                f"Worker iniciado · concurrencia={concurrencia} · tipos={', '.join(tareas.tipos_registrados())}"
+            )
+        )
+
+        if concurrencia == 1:
+            try:
+                tareas.ejecutar_worker(intervalo, una_vez=una_vez)
+            except KeyboardInterrupt:
+                pass
+            return
+
+        # Los procesos hijos no deben heredar la conexión abierta del padre.
+        connections.close_all()
+        procesos = [
+            multiprocessing.Process(target=tareas.ejecutar_worker, args=(intervalo, una_vez), daemon=True)
+            for _ in range(concurrencia)
+        ]
+        for proceso in procesos:
+            proceso.start()
+        try:
+            for proceso in procesos:
+                proceso.join()
+        except KeyboardInterrupt:
+            for proceso in procesos:
+                proceso.terminate()
+            for proceso in procesos:
+                proceso.join()
+        self.stdout.write(self.style.SUCCESS("Worker detenido."))
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from tramites.services.tablero import recalcular_tablero
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye los conteos del tablero de supervisión. Programarlo en cron como respaldo "
+        "y ejecutarlo tras cargas o actualizaciones masivas de trámites."
+    )
+
+    def handle(self, *args, **options):
+        filas = recalcular_tablero()
+        self.stdout.write(self.style.SUCCESS(f"Tablero recalculado: {filas} conteos."))
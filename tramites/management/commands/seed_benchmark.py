@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tramites.services import datos_sinteticos
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera datos sintéticos con volumen de producción (CCT, casos, trámites asociados, "
+        "cambios de estatus e historial) usando inserciones masivas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ccts", type=int, default=500, help="CCT sintéticos a crear.")
+        parser.add_argument("--casos", type=int, default=5000, help="Casos (trámites principales) a crear.")
+        parser.add_argument("--tramites-por-caso", type=int, default=2, help="Trámites asociados por caso.")
+        parser.add_argument("--cambios-por-caso", type=int, default=3, help="Cambios de estatus por caso.")
+        parser.add_argument("--receptores-max", type=int, default=3, help="Máximo de receptores adicionales por caso.")
+        parser.add_argument("--lote", type=int, default=1000, help="Filas por cada INSERT masivo.")
+        parser.add_argument("--semilla", type=int, default=2024, help="Semilla aleatoria (mismos datos con la misma semilla).")
+        parser.add_argument("--usuario", help="Usuario que figura como autor (por defecto, ninguno).")
+        parser.add_argument(
+            "--limpiar",
+            action="store_true",
+            help="Borra antes los datos sintéticos existentes (CCT con prefijo %s)." % datos_sinteticos.PREFIJO_CCT,
+        )
+
+    def handle(self, *args, **options):
+        for opcion in ("ccts", "casos", "tramites_por_caso", "cambios_por_caso", "receptores_max"):
+            if options[opcion] < 0:
+                raise CommandError(f"--{opcion.replace('_', '-')} no puede ser negativo.")
+        if options["lote"] < 1:
+            raise CommandError("--lote debe ser mayor o igual a 1.")
+        usuario = None
+        if options["usuario"]:
+            usuario = get_user_model().objects.filter(username=options["usuario"]).first()
+            if usuario is None:
+                raise CommandError(f"No existe el usuario {options['usuario']}.")
+
+        if options["limpiar"]:
+            borrados = datos_sinteticos.borrar_sinteticos()
+            self.stdout.write(self.style.WARNING(f"CCT sintéticos borrados: {borrados}"))
+
+        inicio = time.perf_counter()
+        try:
+            resumen = datos_sinteticos.generar(
+                ccts=options["ccts"],
+                casos=options["casos"],
+                tramites_por_caso=options["tramites_por_caso"],
+                cambios_por_caso=options["cambios_por_caso"],
+                receptores_max=options["receptores_max"],
+                lote=options["lote"],
+                semilla=options["semilla"],
+                usuario=usuario,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generados en {time.perf_counter() - inicio:.1f} s: {resumen.ccts} CCT · {resumen.casos} casos · "
+                f"{resumen.tramites} trámites asociados · {resumen.cambios_estatus} cambios de estatus · "
+                f"{resumen.cambios_estatus_tramite} estatus de trámites"
+            )
+        )
@@ -0,0 +1,197 @@
+"""Métricas por petición: tiempo total, consultas y tiempo en base de datos, plantilla y bytes.
+
+`MetricasMiddleware` mide cada petición, la etiqueta con el nombre de la ruta
+resuelta (`tramites:casointerno-list`, `tramites_api:cct-list`, …), agrega el
+encabezado `Server-Timing` y acumula los valores en `registro`. La vista
+`metricas_prometheus` publica lo acumulado en formato de texto de Prometheus.
+Los contadores viven en la memoria de cada proceso: con varios workers, Prometheus
+debe consultar cada uno (o sumar por instancia). El middleware funciona igual con
+WSGI y con ASGI (vistas async incluidas).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from tramites.envolturas import envolver_consultas
+
+BUCKETS_SEGUNDOS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIN_RUTA = "sin_ruta"
+
+
+@dataclass
+class MedicionPeticion:
+    consultas: int = 0
+    db_segundos: float = 0.0
+    plantilla_segundos: float = 0.0
+    _inicio_plantilla: float = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.consultas += 1
+            self.db_segundos += time.perf_counter() - inicio
+
+
+@dataclass
+class Serie:
+    peticiones: int = 0
+    segundos: float = 0.0
+    consultas: int = 0
+    db_segundos: float = 0.0
+    plantilla_segundos: float = 0.0
+    bytes: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS_SEGUNDOS))
+
+
+class Registro:
+    """Acumulado en memoria por (ruta, método, clase de código HTTP)."""
+
+    def __init__(self):
+        self._series: dict[tuple[str, str, str], Serie] = {}
+        self._candado = threading.Lock()
+
+    def registrar(self, vista: str, metodo: str, codigo: int, segundos: float, medicion: MedicionPeticion, bytes_: int):
+        clave = (vista, metodo, f"{codigo // 100}xx")
+        with self._candado:
+            serie = self._series.setdefault(clave, Serie())
+            serie.peticiones += 1
+            serie.segundos += segundos
+            serie.consultas += medicion.consultas
+            serie.db_segundos += medicion.db_segundos
+            serie.plantilla_segundos += medicion.plantilla_segundos
+            serie.bytes += bytes_
+            for indice, limite in enumerate(BUCKETS_SEGUNDOS):
+                if segundos <= limite:
+                    serie.buckets[indice] += 1
+
+    def copia(self) -> dict[tuple[str, str, str], Serie]:
+        with self._candado:
+            return {clave: Serie(**{**vars(serie), "buckets": list(serie.buckets)}) for clave, serie in self._series.items()}
+
+    def reiniciar(self) -> None:
+        with self._candado:
+            self._series.clear()
+
+
+registro = Registro()
+
+
+def _etiqueta(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _etiquetas(clave: tuple[str, str, str], **extra: str) -> str:
+    vista, metodo, codigo = clave
+    pares = {"vista": vista, "metodo": metodo, "codigo": codigo, **extra}
+    return "{" + ",".join(f'{nombre}="{_etiqueta(valor)}"' for nombre, valor in pares.items()) + "}"
+
+
+def formato_prometheus(series: dict[tuple[str, str, str], Serie]) -> str:
+    """Texto de exposición de Prometheus (versión 0.0.4) para las series dadas."""
+    contadores = (
+        ("tramites_peticiones_total", "Peticiones atendidas.", "peticiones"),
+        ("tramites_consultas_db_total", "Consultas SQL ejecutadas.", "consultas"),
+        ("tramites_db_segundos_total", "Tiempo acumulado en la base de datos.", "db_segundos"),
+        ("tramites_plantilla_segundos_total", "Tiempo acumulado renderizando plantillas.", "plantilla_segundos"),
+        ("tramites_respuesta_bytes_total", "Bytes enviados en el cuerpo de las respuestas.", "bytes"),
+    )
+    lineas = []
+    for nombre, ayuda, atributo in contadores:
+        lineas += [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} counter"]
+        lineas += [f"{nombre}{_etiquetas(clave)} {getattr(serie, atributo)}" for clave, serie in sorted(series.items())]
+
+    nombre = "tramites_peticion_segundos"
+    lineas += [f"# HELP {nombre} Duración total de la petición.", f"# TYPE {nombre} histogram"]
+    for clave, serie in sorted(series.items()):
+        for limite, acumuladas in zip(BUCKETS_SEGUNDOS, serie.buckets):
+            lineas.append(f"{nombre}_bucket{_etiquetas(clave, le=str(limite))} {acumuladas}")
+        lineas.append(f"{nombre}_bucket{_etiquetas(clave, le='+Inf')} {serie.peticiones}")
+        lineas.append(f"{nombre}_sum{_etiquetas(clave)} {serie.segundos}")
+        lineas.append(f"{nombre}_count{_etiquetas(clave)} {serie.peticiones}")
+    return "\n".join(lineas) + "\n"
+
+
+def _tamano(response: HttpResponse) -> int:
+    if response.streaming:
+        return int(response.get("Content-Length") or 0)
+    return len(response.content)
+
+
+class MetricasMiddleware:
+    """Mide cada petición; se desactiva con METRICAS_ACTIVAS=False."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICAS_ACTIVAS", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        inicio = time.perf_counter()
+        medicion = request._medicion = MedicionPeticion()
+        with envolver_consultas(medicion):
+            response = self.get_response(request)
+        return self._terminar(request, response, time.perf_counter() - inicio, medicion)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        inicio = time.perf_counter()
+        medicion = request._medicion = MedicionPeticion()
+        with envolver_consultas(medicion):
+            response = await self.get_response(request)
+        return self._terminar(request, response, time.perf_counter() - inicio, medicion)
+
+    def _terminar(self, request: HttpRequest, response: HttpResponse, segundos: float, medicion) -> HttpResponse:
+        coincidencia = getattr(request, "resolver_match", None)
+        vista = coincidencia.view_name if coincidencia else SIN_RUTA
+        if vista != "metricas":
+            registro.registrar(vista, request.method, response.status_code, segundos, medicion, _tamano(response))
+        if getattr(settings, "METRICAS_SERVER_TIMING", True):
+            response["Server-Timing"] = ", ".join(
+                (
+                    f"app;dur={segundos * 1000:.1f}",
+                    f'db;dur={medicion.db_segundos * 1000:.1f};desc="{medicion.consultas} consultas"',
+                    f"tpl;dur={medicion.plantilla_segundos * 1000:.1f}",
+                )
+            )
+        return response
+
+    def process_template_response(self, request: HttpRequest, response):
+        # Se llama justo antes de renderizar el TemplateResponse; el callback cierra la medición.
+        medicion = request._medicion
+        medicion._inicio_plantilla = time.perf_counter()
+
+        def terminar(renderizada):
+            medicion.plantilla_segundos += time.perf_counter() - medicion._inicio_plantilla
+
+        response.add_post_render_callback(terminar)
+        return response
+
+
+def metricas_prometheus(request: HttpRequest) -> HttpResponse:
+    """`/metrics`: para personal (`is_staff`) o con `Authorization: Bearer <METRICAS_TOKEN>`."""
+    if not getattr(settings, "METRICAS_ACTIVAS", False):
+        raise Http404
+    token = getattr(settings, "METRICAS_TOKEN", "")
+    encabezado = request.headers.get("Authorization", "")
+    autorizado = request.user.is_authenticated and request.user.is_staff
+    if token and encabezado.startswith("Bearer "):
+        autorizado = autorizado or constant_time_compare(encabezado[len("Bearer "):], token)
+    if not autorizado:
+        return HttpResponseForbidden("Métricas restringidas.")
+    return HttpResponse(formato_prometheus(registro.copia()), content_type="text/plain; version=0.0.4; charset=utf-8")
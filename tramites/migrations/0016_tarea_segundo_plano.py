@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('licencias', '0015_remove_funcion_use_descripcion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TareaSegundoPlano',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(max_length=50, verbose_name='Tipo de tarea')),
+                ('parametros', models.JSONField(blank=True, default=dict, verbose_name='Parámetros')),
+                ('estatus', models.CharField(choices=[('pendiente', 'Pendiente'), ('en_proceso', 'En proceso'), ('completada', 'Completada'), ('fallida', 'Fallida')], default='pendiente', max_length=20, verbose_name='Estatus')),
+                ('resultado', models.FileField(blank=True, upload_to='tareas/%Y/%m/', verbose_name='Archivo de resultado')),
+                ('mensaje_error', models.TextField(blank=True, verbose_name='Error')),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('iniciado_en', models.DateTimeField(blank=True, null=True)),
+                ('terminado_en', models.DateTimeField(blank=True, null=True)),
+                ('creado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tareas_segundo_plano', to=settings.AUTH_USER_MODEL, verbose_name='Solicitada por')),
+            ],
+            options={
+                'verbose_name': 'Tarea en segundo plano',
+                'verbose_name_plural': 'Tareas en segundo plano',
+                'ordering': ('-creado_en',),
+                'indexes': [models.Index(fields=['estatus', 'creado_en'], name='licencias_t_estatus_c42d38_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:53
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def poblar_conteos(apps, schema_editor):
+    CasoInterno = apps.get_model("licencias", "CasoInterno")
+    ConteoTablero = apps.get_model("licencias", "ConteoTablero")
+    totales, abiertos = Counter(), Counter()
+    filas = CasoInterno.objects.values_list(
+        "asesor_cct", "estatus_id", "cct_sistema", "cct_modalidad", "fecha_apertura", "estatus__es_cierre"
+    )
+    for asesor, estatus_id, sistema, modalidad, fecha_apertura, es_cierre in filas.iterator():
+        claves = (
+            ("asesor", asesor or ""),
+            ("estatus", str(estatus_id or "")),
+            ("sistema", sistema or ""),
+            ("modalidad", modalidad or ""),
+            ("mes", fecha_apertura.strftime("%Y-%m") if fecha_apertura else ""),
+        )
+        totales.update(claves)
+        if not es_cierre:
+            abiertos.update(claves)
+    ConteoTablero.objects.bulk_create(
+        ConteoTablero(dimension=dimension, valor=valor, total=total, abiertos=abiertos[(dimension, valor)])
+        for (dimension, valor), total in totales.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('licencias', '0016_tarea_segundo_plano'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConteoTablero',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('asesor', 'Asesor'), ('estatus', 'Estatus'), ('sistema', 'Sistema'), ('modalidad', 'Modalidad'), ('mes', 'Mes de apertura')], max_length=20)),
+                ('valor', models.CharField(blank=True, max_length=255)),
+                ('total', models.IntegerField(default=0)),
+                ('abiertos', models.IntegerField(default=0)),
+                ('actualizado_en', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Conteo del tablero',
+                'verbose_name_plural': 'Conteos del tablero',
+                'ordering': ('dimension', 'valor'),
+            },
+        ),
+        migrations.AddField(
+            model_name='estatuscaso',
+            name='es_cierre',
+            field=models.BooleanField(default=False, help_text='Los trámites con este estatus dejan de contarse como abiertos.', verbose_name='Concluye el trámite'),
+        ),
+        migrations.AddField(
+            model_name='historicalestatuscaso',
+            name='es_cierre',
+            field=models.BooleanField(default=False, help_text='Los trámites con este estatus dejan de contarse como abiertos.', verbose_name='Concluye el trámite'),
+        ),
+        migrations.AddConstraint(
+            model_name='conteotablero',
+            constraint=models.UniqueConstraint(fields=('dimension', 'valor'), name='conteo_tablero_dimension_valor'),
+        ),
+        migrations.RunPython(poblar_conteos, migrations.RunPython.noop),
+    ]
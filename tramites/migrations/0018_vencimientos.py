@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('licencias', '0017_estatus_cierre_conteo_tablero'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='estatustramite',
+            name='es_cierre',
+            field=models.BooleanField(default=False, help_text='Los trámites con este estatus ya no generan alertas de vencimiento.', verbose_name='Concluye el trámite'),
+        ),
+        migrations.AddField(
+            model_name='historicalestatustramite',
+            name='es_cierre',
+            field=models.BooleanField(default=False, help_text='Los trámites con este estatus ya no generan alertas de vencimiento.', verbose_name='Concluye el trámite'),
+        ),
+        migrations.AddIndex(
+            model_name='casointerno',
+            index=models.Index(condition=models.Q(('fecha_termino__isnull', False)), fields=['fecha_termino', 'estatus'], name='caso_vencimiento_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tramitecaso',
+            index=models.Index(condition=models.Q(('fecha_termino__isnull', False)), fields=['fecha_termino', 'estatus'], name='tramite_caso_vencimiento_idx'),
+        ),
+    ]
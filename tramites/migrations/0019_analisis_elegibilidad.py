@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('licencias', '0018_vencimientos'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalisisElegibilidad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('docente', models.CharField(blank=True, max_length=255, verbose_name='Docente')),
+                ('identificador', models.CharField(blank=True, db_index=True, max_length=30, verbose_name='RFC / CURP')),
+                ('fecha_ingreso', models.DateField(verbose_name='Fecha de ingreso')),
+                ('fecha_analisis', models.DateField(blank=True, help_text='Si se deja vacía se usa la fecha del día.', null=True, verbose_name='Fecha de análisis')),
+                ('regimen', models.CharField(choices=[('issste', 'ISSSTE'), ('imss', 'IMSS')], default='issste', max_length=10)),
+                ('licencias', models.JSONField(blank=True, default=list, verbose_name='Licencias médicas')),
+                ('resultado', models.JSONField(blank=True, editable=False, null=True)),
+                ('huella_resultado', models.CharField(blank=True, editable=False, max_length=64)),
+                ('calculado_en', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('actualizado_en', models.DateTimeField(auto_now=True)),
+                ('caso', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='analisis_elegibilidad', to='licencias.casointerno', verbose_name='Trámite')),
+                ('creado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='analisis_elegibilidad', to=settings.AUTH_USER_MODEL, verbose_name='Capturado por')),
+            ],
+            options={
+                'verbose_name': 'Análisis de elegibilidad',
+                'verbose_name_plural': 'Análisis de elegibilidad',
+                'ordering': ('-actualizado_en',),
+            },
+        ),
+    ]
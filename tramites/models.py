@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from simple_history.models import HistoricalRecords
 
 from tramites.utils import normalise_sistema
@@ -95,6 +96,11 @@ class EstatusCaso(CatalogoBase):
     """Catálogo de estatus aplicables a cada trámite."""
 
     orden = models.PositiveIntegerField(default=1)
+    es_cierre = models.BooleanField(
+        default=False,
+        verbose_name="Concluye el trámite",
+        help_text="Los trámites con este estatus dejan de contarse como abiertos.",
+    )
 
     class Meta(CatalogoBase.Meta):
         ordering = ("orden", "nombre")
@@ -144,6 +150,11 @@ class EstatusTramite(CatalogoBase):
     """Catálogo de estatus específicos para trámites del caso."""
 
     orden = models.PositiveIntegerField(default=1)
+    es_cierre = models.BooleanField(
+        default=False,
+        verbose_name="Concluye el trámite",
+        help_text="Los trámites con este estatus ya no generan alertas de vencimiento.",
+    )
 
     class Meta(CatalogoBase.Meta):
         ordering = ("orden", "nombre")
@@ -256,6 +267,12 @@ class CasoInterno(models.Model):
             models.Index(fields=("cct",)),
             models.Index(fields=("estatus",)),
             models.Index(fields=("fecha_apertura",)),
+            # Solo los casos con fecha de término participan en las consultas de vencimientos.
+            models.Index(
+                fields=("fecha_termino", "estatus"),
+                condition=models.Q(fecha_termino__isnull=False),
+                name="caso_vencimiento_idx",
+            ),
         ]
         verbose_name = "Trámite"
         verbose_name_plural = "Trámites"
@@ -436,6 +453,13 @@ class TramiteCaso(models.Model):
 
     class Meta:
         ordering = ("-fecha", "-creado_en")
+        indexes = [
+            models.Index(
+                fields=("fecha_termino", "estatus"),
+                condition=models.Q(fecha_termino__isnull=False),
+                name="tramite_caso_vencimiento_idx",
+            ),
+        ]
         verbose_name = "Trámite del caso"
         verbose_name_plural = "Trámites del caso"
 
@@ -448,3 +472,153 @@ class TramiteCaso(models.Model):
             return None
         today = timezone.localdate()
         return (self.fecha_termino - today).days
+
+
+TAREA_PENDIENTE = "pendiente"
+TAREA_EN_PROCESO = "en_proceso"
+TAREA_COMPLETADA = "completada"
+TAREA_FALLIDA = "fallida"
+
+ESTATUS_TAREA_CHOICES = (
+    (TAREA_PENDIENTE, "Pendiente"),
+    (TAREA_EN_PROCESO, "En proceso"),
+    (TAREA_COMPLETADA, "Completada"),
+    (TAREA_FALLIDA, "Fallida"),
+)
+
+
+class TareaSegundoPlano(models.Model):
+    """Trabajo pesado (exportaciones, PDF) que ejecuta el worker fuera de las peticiones web."""
+
+    tipo = models.CharField(max_length=50, verbose_name="Tipo de tarea")
+    parametros = models.JSONField(default=dict, blank=True, verbose_name="Parámetros")
+    estatus = models.CharField(
+        max_length=20,
+        choices=ESTATUS_TAREA_CHOICES,
+        default=TAREA_PENDIENTE,
+        verbose_name="Estatus",
+    )
+    resultado = models.FileField(upload_to="tareas/%Y/%m/", blank=True, verbose_name="Archivo de resultado")
+    mensaje_error = models.TextField(blank=True, verbose_name="Error")
+    intentos = models.PositiveSmallIntegerField(default=0)
+    creado_por = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="tareas_segundo_plano",
+        verbose_name="Solicitada por",
+        blank=True,
+        null=True,
+    )
+    creado_en = models.DateTimeField(auto_now_add=True)
+    iniciado_en = models.DateTimeField(blank=True, null=True)
+    terminado_en = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ("-creado_en",)
+        indexes = [
+            models.Index(fields=("estatus", "creado_en")),
+        ]
+        verbose_name = "Tarea en segundo plano"
+        verbose_name_plural = "Tareas en segundo plano"
+
+    def __str__(self) -> str:
+        return f"{self.tipo} #{self.pk} · {self.get_estatus_display()}"
+
+    @property
+    def terminada(self) -> bool:
+        return self.estatus in {TAREA_COMPLETADA, TAREA_FALLIDA}
+
+
+DIMENSION_ASESOR = "asesor"
+DIMENSION_ESTATUS = "estatus"
+DIMENSION_SISTEMA = "sistema"
+DIMENSION_MODALIDAD = "modalidad"
+DIMENSION_MES = "mes"
+
+DIMENSIONES_TABLERO_CHOICES = (
+    (DIMENSION_ASESOR, "Asesor"),
+    (DIMENSION_ESTATUS, "Estatus"),
+    (DIMENSION_SISTEMA, "Sistema"),
+    (DIMENSION_MODALIDAD, "Modalidad"),
+    (DIMENSION_MES, "Mes de apertura"),
+)
+
+
+class ConteoTablero(models.Model):
+    """Conteo precalculado de trámites por dimensión; se mantiene al guardar cada caso."""
+
+    dimension = models.CharField(max_length=20, choices=DIMENSIONES_TABLERO_CHOICES)
+    valor = models.CharField(max_length=255, blank=True)
+    total = models.IntegerField(default=0)
+    abiertos = models.IntegerField(default=0)
+    actualizado_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("dimension", "valor")
+        constraints = [
+            models.UniqueConstraint(fields=("dimension", "valor"), name="conteo_tablero_dimension_valor"),
+        ]
+        verbose_name = "Conteo del tablero"
+        verbose_name_plural = "Conteos del tablero"
+
+    def __str__(self) -> str:
+        return f"{self.get_dimension_display()} · {self.valor or '—'}: {self.abiertos}/{self.total}"
+
+
+REGIMEN_ISSSTE = "issste"
+REGIMEN_IMSS = "imss"
+
+REGIMEN_CHOICES = (
+    (REGIMEN_ISSSTE, "ISSSTE"),
+    (REGIMEN_IMSS, "IMSS"),
+)
+
+
+class AnalisisElegibilidad(models.Model):
+    """Análisis guardado del analizador de requisitos con su resultado en caché."""
+
+    caso = models.ForeignKey(
+        CasoInterno,
+        on_delete=models.SET_NULL,
+        related_name="analisis_elegibilidad",
+        verbose_name="Trámite",
+        blank=True,
+        null=True,
+    )
+    docente = models.CharField(max_length=255, blank=True, verbose_name="Docente")
+    identificador = models.CharField(
+        max_length=30,
+        blank=True,
+        db_index=True,
+        verbose_name="RFC / CURP",
+    )
+    fecha_ingreso = models.DateField(verbose_name="Fecha de ingreso")
+    fecha_analisis = models.DateField(
+        blank=True,
+        null=True,
+        verbose_name="Fecha de análisis",
+        help_text="Si se deja vacía se usa la fecha del día.",
+    )
+    regimen = models.CharField(max_length=10, choices=REGIMEN_CHOICES, default=REGIMEN_ISSSTE)
+    licencias = models.JSONField(default=list, blank=True, verbose_name="Licencias médicas")
+    resultado = models.JSONField(blank=True, null=True, editable=False)
+    huella_resultado = models.CharField(max_length=64, blank=True, editable=False)
+    calculado_en = models.DateTimeField(blank=True, null=True, editable=False)
+    creado_por = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="analisis_elegibilidad",
+        verbose_name="Capturado por",
+        blank=True,
+        null=True,
+    )
+    creado_en = models.DateTimeField(auto_now_add=True)
+    actualizado_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-actualizado_en",)
+        verbose_name = "Análisis de elegibilidad"
+        verbose_name_plural = "Análisis de elegibilidad"
+
+    def __str__(self) -> str:
+        return f"{self.docente or self.identificador or 'Análisis'} · {self.fecha_ingreso:%d/%m/%Y}"
@@ -0,0 +1,106 @@
+"""Renderizador de formularios con los widgets comunes armados en Python.
+
+Con el renderizador de Django, cada `<input>`, `<select>` y `<option>` pasa por
+una plantilla y por `attrs.html`, que recorre los atributos con `{% for %}`/`{% if %}`.
+En los formularios grandes de trámites eso es la mayor parte del tiempo de
+render. `RenderizadorFormularios` produce el mismo HTML para las plantillas
+estándar de input, textarea, select y option, con el mismo escapado
+(`render_value_in_context`, `stringformat:'s'`). Cualquier otra plantilla se
+renderiza como siempre; si una app llegara a reemplazar alguna de esas cuatro,
+hay que quitarla de `RAPIDOS`.
+
+`python manage.py benchmark_formularios` compara ambos renderizadores.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from django.forms.renderers import DjangoTemplates
+from django.template import Context
+from django.template.base import render_value_in_context
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData, mark_safe
+
+PLANTILLA_OPCION = "django/forms/widgets/select_option.html"
+PLANTILLAS_INPUT = frozenset(
+    f"django/forms/widgets/{nombre}.html"
+    for nombre in ("input", "text", "number", "email", "url", "password", "hidden", "date", "datetime", "time")
+)
+
+# Contexto por omisión de una plantilla: autoescape activo, localización según settings.
+_CONTEXTO = Context()
+
+
+def _valor(valor: Any) -> str:
+    """`{{ valor }}`."""
+    return render_value_in_context(valor, _CONTEXTO)
+
+
+def _formato_s(valor: Any) -> str:
+    """`{{ valor|stringformat:'s' }}`."""
+    try:
+        texto = "%s" % (str(valor) if isinstance(valor, tuple) else valor)
+    except (ValueError, TypeError):
+        texto = ""
+    if isinstance(valor, SafeData):
+        texto = mark_safe(texto)
+    return conditional_escape(texto)
+
+
+def _atributos(attrs: dict) -> str:
+    """`django/forms/widgets/attrs.html`."""
+    partes = []
+    for nombre, valor in attrs.items():
+        if valor is False:
+            continue
+        partes.append(f" {_valor(nombre)}" if valor is True else f' {_valor(nombre)}="{_formato_s(valor)}"')
+    return "".join(partes)
+
+
+def _input(widget: dict) -> str:
+    valor = "" if widget["value"] is None else f' value="{_formato_s(widget["value"])}"'
+    return f'<input type="{_valor(widget["type"])}" name="{_valor(widget["name"])}"{valor}{_atributos(widget["attrs"])}>'
+
+
+def _textarea(widget: dict) -> str:
+    valor = _valor(widget["value"]) if widget["value"] else ""
+    return f'<textarea name="{_valor(widget["name"])}"{_atributos(widget["attrs"])}>\n{valor}</textarea>'
+
+
+def _opcion(opcion: dict) -> str:
+    return (
+        f'<option value="{_formato_s(opcion["value"])}"{_atributos(opcion["attrs"])}>'
+        f'{_valor(opcion["label"])}</option>\n'
+    )
+
+
+def _select(widget: dict) -> str | None:
+    partes = [f'<select name="{_valor(widget["name"])}"{_atributos(widget["attrs"])}>']
+    for grupo, opciones, _indice in widget["optgroups"]:
+        if grupo:
+            partes.append(f'\n  <optgroup label="{_valor(grupo)}">')
+        for opcion in opciones:
+            if opcion["template_name"] != PLANTILLA_OPCION:
+                return None
+            partes.append(f"\n  {_opcion(opcion)}")
+        if grupo:
+            partes.append("\n  </optgroup>")
+    partes.append("\n</select>")
+    return "".join(partes)
+
+
+RAPIDOS: dict[str, Callable[[dict], str | None]] = {
+    **{plantilla: _input for plantilla in PLANTILLAS_INPUT},
+    "django/forms/widgets/textarea.html": _textarea,
+    "django/forms/widgets/select.html": _select,
+    PLANTILLA_OPCION: _opcion,
+}
+
+
+class RenderizadorFormularios(DjangoTemplates):
+    def render(self, template_name, context, request=None):
+        rapido = RAPIDOS.get(template_name)
+        html = rapido(context["widget"]) if rapido is not None and "widget" in context else None
+        if html is None:
+            return super().render(template_name, context, request=request)
+        return html.strip()
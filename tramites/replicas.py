@@ -0,0 +1,146 @@
+"""Lecturas en una réplica de PostgreSQL con "leer lo propio" tras escribir.
+
+`RouterReplica` manda a la réplica (alias `replica`) solo las lecturas de una
+petición GET/HEAD cuya vista declara `usa_replica = True` (listados, detalle, API
+list/retrieve, tableros) y las de `lecturas_en_replica()` (exportaciones). Todo lo
+demás, y cualquier escritura, va a `default`.
+
+Después de que una petición escribe, `ReplicaMiddleware` deja la cookie
+`REPLICA_COOKIE` durante `REPLICA_PEGAJOSA_SEGUNDOS`: mientras exista, las
+lecturas de ese navegador siguen en la primaria y el usuario ve su propio cambio
+aunque la réplica vaya atrasada. Dentro de la misma petición, una escritura manda
+las lecturas posteriores a la primaria.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest, HttpResponse
+
+ALIAS_REPLICA = "replica"
+REPLICA_COOKIE = "leer_primaria"
+METODOS_LECTURA = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class EstadoLectura:
+    """Lo que el router necesita saber de la petición (o bloque) en curso."""
+
+    lectura: bool = False
+    pegado: bool = False
+    escribio: bool = False
+
+    @property
+    def usa_replica(self) -> bool:
+        return self.lectura and not self.pegado and not self.escribio
+
+
+_estado: ContextVar[EstadoLectura | None] = ContextVar("estado_lectura_replica", default=None)
+
+
+@contextmanager
+def lecturas_en_replica() -> Iterator[EstadoLectura]:
+    """Para tareas de solo lectura fuera de una petición (p. ej. exportaciones)."""
+    estado = EstadoLectura(lectura=True)
+    token = _estado.set(estado)
+    try:
+        yield estado
+    finally:
+        _estado.reset(token)
+
+
+def replica_utilizable() -> bool:
+    """Hay alias `replica` y no apunta a la primaria (como el espejo `TEST.MIRROR` en pruebas).
+
+    Si apuntara a la misma base, otra conexión no vería lo pendiente en la transacción de la primaria.
+    """
+    if ALIAS_REPLICA not in connections.settings:
+        return False
+    replica = connections[ALIAS_REPLICA].settings_dict
+    primaria = connections[DEFAULT_DB_ALIAS].settings_dict
+    return any(replica.get(clave) != primaria.get(clave) for clave in ("ENGINE", "NAME", "HOST", "PORT"))
+
+
+class RouterReplica:
+    def db_for_read(self, model, **hints):
+        estado = _estado.get()
+        if estado is not None and estado.usa_replica and replica_utilizable():
+            return ALIAS_REPLICA
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        estado = _estado.get()
+        if estado is not None:
+            estado.escribio = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, ALIAS_REPLICA}
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # La réplica recibe el esquema por replicación, no por migraciones.
+        return db != ALIAS_REPLICA
+
+
+def vista_usa_replica(view_func) -> bool:
+    clase = getattr(view_func, "view_class", None) or getattr(view_func, "cls", None)
+    return bool(getattr(clase, "usa_replica", False) or getattr(view_func, "usa_replica", False))
+
+
+class ReplicaMiddleware:
+    """Marca las peticiones de solo lectura y fija la primaria tras una escritura."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REPLICA_LECTURA", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        estado = request._estado_lectura = EstadoLectura(pegado=REPLICA_COOKIE in request.COOKIES)
+        token = _estado.set(estado)
+        try:
+            response = self.get_response(request)
+        finally:
+            _estado.reset(token)
+        return self._pegar(estado, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        estado = request._estado_lectura = EstadoLectura(pegado=REPLICA_COOKIE in request.COOKIES)
+        token = _estado.set(estado)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _estado.reset(token)
+        return self._pegar(estado, response)
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        # Se modifica el objeto y no la ContextVar: en modo async este método corre en otro contexto.
+        if request.method in METODOS_LECTURA and vista_usa_replica(view_func):
+            request._estado_lectura.lectura = True
+        return None
+
+    def _pegar(self, estado: EstadoLectura, response: HttpResponse) -> HttpResponse:
+        if estado.escribio:
+            response.set_cookie(
+                REPLICA_COOKIE,
+                "1",
+                max_age=getattr(settings, "REPLICA_PEGAJOSA_SEGUNDOS", 10),
+                httponly=True,
+                samesite="Lax",
+                secure=settings.SESSION_COOKIE_SECURE,
+            )
+        return response
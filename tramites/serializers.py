@@ -3,9 +3,11 @@ from __future__ import annotations
 
 from typing import Any
 
+from django.conf import settings
 from rest_framework import serializers
 
 from tramites import models
+from tramites.services import catalogo_cct, elegibilidad
 from tramites.utils import normalise_sistema
 
 
@@ -40,6 +42,35 @@ class CCTSecundariaSerializer(serializers.ModelSerializer):
         return data
 
 
+class CCTLoteSerializer(serializers.Serializer):
+    """Claves a resolver en `POST /api/ccts/buscar/` (máximo `CCT_LOTE_MAXIMO`)."""
+
+    ccts = serializers.ListField(child=serializers.CharField(allow_blank=True), allow_empty=False)
+
+    def validate_ccts(self, value: list[str]) -> list[str]:
+        codigos = catalogo_cct.normalizar_codigos(value)
+        maximo = settings.CCT_LOTE_MAXIMO
+        if not codigos:
+            raise serializers.ValidationError("Envía al menos una clave de CCT.")
+        if len(codigos) > maximo:
+            raise serializers.ValidationError(f"Máximo {maximo} CCT por consulta (se recibieron {len(codigos)}).")
+        return codigos
+
+
+class EstatusMasivoSerializer(serializers.Serializer):
+    """Entrada de `POST /api/casos/estatus/` (máximo `ESTATUS_MASIVO_MAXIMO` casos)."""
+
+    casos = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+    estatus = serializers.PrimaryKeyRelatedField(queryset=models.EstatusCaso.objects.all())
+    comentario = serializers.CharField(required=False, allow_blank=True, default="")
+
+    def validate_casos(self, value: list[int]) -> list[int]:
+        maximo = settings.ESTATUS_MASIVO_MAXIMO
+        if len(value) > maximo:
+            raise serializers.ValidationError(f"Máximo {maximo} casos por solicitud (se recibieron {len(value)}).")
+        return value
+
+
 class TipoProcesoSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.TipoProceso
@@ -66,6 +97,7 @@ class EstatusCasoSerializer(serializers.ModelSerializer):
             "nombre",
             "esta_activo",
             "orden",
+            "es_cierre",
         )
 
     def validate_nombre(self, value: str) -> str:
@@ -182,6 +214,7 @@ class EstatusTramiteSerializer(serializers.ModelSerializer):
             "descripcion",
             "esta_activo",
             "orden",
+            "es_cierre",
         )
 
     def validate_nombre(self, value: str) -> str:
@@ -189,3 +222,108 @@ class EstatusTramiteSerializer(serializers.ModelSerializer):
         if not value:
             raise serializers.ValidationError("Este campo es obligatorio.")
         return value
+
+
+class CasoVencimientoSerializer(serializers.ModelSerializer):
+    estatus = serializers.CharField(source="estatus.nombre", read_only=True)
+    dias_restantes = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = models.CasoInterno
+        fields = (
+            "id",
+            "cct",
+            "cct_nombre",
+            "asesor_cct",
+            "numero_oficio",
+            "estatus",
+            "fecha_termino",
+            "dias_restantes",
+        )
+
+
+class TramiteVencimientoSerializer(serializers.ModelSerializer):
+    tipo = serializers.CharField(source="tipo.nombre", read_only=True)
+    estatus = serializers.CharField(source="estatus.nombre", read_only=True, default=None)
+    asesor_cct = serializers.CharField(source="caso.asesor_cct", read_only=True)
+    dias_restantes = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = models.TramiteCaso
+        fields = (
+            "id",
+            "caso",
+            "asesor_cct",
+            "tipo",
+            "asunto",
+            "numero_oficio",
+            "estatus",
+            "fecha_termino",
+            "dias_restantes",
+        )
+
+
+class AnalisisElegibilidadSerializer(serializers.ModelSerializer):
+    """El resultado se guarda al escribir; al leer solo se calcula, sin guardar, si quedó desfasado."""
+
+    resultado = serializers.SerializerMethodField()
+    errores_resultado = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.AnalisisElegibilidad
+        fields = (
+            "id",
+            "caso",
+            "docente",
+            "identificador",
+            "fecha_ingreso",
+            "fecha_analisis",
+            "regimen",
+            "licencias",
+            "resultado",
+            "errores_resultado",
+            "calculado_en",
+            "creado_en",
+            "actualizado_en",
+        )
+        read_only_fields = ("calculado_en", "creado_en", "actualizado_en")
+
+    def validate_licencias(self, value):
+        if not isinstance(value, list):
+            raise serializers.ValidationError("Debe ser una lista de periodos con `inicio` y `fin`.")
+        errores: list[str] = []
+        licencias = []
+        for numero, licencia in enumerate(value, start=1):
+            if not isinstance(licencia, dict):
+                errores.append(f"Licencia {numero}: debe tener `inicio` y `fin`.")
+                continue
+            previos = len(errores)
+            inicio = elegibilidad.parsear_fecha(licencia.get("inicio"), f"Licencia {numero}", errores)
+            fin = elegibilidad.parsear_fecha(licencia.get("fin"), f"Licencia {numero}", errores)
+            if len(errores) > previos:
+                continue
+            if inicio is None or fin is None:
+                errores.append(f"Licencia {numero}: faltan fechas.")
+                continue
+            if fin < inicio:
+                errores.append(f"Licencia {numero}: la fecha de término es anterior al inicio.")
+                continue
+            licencias.append({"inicio": inicio.isoformat(), "fin": fin.isoformat()})
+        if errores:
+            raise serializers.ValidationError(errores)
+        return licencias
+
+    def _evaluar(self, obj: models.AnalisisElegibilidad) -> tuple[dict | None, list[str]]:
+        evaluados = self.context.setdefault("_resultados_analisis", {})
+        if obj.pk not in evaluados:
+            try:
+                evaluados[obj.pk] = (elegibilidad.resultado_de_analisis(obj), [])
+            except elegibilidad.LoteInvalido as exc:
+                evaluados[obj.pk] = (None, exc.errores)
+        return evaluados[obj.pk]
+
+    def get_resultado(self, obj: models.AnalisisElegibilidad):
+        return self._evaluar(obj)[0]
+
+    def get_errores_resultado(self, obj: models.AnalisisElegibilidad) -> list[str]:
+        return self._evaluar(obj)[1]
@@ -1,3 +1,9 @@
+from tramites.services.expediente_pdf import generar_expediente_pdf, generar_expedientes_lote
 from tramites.services.import_ccts import importar_ccts, ImportCCTResult
 
-__all__ = ["importar_ccts", "ImportCCTResult"]
+__all__ = [
+    "generar_expediente_pdf",
+    "generar_expedientes_lote",
+    "importar_ccts",
+    "ImportCCTResult",
+]
@@ -0,0 +1,213 @@
+"""Reproduce una mezcla de peticiones típicas y mide latencias (`manage.py benchmark_tramites`).
+
+Cada hilo usa su propio `django.test.Client` con sesión iniciada, así que se mide
+la pila completa de Django (middleware, vistas, plantillas, base de datos) sin el
+ruido de la red. Los escenarios eligen casos y CCT al azar entre los existentes;
+`seed_benchmark` genera el volumen.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from django.test import Client
+from django.urls import reverse
+
+from tramites import models
+
+POR_PAGINA = 25  # paginate_by de los listados y PAGE_SIZE de la API.
+
+MEZCLA_PREDETERMINADA = {
+    "listado": 25,
+    "listado_filtrado": 15,
+    "busqueda": 10,
+    "detalle": 25,
+    "cambio_estatus": 5,
+    "consulta_cct": 10,
+    "api_listado": 10,
+}
+
+
+@dataclass
+class Muestras:
+    """Datos que los escenarios eligen al azar (se leen una vez antes de la corrida)."""
+
+    casos: list[int]
+    ccts: list[str]
+    estatus: list[int]
+    asesores: list[str]
+    paginas_casos: int = 1
+    paginas_tramites: int = 1
+    palabras: list[str] = field(default_factory=lambda: ["oficio", "licencia", "queja", "seguimiento", "SE/"])
+
+    @classmethod
+    def cargar(cls, limite: int = 5000) -> Muestras:
+        muestras = cls(
+            casos=list(models.CasoInterno.objects.order_by("-pk").values_list("pk", flat=True)[:limite]),
+            ccts=list(models.CCTSecundaria.objects.order_by("cct").values_list("cct", flat=True)[:limite]),
+            estatus=list(models.EstatusCaso.objects.values_list("pk", flat=True)),
+            asesores=list(
+                models.CasoInterno.objects.exclude(asesor_cct="").values_list("asesor_cct", flat=True).distinct()[:50]
+            ),
+            paginas_casos=max(1, math.ceil(models.CasoInterno.objects.count() / POR_PAGINA)),
+            paginas_tramites=max(1, math.ceil(models.TramiteCaso.objects.count() / POR_PAGINA)),
+        )
+        if not muestras.casos or not muestras.estatus:
+            raise ValueError("No hay casos para el benchmark; ejecuta primero `manage.py seed_benchmark`.")
+        return muestras
+
+
+def _listado(client: Client, rng: random.Random, muestras: Muestras):
+    return client.get(reverse("tramites:casointerno-list"), {"page": rng.randint(1, min(5, muestras.paginas_casos))})
+
+
+def _listado_filtrado(client: Client, rng: random.Random, muestras: Muestras):
+    filtros = {"estatus": rng.choice(muestras.estatus)}
+    if muestras.asesores and rng.random() < 0.5:
+        filtros["asesor_cct"] = rng.choice(muestras.asesores)
+    if rng.random() < 0.5:
+        filtros["fecha_apertura_after"] = f"{rng.randint(2023, 2025)}-01-01"
+    return client.get(reverse("tramites:casointerno-list"), filtros)
+
+
+def _busqueda(client: Client, rng: random.Random, muestras: Muestras):
+    return client.get(reverse("tramites:casointerno-list"), {"buscar": rng.choice(muestras.palabras)})
+
+
+def _detalle(client: Client, rng: random.Random, muestras: Muestras):
+    return client.get(reverse("tramites:casointerno-detail", kwargs={"pk": rng.choice(muestras.casos)}))
+
+
+def _cambio_estatus(client: Client, rng: random.Random, muestras: Muestras):
+    return client.post(
+        reverse("tramites:casointerno-estatus-create", kwargs={"pk": rng.choice(muestras.casos)}),
+        {"estatus_nuevo": rng.choice(muestras.estatus), "comentario": "benchmark"},
+    )
+
+
+def _consulta_cct(client: Client, rng: random.Random, muestras: Muestras):
+    return client.get(reverse("tramites:cct-lookup"), {"cct": rng.choice(muestras.ccts) if muestras.ccts else ""})
+
+
+def _api_listado(client: Client, rng: random.Random, muestras: Muestras):
+    return client.get(reverse("tramites_api:tramite-caso-list"), {"page": rng.randint(1, min(3, muestras.paginas_tramites))})
+
+
+ESCENARIOS: dict[str, Callable] = {
+    "listado": _listado,
+    "listado_filtrado": _listado_filtrado,
+    "busqueda": _busqueda,
+    "detalle": _detalle,
+    "cambio_estatus": _cambio_estatus,
+    "consulta_cct": _consulta_cct,
+    "api_listado": _api_listado,
+}
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not valores:
+        return 0.0
+    return valores[max(0, math.ceil(p / 100 * len(valores)) - 1)]
+
+
+@dataclass
+class Resultado:
+    duracion_s: float
+    por_escenario: dict[str, list[float]]
+    errores: dict[str, int]
+
+    @property
+    def total(self) -> int:
+        return sum(len(tiempos) for tiempos in self.por_escenario.values())
+
+    def resumen(self) -> dict[str, dict[str, float]]:
+        filas = {}
+        todos = []
+        for nombre, tiempos in sorted(self.por_escenario.items()):
+            tiempos = sorted(tiempos)
+            todos += tiempos
+            filas[nombre] = self._fila(tiempos, self.errores.get(nombre, 0))
+        filas["total"] = self._fila(sorted(todos), sum(self.errores.values()))
+        filas["total"]["rps"] = self.total / self.duracion_s if self.duracion_s else 0.0
+        return filas
+
+    @staticmethod
+    def _fila(tiempos: list[float], errores: int) -> dict[str, float]:
+        return {
+            "peticiones": len(tiempos),
+            "errores": errores,
+            "p50_ms": percentil(tiempos, 50),
+            "p95_ms": percentil(tiempos, 95),
+            "p99_ms": percentil(tiempos, 99),
+        }
+
+
+def parsear_mezcla(texto: str) -> dict[str, int]:
+    """`"listado=3,detalle=1"` → pesos por escenario."""
+    mezcla = {}
+    for parte in filter(None, (p.strip() for p in texto.split(","))):
+        nombre, _, peso = parte.partition("=")
+        if nombre not in ESCENARIOS:
+            raise ValueError(f"Escenario desconocido: {nombre} (disponibles: {', '.join(ESCENARIOS)})")
+        mezcla[nombre] = int(peso or 1)
+    return mezcla
+
+
+def ejecutar(
+    usuario,
+    peticiones: int = 500,
+    concurrencia: int = 4,
+    mezcla: dict[str, int] | None = None,
+    semilla: int = 7,
+    calentamiento: int = 10,
+) -> Resultado:
+    """Ejecuta `peticiones` repartidas entre `concurrencia` hilos según los pesos de `mezcla`."""
+    mezcla = mezcla or MEZCLA_PREDETERMINADA
+    muestras = Muestras.cargar()
+    nombres = list(mezcla)
+    pesos = [mezcla[nombre] for nombre in nombres]
+    por_escenario: dict[str, list[float]] = defaultdict(list)
+    errores: dict[str, int] = defaultdict(int)
+    candado = threading.Lock()
+    locales = threading.local()
+    # Una sola sesión, creada antes de arrancar los hilos: iniciar sesión en paralelo
+    # escribe django_session desde varios hilos y SQLite puede rechazarlo.
+    # Fuera de las pruebas "testserver" no está en ALLOWED_HOSTS.
+    sesion = Client(HTTP_HOST="localhost")
+    sesion.force_login(usuario)
+
+    def cliente() -> Client:
+        if not hasattr(locales, "client"):
+            locales.client = Client(HTTP_HOST="localhost")
+            locales.client.cookies.load({nombre: cookie.value for nombre, cookie in sesion.cookies.items()})
+        return locales.client
+
+    def correr(indice: int, medir: bool = True) -> None:
+        rng = random.Random(semilla * 100_003 + indice)
+        nombre = rng.choices(nombres, weights=pesos)[0]
+        inicio = time.perf_counter()
+        try:
+            respuesta = ESCENARIOS[nombre](cliente(), rng, muestras)
+            fallo = respuesta.status_code >= 400
+        except Exception:
+            fallo = True
+        milisegundos = (time.perf_counter() - inicio) * 1000
+        if medir:
+            with candado:
+                por_escenario[nombre].append(milisegundos)
+                if fallo:
+                    errores[nombre] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrencia) as hilos:
+        list(hilos.map(lambda i: correr(-1 - i, medir=False), range(calentamiento)))
+        inicio = time.perf_counter()
+        list(hilos.map(correr, range(peticiones)))
+        duracion = time.perf_counter() - inicio
+    return Resultado(duracion, dict(por_escenario), dict(errores))
@@ -0,0 +1,103 @@
+"""Consultas al catálogo de CCT: por lote, por clave y el listado de los formularios.
+
+La consulta por clave y el listado completo se guardan en los espacios de caché
+`ccts` y `catalogos`; `tramites.signals` los invalida al guardar o borrar un CCT.
+Las funciones con prefijo `a` son sus equivalentes para las vistas async.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from django.db.models import Q
+
+from tramites import models
+from tramites.cache import cache_de
+from tramites.utils import normalise_sistema
+
+CLAVE_CATALOGO = "cct:formulario"
+CAMPOS_SUGERENCIA = ("cct", "nombre", "asesor", "servicio", "sostenimiento", "municipio", "turno")
+
+
+def normalizar_codigos(valores: Iterable[str]) -> list[str]:
+    """Claves en mayúsculas, sin espacios ni repetidas, en el orden recibido."""
+    codigos = (str(valor or "").strip().upper() for valor in valores)
+    return list(dict.fromkeys(codigo for codigo in codigos if codigo))
+
+
+def buscar_ccts(codigos: Iterable[str]) -> dict[str, models.CCTSecundaria | None]:
+    """Resuelve las claves con un solo `IN` sobre la llave primaria; None si no existe."""
+    codigos = normalizar_codigos(codigos)
+    encontrados = models.CCTSecundaria.objects.in_bulk(codigos)
+    return {codigo: encontrados.get(codigo) for codigo in codigos}
+
+
+def _datos_consulta(cct: models.CCTSecundaria | None) -> dict[str, Any]:
+    if cct is None:
+        return {"found": False}
+    return {
+        "found": True,
+        "cct": cct.cct,
+        "c_nombre": cct.nombre,
+        "sostenimiento_c_subcontrol": normalise_sistema(cct.sostenimiento),
+        "tiponivelsub_c_servicion3": cct.servicio or "",
+        "asesor": cct.asesor or "",
+    }
+
+
+def consultar_cct(codigo: str) -> dict[str, Any] | None:
+    """Datos de un CCT para el autocompletado; None si no existe (también se guarda en caché)."""
+    codigo = codigo.strip().upper()
+    cache = cache_de("ccts")
+    datos = cache.get(codigo)
+    if datos is None:
+        datos = _datos_consulta(models.CCTSecundaria.objects.filter(cct__iexact=codigo).first())
+        cache.set(codigo, datos)
+    return datos if datos["found"] else None
+
+
+async def aconsultar_cct(codigo: str) -> dict[str, Any] | None:
+    """`consultar_cct` con ORM y caché async."""
+    codigo = codigo.strip().upper()
+    cache = cache_de("ccts")
+    datos = await cache.aget(codigo)
+    if datos is None:
+        datos = _datos_consulta(await models.CCTSecundaria.objects.filter(cct__iexact=codigo).afirst())
+        await cache.aset(codigo, datos)
+    return datos if datos["found"] else None
+
+
+async def asugerencias(termino: str, limite: int = 7) -> list[dict[str, Any]]:
+    """CCT cuya clave empieza con el término o cuyo nombre o municipio lo contiene."""
+    termino = termino.strip()
+    if not termino:
+        return []
+    consulta = (
+        models.CCTSecundaria.objects.filter(
+            Q(cct__istartswith=termino) | Q(nombre__icontains=termino) | Q(municipio__icontains=termino)
+        )
+        .order_by("cct")
+        .values(*CAMPOS_SUGERENCIA)[:limite]
+    )
+    sugerencias = [fila async for fila in consulta]
+    for fila in sugerencias:
+        fila["sostenimiento"] = normalise_sistema(fila["sostenimiento"])
+    return sugerencias
+
+
+def catalogo_formulario() -> list[dict[str, Any]]:
+    """Catálogo completo que se incrusta en los formularios de trámites."""
+
+    def calcular() -> list[dict[str, Any]]:
+        catalogo = list(
+            models.CCTSecundaria.objects.order_by("cct").values("cct", "nombre", "servicio", "asesor", "sostenimiento")
+        )
+        for item in catalogo:
+            item["sostenimiento"] = normalise_sistema(item.get("sostenimiento"))
+        return catalogo
+
+    return cache_de("catalogos").get_or_set(CLAVE_CATALOGO, calcular)
+
+
+def invalidar_cct(codigo: str) -> None:
+    cache_de("ccts").delete(codigo.strip().upper())
+    cache_de("catalogos").delete(CLAVE_CATALOGO)
@@ -0,0 +1,42 @@
+"""Catálogos activos (prefijos, tipos de violencia, solicitantes, destinatarios) en caché.
+
+Se leen en cada formulario de trámites y cambian poco; `tramites.signals`
+borra la entrada del modelo al guardar o eliminar un registro. Ese borrado solo
+llega a todos los workers con caché compartida (redis). Con una caché por
+proceso el espacio `catalogos` caduca al minuto, así que otro worker sirve la
+lista vieja a lo más ese tiempo. `aactivos` comparte la entrada de caché con
+`activos` para las vistas async.
+"""
+from __future__ import annotations
+
+from django.db.models import Model
+
+from tramites import models
+from tramites.cache import cache_de
+
+MODELOS = (models.PrefijoOficio, models.TipoViolencia, models.Solicitante, models.Destinatario)
+POR_NOMBRE = {modelo._meta.model_name: modelo for modelo in MODELOS}
+
+
+def _clave(modelo: type[Model]) -> str:
+    return f"activos:{modelo._meta.model_name}"
+
+
+def _consulta(modelo: type[Model]):
+    return modelo.objects.filter(esta_activo=True).order_by("nombre")
+
+
+def activos(modelo: type[Model]) -> list[Model]:
+    """Registros con `esta_activo=True` ordenados por nombre."""
+    return cache_de("catalogos").get_or_set(_clave(modelo), lambda: list(_consulta(modelo)))
+
+
+async def aactivos(modelo: type[Model]) -> list[Model]:
+    async def calcular() -> list[Model]:
+        return [registro async for registro in _consulta(modelo)]
+
+    return await cache_de("catalogos").aget_or_set(_clave(modelo), calcular)
+
+
+def invalidar(modelo: type[Model]) -> None:
+    cache_de("catalogos").delete(_clave(modelo))
@@ -0,0 +1,224 @@
+"""Cribado masivo de elegibilidad a partir de hojas de cálculo de Recursos Humanos.
+
+El archivo trae una fila por licencia (`id`, `ingreso`, `licencia_inicio`,
+`licencia_fin` y opcionalmente `nombre`, `analisis`, `regimen`); las filas de una
+misma persona deben ser consecutivas. Se lee con pandas por bloques y cada
+bloque se evalúa con `elegibilidad.evaluar_arreglos` en una sola pasada
+vectorizada, sin construir objetos por persona. pandas se importa dentro de
+las funciones para no cargarlo en los procesos web (solo lo usa el worker).
+"""
+from __future__ import annotations
+
+import io
+from datetime import date
+from pathlib import PurePath
+from typing import IO, TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from tramites.services import elegibilidad
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TAMANO_BLOQUE = 50_000
+EXTENSIONES_PERMITIDAS = {".csv", ".xlsx"}
+COLUMNAS_REQUERIDAS = ("id", "ingreso")
+ALIAS_COLUMNAS = {
+    "rfc": "id",
+    "curp": "id",
+    "fecha_ingreso": "ingreso",
+    "fecha_analisis": "analisis",
+    "inicio": "licencia_inicio",
+    "fin": "licencia_fin",
+    "docente": "nombre",
+}
+COLUMNAS_RESULTADO = (
+    ("id", "Id"),
+    ("nombre", "Nombre"),
+    ("ingreso", "Fecha de ingreso"),
+    ("analisis", "Fecha de análisis"),
+    ("regimen", "Régimen"),
+    ("fecha_minima", "Cumple 15 años el"),
+    ("cumple_anios", "Cumple años"),
+    ("dias_faltantes_anios", "Días faltantes (años)"),
+    ("licencias", "Licencias"),
+    ("licencias_traslapadas", "Licencias traslapadas"),
+    ("dias_validos", "Días válidos"),
+    ("dias_requeridos", "Días requeridos"),
+    ("cumple_licencias", "Cumple licencias"),
+    ("cumple", "Cumple"),
+    ("observaciones", "Observaciones"),
+)
+
+
+class ArchivoCribadoInvalido(elegibilidad.LoteInvalido):
+    """El archivo no tiene el formato esperado."""
+
+
+def extension_valida(nombre: str) -> bool:
+    return PurePath(nombre).suffix.lower() in EXTENSIONES_PERMITIDAS
+
+
+def leer_bloques(archivo: IO[bytes], nombre: str, tamano: int = TAMANO_BLOQUE) -> Iterator[pd.DataFrame]:
+    """Lee el archivo en bloques de texto. Excel no admite lectura parcial: se lee y se divide."""
+    import pandas as pd
+
+    extension = PurePath(nombre).suffix.lower()
+    if extension == ".csv":
+        yield from pd.read_csv(
+            archivo, dtype=str, keep_default_na=False, chunksize=tamano, encoding="utf-8-sig"
+        )
+        return
+    if extension == ".xlsx":
+        hoja = pd.read_excel(archivo, dtype=str, keep_default_na=False)
+        for inicio in range(0, len(hoja), tamano):
+            yield hoja.iloc[inicio : inicio + tamano]
+        return
+    raise ArchivoCribadoInvalido([f"Formato no soportado: {extension or nombre} (usa CSV o Excel .xlsx)."])
+
+
+def _normalizar_columnas(bloque: pd.DataFrame) -> pd.DataFrame:
+    columnas = {columna: str(columna).strip().lower().replace(" ", "_") for columna in bloque.columns}
+    bloque = bloque.rename(columns=columnas).rename(columns=ALIAS_COLUMNAS)
+    faltantes = [columna for columna in COLUMNAS_REQUERIDAS if columna not in bloque.columns]
+    if faltantes:
+        raise ArchivoCribadoInvalido([f"Faltan columnas: {', '.join(faltantes)}."])
+    for columna in ("nombre", "analisis", "regimen", "licencia_inicio", "licencia_fin"):
+        if columna not in bloque.columns:
+            bloque[columna] = ""
+    bloque = bloque.fillna("")
+    bloque["id"] = bloque["id"].astype(str).str.strip()
+    return bloque[bloque["id"] != ""]
+
+
+def bloques_por_persona(bloques: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Reagrupa los bloques para que las filas de una persona nunca queden partidas."""
+    import pandas as pd
+
+    pendiente: pd.DataFrame | None = None
+    vistos: set[str] = set()
+    for bloque in bloques:
+        bloque = _normalizar_columnas(bloque)
+        if pendiente is not None:
+            bloque = pd.concat([pendiente, bloque], ignore_index=True)
+        if bloque.empty:
+            continue
+        # Solo la última racha de filas puede continuar en el siguiente bloque.
+        ids = bloque["id"].to_numpy()
+        distintos = np.flatnonzero(ids != ids[-1])
+        corte = distintos[-1] + 1 if len(distintos) else 0
+        completo, pendiente = bloque.iloc[:corte], bloque.iloc[corte:]
+        if not completo.empty:
+            _verificar_consecutivos(completo, vistos)
+            yield completo
+    if pendiente is not None and not pendiente.empty:
+        _verificar_consecutivos(pendiente, vistos)
+        yield pendiente
+
+
+def _verificar_consecutivos(bloque: pd.DataFrame, vistos: set[str]) -> None:
+    ids = bloque["id"]
+    inicios_de_grupo = ids[ids != ids.shift()]
+    repetidos = set(inicios_de_grupo[inicios_de_grupo.duplicated()]) | (set(inicios_de_grupo) & vistos)
+    if repetidos:
+        raise ArchivoCribadoInvalido(
+            [f"Las filas de '{min(repetidos)}' no son consecutivas; ordena el archivo por id antes de subirlo."]
+        )
+    vistos.update(inicios_de_grupo)
+
+
+def _fechas(serie: pd.Series) -> np.ndarray:
+    """Acepta AAAA-MM-DD (también con hora, como las exporta Excel) o DD/MM/AAAA."""
+    import pandas as pd
+
+    texto = serie.astype(str).str.strip()
+    fechas = pd.to_datetime(texto.str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+    faltantes = fechas.isna() & (texto != "")
+    if faltantes.any():
+        fechas[faltantes] = pd.to_datetime(texto[faltantes], format="%d/%m/%Y", errors="coerce")
+    return fechas.to_numpy(dtype="datetime64[D]")
+
+
+def evaluar_bloque(bloque: pd.DataFrame, fecha_analisis: date, regimen: str) -> pd.DataFrame:
+    """Evalúa un bloque con todas las filas de cada persona; devuelve una fila por persona."""
+    import pandas as pd
+
+    codigos, _ids = pd.factorize(bloque["id"])
+    primeras = ~pd.Series(codigos).duplicated().to_numpy()
+    personas = bloque.loc[primeras, ["id", "nombre", "ingreso", "analisis", "regimen"]].reset_index(drop=True)
+
+    ingreso = _fechas(personas["ingreso"])
+    analisis = _fechas(personas["analisis"])
+    analisis = np.where(np.isnat(analisis), np.datetime64(fecha_analisis, "D"), analisis)
+    regimenes = personas["regimen"].str.strip().str.lower().replace("", regimen)
+    requeridos = regimenes.map(elegibilidad.DIAS_REQUERIDOS_POR_REGIMEN)
+
+    con_licencia = ((bloque["licencia_inicio"] != "") | (bloque["licencia_fin"] != "")).to_numpy()
+    inicios = _fechas(bloque.loc[con_licencia, "licencia_inicio"])
+    fines = _fechas(bloque.loc[con_licencia, "licencia_fin"])
+    duenos = codigos[con_licencia].astype("int64")
+
+    evaluacion = elegibilidad.evaluar_arreglos(
+        ingreso,
+        analisis,
+        requeridos.fillna(np.iinfo("int64").max).to_numpy(dtype="int64"),
+        duenos,
+        inicios,
+        fines,
+    )
+    fechas_invalidas = np.bincount(duenos, weights=np.isnat(inicios) | np.isnat(fines), minlength=len(personas))
+    traslapadas = np.bincount(duenos, weights=evaluacion.union.traslapadas, minlength=len(personas))
+
+    observaciones = pd.Series("", index=personas.index)
+    observaciones[np.isnat(ingreso)] += "Fecha de ingreso inválida. "
+    observaciones[requeridos.isna().to_numpy()] += "Régimen desconocido. "
+    observaciones[evaluacion.inconsistente] += "La fecha de análisis es anterior al ingreso. "
+    observaciones[fechas_invalidas > 0] += "Licencias con fechas inválidas (no se contaron). "
+
+    return pd.DataFrame(
+        {
+            "id": personas["id"],
+            "nombre": personas["nombre"],
+            "ingreso": pd.Series(ingreso).dt.strftime("%Y-%m-%d"),
+            "analisis": pd.Series(analisis).dt.strftime("%Y-%m-%d"),
+            "regimen": regimenes.str.upper(),
+            "fecha_minima": pd.Series(evaluacion.fecha_minima).dt.strftime("%Y-%m-%d"),
+            "cumple_anios": np.where(evaluacion.cumple_anios, "Sí", "No"),
+            "dias_faltantes_anios": evaluacion.dias_faltantes_anios,
+            "licencias": evaluacion.licencias,
+            "licencias_traslapadas": traslapadas.astype("int64"),
+            "dias_validos": evaluacion.dias_validos,
+            "dias_requeridos": requeridos.astype("Int64"),
+            "cumple_licencias": np.where(evaluacion.cumple_licencias, "Sí", "No"),
+            "cumple": np.where(evaluacion.cumple, "Sí", "No"),
+            "observaciones": observaciones.str.strip(),
+        }
+    )
+
+
+def cribar_archivo(
+    archivo: IO[bytes],
+    nombre: str,
+    *,
+    fecha_analisis: date,
+    regimen: str = elegibilidad.REGIMEN_DEFAULT,
+    tamano_bloque: int = TAMANO_BLOQUE,
+) -> tuple[bytes, int]:
+    """Evalúa todo el archivo y devuelve (CSV de resultados en UTF-8 con BOM, personas evaluadas)."""
+    salida = io.StringIO()
+    total = 0
+    encabezado = True
+    for bloque in bloques_por_persona(leer_bloques(archivo, nombre, tamano_bloque)):
+        resultado = evaluar_bloque(bloque, fecha_analisis, regimen)
+        resultado.to_csv(
+            salida,
+            index=False,
+            header=[titulo for _columna, titulo in COLUMNAS_RESULTADO] if encabezado else False,
+            columns=[columna for columna, _titulo in COLUMNAS_RESULTADO],
+        )
+        encabezado = False
+        total += len(resultado)
+    if encabezado:
+        raise ArchivoCribadoInvalido(["El archivo no contiene filas con id."])
+    return salida.getvalue().encode("utf-8-sig"), total
@@ -0,0 +1,190 @@
+"""Datos sintéticos a escala de producción para pruebas de carga (`manage.py seed_benchmark`).
+
+Todo se inserta con `bulk_create` por lotes; los modelos con `HistoricalRecords`
+usan `bulk_create_with_history` para que la bitácora de simple_history también
+tenga volumen. Los CCT sintéticos comparten el prefijo `PREFIJO_CCT`, lo que
+permite borrarlos (junto con sus casos) sin tocar datos reales.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.db import transaction
+from simple_history.utils import bulk_create_with_history
+
+from tramites import models
+from tramites.services import tablero
+from tramites.utils import normalise_sistema
+
+PREFIJO_CCT = "99BEN"
+ASESORES = tuple(f"Asesor sintético {numero}" for numero in range(1, 13))
+SOSTENIMIENTOS = ("FEDERAL TRANSFERIDO", "ESTATAL", "PARTICULAR")
+SERVICIOS = ("GENERAL", "TÉCNICA", "TELESECUNDARIA", "COMUNITARIA")
+MUNICIPIOS = ("Mérida", "Valladolid", "Tizimín", "Progreso", "Ticul", "Umán", "Kanasín")
+PALABRAS = ("acoso", "licencia", "queja", "violencia", "inasistencia", "reporte", "oficio", "seguimiento", "revisión")
+SEXOS = ("M", "H")
+
+
+@dataclass
+class ResumenSintetico:
+    ccts: int = 0
+    casos: int = 0
+    tramites: int = 0
+    cambios_estatus: int = 0
+    cambios_estatus_tramite: int = 0
+
+
+def _catalogo(modelo, nombres: list[str], **extra) -> list:
+    existentes = list(modelo.objects.order_by("pk"))
+    if existentes:
+        return existentes
+    return [modelo.objects.create(nombre=nombre, **extra.get(nombre, {})) for nombre in nombres]
+
+
+def _iniciales(rng: random.Random) -> str:
+    return "".join(rng.choice("ABCDEFGHJKLMNPRSTVZ") for _ in range(3))
+
+
+def borrar_sinteticos() -> int:
+    """Elimina los casos y CCT sintéticos; devuelve cuántos CCT se borraron."""
+    casos = models.CasoInterno.objects.filter(cct__cct__startswith=PREFIJO_CCT)
+    with transaction.atomic():
+        models.AnalisisElegibilidad.objects.filter(caso__in=casos).update(caso=None)
+        models.HistorialEstatusTramiteCaso.objects.filter(tramite__caso__in=casos).delete()
+        models.TramiteCaso.objects.filter(caso__in=casos).delete()
+        models.HistorialEstatusCaso.objects.filter(caso__in=casos).delete()
+        # Sin señales por caso (el tablero se recalcula completo al final).
+        casos._raw_delete(casos.db)
+        borrados, _ = models.CCTSecundaria.objects.filter(cct__startswith=PREFIJO_CCT).delete()
+    tablero.recalcular_tablero()
+    return borrados
+
+
+def generar(
+    ccts: int = 500,
+    casos: int = 5000,
+    tramites_por_caso: int = 2,
+    cambios_por_caso: int = 3,
+    receptores_max: int = 3,
+    lote: int = 1000,
+    semilla: int = 2024,
+    usuario=None,
+) -> ResumenSintetico:
+    """Genera CCT, casos, trámites asociados, cambios de estatus y su historial."""
+    rng = random.Random(semilla)
+    resumen = ResumenSintetico()
+    estatus = _catalogo(
+        models.EstatusCaso,
+        ["Recibido", "En análisis", "En seguimiento", "Turnado", "Concluido"],
+        Concluido={"es_cierre": True},
+    )
+    estatus_tramite = _catalogo(models.EstatusTramite, ["Pendiente", "En proceso", "Atendido"])
+    tipos = _catalogo(models.TipoProceso, ["Queja", "Licencia", "Oficio", "Reporte"])
+    violencias = _catalogo(models.TipoViolencia, ["Física", "Psicológica", "Verbal", "Digital"])
+    solicitantes = _catalogo(models.Solicitante, ["Madre o padre de familia", "Dirección escolar", "Supervisión"])
+    destinatarios = _catalogo(models.Destinatario, ["Dirección jurídica", "Supervisión escolar"])
+    hoy = date.today()
+
+    with transaction.atomic():
+        existentes = models.CCTSecundaria.objects.filter(cct__startswith=PREFIJO_CCT).count()
+        nuevos_ccts = [
+            models.CCTSecundaria(
+                cct=f"{PREFIJO_CCT}{numero:06d}X",
+                nombre=f"Secundaria sintética {numero}",
+                asesor=rng.choice(ASESORES),
+                servicio=rng.choice(SERVICIOS),
+                sostenimiento=rng.choice(SOSTENIMIENTOS),
+                municipio=rng.choice(MUNICIPIOS),
+                turno=rng.choice(("MATUTINO", "VESPERTINO")),
+            )
+            for numero in range(existentes, existentes + ccts)
+        ]
+        bulk_create_with_history(nuevos_ccts, models.CCTSecundaria, batch_size=lote, default_user=usuario)
+        resumen.ccts = len(nuevos_ccts)
+        catalogo_ccts = list(models.CCTSecundaria.objects.filter(cct__startswith=PREFIJO_CCT).order_by("cct"))
+        if casos and not catalogo_ccts:
+            raise ValueError("No hay CCT sintéticos para asignar los casos; usa --ccts mayor que cero.")
+
+        for inicio in range(0, casos, lote):
+            cadenas: list[list[models.EstatusCaso]] = []
+            nuevos_casos = []
+            for _ in range(min(lote, casos - inicio)):
+                cct = rng.choice(catalogo_ccts)
+                cadena = [rng.choice(estatus) for _ in range(max(cambios_por_caso, 1))]
+                cadenas.append(cadena)
+                apertura = hoy - timedelta(days=rng.randint(0, 730))
+                nuevos_casos.append(
+                    models.CasoInterno(
+                        cct=cct,
+                        cct_nombre=cct.nombre,
+                        cct_sistema=normalise_sistema(cct.sostenimiento),
+                        cct_modalidad=cct.servicio,
+                        asesor_cct=cct.asesor,
+                        descripcion_breve=" ".join(rng.sample(PALABRAS, 3)).capitalize(),
+                        fecha_apertura=apertura,
+                        estatus=cadena[-1],
+                        tipo_inicial=rng.choice(tipos),
+                        tipo_violencia=rng.choice(violencias),
+                        numero_oficio=f"SE/{rng.randint(1, 9999):04d}/{apertura.year}",
+                        solicitante=rng.choice(solicitantes),
+                        dirigido_a=rng.choice(destinatarios),
+                        generador_iniciales=_iniciales(rng),
+                        generador_sexo=rng.choice(SEXOS),
+                        receptor_iniciales=_iniciales(rng),
+                        receptor_sexo=rng.choice(SEXOS),
+                        receptores_adicionales=[
+                            {"nombre": "", "iniciales": _iniciales(rng), "sexo": rng.choice(SEXOS)}
+                            for _ in range(rng.randint(0, receptores_max))
+                        ],
+                        asunto=" ".join(rng.choices(PALABRAS, k=12)),
+                        fecha_termino=apertura + timedelta(days=rng.randint(5, 120)) if rng.random() < 0.6 else None,
+                        creado_por=usuario,
+                    )
+                )
+            creados = bulk_create_with_history(nuevos_casos, models.CasoInterno, batch_size=lote, default_user=usuario)
+            resumen.casos += len(creados)
+
+            cambios = []
+            tramites = []
+            for caso, cadena in zip(creados, cadenas):
+                anterior = None
+                for nuevo in cadena[:cambios_por_caso]:
+                    cambios.append(
+                        models.HistorialEstatusCaso(
+                            caso=caso, estatus_anterior=anterior, estatus_nuevo=nuevo, usuario=usuario
+                        )
+                    )
+                    anterior = nuevo
+                for _ in range(tramites_por_caso):
+                    fecha = caso.fecha_apertura + timedelta(days=rng.randint(0, 60))
+                    tramites.append(
+                        models.TramiteCaso(
+                            caso=caso,
+                            tipo=rng.choice(tipos),
+                            estatus=rng.choice(estatus_tramite),
+                            tipo_violencia=caso.tipo_violencia,
+                            solicitante=caso.solicitante,
+                            dirigido_a=caso.dirigido_a,
+                            fecha=fecha,
+                            numero_oficio=f"SE/{rng.randint(1, 9999):04d}/{fecha.year}",
+                            asunto=" ".join(rng.sample(PALABRAS, 4)),
+                            receptores_adicionales=caso.receptores_adicionales,
+                            fecha_termino=fecha + timedelta(days=rng.randint(5, 60)) if rng.random() < 0.5 else None,
+                        )
+                    )
+            models.HistorialEstatusCaso.objects.bulk_create(cambios, batch_size=lote)
+            resumen.cambios_estatus += len(cambios)
+            tramites = bulk_create_with_history(tramites, models.TramiteCaso, batch_size=lote, default_user=usuario)
+            resumen.tramites += len(tramites)
+            cambios_tramite = [
+                models.HistorialEstatusTramiteCaso(tramite=tramite, estatus_nuevo=tramite.estatus, usuario=usuario)
+                for tramite in tramites
+            ]
+            models.HistorialEstatusTramiteCaso.objects.bulk_create(cambios_tramite, batch_size=lote)
+            resumen.cambios_estatus_tramite += len(cambios_tramite)
+
+    # bulk_create no dispara las señales que mantienen el tablero.
+    tablero.recalcular_tablero()
+    return resumen
@@ -0,0 +1,525 @@
+"""Motor de elegibilidad del analizador de requisitos, vectorizado con NumPy.
+
+Replica las reglas de `static/js/analizador_core.js` (`calculateValidDays`,
+`calculateInclusiveDays`, `evaluateYearsRequirement` y
+`evaluateLicensesRequirement`) para evaluar lotes completos de personas en el
+servidor: todas las licencias del lote se procesan como arreglos `datetime64[D]`
+y se suman por persona con `np.bincount`, sin ciclos por licencia. Los periodos
+traslapados se unen antes de sumar (`unir_intervalos`, igual que
+`mergeLicenseIntervals` en JS), de modo que cada día se cuenta una sola vez.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from tramites import models
+
+ANIOS_MINIMOS = 15
+DIAS_REQUERIDOS_POR_REGIMEN = {"issste": 60, "imss": 90}
+REGIMEN_DEFAULT = "issste"
+# Incrementar cuando cambien las reglas de cálculo para invalidar los resultados guardados.
+VERSION_REGLAS = 2
+
+COLUMNAS_CSV = ("id", "ingreso", "analisis", "regimen", "licencia_inicio", "licencia_fin")
+
+_UN_DIA = np.timedelta64(1, "D")
+# Desfase por persona al ordenar: mayor que cualquier rango de fechas representable.
+_SEPARACION_PERSONAS = 10**7
+_SIN_PREVIO = -(2**62)
+
+
+class LoteInvalido(ValueError):
+    """El lote contiene fechas o regímenes que no se pueden interpretar."""
+
+    def __init__(self, errores: list[str]):
+        super().__init__("; ".join(errores))
+        self.errores = errores
+
+
+@dataclass
+class PersonaLote:
+    id: str
+    ingreso: date | None
+    analisis: date | None = None
+    regimen: str = REGIMEN_DEFAULT
+    licencias: list[tuple[date | None, date | None]] = field(default_factory=list)
+
+
+@dataclass
+class PeriodoUnido:
+    inicio: date
+    fin: date
+    dias_validos: int
+    licencias: list[int] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "inicio": self.inicio.isoformat(),
+            "fin": self.fin.isoformat(),
+            "dias_validos": self.dias_validos,
+            "licencias": self.licencias,
+        }
+
+
+@dataclass
+class ResultadoElegibilidad:
+    id: str
+    regimen: str
+    cumple_anios: bool
+    fecha_minima: date | None
+    dias_faltantes_anios: int
+    inconsistente: bool
+    licencias: int
+    dias_validos: int
+    dias_requeridos: int
+    cumple_licencias: bool
+    cumple: bool
+    licencias_traslapadas: list[int] = field(default_factory=list)
+    periodos: list[PeriodoUnido] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        datos = asdict(self)
+        datos["fecha_minima"] = self.fecha_minima.isoformat() if self.fecha_minima else None
+        datos["periodos"] = [periodo.as_dict() for periodo in self.periodos]
+        return datos
+
+
+@dataclass
+class UnionIntervalos:
+    """Resultado de `unir_intervalos` para un lote de licencias."""
+
+    dias_validos: np.ndarray  # por persona
+    traslapadas: np.ndarray  # bool por licencia, en el orden recibido
+    dueno_periodo: np.ndarray
+    inicio_periodo: np.ndarray
+    fin_periodo: np.ndarray
+    dias_periodo: np.ndarray
+    licencias_ordenadas: np.ndarray
+    cortes: np.ndarray  # posición en `licencias_ordenadas` donde inicia cada periodo
+
+    def licencias_por_periodo(self) -> list[list[int]]:
+        """Índices de licencia (orden recibido) que forman cada periodo."""
+        limites = self.cortes.tolist()[1:] + [len(self.licencias_ordenadas)]
+        ordenadas = self.licencias_ordenadas.tolist()
+        return [sorted(ordenadas[inicio:fin]) for inicio, fin in zip(self.cortes.tolist(), limites)]
+
+
+# --------------------------------------------------------------------------- #
+# Funciones vectorizadas (equivalentes a analizador_core.js)
+# --------------------------------------------------------------------------- #
+
+
+def a_fechas(valores: Iterable[date | str | None]) -> np.ndarray:
+    """Convierte fechas o cadenas ISO a `datetime64[D]` (vacíos como NaT)."""
+    return np.array([valor or None for valor in valores], dtype="datetime64[D]")
+
+
+def dias_inclusivos(inicio: np.ndarray, fin: np.ndarray) -> np.ndarray:
+    """`calculateInclusiveDays`: días entre ambas fechas contando los extremos."""
+    dias = (fin - inicio).astype("int64") + 1
+    valido = ~(np.isnat(inicio) | np.isnat(fin)) & (fin >= inicio)
+    return np.where(valido, dias, 0)
+
+
+def dias_validos(inicio: np.ndarray, fin: np.ndarray, ingreso: np.ndarray) -> np.ndarray:
+    """`calculateValidDays`: solo cuentan los días posteriores a la fecha de ingreso."""
+    inicio_efectivo = np.where(inicio <= ingreso, ingreso + _UN_DIA, inicio)
+    dias = dias_inclusivos(inicio_efectivo, fin)
+    return np.where(np.isnat(ingreso) | np.isnat(inicio) | (fin < ingreso), 0, dias)
+
+
+def sumar_anios(fechas: np.ndarray, anios: int) -> np.ndarray:
+    """`addYears` de JS: el 29 de febrero pasa al 1 de marzo en años no bisiestos."""
+    anio = fechas.astype("datetime64[Y]")
+    mes = fechas.astype("datetime64[M]")
+    desfase_mes = mes - anio.astype("datetime64[M]")
+    desfase_dia = fechas - mes.astype("datetime64[D]")
+    return ((anio + anios).astype("datetime64[M]") + desfase_mes).astype("datetime64[D]") + desfase_dia
+
+
+def dias_faltantes(desde: np.ndarray, hasta: np.ndarray) -> np.ndarray:
+    """`daysBetween`: días de `desde` a `hasta`, nunca negativo."""
+    dias = (hasta - desde).astype("int64")
+    return np.where(np.isnat(desde) | np.isnat(hasta) | (dias < 0), 0, dias)
+
+
+def unir_intervalos(
+    duenos: np.ndarray, inicios: np.ndarray, fines: np.ndarray, ingreso: np.ndarray
+) -> UnionIntervalos:
+    """`mergeLicenseIntervals` para todo el lote: ordenar + barrido, O(n log n).
+
+    `duenos[i]` es el índice (en `ingreso`) de la persona dueña de la licencia i.
+    Las licencias se ordenan por persona e inicio; cada persona se desplaza
+    `_SEPARACION_PERSONAS` días para que el máximo acumulado de fines no cruce
+    de una persona a otra. Un periodo nuevo empieza cuando el inicio queda
+    después del día siguiente al mayor fin previo.
+    """
+    num_personas = len(ingreso)
+    validas = ~(np.isnat(inicios) | np.isnat(fines)) & (fines >= inicios)
+    posiciones = np.flatnonzero(validas)
+    dueno = duenos[posiciones]
+    inicio = inicios[posiciones].astype("int64")
+    fin = fines[posiciones].astype("int64")
+    orden = np.lexsort((fin, inicio, dueno))
+    posiciones, dueno, inicio, fin = posiciones[orden], dueno[orden], inicio[orden], fin[orden]
+
+    desfase = dueno * _SEPARACION_PERSONAS
+    inicio_global, fin_global = inicio + desfase, fin + desfase
+    fin_previo = np.empty_like(fin_global)
+    if fin_global.size:
+        fin_previo[0] = _SIN_PREVIO
+        fin_previo[1:] = np.maximum.accumulate(fin_global)[:-1]
+
+    traslapa = inicio_global <= fin_previo
+    traslapa[:-1] |= inicio_global[1:] <= fin_global[:-1]
+    traslapadas = np.zeros(len(duenos), dtype=bool)
+    traslapadas[posiciones] = traslapa
+
+    cortes = np.flatnonzero(inicio_global > fin_previo + 1)
+    dueno_periodo = dueno[cortes]
+    inicio_periodo = inicio[cortes]
+    fin_periodo = np.maximum.reduceat(fin, cortes) if cortes.size else fin[:0]
+
+    ingreso_periodo = ingreso[dueno_periodo]
+    efectivo = np.maximum(inicio_periodo, ingreso_periodo.astype("int64") + 1)
+    dias_periodo = np.where(
+        np.isnat(ingreso_periodo) | (fin_periodo < efectivo), 0, fin_periodo - efectivo + 1
+    )
+    return UnionIntervalos(
+        dias_validos=np.bincount(dueno_periodo, weights=dias_periodo, minlength=num_personas).astype("int64"),
+        traslapadas=traslapadas,
+        dueno_periodo=dueno_periodo,
+        inicio_periodo=inicio_periodo.astype("datetime64[D]"),
+        fin_periodo=fin_periodo.astype("datetime64[D]"),
+        dias_periodo=dias_periodo.astype("int64"),
+        licencias_ordenadas=posiciones,
+        cortes=cortes,
+    )
+
+
+def unir_periodos(
+    licencias: Iterable[tuple[date | str | None, date | str | None]], ingreso: date | str | None
+) -> tuple[list[PeriodoUnido], int, list[int]]:
+    """Une las licencias de una persona: (periodos, días válidos, índices traslapados)."""
+    licencias = list(licencias)
+    union = unir_intervalos(
+        np.zeros(len(licencias), dtype="int64"),
+        a_fechas(inicio for inicio, _fin in licencias),
+        a_fechas(fin for _inicio, fin in licencias),
+        a_fechas([ingreso]),
+    )
+    periodos = [
+        PeriodoUnido(inicio=inicio, fin=fin, dias_validos=dias, licencias=indices)
+        for inicio, fin, dias, indices in zip(
+            union.inicio_periodo.tolist(),
+            union.fin_periodo.tolist(),
+            union.dias_periodo.tolist(),
+            union.licencias_por_periodo(),
+        )
+    ]
+    return periodos, int(union.dias_validos[0]), np.flatnonzero(union.traslapadas).tolist()
+
+
+# --------------------------------------------------------------------------- #
+# Evaluación por lote
+# --------------------------------------------------------------------------- #
+
+
+def parsear_fecha(valor: Any, etiqueta: str, errores: list[str]) -> date | None:
+    """Interpreta una fecha ISO; si no es válida agrega el error y devuelve None."""
+    if valor in (None, ""):
+        return None
+    if isinstance(valor, date):
+        return valor
+    try:
+        return date.fromisoformat(str(valor).strip())
+    except ValueError:
+        errores.append(f"{etiqueta}: fecha inválida '{valor}' (usa AAAA-MM-DD).")
+        return None
+
+
+def _verificar_tamano(total: int, maximo: int | None) -> None:
+    maximo = settings.ELEGIBILIDAD_LOTE_MAXIMO if maximo is None else maximo
+    if total > maximo:
+        raise LoteInvalido([f"Máximo {maximo} personas por lote (se recibieron {total})."])
+
+
+def personas_desde_datos(
+    registros: Iterable[Mapping[str, Any]], regimen: str | None = None, maximo: int | None = None
+) -> list[PersonaLote]:
+    """Valida registros JSON (`id`, `ingreso`, `analisis`, `regimen`, `licencias`)."""
+    registros = list(registros)
+    _verificar_tamano(len(registros), maximo)
+    personas: list[PersonaLote] = []
+    errores: list[str] = []
+    for indice, registro in enumerate(registros, start=1):
+        if not isinstance(registro, Mapping):
+            errores.append(f"Registro {indice}: se esperaba un objeto con `id`, `ingreso` y `licencias`.")
+            continue
+        ident = str(registro.get("id") or indice)
+        regimen_persona = registro.get("regimen") or regimen or REGIMEN_DEFAULT
+        if isinstance(regimen_persona, str):
+            regimen_persona = regimen_persona.strip().lower()
+        if regimen_persona not in DIAS_REQUERIDOS_POR_REGIMEN:
+            errores.append(f"{ident}: régimen desconocido '{regimen_persona}'.")
+            regimen_persona = REGIMEN_DEFAULT
+        registro_licencias = registro.get("licencias") or []
+        if not isinstance(registro_licencias, list):
+            errores.append(f"Registro {indice} ({ident}): `licencias` debe ser una lista de objetos.")
+            registro_licencias = []
+        licencias = []
+        for numero, licencia in enumerate(registro_licencias, start=1):
+            etiqueta = f"{ident} licencia {numero}"
+            if not isinstance(licencia, Mapping):
+                errores.append(f"Registro {indice} ({etiqueta}): se esperaba un objeto con `inicio` y `fin`.")
+                continue
+            licencias.append(
+                (
+                    parsear_fecha(licencia.get("inicio"), etiqueta, errores),
+                    parsear_fecha(licencia.get("fin"), etiqueta, errores),
+                )
+            )
+        personas.append(
+            PersonaLote(
+                id=ident,
+                ingreso=parsear_fecha(registro.get("ingreso"), f"{ident} ingreso", errores),
+                analisis=parsear_fecha(registro.get("analisis"), f"{ident} análisis", errores),
+                regimen=regimen_persona,
+                licencias=licencias,
+            )
+        )
+    if errores:
+        raise LoteInvalido(errores)
+    return personas
+
+
+def personas_desde_csv(
+    contenido: str | bytes, regimen: str | None = None, maximo: int | None = None
+) -> list[PersonaLote]:
+    """Lee un CSV con una fila por licencia; las filas con el mismo `id` se agrupan."""
+    if isinstance(contenido, bytes):
+        try:
+            contenido = contenido.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise LoteInvalido(["El CSV debe estar codificado en UTF-8."]) from None
+    lector = csv.DictReader(io.StringIO(contenido))
+    registros: dict[str, dict[str, Any]] = {}
+    try:
+        faltantes = {"id", "ingreso"} - set(lector.fieldnames or ())
+        if faltantes:
+            raise LoteInvalido([f"Faltan columnas en el CSV: {', '.join(sorted(faltantes))}."])
+        for fila in lector:
+            ident = (fila.get("id") or "").strip()
+            if not ident:
+                continue
+            if ident not in registros:
+                _verificar_tamano(len(registros) + 1, maximo)
+            registro = registros.setdefault(
+                ident,
+                {
+                    "id": ident,
+                    "ingreso": fila.get("ingreso"),
+                    "analisis": fila.get("analisis"),
+                    "regimen": fila.get("regimen"),
+                    "licencias": [],
+                },
+            )
+            if fila.get("licencia_inicio") or fila.get("licencia_fin"):
+                registro["licencias"].append({"inicio": fila.get("licencia_inicio"), "fin": fila.get("licencia_fin")})
+    except csv.Error as exc:
+        raise LoteInvalido([f"CSV inválido en la línea {lector.line_num}: {exc}."]) from None
+    return personas_desde_datos(registros.values(), regimen=regimen, maximo=maximo)
+
+
+@dataclass
+class EvaluacionArreglos:
+    """Resultado columnar de `evaluar_arreglos` (un elemento por persona)."""
+
+    fecha_minima: np.ndarray
+    cumple_anios: np.ndarray
+    dias_faltantes_anios: np.ndarray
+    inconsistente: np.ndarray
+    licencias: np.ndarray
+    dias_validos: np.ndarray
+    cumple_licencias: np.ndarray
+    union: UnionIntervalos
+
+    @property
+    def cumple(self) -> np.ndarray:
+        return self.cumple_anios & self.cumple_licencias
+
+
+def evaluar_arreglos(
+    ingreso: np.ndarray,
+    analisis: np.ndarray,
+    requeridos: np.ndarray,
+    duenos: np.ndarray,
+    inicios: np.ndarray,
+    fines: np.ndarray,
+    *,
+    anios_minimos: int = ANIOS_MINIMOS,
+) -> EvaluacionArreglos:
+    """Reglas del analizador sobre arreglos: una posición por persona y una por licencia."""
+    # Años de servicio (evaluateYearsRequirement).
+    fecha_minima = sumar_anios(ingreso, anios_minimos)
+    listo = ~np.isnat(ingreso) & ~np.isnat(analisis)
+    inconsistente = listo & (analisis < ingreso)
+    cumple_anios = listo & ~inconsistente & (analisis >= fecha_minima)
+    faltan_anios = np.where(listo & ~inconsistente, dias_faltantes(analisis, fecha_minima), 0)
+
+    # Licencias (evaluateLicensesRequirement), con los periodos traslapados unidos.
+    union = unir_intervalos(duenos, inicios, fines, ingreso)
+    num_licencias = np.bincount(duenos, minlength=len(ingreso))
+    cumple_licencias = ~np.isnat(ingreso) & (num_licencias > 0) & (union.dias_validos >= requeridos)
+    return EvaluacionArreglos(
+        fecha_minima=fecha_minima,
+        cumple_anios=cumple_anios,
+        dias_faltantes_anios=faltan_anios,
+        inconsistente=inconsistente,
+        licencias=num_licencias,
+        dias_validos=union.dias_validos,
+        cumple_licencias=cumple_licencias,
+        union=union,
+    )
+
+
+def evaluar_lote(
+    personas: list[PersonaLote],
+    *,
+    fecha_analisis: date | None = None,
+    anios_minimos: int = ANIOS_MINIMOS,
+) -> list[ResultadoElegibilidad]:
+    """Evalúa años de servicio y días válidos de licencia para todas las personas."""
+    if not personas:
+        return []
+    fecha_analisis = fecha_analisis or timezone.localdate()
+    duenos = np.fromiter(
+        (indice for indice, persona in enumerate(personas) for _licencia in persona.licencias), dtype="int64"
+    )
+    evaluacion = evaluar_arreglos(
+        a_fechas(persona.ingreso for persona in personas),
+        a_fechas(persona.analisis or fecha_analisis for persona in personas),
+        np.array([DIAS_REQUERIDOS_POR_REGIMEN[persona.regimen] for persona in personas], dtype="int64"),
+        duenos,
+        a_fechas(inicio for persona in personas for inicio, _fin in persona.licencias),
+        a_fechas(fin for persona in personas for _inicio, fin in persona.licencias),
+        anios_minimos=anios_minimos,
+    )
+    union = evaluacion.union
+
+    # Índices de licencia relativos a cada persona y periodos agrupados por persona.
+    primera_licencia = np.concatenate(([0], np.cumsum(evaluacion.licencias)[:-1])).tolist()
+    traslapadas: list[list[int]] = [[] for _persona in personas]
+    for posicion, dueno in zip(np.flatnonzero(union.traslapadas).tolist(), duenos[union.traslapadas].tolist()):
+        traslapadas[dueno].append(posicion - primera_licencia[dueno])
+    periodos: list[list[PeriodoUnido]] = [[] for _persona in personas]
+    for dueno, inicio, fin, dias_periodo, indices in zip(
+        union.dueno_periodo.tolist(),
+        union.inicio_periodo.tolist(),
+        union.fin_periodo.tolist(),
+        union.dias_periodo.tolist(),
+        union.licencias_por_periodo(),
+    ):
+        base = primera_licencia[dueno]
+        periodos[dueno].append(
+            PeriodoUnido(
+                inicio=inicio, fin=fin, dias_validos=dias_periodo, licencias=[indice - base for indice in indices]
+            )
+        )
+
+    # Listas nativas: indexar arreglos de NumPy elemento por elemento es lento.
+    anios_ok = evaluacion.cumple_anios.tolist()
+    licencias_ok = evaluacion.cumple_licencias.tolist()
+    minimas = evaluacion.fecha_minima.tolist()
+    faltan = evaluacion.dias_faltantes_anios.tolist()
+    inconsistentes = evaluacion.inconsistente.tolist()
+    totales = evaluacion.licencias.tolist()
+    dias = evaluacion.dias_validos.tolist()
+    return [
+        ResultadoElegibilidad(
+            id=persona.id,
+            regimen=persona.regimen,
+            cumple_anios=anios_ok[i],
+            fecha_minima=minimas[i],
+            dias_faltantes_anios=faltan[i],
+            inconsistente=inconsistentes[i],
+            licencias=totales[i],
+            dias_validos=dias[i],
+            dias_requeridos=DIAS_REQUERIDOS_POR_REGIMEN[persona.regimen],
+            cumple_licencias=licencias_ok[i],
+            cumple=anios_ok[i] and licencias_ok[i],
+            licencias_traslapadas=traslapadas[i],
+            periodos=periodos[i],
+        )
+        for i, persona in enumerate(personas)
+    ]
+
+
+# --------------------------------------------------------------------------- #
+# Análisis guardados
+# --------------------------------------------------------------------------- #
+
+
+def huella_analisis(analisis: models.AnalisisElegibilidad, hoy: date | None = None) -> str:
+    """Hash de las entradas del análisis: si no cambia, el resultado guardado sigue vigente."""
+    fecha_analisis = analisis.fecha_analisis or hoy or timezone.localdate()
+    entradas = {
+        "reglas": VERSION_REGLAS,
+        "ingreso": str(analisis.fecha_ingreso),
+        "analisis": str(fecha_analisis),
+        "regimen": analisis.regimen,
+        "licencias": [
+            [licencia.get("inicio"), licencia.get("fin")] if isinstance(licencia, dict) else licencia
+            for licencia in analisis.licencias or []
+        ],
+    }
+    return hashlib.sha256(json.dumps(entradas, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def calcular_resultado(analisis: models.AnalisisElegibilidad, hoy: date | None = None) -> dict[str, Any]:
+    """Evalúa el análisis sin guardar nada; `LoteInvalido` si sus entradas no se pueden interpretar."""
+    registro = {
+        "id": str(analisis.pk or ""),
+        "ingreso": analisis.fecha_ingreso,
+        "analisis": analisis.fecha_analisis or hoy or timezone.localdate(),
+        "regimen": analisis.regimen,
+        "licencias": analisis.licencias or [],
+    }
+    return evaluar_lote(personas_desde_datos([registro], maximo=1))[0].as_dict()
+
+
+def guardar_resultado(analisis: models.AnalisisElegibilidad, *, forzar: bool = False) -> dict[str, Any]:
+    """Recalcula y guarda el resultado si cambiaron las entradas; para usarse al escribir el análisis."""
+    hoy = timezone.localdate()
+    huella = huella_analisis(analisis, hoy)
+    if not forzar and analisis.resultado is not None and analisis.huella_resultado == huella:
+        return analisis.resultado
+    resultado = calcular_resultado(analisis, hoy)
+    analisis.resultado, analisis.huella_resultado, analisis.calculado_en = resultado, huella, timezone.now()
+    # update() para no tocar `actualizado_en`, que refleja cambios en las entradas.
+    models.AnalisisElegibilidad.objects.filter(pk=analisis.pk).update(
+        resultado=resultado, huella_resultado=huella, calculado_en=analisis.calculado_en
+    )
+    return resultado
+
+
+def resultado_de_analisis(analisis: models.AnalisisElegibilidad) -> dict[str, Any]:
+    """Resultado vigente para mostrar: el guardado si las entradas no cambiaron; si no, se calcula sin guardar.
+
+    Sin `fecha_analisis` el resultado depende del día, así que se vuelve a calcular
+    en la lectura en lugar de reescribir la fila cada día.
+    """
+    hoy = timezone.localdate()
+    if analisis.resultado is not None and analisis.huella_resultado == huella_analisis(analisis, hoy):
+        return analisis.resultado
+    return calcular_resultado(analisis, hoy)
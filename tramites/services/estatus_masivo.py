@@ -0,0 +1,99 @@
+"""Cambio de estatus de muchos casos a la vez (p. ej. al cerrar un ciclo escolar).
+
+En lugar de un guardado por caso, los casos se actualizan con
+`bulk_update_with_history`, que también escribe por lotes su historial de
+simple_history. La bitácora `HistorialEstatusCaso` se inserta con `bulk_create`.
+`bulk_update` no aplica `auto_now` ni dispara señales. Por eso `actualizado_en`
+se asigna a mano, porque de él dependen los ETag y los fragmentos en caché, y el
+tablero se recalcula al final.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from simple_history.utils import bulk_update_with_history
+
+from tramites import models
+from tramites.services import tablero
+
+LOTE = 500
+
+
+@dataclass
+class ResultadoMasivo:
+    actualizados: int = 0
+    sin_cambio: int = 0
+    no_encontrados: list[int] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "actualizados": self.actualizados,
+            "sin_cambio": self.sin_cambio,
+            "no_encontrados": self.no_encontrados,
+        }
+
+
+def cambiar_estatus(
+    casos: QuerySet[models.CasoInterno],
+    estatus: models.EstatusCaso,
+    usuario=None,
+    comentario: str = "",
+    lote: int = LOTE,
+) -> ResultadoMasivo:
+    """Pasa a `estatus` los casos de `casos` en una sola transacción.
+
+    Los casos que ya tienen ese estatus no se tocan ni generan bitácora.
+    """
+    actor = usuario if getattr(usuario, "is_authenticated", False) else None
+    comentario = comentario or ""
+    resultado = ResultadoMasivo()
+    with transaction.atomic():
+        # Por pk: los filtros del listado pueden usar DISTINCT, que no admite FOR UPDATE.
+        seleccion = models.CasoInterno.objects.filter(pk__in=casos.values("pk")).select_for_update().order_by("pk")
+        pendientes = []
+        for caso in seleccion:
+            if caso.estatus_id == estatus.pk:
+                resultado.sin_cambio += 1
+            else:
+                pendientes.append(caso)
+        if not pendientes:
+            return resultado
+
+        ahora = timezone.now()
+        cambios = []
+        for caso in pendientes:
+            cambios.append(
+                models.HistorialEstatusCaso(
+                    caso=caso,
+                    estatus_anterior_id=caso.estatus_id,
+                    estatus_nuevo=estatus,
+                    usuario=actor,
+                    comentario=comentario,
+                )
+            )
+            caso.estatus = estatus
+            caso.actualizado_en = ahora
+        bulk_update_with_history(
+            pendientes,
+            models.CasoInterno,
+            ["estatus", "actualizado_en"],
+            batch_size=lote,
+            default_user=actor,
+            default_change_reason=comentario or None,
+        )
+        models.HistorialEstatusCaso.objects.bulk_create(cambios, batch_size=lote)
+        resultado.actualizados = len(pendientes)
+        tablero.recalcular_tablero()
+    return resultado
+
+
+def cambiar_estatus_por_ids(ids: list[int], estatus: models.EstatusCaso, **kwargs) -> ResultadoMasivo:
+    """Como `cambiar_estatus`, y reporta en `no_encontrados` los ids que no existen."""
+    ids = list(dict.fromkeys(ids))
+    existentes = set(models.CasoInterno.objects.filter(pk__in=ids).values_list("pk", flat=True))
+    resultado = cambiar_estatus(models.CasoInterno.objects.filter(pk__in=existentes), estatus, **kwargs)
+    resultado.no_encontrados = [pk for pk in ids if pk not in existentes]
+    return resultado
@@ -0,0 +1,135 @@
+"""Generación del expediente en PDF de un trámite (CasoInterno) con WeasyPrint."""
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connections
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from tramites import models
+from tramites.services import versiones
+
+logger = logging.getLogger(__name__)
+
+EXPEDIENTE_TEMPLATE = "tramites/tramites/expediente_pdf.html"
+
+
+def _ruta_base() -> Path:
+    return Path(getattr(settings, "EXPEDIENTES_PDF_ROOT", Path(settings.MEDIA_ROOT) / "expedientes"))
+
+
+def cargar_caso(caso_pk: int) -> models.CasoInterno:
+    return models.CasoInterno.objects.select_related(
+        "cct",
+        "estatus",
+        "tipo_inicial",
+        "tipo_violencia",
+        "solicitante",
+        "dirigido_a",
+        "area_origen_inicial",
+        "creado_por",
+    ).get(pk=caso_pk)
+
+
+def expediente_cache_key(caso: models.CasoInterno) -> str:
+    """Clave de caché: la versión del caso, que cambia con sus trámites y su bitácora."""
+    version = versiones.version_caso(caso.pk)
+    return version.huella if version else "0"
+
+
+def expediente_path(caso: models.CasoInterno) -> Path:
+    """Ruta en disco del PDF para la versión actual del caso."""
+    return _ruta_base() / f"caso-{caso.pk}" / f"expediente-{expediente_cache_key(caso)}.pdf"
+
+
+def render_expediente_html(caso: models.CasoInterno) -> str:
+    """Renderiza el HTML del expediente: datos del caso, trámites y línea de tiempo."""
+    context = {
+        "caso": caso,
+        "historial_estatus": list(
+            caso.historial_estatus.select_related("estatus_anterior", "estatus_nuevo", "usuario").order_by(
+                "fecha_cambio", "id"
+            )
+        ),
+        "tramites_caso": list(
+            caso.tramites_relacionados.select_related(
+                "tipo", "estatus", "tipo_violencia", "solicitante", "dirigido_a"
+            ).order_by("fecha", "creado_en")
+        ),
+        "generado_en": timezone.localtime(),
+    }
+    return render_to_string(EXPEDIENTE_TEMPLATE, context)
+
+
+def _html_a_pdf(html: str) -> bytes:
+    # Importación diferida: WeasyPrint carga librerías nativas (pango/cairo) costosas.
+    from weasyprint import HTML
+
+    base_url = str(settings.STATICFILES_DIRS[0]) if settings.STATICFILES_DIRS else None
+    return HTML(string=html, base_url=base_url).write_pdf()
+
+
+def _limpiar_versiones_previas(destino: Path) -> None:
+    for previo in destino.parent.glob("expediente-*.pdf"):
+        if previo != destino:
+            try:
+                previo.unlink()
+            except OSError:
+                logger.warning("No se pudo eliminar el expediente obsoleto %s", previo)
+
+
+def generar_expediente_pdf(caso: models.CasoInterno, *, forzar: bool = False) -> Path:
+    """Devuelve la ruta del PDF del caso, renderizándolo solo si cambió."""
+    destino = expediente_path(caso)
+    if destino.exists() and not forzar:
+        return destino
+    pdf = _html_a_pdf(render_expediente_html(caso))
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    temporal = destino.with_name(f".{destino.name}.{os.getpid()}.tmp")
+    temporal.write_bytes(pdf)
+    os.replace(temporal, destino)
+    _limpiar_versiones_previas(destino)
+    return destino
+
+
+def _inicializar_worker() -> None:
+    import django
+    from django.apps import apps
+
+    # Con el método "spawn" el proceso hijo arranca sin Django configurado.
+    if not apps.ready:
+        django.setup()
+
+
+def _generar_en_worker(caso_pk: int, forzar: bool) -> tuple[int, str]:
+    caso = cargar_caso(caso_pk)
+    return caso_pk, str(generar_expediente_pdf(caso, forzar=forzar))
+
+
+def generar_expedientes_lote(
+    caso_pks: Iterable[int],
+    *,
+    max_workers: int | None = None,
+    forzar: bool = False,
+) -> dict[int, Path]:
+    """Renderiza varios expedientes en un pool de procesos (WeasyPrint es intensivo en CPU)."""
+    pks = list(dict.fromkeys(caso_pks))
+    if not pks:
+        return {}
+    workers = max_workers or getattr(settings, "EXPEDIENTES_PDF_WORKERS", None) or os.cpu_count() or 1
+    workers = max(1, min(workers, len(pks)))
+    # Cerrar conexiones antes de crear procesos: un socket heredado no se comparte.
+    connections.close_all()
+    resultados: dict[int, Path] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker) as pool:
+        futuros = [pool.submit(_generar_en_worker, pk, forzar) for pk in pks]
+        for futuro in futuros:
+            caso_pk, ruta = futuro.result()
+            resultados[caso_pk] = Path(ruta)
+    return resultados
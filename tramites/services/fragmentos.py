@@ -0,0 +1,94 @@
+"""Fragmentos de plantilla en caché (espacio `fragmentos`).
+
+La clave de cada fragmento lleva la versión de lo que muestra (`actualizado_en`
+de los registros o la huella de `services.versiones`), así que guardar un caso o
+un trámite deja de usar la entrada vieja sin borrar nada. Los nombres de catálogo
+(estatus, tipos) no están en esas versiones, así que todas las claves llevan
+además una generación de catálogos:
+
+- con caché compartida (redis), un valor en la caché que `tramites.signals`
+  renueva con `invalidar()` al guardar un catálogo;
+- con caché por proceso (locmem, file), esa renovación no llegaría a los demás
+  workers. La generación se calcula entonces en la base de datos, con una
+  consulta sobre el último `actualizado_en` y el total de cada catálogo.
+
+En ambos casos se lee una vez por petición (`memo_peticion`): el ETag y todos
+los fragmentos de la página usan el mismo valor.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Iterable
+
+from django.conf import settings
+from django.db.models import CharField, Count, Max, Model, Value
+
+from tramites import models
+from tramites.cache import cache_de, memo_peticion
+
+CLAVE_GENERACION = "generacion"
+CLAVE_MEMO = "fragmentos:generacion"
+# Catálogos cuyos nombres aparecen en los fragmentos sin cambiar el `actualizado_en` de los casos.
+MODELOS_CATALOGO = (
+    models.TipoProceso,
+    models.AreaProceso,
+    models.EstatusCaso,
+    models.TipoViolencia,
+    models.PrefijoOficio,
+    models.Solicitante,
+    models.Destinatario,
+    models.EstatusTramite,
+)
+
+
+def _backend():
+    # La generación se lee en cada fragmento; no cuenta en las métricas de aciertos.
+    return cache_de("fragmentos").backend
+
+
+def generacion() -> int | str:
+    memo = memo_peticion()
+    if memo is not None and CLAVE_MEMO in memo:
+        return memo[CLAVE_MEMO]
+    if settings.CACHE_COMPARTIDA:
+        # Si la entrada se pierde, una generación nueva descarta todo lo anterior.
+        valor = _backend().get_or_set(CLAVE_GENERACION, time.time_ns, timeout=None)
+    else:
+        valor = generacion_bd()
+    if memo is not None:
+        memo[CLAVE_MEMO] = valor
+    return valor
+
+
+def generacion_bd() -> str:
+    """Huella del último `actualizado_en` y el total de cada catálogo, en una sola consulta."""
+    consultas = [
+        modelo.objects.order_by()
+        .annotate(modelo=Value(modelo._meta.model_name, output_field=CharField()))
+        .values("modelo")
+        .annotate(ultimo=Max("actualizado_en"), total=Count("pk"))
+        for modelo in MODELOS_CATALOGO
+    ]
+    filas = consultas[0].union(*consultas[1:], all=True)
+    base = ";".join(f"{fila['modelo']}:{fila['ultimo']}:{fila['total']}" for fila in filas)
+    return hashlib.blake2b(base.encode(), digest_size=8).hexdigest()
+
+
+def invalidar() -> None:
+    _backend().set(CLAVE_GENERACION, time.time_ns(), timeout=None)
+    # Una petición que edita un catálogo y luego renderiza no reutiliza la generación vieja.
+    memo = memo_peticion()
+    if memo is not None:
+        memo.pop(CLAVE_MEMO, None)
+
+
+def huella_registros(registros: Iterable[Model]) -> str:
+    """Huella de una página de registros a partir de su id y `actualizado_en`."""
+    base = ";".join(f"{registro.pk}:{registro.actualizado_en.isoformat()}" for registro in registros)
+    return hashlib.blake2b(base.encode(), digest_size=12).hexdigest()
+
+
+def clave(nombre: str, partes: Iterable[object]) -> str:
+    base = "|".join(str(parte) for parte in partes)
+    return f"{nombre}:{generacion()}:{hashlib.blake2b(base.encode(), digest_size=16).hexdigest()}"
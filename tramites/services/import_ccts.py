@@ -25,7 +25,7 @@ def _iter_rows(csv_path: Path) -> Iterable[dict]:
 def importar_ccts(csv_path: Path) -> ImportCCTResult:
     resultado = ImportCCTResult()
     for row in _iter_rows(csv_path):
-        cct = (row.get("CCT") or "").strip()
+        cct = (row.get("CCT") or "").strip().upper()
         if not cct:
             continue
         nombre = (row.get("c_nombre") or "").strip()
@@ -0,0 +1,39 @@
+"""Borrado en lotes de sesiones y tokens JWT vencidos.
+
+Con `ROTATE_REFRESH_TOKENS` cada renovación agrega un `OutstandingToken` y un
+`BlacklistedToken`; sin limpieza las tablas crecen sin límite. Se borra por
+lotes de llaves primarias para no sostener un bloqueo largo ni cargar la
+transacción con cientos de miles de filas.
+"""
+from __future__ import annotations
+
+import time
+
+from django.contrib.sessions.models import Session
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+def borrar_en_lotes(queryset: QuerySet, lote: int = 1000, pausa: float = 0.0) -> int:
+    """Borra las filas del queryset en lotes de `lote`; devuelve cuántas se borraron."""
+    total = 0
+    while True:
+        pks = list(queryset.order_by("pk").values_list("pk", flat=True)[:lote])
+        if not pks:
+            return total
+        queryset.model.objects.filter(pk__in=pks).delete()
+        total += len(pks)
+        if len(pks) < lote:
+            return total
+        if pausa:
+            time.sleep(pausa)
+
+
+def limpiar_tokens_vencidos(lote: int = 1000, pausa: float = 0.0) -> int:
+    """Tokens de renovación expirados; su entrada en la lista negra se borra en cascada."""
+    return borrar_en_lotes(OutstandingToken.objects.filter(expires_at__lte=timezone.now()), lote, pausa)
+
+
+def limpiar_sesiones_vencidas(lote: int = 1000, pausa: float = 0.0) -> int:
+    return borrar_en_lotes(Session.objects.filter(expire_date__lt=timezone.now()), lote, pausa)
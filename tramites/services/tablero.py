@@ -0,0 +1,179 @@
+"""Tablero de supervisión: conteos de trámites mantenidos de forma incremental.
+
+Cada alta, edición o baja de un `CasoInterno` ajusta la tabla `ConteoTablero`
+(ver `tramites.signals`), de modo que el tablero se responde leyendo unas
+cuantas filas en lugar de agrupar todos los trámites en cada visita.
+Las actualizaciones masivas (`QuerySet.update`, `bulk_update`) no disparan
+señales: después de ellas debe llamarse `recalcular_tablero()`.
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncMonth
+
+from tramites import models
+
+Clave = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class HuellaCaso:
+    """Valores de un caso que determinan en qué conteos participa."""
+
+    asesor: str
+    estatus_id: int | None
+    sistema: str
+    modalidad: str
+    fecha_apertura: date | None
+    abierto: bool
+
+    def claves(self) -> list[Clave]:
+        return [
+            (models.DIMENSION_ASESOR, self.asesor or ""),
+            (models.DIMENSION_ESTATUS, str(self.estatus_id or "")),
+            (models.DIMENSION_SISTEMA, self.sistema or ""),
+            (models.DIMENSION_MODALIDAD, self.modalidad or ""),
+            (models.DIMENSION_MES, self.fecha_apertura.strftime("%Y-%m") if self.fecha_apertura else ""),
+        ]
+
+
+def _estatus_es_cierre(estatus_id: int | None) -> bool:
+    if not estatus_id:
+        return False
+    return models.EstatusCaso.objects.filter(pk=estatus_id, es_cierre=True).exists()
+
+
+def huella_de_instancia(caso: models.CasoInterno) -> HuellaCaso:
+    return HuellaCaso(
+        asesor=caso.asesor_cct or "",
+        estatus_id=caso.estatus_id,
+        sistema=caso.cct_sistema or "",
+        modalidad=caso.cct_modalidad or "",
+        fecha_apertura=caso.fecha_apertura,
+        abierto=not _estatus_es_cierre(caso.estatus_id),
+    )
+
+
+def huella_guardada(caso_pk: int) -> HuellaCaso | None:
+    """Lee de la base la versión previa del caso (antes de guardarlo)."""
+    fila = (
+        models.CasoInterno.objects.filter(pk=caso_pk)
+        .values("asesor_cct", "estatus_id", "cct_sistema", "cct_modalidad", "fecha_apertura", "estatus__es_cierre")
+        .first()
+    )
+    if fila is None:
+        return None
+    return HuellaCaso(
+        asesor=fila["asesor_cct"] or "",
+        estatus_id=fila["estatus_id"],
+        sistema=fila["cct_sistema"] or "",
+        modalidad=fila["cct_modalidad"] or "",
+        fecha_apertura=fila["fecha_apertura"],
+        abierto=not fila["estatus__es_cierre"],
+    )
+
+
+def _aplicar_delta(clave: Clave, total: int, abiertos: int) -> None:
+    if not total and not abiertos:
+        return
+    dimension, valor = clave
+    filtro = models.ConteoTablero.objects.filter(dimension=dimension, valor=valor)
+    if filtro.update(total=F("total") + total, abiertos=F("abiertos") + abiertos):
+        return
+    try:
+        with transaction.atomic():
+            models.ConteoTablero.objects.create(dimension=dimension, valor=valor, total=total, abiertos=abiertos)
+    except IntegrityError:
+        # Otra petición creó la fila al mismo tiempo: basta con sumar.
+        filtro.update(total=F("total") + total, abiertos=F("abiertos") + abiertos)
+
+
+def aplicar_cambio(anterior: HuellaCaso | None, nueva: HuellaCaso | None) -> None:
+    """Ajusta los conteos al pasar de `anterior` a `nueva` (None = no existe)."""
+    if anterior == nueva:
+        return
+    deltas: dict[Clave, list[int]] = defaultdict(lambda: [0, 0])
+    if anterior is not None:
+        for clave in anterior.claves():
+            deltas[clave][0] -= 1
+            deltas[clave][1] -= int(anterior.abierto)
+    if nueva is not None:
+        for clave in nueva.claves():
+            deltas[clave][0] += 1
+            deltas[clave][1] += int(nueva.abierto)
+    for clave, (total, abiertos) in sorted(deltas.items()):
+        _aplicar_delta(clave, total, abiertos)
+
+
+def _conteos_por(campo, dimension: str, formato=str) -> Iterable[models.ConteoTablero]:
+    filas = (
+        models.CasoInterno.objects.order_by()
+        .values(valor=campo)
+        .annotate(total=Count("pk"), abiertos=Count("pk", filter=Q(estatus__es_cierre=False)))
+    )
+    for fila in filas:
+        valor = fila["valor"]
+        yield models.ConteoTablero(
+            dimension=dimension,
+            valor="" if valor is None else formato(valor),
+            total=fila["total"],
+            abiertos=fila["abiertos"],
+        )
+
+
+def recalcular_tablero() -> int:
+    """Reconstruye todos los conteos con GROUP BY (para cron o tras cargas masivas)."""
+    conteos = [
+        *_conteos_por(F("asesor_cct"), models.DIMENSION_ASESOR),
+        *_conteos_por(F("estatus_id"), models.DIMENSION_ESTATUS),
+        *_conteos_por(F("cct_sistema"), models.DIMENSION_SISTEMA),
+        *_conteos_por(F("cct_modalidad"), models.DIMENSION_MODALIDAD),
+        *_conteos_por(TruncMonth("fecha_apertura"), models.DIMENSION_MES, lambda v: v.strftime("%Y-%m")),
+    ]
+    # Valores equivalentes ("" y None) pueden quedar en filas separadas del GROUP BY.
+    agregados: dict[Clave, Counter] = defaultdict(Counter)
+    for conteo in conteos:
+        agregados[(conteo.dimension, conteo.valor)].update(total=conteo.total, abiertos=conteo.abiertos)
+    with transaction.atomic():
+        models.ConteoTablero.objects.all().delete()
+        models.ConteoTablero.objects.bulk_create(
+            models.ConteoTablero(dimension=dimension, valor=valor, total=c["total"], abiertos=c["abiertos"])
+            for (dimension, valor), c in agregados.items()
+        )
+    return len(agregados)
+
+
+def _armar_resumen(nombres_estatus: dict[int, str], conteos: Iterable[models.ConteoTablero]) -> dict[str, list[dict]]:
+    resumen: dict[str, list[dict]] = {clave: [] for clave, _ in models.DIMENSIONES_TABLERO_CHOICES}
+    for conteo in conteos:
+        etiqueta = conteo.valor or "Sin dato"
+        if conteo.dimension == models.DIMENSION_ESTATUS and conteo.valor:
+            etiqueta = nombres_estatus.get(int(conteo.valor), conteo.valor)
+        resumen[conteo.dimension].append(
+            {"valor": conteo.valor, "etiqueta": etiqueta, "total": conteo.total, "abiertos": conteo.abiertos}
+        )
+    for dimension, filas in resumen.items():
+        if dimension == models.DIMENSION_MES:
+            filas.sort(key=lambda fila: fila["valor"], reverse=True)
+        else:
+            filas.sort(key=lambda fila: (-fila["abiertos"], fila["etiqueta"]))
+    return resumen
+
+
+def resumen_tablero() -> dict[str, list[dict]]:
+    """Conteos agrupados por dimensión, listos para la plantilla o JSON."""
+    nombres_estatus = dict(models.EstatusCaso.objects.values_list("pk", "nombre"))
+    return _armar_resumen(nombres_estatus, models.ConteoTablero.objects.filter(total__gt=0))
+
+
+async def aresumen_tablero() -> dict[str, list[dict]]:
+    """`resumen_tablero` con ORM async (mismas dos consultas)."""
+    nombres_estatus = {pk: nombre async for pk, nombre in models.EstatusCaso.objects.values_list("pk", "nombre")}
+    conteos = [conteo async for conteo in models.ConteoTablero.objects.filter(total__gt=0)]
+    return _armar_resumen(nombres_estatus, conteos)
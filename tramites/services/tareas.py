@@ -0,0 +1,271 @@
+"""Cola de tareas en segundo plano respaldada por la base de datos.
+
+Las vistas solo encolan (`encolar_tarea`) y el comando `procesar_tareas` ejecuta
+los trabajos pesados (exportaciones, expedientes en PDF) fuera de los workers web.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import logging
+import time
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.http import QueryDict
+from django.utils import timezone
+
+from tramites import models
+from tramites.replicas import lecturas_en_replica
+
+logger = logging.getLogger(__name__)
+
+# Cada manejador recibe la tarea y devuelve (nombre de archivo, contenido), o None si
+# el resultado ya queda guardado en otro lugar (p. ej. la caché de expedientes).
+ManejadorTarea = Callable[[models.TareaSegundoPlano], tuple[str, bytes] | None]
+# Cada cuánto un worker desocupado borra las tareas terminadas que ya vencieron.
+LIMPIAR_CADA_SEGUNDOS = 3600
+
+_MANEJADORES: dict[str, ManejadorTarea] = {}
+
+
+class TipoTareaDesconocido(ValueError):
+    """Se intentó encolar un tipo de tarea sin manejador registrado."""
+
+
+def registrar_tarea(tipo: str) -> Callable[[ManejadorTarea], ManejadorTarea]:
+    """Decorador para registrar el manejador de un tipo de tarea."""
+
+    def decorador(func: ManejadorTarea) -> ManejadorTarea:
+        _MANEJADORES[tipo] = func
+        return func
+
+    return decorador
+
+
+def tipos_registrados() -> list[str]:
+    return sorted(_MANEJADORES)
+
+
+def encolar_tarea(
+    tipo: str, parametros: dict | None = None, usuario=None, *, reutilizar: bool = False
+) -> models.TareaSegundoPlano:
+    """Registra una tarea pendiente; el worker la tomará en cuanto esté libre.
+
+    Con `reutilizar`, si el mismo usuario ya tiene una igual sin terminar se devuelve ésa.
+    """
+    if tipo not in _MANEJADORES:
+        raise TipoTareaDesconocido(f"No existe un manejador para la tarea '{tipo}'.")
+    actor = usuario if getattr(usuario, "is_authenticated", False) else None
+    parametros = parametros or {}
+    if reutilizar:
+        existente = (
+            models.TareaSegundoPlano.objects.filter(
+                tipo=tipo,
+                parametros=parametros,
+                creado_por=actor,
+                estatus__in=(models.TAREA_PENDIENTE, models.TAREA_EN_PROCESO),
+            )
+            .order_by("creado_en", "id")
+            .first()
+        )
+        if existente is not None:
+            return existente
+    return models.TareaSegundoPlano.objects.create(tipo=tipo, parametros=parametros, creado_por=actor)
+
+
+def reclamar_tarea() -> models.TareaSegundoPlano | None:
+    """Toma la tarea pendiente más antigua sin bloquear a otros workers (SKIP LOCKED)."""
+    with transaction.atomic():
+        tarea = (
+            models.TareaSegundoPlano.objects.select_for_update(skip_locked=True)
+            .filter(estatus=models.TAREA_PENDIENTE)
+            .order_by("creado_en", "id")
+            .first()
+        )
+        if tarea is None:
+            return None
+        ahora = timezone.now()
+        # UPDATE condicionado al estatus: en motores sin SELECT ... FOR UPDATE otro
+        # worker pudo tomarla primero.
+        reclamada = models.TareaSegundoPlano.objects.filter(
+            pk=tarea.pk, estatus=models.TAREA_PENDIENTE
+        ).update(estatus=models.TAREA_EN_PROCESO, iniciado_en=ahora, intentos=F("intentos") + 1)
+    if not reclamada:
+        return reclamar_tarea()
+    tarea.refresh_from_db()
+    return tarea
+
+
+def ejecutar_tarea(tarea: models.TareaSegundoPlano) -> models.TareaSegundoPlano:
+    """Ejecuta el manejador y guarda el archivo de resultado en MEDIA_ROOT."""
+    manejador = _MANEJADORES.get(tarea.tipo)
+    try:
+        if manejador is None:
+            raise TipoTareaDesconocido(f"No existe un manejador para la tarea '{tarea.tipo}'.")
+        archivo = manejador(tarea)
+        if archivo is not None:
+            nombre, contenido = archivo
+            tarea.resultado.save(nombre, ContentFile(contenido), save=False)
+        tarea.estatus = models.TAREA_COMPLETADA
+        tarea.mensaje_error = ""
+    except Exception as exc:  # noqa: BLE001 - cualquier error debe quedar registrado en la tarea
+        logger.exception("Falló la tarea %s (%s)", tarea.pk, tarea.tipo)
+        tarea.estatus = models.TAREA_FALLIDA
+        tarea.mensaje_error = f"{exc.__class__.__name__}: {exc}"
+    tarea.terminado_en = timezone.now()
+    tarea.save(update_fields=["resultado", "estatus", "mensaje_error", "terminado_en"])
+    return tarea
+
+
+def liberar_tareas_vencidas() -> int:
+    """Regresa a pendiente las tareas en proceso de un worker que murió."""
+    limite = timezone.now() - getattr(settings, "TAREAS_TIEMPO_MAXIMO", timedelta(minutes=30))
+    maximo_intentos = getattr(settings, "TAREAS_MAXIMO_INTENTOS", 3)
+    vencidas = models.TareaSegundoPlano.objects.filter(estatus=models.TAREA_EN_PROCESO, iniciado_en__lt=limite)
+    agotadas = vencidas.filter(intentos__gte=maximo_intentos).update(
+        estatus=models.TAREA_FALLIDA,
+        mensaje_error="Se agotaron los intentos: el worker no terminó la tarea.",
+        terminado_en=timezone.now(),
+    )
+    return agotadas + vencidas.update(estatus=models.TAREA_PENDIENTE, iniciado_en=None)
+
+
+def limpiar_tareas_terminadas(conservar: timedelta | None = None, lote: int = 500) -> int:
+    """Borra las tareas terminadas hace más de `conservar` junto con su archivo de resultado."""
+    conservar = conservar if conservar is not None else getattr(settings, "TAREAS_CONSERVAR", timedelta(days=7))
+    vencidas = models.TareaSegundoPlano.objects.filter(
+        estatus__in=(models.TAREA_COMPLETADA, models.TAREA_FALLIDA),
+        terminado_en__lt=timezone.now() - conservar,
+    )
+    total = 0
+    while True:
+        grupo = list(vencidas.order_by("pk")[:lote])
+        if not grupo:
+            return total
+        for tarea in grupo:
+            if tarea.resultado:
+                tarea.resultado.delete(save=False)
+        models.TareaSegundoPlano.objects.filter(pk__in=[tarea.pk for tarea in grupo]).delete()
+        total += len(grupo)
+
+
+def procesar_pendientes(limite: int | None = None) -> int:
+    """Ejecuta tareas pendientes hasta vaciar la cola (o alcanzar `limite`)."""
+    procesadas = 0
+    while limite is None or procesadas < limite:
+        tarea = reclamar_tarea()
+        if tarea is None:
+            break
+        ejecutar_tarea(tarea)
+        procesadas += 1
+    return procesadas
+
+
+def ejecutar_worker(intervalo: float, una_vez: bool = False) -> None:
+    """Bucle de un worker: toma tareas y duerme `intervalo` segundos cuando no hay."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    ultima_limpieza = 0.0
+    while True:
+        close_old_connections()
+        try:
+            tarea = reclamar_tarea()
+        except DatabaseError:
+            logger.warning("No se pudo consultar la cola de tareas; se reintentará.", exc_info=True)
+            time.sleep(intervalo)
+            continue
+        if tarea is None:
+            if una_vez:
+                return
+            if time.monotonic() - ultima_limpieza > LIMPIAR_CADA_SEGUNDOS:
+                ultima_limpieza = time.monotonic()
+                try:
+                    limpiar_tareas_terminadas()
+                except DatabaseError:
+                    logger.warning("No se pudieron borrar las tareas vencidas.", exc_info=True)
+            time.sleep(intervalo)
+            continue
+        ejecutar_tarea(tarea)
+
+
+# --------------------------------------------------------------------------- #
+# Manejadores incluidos
+# --------------------------------------------------------------------------- #
+
+
+@registrar_tarea("expediente_pdf")
+def _tarea_expediente_pdf(tarea: models.TareaSegundoPlano) -> None:
+    from tramites.services.expediente_pdf import cargar_caso, generar_expediente_pdf
+
+    # El PDF queda en la caché de expedientes y se descarga desde ahí; no se copia a la tarea.
+    generar_expediente_pdf(cargar_caso(int(tarea.parametros["caso"])))
+
+
+COLUMNAS_EXPORTACION = (
+    ("id", "Id"),
+    ("cct_id", "CCT"),
+    ("cct_nombre", "Nombre del CCT"),
+    ("cct_sistema", "Sistema"),
+    ("cct_modalidad", "Modalidad"),
+    ("asesor_cct", "Asesor"),
+    ("numero_oficio", "Número de expediente"),
+    ("fecha_apertura", "Fecha de apertura"),
+    ("fecha_termino", "Fecha de término"),
+    ("estatus__nombre", "Estatus"),
+    ("tipo_inicial__nombre", "Tipo inicial"),
+    ("tipo_violencia__nombre", "Tipo de violencia"),
+    ("solicitante__nombre", "Solicitante"),
+    ("dirigido_a__nombre", "Dirigido a"),
+    ("asunto", "Asunto"),
+)
+
+
+@registrar_tarea("exportar_tramites")
+def _tarea_exportar_tramites(tarea: models.TareaSegundoPlano) -> tuple[str, bytes]:
+    from tramites.filters import CasoInternoFilter
+
+    filtros = QueryDict(tarea.parametros.get("filtros", ""))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([titulo for _campo, titulo in COLUMNAS_EXPORTACION])
+    # Con réplica configurada, la exportación completa no carga a la primaria.
+    with lecturas_en_replica():
+        queryset = CasoInternoFilter(filtros, queryset=models.CasoInterno.objects.all()).qs
+        filas = queryset.order_by("-fecha_apertura", "-id").values_list(
+            *(campo for campo, _titulo in COLUMNAS_EXPORTACION)
+        )
+        for fila in filas.iterator(chunk_size=2000):
+            writer.writerow(["" if valor is None else valor for valor in fila])
+    # BOM para que Excel reconozca los acentos.
+    return f"tramites-{timezone.localdate():%Y%m%d}.csv", buffer.getvalue().encode("utf-8-sig")
+
+
+@registrar_tarea("cribado_elegibilidad")
+def _tarea_cribado_elegibilidad(tarea: models.TareaSegundoPlano) -> tuple[str, bytes]:
+    from datetime import date
+
+    from django.core.files.storage import default_storage
+
+    from tramites.services.cribado import cribar_archivo
+
+    parametros = tarea.parametros
+    fecha_analisis = date.fromisoformat(parametros["fecha_analisis"]) if parametros.get("fecha_analisis") else None
+    try:
+        with default_storage.open(parametros["archivo"], "rb") as archivo:
+            contenido, _total = cribar_archivo(
+                archivo,
+                parametros.get("nombre") or parametros["archivo"],
+                fecha_analisis=fecha_analisis or timezone.localdate(),
+                regimen=parametros.get("regimen") or "issste",
+            )
+    finally:
+        default_storage.delete(parametros["archivo"])
+    return f"cribado-{timezone.localdate():%Y%m%d}.csv", contenido
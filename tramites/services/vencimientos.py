@@ -0,0 +1,161 @@
+"""Consultas de vencimientos sobre `fecha_termino` resueltas en la base de datos.
+
+Los filtros usan rangos sobre `fecha_termino` (índices parciales
+`caso_vencimiento_idx` y `tramite_caso_vencimiento_idx`) y los días restantes
+se calculan en SQL, de modo que "qué vence en los próximos 7 días" no requiere
+cargar todos los trámites para evaluar `dias_para_termino` en Python.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.db.models import Count, F, Func, IntegerField, Q, QuerySet, Value
+from django.db.models.fields import DateField
+from django.utils import timezone
+
+from tramites import models
+
+DIAS_ALERTA_DEFAULT = 7
+# Valor de `?asesor=` para los casos sin asesor asignado (`asesor_cct` vacío).
+SIN_ASESOR = "-"
+
+
+class DiasHasta(Func):
+    """Días enteros desde `fecha` hasta la expresión (negativo si ya pasó)."""
+
+    output_field = IntegerField()
+    arity = 2
+
+    def __init__(self, expresion, fecha: date, **extra):
+        super().__init__(expresion, Value(fecha, output_field=DateField()), **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # PostgreSQL: date - date devuelve un entero de días.
+        return super().as_sql(compiler, connection, template="(%(expressions)s)", arg_joiner=" - ", **extra_context)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template="CAST(julianday(%(expressions)s) AS INTEGER)",
+            arg_joiner=") - julianday(",
+            **extra_context,
+        )
+
+
+def _hoy(hoy: date | None) -> date:
+    return hoy or timezone.localdate()
+
+
+def casos_abiertos_con_termino(hoy: date | None = None) -> QuerySet:
+    """Casos abiertos con fecha de término y sus días restantes anotados."""
+    return (
+        models.CasoInterno.objects.filter(fecha_termino__isnull=False, estatus__es_cierre=False)
+        .annotate(dias_restantes=DiasHasta(F("fecha_termino"), _hoy(hoy)))
+        .order_by("fecha_termino", "pk")
+    )
+
+
+def tramites_abiertos_con_termino(hoy: date | None = None) -> QuerySet:
+    """Trámites asociados abiertos (o sin estatus) con fecha de término."""
+    return (
+        models.TramiteCaso.objects.filter(fecha_termino__isnull=False)
+        .exclude(estatus__es_cierre=True)
+        .annotate(dias_restantes=DiasHasta(F("fecha_termino"), _hoy(hoy)))
+        .order_by("fecha_termino", "pk")
+    )
+
+
+def _ventana(queryset: QuerySet, dias: int, hoy: date, incluir_vencidos: bool) -> QuerySet:
+    limite = hoy + timedelta(days=dias)
+    if incluir_vencidos:
+        return queryset.filter(fecha_termino__lte=limite)
+    return queryset.filter(fecha_termino__range=(hoy, limite))
+
+
+def casos_por_vencer(
+    dias: int = DIAS_ALERTA_DEFAULT, *, hoy: date | None = None, incluir_vencidos: bool = True
+) -> QuerySet:
+    hoy = _hoy(hoy)
+    return _ventana(casos_abiertos_con_termino(hoy), dias, hoy, incluir_vencidos)
+
+
+def tramites_por_vencer(
+    dias: int = DIAS_ALERTA_DEFAULT, *, hoy: date | None = None, incluir_vencidos: bool = True
+) -> QuerySet:
+    hoy = _hoy(hoy)
+    return _ventana(tramites_abiertos_con_termino(hoy), dias, hoy, incluir_vencidos)
+
+
+def filtrar_asesor(queryset: QuerySet, asesor: str, campo: str = "asesor_cct") -> QuerySet:
+    """Filtra por el valor de `?asesor=`; `SIN_ASESOR` selecciona los casos sin asesor."""
+    asesor = (asesor or "").strip()
+    if not asesor:
+        return queryset
+    return queryset.filter(**{campo: "" if asesor == SIN_ASESOR else asesor})
+
+
+@dataclass
+class AlertaAsesor:
+    asesor: str
+    vencidos: int
+    vencen_hoy: int
+    proximos: int
+    clave: str = ""  # valor para `?asesor=`
+
+    @property
+    def total(self) -> int:
+        return self.vencidos + self.vencen_hoy + self.proximos
+
+    def as_dict(self) -> dict:
+        return {
+            "asesor": self.asesor,
+            "clave": self.clave,
+            "vencidos": self.vencidos,
+            "vencen_hoy": self.vencen_hoy,
+            "proximos": self.proximos,
+            "total": self.total,
+        }
+
+
+def _conteos_por_asesor(dias: int, hoy: date) -> QuerySet:
+    return (
+        models.CasoInterno.objects.filter(
+            fecha_termino__isnull=False,
+            fecha_termino__lte=hoy + timedelta(days=dias),
+            estatus__es_cierre=False,
+        )
+        .order_by()
+        .values("asesor_cct")
+        .annotate(
+            vencidos=Count("pk", filter=Q(fecha_termino__lt=hoy)),
+            vencen_hoy=Count("pk", filter=Q(fecha_termino=hoy)),
+            proximos=Count("pk", filter=Q(fecha_termino__gt=hoy)),
+        )
+    )
+
+
+def _alertas(filas) -> list[AlertaAsesor]:
+    alertas = [
+        AlertaAsesor(
+            asesor=fila["asesor_cct"] or "Sin asesor",
+            clave=fila["asesor_cct"] or SIN_ASESOR,
+            vencidos=fila["vencidos"],
+            vencen_hoy=fila["vencen_hoy"],
+            proximos=fila["proximos"],
+        )
+        for fila in filas
+    ]
+    alertas.sort(key=lambda alerta: (-alerta.vencidos, -alerta.vencen_hoy, -alerta.proximos, alerta.asesor))
+    return alertas
+
+
+def resumen_por_asesor(dias: int = DIAS_ALERTA_DEFAULT, *, hoy: date | None = None) -> list[AlertaAsesor]:
+    """Casos vencidos, que vencen hoy y próximos a vencer por asesor (un solo GROUP BY)."""
+    return _alertas(_conteos_por_asesor(dias, _hoy(hoy)))
+
+
+async def aresumen_por_asesor(dias: int = DIAS_ALERTA_DEFAULT, *, hoy: date | None = None) -> list[AlertaAsesor]:
+    """`resumen_por_asesor` con ORM async."""
+    return _alertas([fila async for fila in _conteos_por_asesor(dias, _hoy(hoy))])
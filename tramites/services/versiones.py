@@ -0,0 +1,98 @@
+"""Versión de un caso o trámite para respuestas condicionales (ETag/Last-Modified).
+
+Cada función resuelve en una sola consulta, por llave primaria y subconsultas
+sobre las llaves foráneas indexadas, la marca de tiempo más reciente de lo que
+muestra la página de detalle y una huella que también cambia si se borra un
+trámite o un registro de la bitácora. Así una revalidación cuesta esa consulta y
+no el armado completo del contexto.
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from tramites import models
+
+
+@dataclass(frozen=True)
+class Version:
+    huella: str
+    modificado: datetime
+
+    def etag(self, *extras: object) -> str:
+        """ETag débil; `extras` distingue variantes (usuario, formato) de la misma versión."""
+        if not extras:
+            return f'W/"{self.huella}"'
+        base = "|".join([self.huella, *(str(extra) for extra in extras)])
+        return f'W/"{hashlib.blake2b(base.encode(), digest_size=12).hexdigest()}"'
+
+
+def _agregado(queryset, campo: str, funcion):
+    """Subconsulta escalar agregada sobre los hijos de la fila externa."""
+    return Subquery(
+        queryset.order_by().values(campo).annotate(valor=funcion).values("valor")[:1]
+    )
+
+
+def _version(valores: tuple) -> Version:
+    marcas = [valor for valor in valores if isinstance(valor, datetime)]
+    base = "|".join("" if valor is None else str(valor) for valor in valores)
+    return Version(hashlib.blake2b(base.encode(), digest_size=12).hexdigest(), max(marcas))
+
+
+def version_caso(pk: int) -> Version | None:
+    """Versión del detalle de un caso: el caso, sus trámites y su bitácora de estatus."""
+    tramites = models.TramiteCaso.objects.filter(caso=OuterRef("pk"))
+    historial = models.HistorialEstatusCaso.objects.filter(caso=OuterRef("pk"))
+    valores = (
+        models.CasoInterno.objects.filter(pk=pk)
+        .annotate(
+            tramites_modificado=_agregado(tramites, "caso", Max("actualizado_en")),
+            tramites_total=Coalesce(
+                _agregado(tramites, "caso", Count("pk")), Value(0), output_field=IntegerField()
+            ),
+            historial_modificado=_agregado(historial, "caso", Max("fecha_cambio")),
+            historial_total=Coalesce(
+                _agregado(historial, "caso", Count("pk")), Value(0), output_field=IntegerField()
+            ),
+        )
+        .values_list(
+            "pk",
+            "actualizado_en",
+            "tramites_modificado",
+            "tramites_total",
+            "historial_modificado",
+            "historial_total",
+        )
+        .first()
+    )
+    return _version(valores) if valores else None
+
+
+def version_tramite(pk: int, caso_pk: int | None = None) -> Version | None:
+    """Versión del detalle de un trámite: el trámite, su caso y su bitácora de estatus."""
+    historial = models.HistorialEstatusTramiteCaso.objects.filter(tramite=OuterRef("pk"))
+    consulta = models.TramiteCaso.objects.filter(pk=pk)
+    if caso_pk is not None:
+        consulta = consulta.filter(caso_id=caso_pk)
+    valores = (
+        consulta.annotate(
+            historial_modificado=_agregado(historial, "tramite", Max("fecha_cambio")),
+            historial_total=Coalesce(
+                _agregado(historial, "tramite", Count("pk")), Value(0), output_field=IntegerField()
+            ),
+        )
+        .values_list("pk", "actualizado_en", "caso__actualizado_en", "historial_modificado", "historial_total")
+        .first()
+    )
+    return _version(valores) if valores else None
+
+
+def version_registro(queryset, **filtro) -> Version | None:
+    """Versión de un registro con `actualizado_en` (p. ej. el `retrieve` de la API)."""
+    valores = queryset.filter(**filtro).values_list("pk", "actualizado_en").first()
+    return _version(valores) if valores else None
@@ -0,0 +1,12 @@
+"""Motor de sesiones `cached_db` cuyas lecturas cuentan en las métricas del espacio `sesiones`."""
+from __future__ import annotations
+
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+
+from tramites.cache import cache_de
+
+
+class SessionStore(CachedDBStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._cache = cache_de("sesiones")
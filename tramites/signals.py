@@ -0,0 +1,85 @@
+"""Señales del módulo de trámites."""
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from tramites import models, tokens
+from tramites.services import catalogo_cct, catalogos, fragmentos, tablero
+
+
+@receiver(pre_save, sender=models.CasoInterno)
+def _caso_guardar_huella_previa(sender, instance: models.CasoInterno, **kwargs) -> None:
+    instance._huella_tablero = tablero.huella_guardada(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=models.CasoInterno)
+def _caso_actualizar_tablero(sender, instance: models.CasoInterno, **kwargs) -> None:
+    anterior = getattr(instance, "_huella_tablero", None)
+    tablero.aplicar_cambio(anterior, tablero.huella_de_instancia(instance))
+
+
+@receiver(pre_delete, sender=models.CasoInterno)
+def _caso_huella_antes_de_eliminar(sender, instance: models.CasoInterno, **kwargs) -> None:
+    instance._huella_tablero = tablero.huella_guardada(instance.pk)
+
+
+@receiver(post_delete, sender=models.CasoInterno)
+def _caso_descontar_del_tablero(sender, instance: models.CasoInterno, **kwargs) -> None:
+    tablero.aplicar_cambio(getattr(instance, "_huella_tablero", None), None)
+
+
+@receiver(pre_save, sender=models.EstatusCaso)
+def _estatus_recordar_cierre(sender, instance: models.EstatusCaso, **kwargs) -> None:
+    instance._es_cierre_previo = (
+        models.EstatusCaso.objects.filter(pk=instance.pk).values_list("es_cierre", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=models.EstatusCaso)
+def _estatus_recalcular_abiertos(sender, instance: models.EstatusCaso, created: bool, **kwargs) -> None:
+    # Cambiar si un estatus concluye el trámite reclasifica todos sus casos.
+    if not created and instance._es_cierre_previo not in (None, instance.es_cierre):
+        tablero.recalcular_tablero()
+
+
+def _invalidar_al_confirmar(funcion, *args) -> None:
+    # Al borrar de inmediato y otra vez al confirmar, una lectura hecha dentro de la
+    # misma transacción no deja en caché datos que luego se revierten.
+    funcion(*args)
+    transaction.on_commit(lambda: funcion(*args))
+
+
+@receiver(post_save, sender=models.CCTSecundaria)
+@receiver(post_delete, sender=models.CCTSecundaria)
+def _cct_invalidar_cache(sender, instance: models.CCTSecundaria, **kwargs) -> None:
+    _invalidar_al_confirmar(catalogo_cct.invalidar_cct, instance.cct)
+
+
+def _catalogo_invalidar_cache(sender, **kwargs) -> None:
+    _invalidar_al_confirmar(catalogos.invalidar, sender)
+
+
+for _modelo in catalogos.MODELOS:
+    post_save.connect(_catalogo_invalidar_cache, sender=_modelo, dispatch_uid=f"catalogo-cache-{_modelo.__name__}")
+    post_delete.connect(_catalogo_invalidar_cache, sender=_modelo, dispatch_uid=f"catalogo-cache-{_modelo.__name__}")
+
+
+def _fragmentos_invalidar(sender, **kwargs) -> None:
+    _invalidar_al_confirmar(fragmentos.invalidar)
+
+
+# Los fragmentos muestran nombres de catálogo que no cambian el `actualizado_en` de los casos.
+for _modelo in fragmentos.MODELOS_CATALOGO:
+    post_save.connect(_fragmentos_invalidar, sender=_modelo, dispatch_uid=f"fragmentos-{_modelo.__name__}")
+    post_delete.connect(_fragmentos_invalidar, sender=_modelo, dispatch_uid=f"fragmentos-{_modelo.__name__}")
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def _token_recordar_lista_negra(sender, instance: BlacklistedToken, **kwargs) -> None:
+    # También cubre los tokens que se agregan a mano desde el admin.
+    tokens.marcar_en_lista_negra(instance.token.jti, instance.token.expires_at)
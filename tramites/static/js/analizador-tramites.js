@@ -5,6 +5,7 @@ import {
   evaluateYearsRequirement,
   evaluateLicensesRequirement,
   buildLicenseStatus,
+  mergeLicenseIntervals,
   pluralize,
 } from "./analizador_core.js";
 
@@ -44,11 +45,56 @@ if (typeof document !== "undefined") {
     licenses: root.querySelector('[data-requirement="licenses"]'),
   };
 
+  const analisisForm = document.getElementById("analisis-form");
+  const analisisFeedback = document.getElementById("analisis-feedback");
+
   const state = {
     licencias: [],
     editingId: null,
+    analisisId: null,
   };
 
+  analisisForm?.addEventListener("submit", async (event) => {
+    event.preventDefault();
+    const url = root.dataset.analisisUrl;
+    if (!url) {
+      return;
+    }
+    const csrf = analisisForm.querySelector('input[name="csrfmiddlewaretoken"]');
+    const payload = {
+      docente: analisisForm.elements.docente.value.trim(),
+      identificador: analisisForm.elements.identificador.value.trim(),
+      caso: analisisForm.elements.caso.value ? Number(analisisForm.elements.caso.value) : null,
+      fecha_ingreso: ingresoInput?.value || null,
+      fecha_analisis: analisisInput?.value || null,
+      regimen: regimenSelect?.value || "issste",
+      licencias: state.licencias.map((licencia) => ({ inicio: licencia.start, fin: licencia.end })),
+    };
+    try {
+      const response = await fetch(state.analisisId ? `${url}${state.analisisId}/` : url, {
+        method: state.analisisId ? "PUT" : "POST",
+        headers: {
+          Accept: "application/json",
+          "Content-Type": "application/json",
+          "X-CSRFToken": csrf ? csrf.value : "",
+        },
+        body: JSON.stringify(payload),
+      });
+      const data = await response.json();
+      if (!response.ok) {
+        showAnalisisFeedback(`No se pudo guardar: ${JSON.stringify(data)}`);
+        return;
+      }
+      state.analisisId = data.id;
+      const link = new URL(window.location.href);
+      link.searchParams.set("analisis", data.id);
+      window.history.replaceState(null, "", link);
+      showAnalisisFeedback(`Análisis guardado (#${data.id}). Puedes volver a abrirlo con este enlace.`);
+    } catch (error) {
+      showAnalisisFeedback("No se pudo guardar el análisis. Intenta de nuevo.");
+    }
+  });
+
   form?.addEventListener("submit", (event) => {
     event.preventDefault();
     hideFeedback();
@@ -147,8 +193,9 @@ if (typeof document !== "undefined") {
       return;
     }
     const ingresoDate = parseISODate(ingresoInput?.value || "");
+    const overlapping = new Set(mergeLicenseIntervals(state.licencias, ingresoDate).overlappingIndexes);
     const fragment = document.createDocumentFragment();
-    state.licencias.forEach((licencia) => {
+    state.licencias.forEach((licencia, index) => {
       const startDate = parseISODate(licencia.start);
       const endDate = parseISODate(licencia.end);
       const row = document.createElement("tr");
@@ -178,6 +225,12 @@ if (typeof document !== "undefined") {
       statusText.textContent = statusInfo.detail;
       statusCell.appendChild(badge);
       statusCell.appendChild(statusText);
+      if (overlapping.has(index)) {
+        const overlapText = document.createElement("span");
+        overlapText.className = "table__secondary";
+        overlapText.textContent = "Se traslapa con otra licencia: los días compartidos se cuentan una vez.";
+        statusCell.appendChild(overlapText);
+      }
 
       const actionsCell = document.createElement("td");
       actionsCell.innerHTML = `
@@ -377,7 +430,42 @@ if (typeof document !== "undefined") {
     return `${day}/${month}/${year}`;
   }
 
+  function showAnalisisFeedback(message) {
+    if (!analisisFeedback) {
+      return;
+    }
+    analisisFeedback.textContent = message;
+    analisisFeedback.hidden = false;
+  }
+
+  function loadSavedAnalysis() {
+    const script = document.getElementById("analisis-guardado");
+    const saved = script ? JSON.parse(script.textContent) : null;
+    if (!saved) {
+      return;
+    }
+    state.analisisId = saved.id;
+    if (ingresoInput) {
+      ingresoInput.value = saved.fecha_ingreso || "";
+    }
+    if (analisisInput && saved.fecha_analisis) {
+      analisisInput.value = saved.fecha_analisis;
+    }
+    if (regimenSelect) {
+      regimenSelect.value = saved.regimen;
+    }
+    if (analisisForm) {
+      analisisForm.elements.docente.value = saved.docente || "";
+      analisisForm.elements.identificador.value = saved.identificador || "";
+      analisisForm.elements.caso.value = saved.caso || "";
+    }
+    state.licencias = (saved.licencias || [])
+      .map((licencia) => ({ id: generateId(), start: licencia.inicio, end: licencia.fin }))
+      .sort((a, b) => a.start.localeCompare(b.start));
+  }
+
   // Inicializar vista
+  loadSavedAnalysis();
   renderLicencias();
   updateSummary();
 });
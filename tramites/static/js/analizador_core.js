@@ -53,6 +53,78 @@ export function calculateValidDays(startDate, endDate, ingresoDate) {
   return calculateInclusiveDays(effectiveStart, endDate);
 }
 
+function toDayNumber(date) {
+  return Math.floor(date.getTime() / MS_PER_DAY);
+}
+
+function fromDayNumber(dayNumber) {
+  return new Date(dayNumber * MS_PER_DAY);
+}
+
+// Une los periodos de licencia (ordenar + barrido, O(n log n)) para que los días
+// traslapados o duplicados se cuenten una sola vez. Devuelve los periodos unidos,
+// los días válidos posteriores a la fecha de ingreso y los índices de las
+// licencias que se traslapan con alguna otra.
+export function mergeLicenseIntervals(licencias, ingresoDate) {
+  const intervals = [];
+  licencias.forEach((licencia, index) => {
+    const startDate = parseISODate(licencia.start);
+    const endDate = parseISODate(licencia.end);
+    if (!startDate || !endDate || endDate < startDate) {
+      return;
+    }
+    intervals.push({ start: toDayNumber(startDate), end: toDayNumber(endDate), index });
+  });
+  intervals.sort((a, b) => a.start - b.start || a.end - b.end);
+
+  const cutoff = ingresoDate instanceof Date ? toDayNumber(ingresoDate) + 1 : null;
+  const periods = [];
+  const overlapping = new Set();
+  let validDays = 0;
+  let current = null;
+
+  const closeCurrent = () => {
+    if (!current) {
+      return;
+    }
+    const effectiveStart = cutoff === null ? current.start : Math.max(current.start, cutoff);
+    const days = cutoff === null || current.end < effectiveStart ? 0 : current.end - effectiveStart + 1;
+    validDays += days;
+    periods.push({
+      start: fromDayNumber(current.start),
+      end: fromDayNumber(current.end),
+      days: current.end - current.start + 1,
+      validDays: days,
+      sources: current.sources,
+    });
+  };
+
+  intervals.forEach((interval, position) => {
+    const next = intervals[position + 1];
+    if (next && next.start <= interval.end) {
+      overlapping.add(interval.index);
+      overlapping.add(next.index);
+    }
+    if (current && interval.start <= current.end) {
+      overlapping.add(interval.index);
+    }
+    if (current && interval.start <= current.end + 1) {
+      current.end = Math.max(current.end, interval.end);
+      current.sources.push(interval.index);
+      return;
+    }
+    closeCurrent();
+    current = { start: interval.start, end: interval.end, sources: [interval.index] };
+  });
+  closeCurrent();
+
+  return {
+    periods,
+    validDays,
+    overlappingIndexes: [...overlapping].sort((a, b) => a - b),
+  };
+}
+
 export function daysBetween(start, end) {
   if (!(start instanceof Date) || !(end instanceof Date)) {
     return 0;
@@ -140,16 +212,15 @@ export function evaluateLicensesRequirement(ingresoDate, licencias, requiredDays
       ready: false,
       valid: false,
       validDays: 0,
+      mergedPeriods: [],
+      overlappingIndexes: [],
       badgeClass: "badge--warning",
       badgeText: "Pendiente",
       description: "Captura la fecha de ingreso para validar los días de licencia.",
     };
   }
-  const validDays = licencias.reduce((total, licencia) => {
-    const startDate = parseISODate(licencia.start);
-    const endDate = parseISODate(licencia.end);
-    return total + calculateValidDays(startDate, endDate, ingresoDate);
-  }, 0);
+  const union = mergeLicenseIntervals(licencias, ingresoDate);
+  const validDays = union.validDays;
   const valid = validDays >= requiredDays && licencias.length > 0;
   let description;
   if (!licencias.length) {
@@ -160,10 +231,16 @@ export function evaluateLicensesRequirement(ingresoDate, licencias, requiredDays
     const remaining = Math.max(requiredDays - validDays, 0);
     description = `Faltan ${remaining} ${pluralize("día", remaining)} válidos.`;
   }
+  if (union.overlappingIndexes.length) {
+    const overlaps = union.overlappingIndexes.length;
+    description += ` ${overlaps} ${pluralize("licencia", overlaps)} con días traslapados (se cuentan una sola vez).`;
+  }
   return {
     ready: licencias.length > 0,
     valid,
     validDays,
+    mergedPeriods: union.periods,
+    overlappingIndexes: union.overlappingIndexes,
     badgeClass: !licencias.length ? "badge--warning" : valid ? "badge--success" : "badge--danger",
     badgeText: !licencias.length ? "Pendiente" : valid ? "Cumple" : "No cumple",
     description,
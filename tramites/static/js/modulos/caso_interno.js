@@ -0,0 +1,58 @@
+// Formulario del trámite: CCT, catálogos, estatus y receptores.
+import {
+  initDestinatarioCrud,
+  initPrefijoOficioCrud,
+  initSolicitanteCrud,
+  initTipoProcesoCrud,
+  initTipoViolenciaCrud,
+} from "./catalogos.js";
+import { setupCCTForm } from "./cct.js";
+import { initEstatusCasoCrud, initEstatusTramiteCrud } from "./estatus.js";
+import { initReceptoresAdicionales } from "./receptores.js";
+
+export function initCasoInternoForm() {
+  const form = document.querySelector("[data-caso-interno-form]");
+  if (!form) {
+    return;
+  }
+  setupCCTForm({
+    form,
+    lookupUrl: form.dataset.lookupUrl || "",
+    apiBase: form.dataset.cctApi || "",
+    suggestionsUrl: form.dataset.cctSugerencias || "",
+    cctInput: form.querySelector("#id_cct_codigo"),
+    hiddenCctInput: form.querySelector("#id_cct"),
+    nombreInput: form.querySelector("#id_cct_nombre"),
+    servicioInput: form.querySelector("#id_cct_modalidad"),
+    sistemaInput: form.querySelector("#id_cct_sistema"),
+    asesorInput: form.querySelector("#id_asesor_cct"),
+    datalist: document.getElementById("cct-options"),
+    suggestionsContainer: form.querySelector("[data-cct-suggestions]"),
+    modalId: "cct-modal",
+    canCreate: form.dataset.cctCanCreate === "true",
+    canEdit: form.dataset.cctCanEdit === "true",
+    canDelete: form.dataset.cctCanDelete === "true",
+  });
+
+  // Inicializar CRUD de tipos de proceso
+  initTipoProcesoCrud();
+
+  // Inicializar CRUD de estatus de caso
+  initEstatusCasoCrud();
+
+  // Inicializar CRUD de prefijos de oficio y enlace con el campo
+  initPrefijoOficioCrud();
+
+  // Inicializar CRUD de tipos de violencia
+  initTipoViolenciaCrud();
+
+  // Inicializar CRUD de solicitante y destinatario
+  initSolicitanteCrud();
+  initDestinatarioCrud();
+
+  // Inicializar gestor de receptores adicionales
+  initReceptoresAdicionales();
+
+  // Inicializar CRUD de estatus de trámite (para trámites del caso en detalle)
+  initEstatusTramiteCrud();
+}
@@ -0,0 +1,1776 @@
+// Gestores de catálogos en modal: tipos de proceso y violencia, solicitantes, destinatarios y prefijos de oficio.
+import { defaultHeaders, extractErrorMessage } from "./comun.js";
+
+export function initTramiteCasoPrefijos() {
+  const select = document.querySelector("[data-prefijo-oficio-modal-select]");
+  const numeroInput = document.querySelector("#id_numero_oficio");
+  if (!select || !numeroInput) {
+    return;
+  }
+  select.addEventListener("change", () => {
+    if (select.value) {
+      numeroInput.value = select.value;
+      numeroInput.focus();
+    }
+  });
+}
+
+// Función genérica para inicializar CRUD de catálogos
+export function initGenericCrud(config) {
+  const {
+    catalogType = "", // tipo-proceso, tipo-violencia, solicitante, destinatario, estatus-tramite
+    selectSelector = "", // ID del select (#id_tipo_inicial)
+    modalId = "generic-modal", // ID del modal a usar
+    apiEndpoint = "/api/default/", // endpoint del API
+    fieldConfig = {}, // config de campos { nombre: {...}, orden: {...}, etc }
+  } = config;
+
+  if (!catalogType || !selectSelector) {
+    return;
+  }
+
+  const selectElement = document.querySelector(selectSelector);
+  const modal = document.getElementById(modalId);
+  const form = modal ? modal.querySelector("form") : null;
+
+  if (!selectElement || !modal || !form) {
+    return;
+  }
+
+  // Buscar los botones CRUD que apunten a este catálogo
+  const openBtn = document.querySelector(`[data-crud-open="${catalogType}"][data-crud-target="${selectSelector.substring(1)}"]`);
+  const editBtn = document.querySelector(`[data-crud-edit="${catalogType}"][data-crud-target="${selectSelector.substring(1)}"]`);
+  const deleteBtn = document.querySelector(`[data-crud-delete="${catalogType}"][data-crud-target="${selectSelector.substring(1)}"]`);
+  const closeBtns = modal.querySelectorAll("[data-modal-close]");
+  const saveBtn = form.querySelector("button[type='submit']");
+  const modalTitle = modal.querySelector("[data-modal-title]");
+  const modalMessage = modal.querySelector("[data-modal-message]");
+  const fieldset = form.querySelector("fieldset:first-of-type");
+
+  let currentMode = "create";
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = `Agregar ${fieldConfig.label || catalogType}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    // Habilitar validación requerida
+    form.querySelectorAll("input[type='text']").forEach((input) => {
+      input.required = true;
+    });
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    const firstInput = form.querySelector("input[type='text']");
+    firstInput?.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+  };
+
+  const openModalForEdit = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage(`Por favor selecciona un ${fieldConfig.label || catalogType} primero.`, true);
+      return;
+    }
+
+    currentMode = "edit";
+    if (modalTitle) {
+      modalTitle.textContent = `Editar ${fieldConfig.label || catalogType}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    form.querySelectorAll("input[type='text']").forEach((input) => {
+      input.required = true;
+    });
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    fetch(`${apiEndpoint}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error(`No se pudo cargar ${fieldConfig.label || catalogType}`);
+        return response.json();
+      })
+      .then((data) => {
+        // Poblar campos del formulario
+        form.querySelectorAll("input[type='text'], input[type='number'], textarea").forEach((input) => {
+          if (data[input.name]) {
+            input.value = data[input.name] || "";
+          }
+        });
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage(`Por favor selecciona un ${fieldConfig.label || catalogType} primero.`, true);
+      return;
+    }
+
+    currentMode = "delete";
+    if (modalTitle) {
+      modalTitle.textContent = `Eliminar ${fieldConfig.label || catalogType}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    form.querySelectorAll("input[type='text']").forEach((input) => {
+      input.required = false;
+    });
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = `¿Estás seguro de que deseas eliminar este ${fieldConfig.label || catalogType}? Esta acción no se puede deshacer.`;
+      modalMessage.className = "modal-message";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deleteItem(selectedId);
+    } else {
+      const formData = new FormData(form);
+      const data = Object.fromEntries(formData);
+
+      if (currentMode === "create") {
+        await createItem(data);
+      } else if (currentMode === "edit") {
+        await updateItem(selectedId, data);
+      }
+    }
+  };
+
+  const createItem = async (data) => {
+    try {
+      const response = await fetch(apiEndpoint, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const contentType = response.headers.get("Content-Type") || "";
+        let errorData = {};
+        if (contentType.includes("application/json")) {
+          errorData = await response.json();
+        } else {
+          errorData = { detail: await response.text() };
+        }
+        let errorMessage = `Error al crear ${fieldConfig.label || catalogType}.`;
+
+        if (typeof errorData === "object") {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        } else if (typeof errorData === "string" && errorData.trim()) {
+          errorMessage = errorData.trim();
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const newItem = await response.json();
+      addOption(selectElement, newItem);
+      showMessage(`${fieldConfig.label || catalogType} creado exitosamente.`);
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updateItem = async (id, data) => {
+    try {
+      const response = await fetch(`${apiEndpoint}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const contentType = response.headers.get("Content-Type") || "";
+        let errorData = {};
+        if (contentType.includes("application/json")) {
+          errorData = await response.json();
+        } else {
+          errorData = { detail: await response.text() };
+        }
+        let errorMessage = `Error al actualizar ${fieldConfig.label || catalogType}.`;
+
+        if (typeof errorData === "object") {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        } else if (typeof errorData === "string" && errorData.trim()) {
+          errorMessage = errorData.trim();
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      showMessage(`${fieldConfig.label || catalogType} actualizado exitosamente.`);
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deleteItem = async (id) => {
+    try {
+      const response = await fetch(`${apiEndpoint}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const contentType = response.headers.get("Content-Type") || "";
+        let errorData = {};
+        if (contentType.includes("application/json")) {
+          errorData = await response.json();
+        } else {
+          errorData = { detail: await response.text() };
+        }
+        let errorMessage = `Error al eliminar ${fieldConfig.label || catalogType}.`;
+
+        if (typeof errorData === "object") {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        } else if (typeof errorData === "string" && errorData.trim()) {
+          errorMessage = errorData.trim();
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      removeOption(selectElement, id);
+      showMessage(`${fieldConfig.label || catalogType} eliminado exitosamente.`);
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const formatOptionText = (data) => {
+    if (!data) return "";
+    const nombre = data.nombre || "";
+    const funcion = data.descripcion || "";
+    return funcion ? `${nombre} · ${funcion}` : nombre;
+  };
+
+  const dispatchChange = (select) => {
+    const evt = new Event("change", { bubbles: true });
+    select.dispatchEvent(evt);
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = formatOptionText(data);
+    select.appendChild(option);
+    select.value = data.id;
+    dispatchChange(select);
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = formatOptionText(data);
+      if (select.value === String(data.id)) {
+        dispatchChange(select);
+      }
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+      dispatchChange(select);
+    }
+  };
+
+  // Event listeners
+  if (openBtn) {
+    openBtn.addEventListener("click", openModalForCreate);
+  }
+  if (editBtn) {
+    editBtn.addEventListener("click", openModalForEdit);
+  }
+  if (deleteBtn) {
+    deleteBtn.addEventListener("click", openModalForDelete);
+  }
+
+  closeBtns.forEach((btn) => {
+    btn.addEventListener("click", closeModal);
+  });
+
+  if (form) {
+    form.addEventListener("submit", submitForm);
+  }
+
+  const overlay = modal.querySelector(".modal-overlay");
+  if (overlay) {
+    overlay.addEventListener("click", closeModal);
+  }
+}
+
+export function initTipoProcesoCrud() {
+  const selectElement = document.querySelector("#id_tipo_inicial");
+  const modal = document.getElementById("tipo-proceso-modal");
+  const form = document.getElementById("tipo-proceso-form");
+  const fieldset = form ? form.querySelector("#tipo-proceso-fields") : null;
+  const openBtn = document.querySelector("[data-tipo-proceso-modal-open]");
+  const editBtn = document.querySelector("[data-tipo-proceso-modal-edit]");
+  const deleteBtn = document.querySelector("[data-tipo-proceso-modal-delete]");
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const saveBtn = form ? form.querySelector("[data-tipo-proceso-save]") : null;
+  const modalTitle = modal ? modal.querySelector("[data-modal-title]") : null;
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+
+  if (!selectElement || !modal || !form) {
+    return;
+  }
+
+  const apiBase = "/api/tipos-proceso/";
+  let currentMode = "create"; // "create", "edit", or "delete"
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = "Agregar tipo de trámite";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    // Re-habilitar validación requerida
+    const nombreInput = form.querySelector("#tipo-proceso-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    nombreInput.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+  };
+
+  const openModalForEdit = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Por favor selecciona un tipo de trámite primero.", true);
+      return;
+    }
+
+    currentMode = "edit";
+    if (modalTitle) {
+      modalTitle.textContent = "Editar tipo de trámite";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    // Re-habilitar validación requerida
+    const nombreInput = form.querySelector("#tipo-proceso-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    // Cargar datos del tipo seleccionado
+    fetch(`${apiBase}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error("No se pudo cargar el tipo");
+        return response.json();
+      })
+      .then((data) => {
+        form.querySelector("#tipo-proceso-nombre").value = data.nombre || "";
+        form.querySelector("#tipo-proceso-descripcion").value = data.descripcion || "";
+        form.querySelector("#tipo-proceso-es-documento").checked = data.es_documento || false;
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Por favor selecciona un tipo de trámite primero.", true);
+      return;
+    }
+
+    currentMode = "delete";
+    if (modalTitle) {
+      modalTitle.textContent = "Eliminar tipo de trámite";
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    // Desactivar validación requerida cuando el fieldset está oculto
+    const nombreInput = form.querySelector("#tipo-proceso-nombre");
+    if (nombreInput) {
+      nombreInput.required = false;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = "¿Estás seguro de que deseas eliminar este tipo de trámite? Esta acción no se puede deshacer.";
+      modalMessage.className = "modal-message";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deleteType(selectedId);
+    } else {
+      // Validación de cliente antes de enviar
+      const nombreInput = form.querySelector("#tipo-proceso-nombre");
+      if (!nombreInput.value.trim()) {
+        showMessage("El nombre del tipo es obligatorio.", true);
+        nombreInput.focus();
+        return;
+      }
+
+      const data = {
+        nombre: nombreInput.value.trim(),
+        descripcion: form.querySelector("#tipo-proceso-descripcion").value.trim(),
+        es_documento: form.querySelector("#tipo-proceso-es-documento").checked,
+      };
+
+      if (currentMode === "create") {
+        await createType(data);
+      } else if (currentMode === "edit") {
+        await updateType(selectedId, data);
+      }
+    }
+  };
+
+  const createType = async (data) => {
+    try {
+      const response = await fetch(apiBase, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al crear el tipo de trámite.";
+
+        // Procesar errores del servidor
+        if (errorData.nombre) {
+          errorMessage = Array.isArray(errorData.nombre) ? errorData.nombre[0] : errorData.nombre;
+        } else if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const newType = await response.json();
+      addOption(selectElement, newType);
+      showMessage("Tipo de trámite creado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updateType = async (id, data) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al actualizar el tipo de trámite.";
+
+        // Procesar errores del servidor
+        if (errorData.nombre) {
+          errorMessage = Array.isArray(errorData.nombre) ? errorData.nombre[0] : errorData.nombre;
+        } else if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      showMessage("Tipo de trámite actualizado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deleteType = async (id) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al eliminar el tipo de trámite.";
+
+        if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      removeOption(selectElement, id);
+      showMessage("Tipo de trámite eliminado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = data.nombre;
+    select.appendChild(option);
+    select.value = data.id;
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = data.nombre;
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+    }
+  };
+
+  // Event listeners
+  if (openBtn) {
+    openBtn.addEventListener("click", openModalForCreate);
+  }
+  if (editBtn) {
+    editBtn.addEventListener("click", openModalForEdit);
+  }
+  if (deleteBtn) {
+    deleteBtn.addEventListener("click", openModalForDelete);
+  }
+
+  // Agregar event listeners a todos los botones de cerrar
+  closeBtns.forEach((btn) => {
+    btn.addEventListener("click", closeModal);
+  });
+
+  if (form) {
+    form.addEventListener("submit", submitForm);
+  }
+
+  // Cerrar modal al hacer click en el overlay
+  const overlay = modal ? modal.querySelector(".modal-overlay") : null;
+  if (overlay) {
+    overlay.addEventListener("click", closeModal);
+  }
+}
+
+export function initTipoViolenciaCrud() {
+  const selectElement = document.querySelector("#id_tipo_violencia");
+  const modal = document.getElementById("tipo-violencia-modal");
+  const form = document.getElementById("tipo-violencia-form");
+  const fieldset = form ? form.querySelector("#tipo-violencia-fields") : null;
+  const openBtn = document.querySelector("[data-tipo-violencia-modal-open]");
+  const editBtn = document.querySelector("[data-tipo-violencia-modal-edit]");
+  const deleteBtn = document.querySelector("[data-tipo-violencia-modal-delete]");
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const saveBtn = form ? form.querySelector("[data-tipo-violencia-save]") : null;
+  const modalTitle = modal ? modal.querySelector("[data-modal-title]") : null;
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+
+  if (!selectElement || !modal || !form) {
+    return;
+  }
+
+  const apiBase = "/api/tipos-violencia/";
+  let currentMode = "create";
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = "Agregar tipo de violencia";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#tipo-violencia-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    nombreInput.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+  };
+
+  const openModalForEdit = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un tipo de violencia primero.", true);
+      return;
+    }
+
+    currentMode = "edit";
+    if (modalTitle) {
+      modalTitle.textContent = "Editar tipo de violencia";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#tipo-violencia-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    fetch(`${apiBase}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error("No se pudo cargar el tipo de violencia");
+        return response.json();
+      })
+      .then((data) => {
+        form.querySelector("#tipo-violencia-nombre").value = data.nombre || "";
+        form.querySelector("#tipo-violencia-descripcion").value = data.descripcion || "";
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un tipo de violencia primero.", true);
+      return;
+    }
+
+    currentMode = "delete";
+    if (modalTitle) {
+      modalTitle.textContent = "Eliminar tipo de violencia";
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    const nombreInput = form.querySelector("#tipo-violencia-nombre");
+    if (nombreInput) {
+      nombreInput.required = false;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = "¿Estás seguro de eliminar este tipo de violencia? Esta acción no se puede deshacer.";
+      modalMessage.className = "modal-message warning";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deleteType(selectedId);
+    } else {
+      const nombreInput = form.querySelector("#tipo-violencia-nombre");
+      if (!nombreInput.value.trim()) {
+        showMessage("El nombre es obligatorio.", true);
+        nombreInput.focus();
+        return;
+      }
+
+      const data = {
+        nombre: nombreInput.value.trim(),
+        descripcion: form.querySelector("#tipo-violencia-descripcion").value.trim(),
+      };
+
+      if (currentMode === "create") {
+        await createType(data);
+      } else if (currentMode === "edit") {
+        await updateType(selectedId, data);
+      }
+    }
+  };
+
+  const createType = async (data) => {
+    try {
+      const response = await fetch(apiBase, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al crear el tipo de violencia.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const created = await response.json();
+      addOption(selectElement, created);
+      selectElement.value = created.id;
+      showMessage("Tipo de violencia creado.", false);
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updateType = async (id, data) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al actualizar el tipo de violencia.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      showMessage("Tipo de violencia actualizado.", false);
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deleteType = async (id) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al eliminar el tipo de violencia.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      removeOption(selectElement, id);
+      showMessage("Tipo de violencia eliminado.", false);
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = data.nombre;
+    select.appendChild(option);
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = data.nombre;
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+    }
+  };
+
+  if (openBtn) openBtn.addEventListener("click", openModalForCreate);
+  if (editBtn) editBtn.addEventListener("click", openModalForEdit);
+  if (deleteBtn) deleteBtn.addEventListener("click", openModalForDelete);
+  if (saveBtn) form.addEventListener("submit", submitForm);
+  closeBtns.forEach((btn) => btn.addEventListener("click", closeModal));
+}
+
+export function initSolicitanteCrud() {
+  createSimpleCrud({
+    selectSelector: "#id_solicitante",
+    modalId: "solicitante-modal",
+    formId: "solicitante-form",
+    fieldsetId: "solicitante-fields",
+    openBtnSelector: "[data-solicitante-modal-open]",
+    editBtnSelector: "[data-solicitante-modal-edit]",
+    deleteBtnSelector: "[data-solicitante-modal-delete]",
+    saveBtnSelector: "[data-solicitante-save]",
+    modalTitleText: {
+      create: "Agregar solicitante",
+      edit: "Editar solicitante",
+      delete: "Eliminar solicitante",
+    },
+    apiBase: "/api/solicitantes/",
+    nameInputSelector: "#solicitante-nombre",
+    descriptionSelector: "#solicitante-descripcion",
+    deleteWarning:
+      "¿Estás seguro de que deseas eliminar este solicitante? Esta acción no se puede deshacer.",
+  });
+}
+
+export function initDestinatarioCrud() {
+  createSimpleCrud({
+    selectSelector: "#id_dirigido_a",
+    modalId: "destinatario-modal",
+    formId: "destinatario-form",
+    fieldsetId: "destinatario-fields",
+    openBtnSelector: "[data-destinatario-modal-open]",
+    editBtnSelector: "[data-destinatario-modal-edit]",
+    deleteBtnSelector: "[data-destinatario-modal-delete]",
+    saveBtnSelector: "[data-destinatario-save]",
+    modalTitleText: {
+      create: "Agregar destinatario",
+      edit: "Editar destinatario",
+      delete: "Eliminar destinatario",
+    },
+    apiBase: "/api/destinatarios/",
+    nameInputSelector: "#destinatario-nombre",
+    descriptionSelector: "#destinatario-descripcion",
+    deleteWarning:
+      "¿Estás seguro de que deseas eliminar este destinatario? Esta acción no se puede deshacer.",
+  });
+}
+
+export function createSimpleCrud(config) {
+  const {
+    selectSelector,
+    modalId,
+    formId,
+    fieldsetId,
+    openBtnSelector,
+    editBtnSelector,
+    deleteBtnSelector,
+    saveBtnSelector,
+    modalTitleText,
+    apiBase,
+    nameInputSelector,
+    descriptionSelector,
+    deleteWarning,
+    customDataBuilder,
+    populateForm,
+  } = config;
+
+  const selectElement = document.querySelector(selectSelector);
+  const modal = document.getElementById(modalId);
+  const form = document.getElementById(formId);
+  const fieldset = form ? form.querySelector(`#${fieldsetId}`) : null;
+  const openBtn = document.querySelector(openBtnSelector);
+  const editBtn = document.querySelector(editBtnSelector);
+  const deleteBtn = document.querySelector(deleteBtnSelector);
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const saveBtn = form ? form.querySelector(saveBtnSelector) : null;
+  const modalTitle = modal ? modal.querySelector("[data-modal-title]") : null;
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+
+  if (!selectElement || !modal || !form) {
+    return;
+  }
+
+  let currentMode = "create";
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = modalTitleText.create;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector(nameInputSelector);
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    nombreInput?.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+  };
+
+  const openModalForEdit = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un registro primero.", true);
+      return;
+    }
+
+    currentMode = "edit";
+    if (modalTitle) {
+      modalTitle.textContent = modalTitleText.edit;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector(nameInputSelector);
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    fetch(`${apiBase}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error("No se pudo cargar la información");
+        return response.json();
+      })
+      .then((data) => {
+        if (typeof populateForm === "function") {
+          populateForm(form, data);
+        } else {
+          form.querySelector(nameInputSelector).value = data.nombre || "";
+          form.querySelector(descriptionSelector).value = data.descripcion || "";
+        }
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un registro primero.", true);
+      return;
+    }
+
+    currentMode = "delete";
+    if (modalTitle) {
+      modalTitle.textContent = modalTitleText.delete;
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    const nombreInput = form.querySelector(nameInputSelector);
+    if (nombreInput) {
+      nombreInput.required = false;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = deleteWarning;
+      modalMessage.className = "modal-message warning";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deleteRecord(selectedId);
+    } else {
+      const nombreInput = form.querySelector(nameInputSelector);
+      if (!nombreInput.value.trim()) {
+        showMessage("El nombre es obligatorio.", true);
+        nombreInput.focus();
+        return;
+      }
+
+      const data =
+        typeof customDataBuilder === "function"
+          ? customDataBuilder(form)
+          : {
+            nombre: nombreInput.value.trim(),
+            descripcion: form.querySelector(descriptionSelector).value.trim(),
+          };
+
+      if (currentMode === "create") {
+        await createRecord(data);
+      } else if (currentMode === "edit") {
+        await updateRecord(selectedId, data);
+      }
+    }
+  };
+
+  const createRecord = async (data) => {
+    try {
+      const response = await fetch(apiBase, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al crear el registro.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const created = await response.json();
+      addOption(selectElement, created);
+      selectElement.value = created.id;
+      showMessage("Registro creado correctamente.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updateRecord = async (id, data) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al actualizar el registro.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      showMessage("Registro actualizado correctamente.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deleteRecord = async (id) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al eliminar el registro.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      removeOption(selectElement, id);
+      showMessage("Registro eliminado.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = data.nombre;
+    select.appendChild(option);
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = data.nombre;
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+    }
+  };
+
+  if (openBtn) openBtn.addEventListener("click", openModalForCreate);
+  if (editBtn) editBtn.addEventListener("click", openModalForEdit);
+  if (deleteBtn) deleteBtn.addEventListener("click", openModalForDelete);
+  if (saveBtn) form.addEventListener("submit", submitForm);
+  closeBtns.forEach((btn) => btn.addEventListener("click", closeModal));
+}
+
+export function initPrefijoOficioCrud() {
+  // Inicializar objeto de debugging
+  window.prefijoCrudDebug = window.prefijoCrudDebug || {
+    logs: [],
+    errors: [],
+    calls: 0,
+  };
+  window.prefijoCrudDebug.calls++;
+
+  const debugLog = (msg, data) => {
+    console.log(msg, data);
+    window.prefijoCrudDebug.logs.push({ timestamp: new Date().toISOString(), msg, data });
+  };
+
+  const debugError = (msg, data) => {
+    console.error(msg, data);
+    window.prefijoCrudDebug.errors.push({ timestamp: new Date().toISOString(), msg, data });
+  };
+
+  debugLog("[initPrefijoOficioCrud] Iniciando... (llamada #" + window.prefijoCrudDebug.calls + ")", new Date().toISOString());
+
+  // Determinar si estamos en tramites_form o tramites_detail
+  let numeroInput = document.querySelector("#id_numero_oficio");
+  const isDetailView = !numeroInput;
+  if (!numeroInput) {
+    numeroInput = document.querySelector("#id_tramite_caso-numero_oficio");
+  }
+
+  debugLog("[initPrefijoOficioCrud] Contexto detectado:", {
+    isDetailView,
+    numeroInput: !!numeroInput,
+    numeroInputId: numeroInput?.id,
+  });
+
+  // Buscar el select específicamente basado en el contexto
+  let selectElement;
+  if (isDetailView) {
+    selectElement = document.querySelector("#prefijo-oficio-select-modal");
+  } else {
+    selectElement = document.querySelector("#prefijo-oficio-select");
+  }
+
+  debugLog("[initPrefijoOficioCrud] Select encontrado:", {
+    selectElement: !!selectElement,
+    selectId: selectElement?.id,
+  });
+
+  const modal = document.getElementById("prefijo-oficio-modal");
+  const form = document.getElementById("prefijo-oficio-form");
+  const fieldset = form ? form.querySelector("#prefijo-oficio-fields") : null;
+
+  debugLog("[initPrefijoOficioCrud] Modal y form encontrados:", {
+    modal: !!modal,
+    form: !!form,
+    fieldset: !!fieldset,
+  });
+
+  // Buscar los botones con múltiples estrategias
+  let openBtn = null, editBtn = null, deleteBtn = null;
+
+  // Estrategia 1: Buscar en el contenedor padre directo
+  if (selectElement) {
+    const fieldContainer = selectElement.closest(".form-field");
+    const actionsContainer = fieldContainer?.querySelector(".field-actions");
+
+    debugLog("[initPrefijoOficioCrud] Búsqueda estrategia 1 (contenedor padre):", {
+      fieldContainer: !!fieldContainer,
+      actionsContainer: !!actionsContainer,
+    });
+
+    if (actionsContainer) {
+      openBtn = actionsContainer.querySelector("[data-prefijo-oficio-modal-open]");
+      editBtn = actionsContainer.querySelector("[data-prefijo-oficio-modal-edit]");
+      deleteBtn = actionsContainer.querySelector("[data-prefijo-oficio-modal-delete]");
+
+      debugLog("[initPrefijoOficioCrud] Botones encontrados en contenedor:", {
+        openBtn: !!openBtn,
+        editBtn: !!editBtn,
+        deleteBtn: !!deleteBtn,
+      });
+    }
+  }
+
+  // Estrategia 2: Buscar todos los botones y seleccionar el correcto
+  if (!openBtn || !editBtn || !deleteBtn) {
+    const allOpenBtns = document.querySelectorAll("[data-prefijo-oficio-modal-open]");
+    const allEditBtns = document.querySelectorAll("[data-prefijo-oficio-modal-edit]");
+    const allDeleteBtns = document.querySelectorAll("[data-prefijo-oficio-modal-delete]");
+
+    debugLog("[initPrefijoOficioCrud] Búsqueda estrategia 2 (todos los botones):", {
+      allOpenBtns: allOpenBtns.length,
+      allEditBtns: allEditBtns.length,
+      allDeleteBtns: allDeleteBtns.length,
+    });
+
+    if (!openBtn && allOpenBtns.length > 0) {
+      openBtn = isDetailView ? allOpenBtns[allOpenBtns.length - 1] : allOpenBtns[0];
+    }
+    if (!editBtn && allEditBtns.length > 0) {
+      editBtn = isDetailView ? allEditBtns[allEditBtns.length - 1] : allEditBtns[0];
+    }
+    if (!deleteBtn && allDeleteBtns.length > 0) {
+      deleteBtn = isDetailView ? allDeleteBtns[allDeleteBtns.length - 1] : allDeleteBtns[0];
+    }
+
+    debugLog("[initPrefijoOficioCrud] Botones seleccionados (estrategia 2):", {
+      openBtn: !!openBtn,
+      editBtn: !!editBtn,
+      deleteBtn: !!deleteBtn,
+    });
+  }
+
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const saveBtn = form ? form.querySelector("[data-prefijo-oficio-save]") : null;
+  const modalTitle = modal ? modal.querySelector("[data-modal-title]") : null;
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+  const datalist = document.getElementById("prefijo-oficio-options");
+
+  debugLog("[initPrefijoOficioCrud] Elementos adicionales encontrados:", {
+    closeBtns: closeBtns.length,
+    saveBtn: !!saveBtn,
+    modalTitle: !!modalTitle,
+    modalMessage: !!modalMessage,
+    datalist: !!datalist,
+  });
+
+  if (!selectElement || !modal || !form || !numeroInput || !openBtn) {
+    debugError("[initPrefijoOficioCrud] ❌ ELEMENTOS FALTANTES - Inicialización cancelada:", {
+      selectElement: !!selectElement,
+      selectElementId: selectElement?.id,
+      modal: !!modal,
+      form: !!form,
+      numeroInput: !!numeroInput,
+      numeroInputId: numeroInput?.id,
+      isDetailView,
+      openBtn: !!openBtn,
+      editBtn: !!editBtn,
+      deleteBtn: !!deleteBtn,
+      timestamp: new Date().toISOString(),
+    });
+    return;
+  }
+
+  debugLog("[initPrefijoOficioCrud] ✅ Inicializado correctamente", {
+    isDetailView,
+    numeroInputId: numeroInput?.id,
+    selectElementId: selectElement?.id,
+    openBtn: !!openBtn,
+    editBtn: !!editBtn,
+    deleteBtn: !!deleteBtn,
+    timestamp: new Date().toISOString(),
+  });
+
+  const apiBase = "/api/prefijos-oficio/";
+  let currentMode = "create";
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    console.log("[openModalForCreate] Click detectado en botón", new Date().toISOString());
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = "Agregar prefijo de oficio";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#prefijo-oficio-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    nombreInput.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+    console.log("[openModalForCreate] Modal abierta correctamente");
+  };
+
+  const openModalForEdit = () => {
+    console.log("[openModalForEdit] Click detectado en botón", new Date().toISOString());
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un prefijo primero.", true);
+      return;
+    }
+
+    currentMode = "edit";
+    console.log("[openModalForEdit] Iniciando carga de prefijo ID:", selectedId);
+    if (modalTitle) {
+      modalTitle.textContent = "Editar prefijo de oficio";
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#prefijo-oficio-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    fetch(`${apiBase}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error("No se pudo cargar el prefijo");
+        return response.json();
+      })
+      .then((data) => {
+        form.querySelector("#prefijo-oficio-nombre").value = data.nombre || "";
+        form.querySelector("#prefijo-oficio-descripcion").value = data.descripcion || "";
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    console.log("[openModalForDelete] Click detectado en botón", new Date().toISOString());
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Selecciona un prefijo primero.", true);
+      return;
+    }
+
+    currentMode = "delete";
+    console.log("[openModalForDelete] Preparando eliminación de ID:", selectedId);
+    if (modalTitle) {
+      modalTitle.textContent = "Eliminar prefijo de oficio";
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    const nombreInput = form.querySelector("#prefijo-oficio-nombre");
+    if (nombreInput) {
+      nombreInput.required = false;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = "¿Estás seguro de que deseas eliminar este prefijo? Esta acción no se puede deshacer.";
+      modalMessage.className = "modal-message";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deletePrefix(selectedId);
+    } else {
+      const nombreInput = form.querySelector("#prefijo-oficio-nombre");
+      if (!nombreInput.value.trim()) {
+        showMessage("El prefijo es obligatorio.", true);
+        nombreInput.focus();
+        return;
+      }
+
+      const data = {
+        nombre: nombreInput.value.trim(),
+        descripcion: form.querySelector("#prefijo-oficio-descripcion").value.trim(),
+      };
+
+      if (currentMode === "create") {
+        await createPrefix(data);
+      } else if (currentMode === "edit") {
+        await updatePrefix(selectedId, data);
+      }
+    }
+  };
+
+  const createPrefix = async (data) => {
+    try {
+      const response = await fetch(apiBase, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al crear el prefijo.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const created = await response.json();
+      addOption(selectElement, created);
+      upsertDatalistOption(created.nombre);
+      numeroInput.value = created.nombre;
+      showMessage("Prefijo creado exitosamente.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updatePrefix = async (id, data) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al actualizar el prefijo.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      upsertDatalistOption(updated.nombre);
+      if (selectElement.value === String(updated.id)) {
+        numeroInput.value = updated.nombre;
+      }
+      showMessage("Prefijo actualizado exitosamente.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deletePrefix = async (id) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        const errorMessage = extractErrorMessage(errorData) || "Error al eliminar el prefijo.";
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const option = selectElement.querySelector(`option[value="${id}"]`);
+      const optionLabel = option ? option.textContent : "";
+      removeOption(selectElement, id);
+      if (optionLabel) {
+        removeDatalistOption(optionLabel);
+        if (numeroInput.value === optionLabel) {
+          numeroInput.value = "";
+        }
+      }
+      showMessage("Prefijo eliminado.");
+      setTimeout(closeModal, 800);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = data.nombre;
+    select.appendChild(option);
+    select.value = data.id;
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = data.nombre;
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+    }
+  };
+
+  const upsertDatalistOption = (value) => {
+    if (!datalist) {
+      return;
+    }
+    const existing = Array.from(datalist.children).find((opt) => opt.value === value);
+    if (existing) {
+      return;
+    }
+    const option = document.createElement("option");
+    option.value = value;
+    datalist.appendChild(option);
+  };
+
+  const removeDatalistOption = (value) => {
+    if (!datalist) {
+      return;
+    }
+    const option = Array.from(datalist.children).find((opt) => opt.value === value);
+    if (option) {
+      option.remove();
+    }
+  };
+
+  const applySelectedPrefix = () => {
+    const selected = selectElement.selectedOptions[0];
+    if (selected && selected.textContent) {
+      numeroInput.value = selected.textContent;
+      numeroInput.focus();
+    }
+  };
+
+  if (openBtn) {
+    openBtn.addEventListener("click", openModalForCreate);
+    debugLog("[initPrefijoOficioCrud] Event listener registrado para openBtn");
+  }
+  if (editBtn) {
+    editBtn.addEventListener("click", openModalForEdit);
+    debugLog("[initPrefijoOficioCrud] Event listener registrado para editBtn");
+  }
+  if (deleteBtn) {
+    deleteBtn.addEventListener("click", openModalForDelete);
+    debugLog("[initPrefijoOficioCrud] Event listener registrado para deleteBtn");
+  }
+  if (saveBtn) {
+    form.addEventListener("submit", submitForm);
+    debugLog("[initPrefijoOficioCrud] Event listener registrado para form submit");
+  }
+  closeBtns.forEach((btn) => btn.addEventListener("click", closeModal));
+  selectElement.addEventListener("change", applySelectedPrefix);
+  debugLog("[initPrefijoOficioCrud] ✅ TODOS LOS EVENT LISTENERS REGISTRADOS");
+}
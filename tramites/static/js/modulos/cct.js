@@ -0,0 +1,904 @@
+// Búsqueda de CCT con sugerencias y su CRUD en modal (formulario del trámite).
+import { createCCTLookup, LRUCache } from "./cct_consulta.js";
+import { buildDetailUrl, defaultHeaders, extractErrorMessage, normaliseSistema } from "./comun.js";
+
+export function setupCCTForm(options) {
+  const {
+    form,
+    lookupUrl = "",
+    apiBase = "",
+    // Endpoint async de sugerencias; si falta, se usa el listado del API.
+    suggestionsUrl = "",
+    cctInput,
+    hiddenCctInput,
+    nombreInput,
+    servicioInput,
+    sistemaInput,
+    asesorInput,
+    datalist,
+    suggestionsContainer,
+    modalId = "cct-modal",
+    canCreate = false,
+    canEdit = false,
+    canDelete = false,
+  } = options;
+  if (!form || !cctInput || !hiddenCctInput || !nombreInput || !servicioInput || !datalist) {
+    return;
+  }
+
+  const normalize = (value) => (value || "").trim().toUpperCase();
+  const SUGGESTION_MIN_LENGTH = 3;
+  const LOOKUP_MIN_LENGTH = 10;
+  const SUGGESTION_DEBOUNCE = 200;
+  const LOOKUP_DEBOUNCE = 300;
+  let suggestionTimer = null;
+  let suggestionAbortController = null;
+  let lookupTimer = null;
+  // Sugerencias ya mostradas por término; se descartan cuando cambia el catálogo.
+  const suggestionCache = new LRUCache(50);
+  // El catálogo que ya viene en el datalist resuelve la mayoría de los códigos sin red.
+  const cctLookup = createCCTLookup({
+    url: lookupUrl,
+    catalog: Array.from(datalist.options).map((opt) => ({
+      cct: normalize(opt.value),
+      nombre: opt.dataset.nombre || "",
+      servicio: opt.dataset.servicio || "",
+      asesor: opt.dataset.asesor || "",
+      sostenimiento: opt.dataset.sostenimiento || "",
+    })),
+  });
+
+  const upsertOption = (item) => {
+    if (!item || !item.cct) {
+      return;
+    }
+    const code = normalize(item.cct);
+    const sistemaNormalizado = normaliseSistema(item.sostenimiento);
+    item.sostenimiento = sistemaNormalizado;
+    const existing = Array.from(datalist.options).find(
+      (opt) => normalize(opt.value || opt.text) === code,
+    );
+    const label = `${code} · ${item.nombre || ""}`.trim();
+    if (existing) {
+      existing.value = code;
+      existing.textContent = label;
+      existing.dataset.nombre = item.nombre || "";
+      existing.dataset.servicio = item.servicio || "";
+      existing.dataset.asesor = item.asesor || "";
+      existing.dataset.sostenimiento = sistemaNormalizado;
+      existing.setAttribute("data-nombre", item.nombre || "");
+      existing.setAttribute("data-servicio", item.servicio || "");
+      existing.setAttribute("data-asesor", item.asesor || "");
+      existing.setAttribute("data-sostenimiento", sistemaNormalizado);
+    } else {
+      const option = document.createElement("option");
+      option.value = code;
+      option.textContent = label;
+      option.dataset.nombre = item.nombre || "";
+      option.dataset.servicio = item.servicio || "";
+      option.dataset.asesor = item.asesor || "";
+      option.dataset.sostenimiento = sistemaNormalizado;
+      option.setAttribute("data-nombre", item.nombre || "");
+      option.setAttribute("data-servicio", item.servicio || "");
+      option.setAttribute("data-asesor", item.asesor || "");
+      option.setAttribute("data-sostenimiento", sistemaNormalizado);
+      datalist.appendChild(option);
+    }
+  };
+
+  const updateFromOption = (codigo) => {
+    const option = Array.from(datalist.options).find(
+      (opt) => normalize(opt.value || opt.text) === codigo,
+    );
+    if (!option) {
+      return false;
+    }
+    nombreInput.value =
+      option.dataset?.nombre || option.getAttribute("data-nombre") || "";
+    servicioInput.value =
+      option.dataset?.servicio || option.getAttribute("data-servicio") || "";
+    const sistemaDato =
+      option.dataset?.sostenimiento ||
+      option.getAttribute("data-sostenimiento") ||
+      "";
+    if (sistemaInput) {
+      sistemaInput.value = normaliseSistema(sistemaDato);
+    }
+    if (asesorInput) {
+      asesorInput.value =
+        option.dataset?.asesor || option.getAttribute("data-asesor") || "";
+    }
+    hiddenCctInput.value = codigo;
+    return true;
+  };
+
+  // Devuelve undefined si otra consulta más reciente la canceló (no debe tocar el formulario).
+  const fetchAndUpdate = async (codigo) => {
+    if (!lookupUrl) {
+      return null;
+    }
+    try {
+      const found = await cctLookup.lookup(codigo);
+      if (!found) {
+        return null;
+      }
+      const item = { ...found, sostenimiento: normaliseSistema(found.sostenimiento) };
+      nombreInput.value = item.nombre;
+      if (sistemaInput) {
+        sistemaInput.value = item.sostenimiento;
+      }
+      servicioInput.value = item.servicio;
+      if (asesorInput) {
+        asesorInput.value = item.asesor;
+      }
+      hiddenCctInput.value = item.cct;
+      return item;
+    } catch (error) {
+      if (error.name === "AbortError") {
+        return undefined;
+      }
+      console.warn(error);
+      return null;
+    }
+  };
+
+  const hideSuggestions = () => {
+    if (!suggestionsContainer) {
+      return;
+    }
+    suggestionsContainer.innerHTML = "";
+    suggestionsContainer.hidden = true;
+  };
+
+  const renderSuggestions = (items) => {
+    if (!suggestionsContainer) {
+      return;
+    }
+    suggestionsContainer.innerHTML = "";
+    if (!items.length) {
+      suggestionsContainer.hidden = true;
+      return;
+    }
+    const list = document.createElement("ul");
+    list.className = "cct-suggestion-list";
+    items.forEach((item) => {
+      const entry = document.createElement("li");
+      entry.className = "cct-suggestion-item";
+      const button = document.createElement("button");
+      button.type = "button";
+      button.className = "btn btn--ghost btn--sm";
+      button.textContent = `${item.cct} · ${item.nombre || ""}`.trim();
+      button.addEventListener("mousedown", (event) => {
+        event.preventDefault();
+        applySuggestion(item);
+      });
+      entry.appendChild(button);
+      list.appendChild(entry);
+    });
+    suggestionsContainer.appendChild(list);
+    suggestionsContainer.hidden = false;
+  };
+
+  const applySuggestion = (item) => {
+    if (!item) {
+      return;
+    }
+    const code = normalize(item.cct);
+    cctInput.value = code;
+    hiddenCctInput.value = code;
+    nombreInput.value = item.nombre || "";
+    if (sistemaInput) {
+      sistemaInput.value = item.sostenimiento || "";
+    }
+    servicioInput.value = item.servicio || "";
+    if (asesorInput) {
+      asesorInput.value = item.asesor || "";
+    }
+    upsertOption(item);
+    hideSuggestions();
+  };
+
+  const fetchSuggestions = async (term) => {
+    if (!suggestionsContainer || !(suggestionsUrl || apiBase)) {
+      return;
+    }
+    if (suggestionAbortController) {
+      suggestionAbortController.abort();
+    }
+    if (suggestionCache.has(term)) {
+      renderSuggestions(suggestionCache.get(term));
+      return;
+    }
+    suggestionAbortController = new AbortController();
+    try {
+      const url = new URL(suggestionsUrl || apiBase, window.location.origin);
+      url.searchParams.set("search", term);
+      url.searchParams.set("ordering", "cct");
+      url.searchParams.set("page_size", "7");
+      const response = await fetch(url, {
+        headers: { Accept: "application/json" },
+        signal: suggestionAbortController.signal,
+      });
+      if (!response.ok) {
+        throw new Error("No fue posible obtener sugerencias.");
+      }
+      const data = await response.json();
+      const items = Array.isArray(data?.results)
+        ? data.results
+        : Array.isArray(data)
+          ? data
+          : [];
+      items.forEach((entry) => {
+        entry.sostenimiento = normaliseSistema(entry.sostenimiento);
+        cctLookup.remember(entry);
+      });
+      suggestionCache.set(term, items);
+      renderSuggestions(items);
+    } catch (error) {
+      if (error.name !== "AbortError") {
+        console.warn(error);
+      }
+      hideSuggestions();
+    } finally {
+      suggestionAbortController = null;
+    }
+  };
+
+  const scheduleSuggestions = (term) => {
+    if (!suggestionsContainer) {
+      return;
+    }
+    if (suggestionTimer) {
+      window.clearTimeout(suggestionTimer);
+    }
+    suggestionTimer = window.setTimeout(() => {
+      fetchSuggestions(term);
+    }, SUGGESTION_DEBOUNCE);
+  };
+
+  const handleChange = async () => {
+    hideSuggestions();
+    const codigo = normalize(cctInput.value);
+    if (!codigo) {
+      hiddenCctInput.value = "";
+      nombreInput.value = "";
+      servicioInput.value = "";
+      if (sistemaInput) {
+        sistemaInput.value = "";
+      }
+      if (asesorInput) {
+        asesorInput.value = "";
+      }
+      return;
+    }
+    if (updateFromOption(codigo)) {
+      hiddenCctInput.value = codigo;
+      return;
+    }
+    const fetched = await fetchAndUpdate(codigo);
+    if (fetched === undefined) {
+      return;
+    }
+    if (fetched) {
+      upsertOption(fetched);
+      hiddenCctInput.value = normalize(fetched.cct);
+    } else {
+      hiddenCctInput.value = "";
+    }
+  };
+
+  cctInput.addEventListener("change", handleChange);
+  cctInput.addEventListener("blur", () => window.setTimeout(() => hideSuggestions(), 150));
+  cctInput.addEventListener("input", (event) => {
+    const value = normalize(event.target.value);
+    if (!value) {
+      hiddenCctInput.value = "";
+      nombreInput.value = "";
+      servicioInput.value = "";
+      if (sistemaInput) {
+        sistemaInput.value = "";
+      }
+      if (asesorInput) {
+        asesorInput.value = "";
+      }
+      hideSuggestions();
+      return;
+    }
+    if (value.length >= SUGGESTION_MIN_LENGTH) {
+      scheduleSuggestions(value);
+    } else {
+      hideSuggestions();
+    }
+    // Con el código completo se llenan los datos sin esperar a que el campo pierda el foco.
+    window.clearTimeout(lookupTimer);
+    if (value.length >= LOOKUP_MIN_LENGTH) {
+      lookupTimer = window.setTimeout(() => {
+        if (normalize(cctInput.value) === value) {
+          void handleChange();
+        }
+      }, LOOKUP_DEBOUNCE);
+    }
+  });
+  cctInput.addEventListener("focus", () => {
+    const value = normalize(cctInput.value);
+    if (value && value.length >= SUGGESTION_MIN_LENGTH) {
+      scheduleSuggestions(value);
+    }
+  });
+
+  if (normalize(cctInput.value)) {
+    void handleChange();
+  }
+  initCCTCrud({
+    form,
+    modalId,
+    apiBase,
+    datalist,
+    cctInput,
+    hiddenCctInput,
+    nombreInput,
+    servicioInput,
+    asesorInput,
+    normalize,
+    updateFromOption,
+    fetchAndUpdate,
+    upsertOption,
+    canCreate,
+    canEdit,
+    canDelete,
+    lookupMinLength: LOOKUP_MIN_LENGTH,
+    onCatalogChange: (code, item) => {
+      if (item) {
+        cctLookup.remember(item);
+      } else {
+        cctLookup.forget(code);
+      }
+      suggestionCache.clear();
+    },
+  });
+}
+
+function initCCTCrud(config) {
+  const {
+    form,
+    modalId,
+    apiBase,
+    datalist,
+    cctInput,
+    hiddenCctInput,
+    nombreInput,
+    servicioInput,
+    asesorInput,
+    normalize,
+    updateFromOption,
+    fetchAndUpdate,
+    upsertOption,
+    canCreate = false,
+    canEdit = false,
+    canDelete = false,
+    lookupMinLength = 10,
+    onCatalogChange = () => {},
+  } = config;
+  if (!form || !modalId || !apiBase) {
+    return;
+  }
+  const modal = document.getElementById(modalId);
+  if (!modal) {
+    return;
+  }
+  const actionButtons = document.querySelectorAll("[data-cct-action]");
+  const cctForm = modal.querySelector("#cct-form");
+  const messageBox = modal.querySelector("[data-modal-message]");
+  const modalTitle = modal.querySelector("[data-modal-title]");
+  const overlay = modal.querySelector(".modal-overlay");
+  const closeTriggers = modal.querySelectorAll("[data-modal-close]");
+  const saveButton = cctForm?.querySelector("[data-cct-save]");
+  const codigoInput = cctForm?.querySelector('input[name="cct"]');
+  const nombreField = cctForm?.querySelector('input[name="nombre"]');
+  const servicioField = cctForm?.querySelector('input[name="servicio"]');
+  const sostenimientoField = cctForm?.querySelector('input[name="sostenimiento"]');
+  const asesorField = cctForm?.querySelector('input[name="asesor"]');
+  const municipioField = cctForm?.querySelector('input[name="municipio"]');
+  const turnoField = cctForm?.querySelector('input[name="turno"]');
+  const resultsContainer = modal.querySelector("[data-cct-results]");
+  const searchInput = modal.querySelector("[data-cct-search]");
+  const hint = modal.querySelector("[data-cct-hint]");
+
+  if (
+    !cctForm ||
+    !messageBox ||
+    !modalTitle ||
+    !codigoInput ||
+    !nombreField ||
+    !servicioField ||
+    !sostenimientoField ||
+    !asesorField ||
+    !resultsContainer ||
+    !searchInput
+  ) {
+    return;
+  }
+
+  const HINT_DEFAULT = "Escribe al menos un carácter para ver resultados del catálogo.";
+  const HINT_RESULTS =
+    "Selecciona un CCT del listado o continúa refinando la búsqueda.";
+  const HINT_EMPTY = "Sin coincidencias para tu búsqueda.";
+
+  const setHint = (message) => {
+    if (hint) {
+      hint.textContent = message;
+    }
+  };
+
+  const hideResults = () => {
+    resultsContainer.innerHTML = "";
+    resultsContainer.hidden = true;
+  };
+
+  const renderResultsPlaceholder = (message, { hintMessage } = {}) => {
+    resultsContainer.innerHTML = "";
+    if (!message) {
+      resultsContainer.hidden = true;
+    } else {
+      const empty = document.createElement("p");
+      empty.className = "modal-empty";
+      empty.textContent = message;
+      resultsContainer.appendChild(empty);
+      resultsContainer.hidden = false;
+    }
+    if (hintMessage) {
+      setHint(hintMessage);
+    }
+  };
+
+  hideResults();
+  setHint(HINT_DEFAULT);
+
+  let mode = "create";
+  let debounceTimer = null;
+
+  const openModal = (nextMode) => {
+    mode = nextMode;
+    let title = "Buscar CCT";
+    if (mode === "create") {
+      title = "Registrar CCT";
+    } else if (mode === "edit") {
+      title = "Editar CCT";
+    }
+    modalTitle.textContent = title;
+    messageBox.textContent = "";
+    modal.classList.add("is-open");
+    modal.hidden = false;
+    hideResults();
+    setHint(HINT_DEFAULT);
+    const showForm = mode !== "search";
+    cctForm.hidden = !showForm;
+    if (saveButton) {
+      saveButton.disabled = !showForm;
+      saveButton.style.display = showForm ? "" : "none";
+    }
+    if (mode === "create") {
+      cctForm.reset();
+    }
+    codigoInput.readOnly = mode === "edit";
+    const focusTarget = showForm ? codigoInput : searchInput;
+    window.setTimeout(() => focusTarget.focus(), 40);
+  };
+
+  const closeModal = () => {
+    modal.classList.remove("is-open");
+    modal.hidden = true;
+    cctForm.reset();
+    cctForm.hidden = false;
+    codigoInput.readOnly = false;
+    if (saveButton) {
+      saveButton.disabled = false;
+      saveButton.style.display = "";
+    }
+    messageBox.textContent = "";
+    mode = "create";
+    hideResults();
+    setHint(HINT_DEFAULT);
+  };
+
+  const displayMessage = (text, isError = false) => {
+    messageBox.textContent = text;
+    messageBox.style.color = isError ? "#dc2626" : "#0f4c81";
+  };
+
+  const upsertOptionFn =
+    typeof upsertOption === "function"
+      ? upsertOption
+      : (item) => {
+        if (!datalist) {
+          return;
+        }
+        const code = item.cct;
+        if (!code) {
+          return;
+        }
+        const existing = Array.from(datalist.options).find(
+          (opt) => normalize(opt.value) === normalize(code),
+        );
+        const label = `${code} · ${item.nombre || ""}`.trim();
+        if (existing) {
+          existing.value = code;
+          existing.textContent = label;
+          existing.dataset.nombre = item.nombre || "";
+          existing.dataset.servicio = item.servicio || "";
+          existing.dataset.asesor = item.asesor || "";
+          existing.dataset.sostenimiento = item.sostenimiento || "";
+          existing.setAttribute("data-nombre", item.nombre || "");
+          existing.setAttribute("data-servicio", item.servicio || "");
+          existing.setAttribute("data-asesor", item.asesor || "");
+          existing.setAttribute("data-sostenimiento", item.sostenimiento || "");
+        } else {
+          const option = document.createElement("option");
+          option.value = code;
+          option.textContent = label;
+          option.dataset.nombre = item.nombre || "";
+          option.dataset.servicio = item.servicio || "";
+          option.dataset.asesor = item.asesor || "";
+          option.dataset.sostenimiento = item.sostenimiento || "";
+          option.setAttribute("data-nombre", item.nombre || "");
+          option.setAttribute("data-servicio", item.servicio || "");
+          option.setAttribute("data-asesor", item.asesor || "");
+          option.setAttribute("data-sostenimiento", item.sostenimiento || "");
+          datalist.appendChild(option);
+        }
+      };
+
+  const removeOption = (code) => {
+    if (!datalist) {
+      return;
+    }
+    const option = Array.from(datalist.options).find(
+      (opt) => normalize(opt.value) === normalize(code),
+    );
+    option?.remove();
+  };
+
+  const fillMainForm = (item) => {
+    if (!item) {
+      return;
+    }
+    const code = item.cct;
+    const sistema = normaliseSistema(item.sostenimiento);
+    cctInput.value = code;
+    hiddenCctInput.value = code;
+    nombreInput.value = item.nombre || "";
+    if (sostenimientoInput) {
+      sostenimientoInput.value = sistema;
+    }
+    servicioInput.value = item.servicio || "";
+    if (asesorInput) {
+      asesorInput.value = item.asesor || "";
+    }
+  };
+
+  const renderResults = (items) => {
+    items.forEach((entry) => {
+      entry.sostenimiento = normaliseSistema(entry.sostenimiento);
+    });
+    resultsContainer.innerHTML = "";
+    if (!items.length) {
+      renderResultsPlaceholder("Sin resultados.", { hintMessage: HINT_EMPTY });
+      return;
+    }
+    const list = document.createElement("ul");
+    list.className = "modal-result-list";
+    items.forEach((item) => {
+      const li = document.createElement("li");
+      li.className = "modal-result-item";
+      const info = document.createElement("div");
+      info.className = "modal-result-info";
+      info.innerHTML = `<strong>${item.cct}</strong> · ${item.nombre || ""}`;
+      const actions = document.createElement("div");
+      actions.className = "modal-result-actions";
+
+      const selectBtn = document.createElement("button");
+      selectBtn.type = "button";
+      selectBtn.className = "btn btn--secondary btn--sm";
+      selectBtn.textContent = "Seleccionar";
+      selectBtn.addEventListener("click", () => {
+        fillMainForm(item);
+        upsertOptionFn(item);
+        closeModal();
+      });
+      actions.append(selectBtn);
+
+      if (canEdit) {
+        const editBtn = document.createElement("button");
+        editBtn.type = "button";
+        editBtn.className = "btn btn--ghost btn--sm";
+        editBtn.textContent = "Editar";
+        editBtn.addEventListener("click", async () => {
+          await loadForEdit(item.cct);
+        });
+        actions.append(editBtn);
+      }
+
+      if (canDelete) {
+        const deleteBtn = document.createElement("button");
+        deleteBtn.type = "button";
+        deleteBtn.className = "btn btn--danger btn--sm";
+        deleteBtn.textContent = "Eliminar";
+        deleteBtn.addEventListener("click", () => {
+          deleteCCT(item.cct);
+        });
+        actions.append(deleteBtn);
+      }
+
+      li.append(info, actions);
+      list.appendChild(li);
+    });
+    resultsContainer.appendChild(list);
+    resultsContainer.hidden = false;
+    setHint(HINT_RESULTS);
+  };
+
+  const loadForEdit = async (code) => {
+    if (!code || code.length < lookupMinLength) {
+      window.alert("Proporciona un CCT completo para editar.");
+      return;
+    }
+    if (!canEdit) {
+      window.alert("No tienes permisos para editar CCT.");
+      return;
+    }
+    try {
+      const detail = await fetchCCTDetail(code);
+      if (!detail) {
+        displayMessage("No se encontró el CCT solicitado.", true);
+        return;
+      }
+      cctForm.reset();
+      codigoInput.value = detail.cct || "";
+      nombreField.value = detail.nombre || "";
+      servicioField.value = detail.servicio || "";
+      sostenimientoField.value = normaliseSistema(detail.sostenimiento);
+      asesorField.value = detail.asesor || "";
+      if (municipioField) {
+        municipioField.value = detail.municipio || "";
+      }
+      if (turnoField) {
+        turnoField.value = detail.turno || "";
+      }
+      openModal("edit");
+    } catch (error) {
+      displayMessage(error.message, true);
+    }
+  };
+
+  const fetchCCTDetail = async (code) => {
+    if (!code || code.length < lookupMinLength) {
+      return null;
+    }
+    const target = buildDetailUrl(apiBase, encodeURIComponent(code));
+    const response = await fetch(target, {
+      headers: { Accept: "application/json" },
+    });
+    if (!response.ok) {
+      if (response.status === 404) {
+        return null;
+      }
+      throw new Error("No fue posible obtener la información del CCT.");
+    }
+    const detail = await response.json();
+    detail.sostenimiento = normaliseSistema(detail.sostenimiento);
+    return detail;
+  };
+
+  const performSearch = async (term) => {
+    const query = term.trim();
+    if (!query) {
+      hideResults();
+      setHint(HINT_DEFAULT);
+      displayMessage("");
+      return;
+    }
+    renderResultsPlaceholder("Buscando resultados...", { hintMessage: HINT_RESULTS });
+    const url = new URL(apiBase, window.location.origin);
+    url.searchParams.set("search", query);
+    url.searchParams.set("page_size", "10");
+    const response = await fetch(url, {
+      headers: { Accept: "application/json" },
+    });
+    if (!response.ok) {
+      displayMessage("Ocurrió un problema al buscar CCT.", true);
+      renderResultsPlaceholder("No fue posible completar la búsqueda.", {
+        hintMessage: HINT_DEFAULT,
+      });
+      return;
+    }
+    const data = await response.json();
+    const results = Array.isArray(data.results) ? data.results : [];
+    renderResults(results);
+  };
+
+  const deleteCCT = async (code) => {
+    if (!code || code.length < lookupMinLength) {
+      window.alert("Proporciona un CCT completo para eliminar.");
+      return;
+    }
+    if (!canDelete) {
+      window.alert("No tienes permisos para eliminar CCT.");
+      return;
+    }
+    if (!window.confirm(`¿Eliminar el CCT ${code}? Esta acción es irreversible.`)) {
+      return;
+    }
+    const target = buildDetailUrl(apiBase, encodeURIComponent(code));
+    const response = await fetch(target, {
+      method: "DELETE",
+      headers: defaultHeaders(),
+    });
+    if (!response.ok) {
+      displayMessage("No fue posible eliminar el CCT.", true);
+      return;
+    }
+    removeOption(code);
+    onCatalogChange(normalize(code), null);
+    if (normalize(hiddenCctInput.value) === normalize(code)) {
+      hiddenCctInput.value = "";
+      cctInput.value = "";
+      nombreInput.value = "";
+      servicioInput.value = "";
+      if (asesorInput) {
+        asesorInput.value = "";
+      }
+    }
+    await performSearch(searchInput.value.trim());
+    displayMessage("CCT eliminado correctamente.");
+  };
+
+  actionButtons.forEach((button) => {
+    const action = button.dataset.cctAction;
+    if (action === "create") {
+      button.addEventListener("click", () => {
+        if (!canCreate) {
+          window.alert("No tienes permisos para crear CCT.");
+          return;
+        }
+        cctForm.reset();
+        openModal("create");
+        searchInput.value = "";
+        hideResults();
+        setHint(HINT_DEFAULT);
+        displayMessage("");
+      });
+    } else if (action === "edit") {
+      button.addEventListener("click", async () => {
+        if (!canEdit) {
+          window.alert("No tienes permisos para editar CCT.");
+          return;
+        }
+        const selectedCode = normalize(hiddenCctInput.value || cctInput.value);
+        if (!selectedCode) {
+          window.alert("Selecciona un CCT para editar.");
+          return;
+        }
+        await loadForEdit(selectedCode);
+      });
+    } else if (action === "delete") {
+      button.addEventListener("click", () => {
+        if (!canDelete) {
+          window.alert("No tienes permisos para eliminar CCT.");
+          return;
+        }
+        const selectedCode = normalize(hiddenCctInput.value || cctInput.value);
+        if (!selectedCode) {
+          window.alert("Selecciona un CCT para eliminar.");
+          return;
+        }
+        deleteCCT(selectedCode);
+      });
+    } else if (action === "search") {
+      button.addEventListener("click", () => {
+        openModal("search");
+        searchInput.value = "";
+        hideResults();
+        setHint(HINT_DEFAULT);
+        displayMessage("");
+      });
+    }
+  });
+
+  closeTriggers.forEach((trigger) => trigger.addEventListener("click", closeModal));
+  overlay?.addEventListener("click", closeModal);
+  modal.addEventListener("keydown", (event) => {
+    if (event.key === "Escape") {
+      event.preventDefault();
+      closeModal();
+    }
+  });
+
+  searchInput.addEventListener("input", (event) => {
+    const term = event.target.value.trim();
+    if (debounceTimer) {
+      window.clearTimeout(debounceTimer);
+    }
+    if (!term) {
+      hideResults();
+      setHint(HINT_DEFAULT);
+      displayMessage("");
+      return;
+    }
+    debounceTimer = window.setTimeout(() => {
+      performSearch(term);
+    }, 250);
+  });
+
+  cctForm.addEventListener("submit", async (event) => {
+    event.preventDefault();
+    displayMessage("");
+    if (mode === "create" && !canCreate) {
+      displayMessage("No tienes permisos para crear CCT.", true);
+      return;
+    }
+    if (mode === "edit" && !canEdit) {
+      displayMessage("No tienes permisos para editar CCT.", true);
+      return;
+    }
+    const sistemaValue = normaliseSistema(sostenimientoField.value.trim());
+    sostenimientoField.value = sistemaValue;
+    const payload = {
+      cct: codigoInput.value.trim().toUpperCase(),
+      nombre: nombreField.value.trim(),
+      sostenimiento: sistemaValue,
+      servicio: servicioField.value.trim(),
+      asesor: asesorField?.value.trim() || "",
+      municipio: municipioField?.value.trim() || "",
+      turno: turnoField?.value.trim() || "",
+    };
+    if (!payload.cct) {
+      displayMessage("La clave CCT es obligatoria.", true);
+      codigoInput.focus();
+      return;
+    }
+    if (!payload.nombre) {
+      displayMessage("El nombre es obligatorio.", true);
+      nombreField.focus();
+      return;
+    }
+    try {
+      let result;
+      if (mode === "create") {
+        const response = await fetch(apiBase, {
+          method: "POST",
+          headers: defaultHeaders(),
+          body: JSON.stringify(payload),
+        });
+        if (!response.ok) {
+          const errorData = await response.json().catch(() => ({}));
+          const msg = extractErrorMessage(errorData) || "No fue posible crear el CCT.";
+          throw new Error(msg);
+        }
+        result = await response.json();
+      } else {
+        const target = buildDetailUrl(apiBase, encodeURIComponent(payload.cct));
+        const response = await fetch(target, {
+          method: "PUT",
+          headers: defaultHeaders(),
+          body: JSON.stringify(payload),
+        });
+        if (!response.ok) {
+          const errorData = await response.json().catch(() => ({}));
+          const msg = extractErrorMessage(errorData) || "No fue posible actualizar el CCT.";
+          throw new Error(msg);
+        }
+        result = await response.json();
+      }
+      upsertOptionFn(result);
+      onCatalogChange(normalize(result.cct), result);
+      fillMainForm(result);
+      const successText = mode === "create"
+        ? "CCT guardado correctamente."
+        : "CCT actualizado correctamente.";
+      displayMessage(successText, false);
+      window.setTimeout(() => closeModal(), 800);
+    } catch (error) {
+      displayMessage(error.message, true);
+    }
+  });
+}
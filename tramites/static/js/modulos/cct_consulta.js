@@ -0,0 +1,186 @@
+// Consulta de CCT por código con caché: primero el catálogo que ya trae la página,
+// luego un LRU de la sesión (sessionStorage) y, solo si no está en ninguno, la red.
+// Una consulta nueva cancela la anterior que siga en vuelo.
+
+export class LRUCache {
+  constructor(limit = 200) {
+    this.limit = limit;
+    this.entries = new Map();
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  has(key) {
+    return this.entries.has(key);
+  }
+
+  get(key) {
+    if (!this.entries.has(key)) {
+      return undefined;
+    }
+    const value = this.entries.get(key);
+    // Reinsertar la marca como la más reciente.
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    while (this.entries.size > this.limit) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  delete(key) {
+    return this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  toJSON() {
+    return Array.from(this.entries);
+  }
+}
+
+const STORAGE_KEY = "cct-consulta:v1";
+
+const normalizeCode = (value) => (value || "").trim().toUpperCase();
+
+// Convierte la respuesta de CCTLookupView al formato que usa el formulario.
+export function itemFromLookup(data, code) {
+  if (!data || !data.found) {
+    return null;
+  }
+  return {
+    cct: data.cct || code,
+    nombre: data.c_nombre || "",
+    sostenimiento: data.sostenimiento_c_subcontrol || "",
+    servicio: data.tiponivelsub_c_servicion3 || "",
+    asesor: data.asesor || "",
+  };
+}
+
+export function createCCTLookup({
+  url,
+  catalog = [],
+  limit = 200,
+  ttlMs = 15 * 60 * 1000,
+  storage = globalThis.sessionStorage,
+  fetchFn = (...args) => globalThis.fetch(...args),
+  now = () => Date.now(),
+} = {}) {
+  const catalogByCode = new Map();
+  const cache = new LRUCache(limit);
+  const pending = new Map();
+  let controller = null;
+  let pendingCode = null;
+  const stats = { requests: 0, catalogHits: 0, cacheHits: 0, aborted: 0 };
+
+  try {
+    const saved = JSON.parse(storage?.getItem(STORAGE_KEY) || "[]");
+    saved.forEach(([code, entry]) => cache.set(code, entry));
+  } catch (error) {
+    // Sin sessionStorage (modo privado, cuota) el caché vive solo en memoria.
+  }
+
+  const persist = () => {
+    try {
+      storage?.setItem(STORAGE_KEY, JSON.stringify(cache));
+    } catch (error) {
+      // Ídem: se ignora un sessionStorage no disponible o lleno.
+    }
+  };
+
+  const remember = (item) => {
+    const code = normalizeCode(item?.cct);
+    if (!code) {
+      return;
+    }
+    if (catalogByCode.has(code)) {
+      catalogByCode.set(code, item);
+      return;
+    }
+    cache.set(code, { item, t: now() });
+    persist();
+  };
+
+  const forget = (value) => {
+    const code = normalizeCode(value);
+    catalogByCode.delete(code);
+    if (cache.delete(code)) {
+      persist();
+    }
+  };
+
+  const preload = (items) => {
+    items.forEach((item) => {
+      const code = normalizeCode(item?.cct);
+      if (code) {
+        catalogByCode.set(code, item);
+      }
+    });
+  };
+
+  // Devuelve el CCT (o null si no existe) sin tocar la red cuando ya se conoce.
+  // Rechaza con AbortError si otra consulta la reemplazó antes de responder.
+  const lookup = (value) => {
+    const code = normalizeCode(value);
+    if (!code) {
+      return Promise.resolve(null);
+    }
+    if (catalogByCode.has(code)) {
+      stats.catalogHits += 1;
+      return Promise.resolve(catalogByCode.get(code));
+    }
+    const cached = cache.get(code);
+    if (cached && now() - cached.t < ttlMs) {
+      stats.cacheHits += 1;
+      return Promise.resolve(cached.item);
+    }
+    if (pending.has(code)) {
+      return pending.get(code);
+    }
+    if (controller) {
+      controller.abort();
+      stats.aborted += 1;
+    }
+    const currentController = new AbortController();
+    controller = currentController;
+    pendingCode = code;
+    stats.requests += 1;
+    const request = (async () => {
+      const target = `${url}${url.includes("?") ? "&" : "?"}cct=${encodeURIComponent(code)}`;
+      const response = await fetchFn(target, {
+        headers: { "X-Requested-With": "XMLHttpRequest", Accept: "application/json" },
+        signal: currentController.signal,
+      });
+      if (!response.ok && response.status !== 404) {
+        throw new Error("No fue posible consultar la información del CCT.");
+      }
+      const item = response.ok ? itemFromLookup(await response.json(), code) : null;
+      // Los "no encontrado" también se guardan: repetir un código mal escrito no vuelve a consultar.
+      cache.set(code, { item, t: now() });
+      persist();
+      return item;
+    })();
+    pending.set(code, request);
+    const cleanup = () => {
+      pending.delete(code);
+      if (pendingCode === code) {
+        controller = null;
+        pendingCode = null;
+      }
+    };
+    request.then(cleanup, cleanup);
+    return request;
+  };
+
+  preload(catalog);
+  return { lookup, remember, forget, preload, stats };
+}
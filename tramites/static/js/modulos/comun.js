@@ -0,0 +1,64 @@
+// Utilidades compartidas por los módulos de la interfaz (CSRF, encabezados y errores del API).
+
+export function getCsrfToken() {
+  const input = document.querySelector('input[name="csrfmiddlewaretoken"]');
+  return input ? input.value : "";
+}
+
+export function defaultHeaders() {
+  return {
+    "Content-Type": "application/json",
+    Accept: "application/json",
+    "X-CSRFToken": getCsrfToken(),
+  };
+}
+
+export function extractErrorMessage(data) {
+  if (!data) {
+    return "";
+  }
+  if (typeof data === "string") {
+    return data;
+  }
+  if (Array.isArray(data)) {
+    return data.join(" ");
+  }
+  if (typeof data === "object") {
+    if (data.detail) {
+      if (Array.isArray(data.detail)) {
+        return data.detail.join(" ");
+      }
+      if (typeof data.detail === "string") {
+        return data.detail;
+      }
+    }
+    const messages = [];
+    Object.values(data).forEach((value) => {
+      if (!value) {
+        return;
+      }
+      if (Array.isArray(value)) {
+        messages.push(value.join(" "));
+      } else if (typeof value === "string") {
+        messages.push(value);
+      } else if (typeof value === "object") {
+        const nested = extractErrorMessage(value);
+        if (nested) {
+          messages.push(nested);
+        }
+      }
+    });
+    return messages.join(" ");
+  }
+  return "";
+}
+
+export function buildDetailUrl(baseUrl, id) {
+  const separator = baseUrl.endsWith("/") ? "" : "/";
+  return `${baseUrl}${separator}${id}/`;
+}
+
+export const normaliseSistema = (value) => {
+  const trimmed = (value || "").trim();
+  return trimmed.toUpperCase() === "FEDERAL TRANSFERIDO" ? "FEDERAL" : trimmed;
+};
@@ -0,0 +1,357 @@
+// CRUD en modal de los estatus de caso y de trámite.
+import { defaultHeaders } from "./comun.js";
+import { createSimpleCrud } from "./catalogos.js";
+
+export function initEstatusCasoCrud() {
+  const selectElement =
+    document.querySelector("[data-estatus-caso-select]") || document.querySelector("#id_estatus");
+  const modal = document.getElementById("estatus-caso-modal");
+  const form = document.getElementById("estatus-caso-form");
+  const fieldset = form ? form.querySelector("#estatus-caso-fields") : null;
+  const openBtn = document.querySelector("[data-estatus-caso-modal-open]");
+  const editBtn = document.querySelector("[data-estatus-caso-modal-edit]");
+  const deleteBtn = document.querySelector("[data-estatus-caso-modal-delete]");
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const saveBtn = form ? form.querySelector("[data-estatus-caso-save]") : null;
+  const modalTitle = modal ? modal.querySelector("[data-modal-title]") : null;
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+
+  // El formulario del trámite y el detalle pueden pedirlo ambos; se enlaza una sola vez.
+  if (!selectElement || !modal || !form || form.dataset.crudIniciado === "true") {
+    return;
+  }
+  form.dataset.crudIniciado = "true";
+
+  const apiBase = selectElement.dataset.estatusApi || "/api/estatus-caso/";
+  const labelTarget = selectElement.dataset.estatusLabel || "estatus";
+  let currentMode = "create";
+  let selectedId = null;
+
+  const showMessage = (message, isError = false) => {
+    if (modalMessage) {
+      modalMessage.textContent = message;
+      modalMessage.className = isError ? "modal-message error" : "modal-message success";
+      modalMessage.style.display = isError || message ? "block" : "none";
+    }
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+    }
+  };
+
+  const openModalForCreate = () => {
+    currentMode = "create";
+    if (modalTitle) {
+      modalTitle.textContent = `Agregar ${labelTarget}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#estatus-caso-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+    form.reset();
+    nombreInput.focus();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+    }
+    modal.hidden = false;
+  };
+
+  const openModalForEdit = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Por favor selecciona un estatus primero.", true);
+      return;
+    }
+
+    currentMode = "edit";
+    if (modalTitle) {
+      modalTitle.textContent = `Editar ${labelTarget}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "block";
+    }
+    const nombreInput = form.querySelector("#estatus-caso-nombre");
+    if (nombreInput) {
+      nombreInput.required = true;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Guardar";
+      saveBtn.classList.remove("btn--danger");
+      saveBtn.classList.add("btn--primary");
+    }
+
+    fetch(`${apiBase}${selectedId}/`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" },
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error("No se pudo cargar el estatus");
+        return response.json();
+      })
+      .then((data) => {
+        form.querySelector("#estatus-caso-nombre").value = data.nombre || "";
+        form.querySelector("#estatus-caso-orden").value = data.orden || 1;
+        if (modalMessage) {
+          modalMessage.style.display = "none";
+        }
+        modal.hidden = false;
+      })
+      .catch((error) => {
+        showMessage(`Error: ${error.message}`, true);
+      });
+  };
+
+  const openModalForDelete = () => {
+    selectedId = parseInt(selectElement.value, 10);
+    if (!selectedId) {
+      showMessage("Por favor selecciona un estatus primero.", true);
+      return;
+    }
+
+    currentMode = "delete";
+    if (modalTitle) {
+      modalTitle.textContent = `Eliminar ${labelTarget}`;
+    }
+    if (fieldset) {
+      fieldset.style.display = "none";
+    }
+    const nombreInput = form.querySelector("#estatus-caso-nombre");
+    if (nombreInput) {
+      nombreInput.required = false;
+    }
+    if (saveBtn) {
+      saveBtn.textContent = "Eliminar";
+      saveBtn.classList.remove("btn--primary");
+      saveBtn.classList.add("btn--danger");
+    }
+    if (modalMessage) {
+      modalMessage.textContent = "¿Estás seguro de que deseas eliminar este estatus? Esta acción no se puede deshacer.";
+      modalMessage.className = "modal-message";
+      modalMessage.style.display = "block";
+    }
+    modal.hidden = false;
+  };
+
+  const submitForm = async (event) => {
+    event.preventDefault();
+
+    if (currentMode === "delete") {
+      await deleteStatus(selectedId);
+    } else {
+      const nombreInput = form.querySelector("#estatus-caso-nombre");
+      if (!nombreInput.value.trim()) {
+        showMessage("El nombre del estatus es obligatorio.", true);
+        nombreInput.focus();
+        return;
+      }
+
+      const data = {
+        nombre: nombreInput.value.trim(),
+        orden: parseInt(form.querySelector("#estatus-caso-orden").value, 10) || 1,
+      };
+
+      if (currentMode === "create") {
+        await createStatus(data);
+      } else if (currentMode === "edit") {
+        await updateStatus(selectedId, data);
+      }
+    }
+  };
+
+  const createStatus = async (data) => {
+    try {
+      const response = await fetch(apiBase, {
+        method: "POST",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al crear el estatus.";
+
+        if (errorData.nombre) {
+          errorMessage = Array.isArray(errorData.nombre) ? errorData.nombre[0] : errorData.nombre;
+        } else if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const newStatus = await response.json();
+      addOption(selectElement, newStatus);
+      showMessage("Estatus de caso creado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const updateStatus = async (id, data) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "PATCH",
+        headers: defaultHeaders(),
+        body: JSON.stringify(data),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al actualizar el estatus.";
+
+        if (errorData.nombre) {
+          errorMessage = Array.isArray(errorData.nombre) ? errorData.nombre[0] : errorData.nombre;
+        } else if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      const updated = await response.json();
+      updateOption(selectElement, updated);
+      showMessage("Estatus de caso actualizado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const deleteStatus = async (id) => {
+    try {
+      const response = await fetch(`${apiBase}${id}/`, {
+        method: "DELETE",
+        headers: defaultHeaders(),
+      });
+
+      if (!response.ok) {
+        const errorData = await response.json();
+        let errorMessage = "Error al eliminar el estatus.";
+
+        if (errorData.detail) {
+          errorMessage = errorData.detail;
+        } else if (typeof errorData === 'object') {
+          const firstError = Object.values(errorData).flat()[0];
+          if (firstError) {
+            errorMessage = String(firstError);
+          }
+        }
+
+        showMessage(errorMessage, true);
+        return;
+      }
+
+      removeOption(selectElement, id);
+      showMessage("Estatus de caso eliminado exitosamente.");
+      setTimeout(closeModal, 1000);
+    } catch (error) {
+      showMessage(`Error: ${error.message}`, true);
+    }
+  };
+
+  const addOption = (select, data) => {
+    const option = document.createElement("option");
+    option.value = data.id;
+    option.textContent = data.nombre;
+    select.appendChild(option);
+    select.value = data.id;
+  };
+
+  const updateOption = (select, data) => {
+    const option = select.querySelector(`option[value="${data.id}"]`);
+    if (option) {
+      option.textContent = data.nombre;
+    }
+  };
+
+  const removeOption = (select, id) => {
+    const idStr = String(id);
+    const option = select.querySelector(`option[value="${idStr}"]`);
+    if (option) {
+      option.remove();
+    }
+    if (select.value === idStr) {
+      select.value = "";
+    }
+  };
+
+  // Event listeners
+  if (openBtn) {
+    openBtn.addEventListener("click", openModalForCreate);
+  }
+  if (editBtn) {
+    editBtn.addEventListener("click", openModalForEdit);
+  }
+  if (deleteBtn) {
+    deleteBtn.addEventListener("click", openModalForDelete);
+  }
+
+  closeBtns.forEach((btn) => {
+    btn.addEventListener("click", closeModal);
+  });
+
+  if (form) {
+    form.addEventListener("submit", submitForm);
+  }
+
+  const overlay = modal ? modal.querySelector(".modal-overlay") : null;
+  if (overlay) {
+    overlay.addEventListener("click", closeModal);
+  }
+}
+
+export function initEstatusTramiteCrud() {
+  createSimpleCrud({
+    selectSelector: "#id_estatus",
+    modalId: "estatus-caso-modal",
+    formId: "estatus-caso-form",
+    fieldsetId: "estatus-caso-fields",
+    openBtnSelector: "[data-estatus-caso-modal-open]",
+    editBtnSelector: "[data-estatus-caso-modal-edit]",
+    deleteBtnSelector: "[data-estatus-caso-modal-delete]",
+    saveBtnSelector: "[data-estatus-caso-save]",
+    modalTitleText: {
+      create: "Agregar estatus de trámite",
+      edit: "Editar estatus de trámite",
+      delete: "Eliminar estatus de trámite",
+    },
+    apiBase: "/api/estatus-tramite/",
+    nameInputSelector: "#estatus-caso-nombre",
+    descriptionSelector: "#estatus-caso-orden",
+    deleteWarning:
+      "¿Estás seguro de que deseas eliminar este estatus? Esta acción no se puede deshacer.",
+    customDataBuilder: (form) => ({
+      nombre: form.querySelector("#estatus-caso-nombre").value.trim(),
+      orden: parseInt(form.querySelector("#estatus-caso-orden").value, 10) || 1,
+    }),
+    populateForm: (form, data) => {
+      form.querySelector("#estatus-caso-nombre").value = data.nombre || "";
+      form.querySelector("#estatus-caso-orden").value = data.orden || 1;
+    },
+  });
+}
@@ -0,0 +1,149 @@
+// Editor de receptores adicionales de un trámite.
+
+export function initReceptoresAdicionales(config = {}) {
+  const {
+    tableSelector = "[data-receptores-rows]",
+    hiddenSelector = "#id_receptores_adicionales",
+    addBtnSelector = "[data-receptor-adicional-add]",
+    modalId = "receptor-adicional-modal",
+    formId = "receptor-adicional-form",
+    nameSelector = "#receptor-adicional-nombre",
+    initialsSelector = "#receptor-adicional-iniciales",
+    sexoSelector = "#receptor-adicional-sexo",
+  } = config;
+  const tableBody = document.querySelector(tableSelector);
+  const hiddenInput = document.querySelector(hiddenSelector);
+  const addBtn = document.querySelector(addBtnSelector);
+  const modal = document.getElementById(modalId);
+  const form = document.getElementById(formId);
+  const modalMessage = modal ? modal.querySelector("[data-modal-message]") : null;
+  const saveBtn = form ? form.querySelector("[data-receptor-adicional-save]") : null;
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+
+  if (!tableBody || !hiddenInput || !modal || !form) {
+    return null;
+  }
+
+  let currentIndex = null;
+
+  const loadData = () => {
+    try {
+      const data = JSON.parse(hiddenInput.value || "[]");
+      return Array.isArray(data) ? data : [];
+    } catch (_err) {
+      return [];
+    }
+  };
+
+  const saveData = (data) => {
+    hiddenInput.value = JSON.stringify(data);
+    renderTable(data);
+  };
+
+  const renderTable = (data) => {
+    tableBody.innerHTML = "";
+    if (!data.length) {
+      const row = document.createElement("tr");
+      row.className = "table__empty-row";
+      const cell = document.createElement("td");
+      cell.colSpan = 4;
+      cell.className = "table__empty";
+      cell.textContent = "No hay receptores adicionales.";
+      row.appendChild(cell);
+      tableBody.appendChild(row);
+      return;
+    }
+    data.forEach((item, index) => {
+      const row = document.createElement("tr");
+      row.innerHTML = `
+        <td>${item.nombre || "-"}</td>
+        <td>${item.iniciales || "-"}</td>
+        <td>${item.sexo === "M" ? "Mujer" : item.sexo === "H" ? "Hombre" : "-"}</td>
+        <td class="table-actions">
+          <button type="button" class="table-actions__link" data-action="edit" data-index="${index}">Editar</button>
+          <button type="button" class="table-actions__link table-actions__link--danger" data-action="delete" data-index="${index}">Eliminar</button>
+        </td>
+      `;
+      tableBody.appendChild(row);
+    });
+  };
+
+  const openModal = (index = null) => {
+    currentIndex = index;
+    const data = loadData();
+    if (index != null && data[index]) {
+      form.querySelector(nameSelector).value = data[index].nombre || "";
+      form.querySelector(initialsSelector).value = data[index].iniciales || "";
+      form.querySelector(sexoSelector).value = data[index].sexo || "";
+    } else {
+      form.reset();
+    }
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+      modalMessage.textContent = "";
+    }
+    modal.hidden = false;
+  };
+
+  const closeModal = () => {
+    modal.hidden = true;
+    form.reset();
+    if (modalMessage) {
+      modalMessage.style.display = "none";
+      modalMessage.className = "modal-message";
+      modalMessage.textContent = "";
+    }
+  };
+
+  const handleSubmit = (event) => {
+    event.preventDefault();
+    const nombre = form.querySelector(nameSelector).value.trim();
+    const iniciales = form.querySelector(initialsSelector).value.trim();
+    const sexo = form.querySelector(sexoSelector).value;
+    if (!nombre && !iniciales && !sexo) {
+      if (modalMessage) {
+        modalMessage.textContent = "Captura al menos un dato (nombre, iniciales o sexo).";
+        modalMessage.className = "modal-message error";
+        modalMessage.style.display = "block";
+      }
+      return;
+    }
+    const data = loadData();
+    const record = { nombre, iniciales, sexo };
+    if (currentIndex != null && data[currentIndex]) {
+      data[currentIndex] = record;
+    } else {
+      data.push(record);
+    }
+    saveData(data);
+    closeModal();
+  };
+
+  const handleTableClick = (event) => {
+    const target = event.target;
+    if (!(target instanceof HTMLElement)) return;
+    const action = target.dataset.action;
+    const index = target.dataset.index ? parseInt(target.dataset.index, 10) : null;
+    if (action === "edit" && index != null) {
+      openModal(index);
+    } else if (action === "delete" && index != null) {
+      const data = loadData();
+      data.splice(index, 1);
+      saveData(data);
+    }
+  };
+
+  addBtn?.addEventListener("click", () => openModal(null));
+  form.addEventListener("submit", handleSubmit);
+  tableBody.addEventListener("click", handleTableClick);
+  closeBtns.forEach((btn) => btn.addEventListener("click", closeModal));
+
+  renderTable(loadData());
+
+  return {
+    reset() {
+      saveData([]);
+    },
+  };
+}
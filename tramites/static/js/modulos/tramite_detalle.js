@@ -0,0 +1,115 @@
+// Alta de trámites asociados (modal del detalle o formulario independiente).
+import { initGenericCrud, initPrefijoOficioCrud, initTramiteCasoPrefijos } from "./catalogos.js";
+import { initReceptoresAdicionales } from "./receptores.js";
+
+export function initTramiteCasoDetail() {
+  const modal = document.getElementById("tramite-caso-modal");
+  const openBtn = document.querySelector("[data-tramite-caso-modal-open]");
+  const closeBtns = modal ? modal.querySelectorAll("[data-modal-close]") : [];
+  const form = modal ? modal.querySelector("form") : null;
+  const standaloneForm = document.querySelector("[data-tramite-caso-form]");
+  if (!modal || !openBtn || !form) {
+    if (standaloneForm) {
+      const hiddenInput = standaloneForm.querySelector("[name$='receptores_adicionales']");
+      initReceptoresAdicionales({
+        tableSelector: "[data-receptores-rows]",
+        hiddenSelector: hiddenInput ? `#${hiddenInput.id}` : "#id_receptores_adicionales",
+        addBtnSelector: "[data-receptor-adicional-add]",
+        modalId: "receptor-adicional-modal",
+        formId: "receptor-adicional-form",
+        nameSelector: "#receptor-adicional-nombre",
+        initialsSelector: "#receptor-adicional-iniciales",
+        sexoSelector: "#receptor-adicional-sexo",
+      });
+      initPrefijoOficioCrud();
+    }
+    return;
+  }
+
+  const receptorsManager = initReceptoresAdicionales({
+    tableSelector: "[data-receptores-rows-modal]",
+    hiddenSelector: "#id_receptores_adicionales_modal",
+    addBtnSelector: "[data-receptor-adicional-modal-add]",
+    modalId: "receptor-adicional-modal-tramite",
+    formId: "receptor-adicional-form-tramite",
+    nameSelector: "#receptor-adicional-nombre-tramite",
+    initialsSelector: "#receptor-adicional-iniciales-tramite",
+    sexoSelector: "#receptor-adicional-sexo-tramite",
+  });
+
+  const resetForm = () => {
+    form.reset();
+    if (receptorsManager) {
+      receptorsManager.reset();
+    }
+  };
+
+  const initCatalogCruds = () => {
+    // Inicializar CRUD para Tipo de Proceso
+    initGenericCrud({
+      catalogType: "tipo-proceso",
+      selectSelector: "#id_tramite_caso-tipo",
+      modalId: "tipo-proceso-modal",
+      apiEndpoint: "/api/tipos-proceso/",
+      fieldConfig: { label: "tipo de trámite" },
+    });
+
+    // Inicializar CRUD para Tipo de Violencia
+    initGenericCrud({
+      catalogType: "tipo-violencia",
+      selectSelector: "#id_tramite_caso-tipo_violencia",
+      modalId: "tipo-violencia-modal",
+      apiEndpoint: "/api/tipos-violencia/",
+      fieldConfig: { label: "tipo de violencia" },
+    });
+
+    // Inicializar CRUD para Solicitante
+    initGenericCrud({
+      catalogType: "solicitante",
+      selectSelector: "#id_tramite_caso-solicitante",
+      modalId: "solicitante-modal",
+      apiEndpoint: "/api/solicitantes/",
+      fieldConfig: { label: "solicitante" },
+    });
+
+    // Inicializar CRUD para Destinatario
+    initGenericCrud({
+      catalogType: "destinatario",
+      selectSelector: "#id_tramite_caso-dirigido_a",
+      modalId: "destinatario-modal",
+      apiEndpoint: "/api/destinatarios/",
+      fieldConfig: { label: "destinatario" },
+    });
+
+    // Inicializar CRUD para Estatus de Trámite
+    initGenericCrud({
+      catalogType: "estatus-tramite",
+      selectSelector: "#id_tramite_caso-estatus",
+      modalId: "estatus-tramite-modal",
+      apiEndpoint: "/api/estatus-tramite/",
+      fieldConfig: { label: "estatus de trámite" },
+    });
+  };
+
+  // Inicializar CRUD de Prefijos una sola vez
+  initPrefijoOficioCrud();
+
+  openBtn.addEventListener("click", () => {
+    resetForm();
+    modal.hidden = false;
+    initTramiteCasoPrefijos();
+    initCatalogCruds();
+    const firstInput = modal.querySelector("input, select, textarea");
+    firstInput?.focus();
+  });
+  closeBtns.forEach((btn) =>
+    btn.addEventListener("click", () => {
+      modal.hidden = true;
+    })
+  );
+  // Con HTMX la tabla de trámites se actualiza en su lugar; el servidor avisa con HX-Trigger.
+  document.body.addEventListener("tramite-caso-agregado", () => {
+    modal.hidden = true;
+    resetForm();
+  });
+}
@@ -1,4 +1,6 @@
 """Template tags personalizados para formularios."""
+from functools import lru_cache
+
 from django import template
 
 from tramites.utils import normalise_sistema
@@ -23,14 +25,20 @@ def get_form_field(form, field_name):
         return None
 
 
+@lru_cache(maxsize=256)
+def _unir_clases(existentes, css_class):
+    return " ".join(filter(None, [existentes, css_class]))
+
+
 @register.filter(name="add_class")
 def add_class(field, css_class):
-    """Agrega clases CSS al renderizado de un campo."""
+    """Agrega clases CSS al renderizado de un campo.
+
+    Solo pasa `class`: `as_widget` ya combina los demás atributos del widget, sin copiarlos.
+    Para formularios propios es mejor fijar la clase en el widget (ver `tramites.forms`).
+    """
     if hasattr(field, "as_widget"):
-        attrs = field.field.widget.attrs.copy()
-        existing = attrs.get("class", "")
-        attrs["class"] = " ".join(filter(None, [existing, css_class]))
-        return field.as_widget(attrs=attrs)
+        return field.as_widget(attrs={"class": _unir_clases(field.field.widget.attrs.get("class", ""), css_class)})
     return field
 
 
@@ -0,0 +1,40 @@
+"""Caché de fragmentos de plantilla sobre el espacio `fragmentos`."""
+from django import template
+
+from tramites.cache import cache_de
+from tramites.services import fragmentos
+
+register = template.Library()
+
+
+class FragmentoNode(template.Node):
+    def __init__(self, nodelist, nombre, variar):
+        self.nodelist = nodelist
+        self.nombre = nombre
+        self.variar = variar
+
+    def render(self, context):
+        clave = fragmentos.clave(self.nombre, [variable.resolve(context) for variable in self.variar])
+        cache = cache_de("fragmentos")
+        contenido = cache.get(clave)
+        if contenido is None:
+            contenido = self.nodelist.render(context)
+            cache.set(clave, contenido)
+        return contenido
+
+
+@register.tag
+def fragmento(parser, token):
+    """`{% fragmento "nombre" version [otros valores] %}…{% endfragmento %}`.
+
+    La clave se arma con el nombre y los valores resueltos; deben incluir todo lo
+    que cambie el HTML (versión de los datos, permisos, URL de la petición).
+    """
+    bits = token.split_contents()
+    if len(bits) < 3 or bits[1][0] not in "\"'" or bits[1][0] != bits[1][-1]:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' requiere un nombre entre comillas y al menos un valor para la clave."
+        )
+    nodelist = parser.parse(("endfragmento",))
+    parser.delete_first_token()
+    return FragmentoNode(nodelist, bits[1][1:-1], [parser.compile_filter(bit) for bit in bits[2:]])
@@ -0,0 +1,37 @@
+"""Resolución de los módulos JavaScript a sus bundles compilados."""
+import json
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+
+register = template.Library()
+
+MANIFIESTO_JS = "dist/manifest.json"
+
+
+def _leer_manifiesto():
+    """Lee el manifiesto que genera `npm run build:js` (módulo fuente → bundle)."""
+    ruta = finders.find(MANIFIESTO_JS)
+    if not ruta:
+        return {}
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+_manifiesto_en_cache = lru_cache(maxsize=1)(_leer_manifiesto)
+
+
+def manifiesto_js():
+    if not settings.JS_USAR_BUNDLES:
+        return {}
+    # En desarrollo se relee para tomar la última compilación sin reiniciar.
+    return _leer_manifiesto() if settings.DEBUG else _manifiesto_en_cache()
+
+
+@register.simple_tag
+def modulo_js(ruta):
+    """URL del bundle minificado de `ruta` o, si no se ha compilado, del módulo fuente."""
+    return static(manifiesto_js().get(ruta, ruta))
@@ -0,0 +1,64 @@
+"""Tokens JWT cuya verificación de lista negra pasa por el espacio de caché `sesiones`.
+
+Con `ROTATE_REFRESH_TOKENS` y `BLACKLIST_AFTER_ROTATION` cada renovación consulta
+`BlacklistedToken` para el token recibido. Un token en la lista negra no sale de
+ella, así que ese resultado se guarda hasta que el token expira. El "no está" se
+guarda solo `JWT_LISTA_NEGRA_CACHE_NEGATIVO` segundos, y con una caché por proceso
+no se guarda (0), porque otro worker podría haber agregado el token a la lista.
+`blacklist()` y la señal de `BlacklistedToken` escriben el resultado positivo de
+inmediato.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken as RefreshTokenBase
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from tramites.cache import cache_de
+
+
+def clave_lista_negra(jti: str) -> str:
+    return f"jwt:lista-negra:{jti}"
+
+
+def marcar_en_lista_negra(jti: str, expira: datetime) -> None:
+    """Recuerda que el token está en la lista negra hasta su expiración."""
+    segundos = int((expira - timezone.now()).total_seconds())
+    if segundos > 0:
+        cache_de("sesiones").set(clave_lista_negra(jti), True, segundos)
+
+
+class RefreshToken(RefreshTokenBase):
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        cache = cache_de("sesiones")
+        en_lista = cache.get(clave_lista_negra(jti))
+        if en_lista is None:
+            en_lista = BlacklistedToken.objects.filter(token__jti=jti).exists()
+            if en_lista:
+                marcar_en_lista_negra(jti, datetime_from_epoch(self.payload["exp"]))
+            elif settings.JWT_LISTA_NEGRA_CACHE_NEGATIVO > 0:
+                cache.set(clave_lista_negra(jti), False, settings.JWT_LISTA_NEGRA_CACHE_NEGATIVO)
+        if en_lista:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        resultado = super().blacklist()
+        marcar_en_lista_negra(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload["exp"]))
+        return resultado
+
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
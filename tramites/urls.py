@@ -20,6 +20,18 @@ urlpatterns = [
     path("tramites/<int:pk>/", views.CasoInternoDetailView.as_view(), name="casointerno-detail"),
     path("tramites/<int:pk>/editar/", views.CasoInternoUpdateView.as_view(), name="casointerno-update"),
     path("tramites/<int:pk>/eliminar/", views.CasoInternoDeleteView.as_view(), name="casointerno-delete"),
+    path(
+        "tramites/<int:pk>/expediente.pdf",
+        views.CasoInternoExpedientePDFView.as_view(),
+        name="casointerno-expediente-pdf",
+    ),
+    path(
+        "tramites/<int:pk>/expediente/solicitar/",
+        views.CasoInternoExpedienteSolicitarView.as_view(),
+        name="casointerno-expediente-solicitar",
+    ),
+    path("tramites/exportar/", views.CasoInternoExportarView.as_view(), name="casointerno-exportar"),
+    path("tramites/estatus/", views.CasoInternoEstatusMasivoView.as_view(), name="casointerno-estatus-masivo"),
     path(
         "tramites/<int:pk>/estatus/agregar/",
         views.CasoInternoEstatusCreateView.as_view(),
@@ -71,7 +83,27 @@ urlpatterns = [
         name="tramite-caso-estatus-delete",
     ),
     path("tramites/catalogos/cct/", views.CCTLookupView.as_view(), name="cct-lookup"),
+    path("tramites/catalogos/cct/sugerencias/", views.CCTSugerenciasView.as_view(), name="cct-sugerencias"),
+    path(
+        "tramites/catalogos/<slug:catalogo>/activos/",
+        views.CatalogoActivosView.as_view(),
+        name="catalogo-activos",
+    ),
+    # Tareas en segundo plano
+    path("tareas/<int:pk>/", views.TareaEstadoView.as_view(), name="tarea-estado"),
+    path("tareas/<int:pk>/descargar/", views.TareaDescargarView.as_view(), name="tarea-descargar"),
+    # Tablero de supervisión
+    path("tablero/", views.TableroView.as_view(), name="tablero"),
+    path("tablero/resumen.json", views.TableroResumenView.as_view(), name="tablero-resumen"),
+    # Vencimientos
+    path("vencimientos/", views.VencimientosListView.as_view(), name="vencimientos"),
+    path("vencimientos/resumen.json", views.VencimientosResumenView.as_view(), name="vencimientos-resumen"),
     # Herramientas
     path("herramientas/", views.ToolIndexView.as_view(), name="herramientas-index"),
     path("herramientas/analizador/", views.TramiteEligibilityToolView.as_view(), name="analizador-tramite"),
+    path(
+        "herramientas/analizador/cribado/",
+        views.CribadoElegibilidadView.as_view(),
+        name="analizador-cribado",
+    ),
 ]
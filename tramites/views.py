@@ -2,25 +2,53 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import uuid
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import PurePath
+from typing import Any, Callable, Dict
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
+from django.core.files.storage import default_storage
 from django.db import DatabaseError, models as dj_models
-from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, JsonResponse
+from django.middleware.csrf import get_token
 from django.urls import reverse_lazy
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.utils.translation import gettext_lazy as _
 from django.views import View
-from django.views.generic import DetailView, TemplateView
+from django.views.generic import DetailView, ListView, TemplateView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.edit import FormView
 from django_filters.views import FilterView
 from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 from tramites import filters, forms, models, serializers
-from tramites.utils import normalise_sistema
+from tramites.services import (
+    catalogo_cct,
+    catalogos,
+    cribado,
+    elegibilidad,
+    estatus_masivo,
+    expediente_pdf,
+    fragmentos,
+    tablero,
+    tareas,
+    vencimientos,
+    versiones,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +73,102 @@ def ensure_cct_catalog_loaded() -> None:
         logger.warning("No se pudo verificar el catálogo de CCT (base de datos no disponible).")
 
 
+async def aensure_cct_catalog_loaded() -> None:
+    if not _CCT_CATALOG_LOADED:
+        await sync_to_async(ensure_cct_catalog_loaded)()
+
+
+def _autorizar(request: HttpRequest, permiso: str) -> tuple[bool, bool]:
+    """(autenticado, con permiso) por sesión o, si no hay sesión, por JWT `Bearer`."""
+    usuario = request.user
+    if not usuario.is_authenticated:
+        try:
+            resultado = JWTAuthentication().authenticate(request)
+        except (AuthenticationFailed, InvalidToken):
+            resultado = None
+        if resultado is None:
+            return False, False
+        usuario = request.user = resultado[0]
+    return True, not permiso or usuario.has_perm(permiso)
+
+
+class AsyncPermisoMixin:
+    """Equivalente async de LoginRequiredMixin + PermissionRequiredMixin.
+
+    Sesión, usuario y permisos se resuelven en una sola llamada síncrona; el resto
+    de la vista corre en el event loop. Con ASGI (uvicorn) una petición en espera de
+    la base de datos o del caché no ocupa un worker.
+    """
+
+    permission_required = ""
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        autenticado, permitido = await sync_to_async(_autorizar)(request, self.permission_required)
+        if not autenticado:
+            return redirect_to_login(request.get_full_path())
+        if not permitido:
+            raise DjangoPermissionDenied
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def _responder_condicional(
+    request: HttpRequest, version: versiones.Version, etag: str, construir: Callable[[], HttpResponse]
+) -> HttpResponse:
+    """304 si el cliente ya tiene `etag`; si no, construye la respuesta completa.
+
+    `private, no-cache` obliga al navegador a revalidar (también al regresar con
+    "atrás") y evita que un proxy comparta la respuesta entre usuarios. Con mensajes
+    pendientes (p. ej. tras un POST sin JS) la página no es la de esa versión: se
+    construye completa y sin validadores para que el aviso no quede en la copia del navegador.
+    """
+    if len(messages.get_messages(request)):
+        respuesta = construir()
+        patch_cache_control(respuesta, private=True, no_cache=True)
+        return respuesta
+    modificado = int(version.modificado.timestamp())
+    respuesta = get_conditional_response(request, etag=etag, last_modified=modificado) or construir()
+    if respuesta.status_code in (200, 304):
+        respuesta["ETag"] = etag
+        respuesta["Last-Modified"] = http_date(modificado)
+        patch_cache_control(respuesta, private=True, no_cache=True)
+    return respuesta
+
+
+class DetalleCondicionalMixin(ABC):
+    """GET de detalle con ETag/Last-Modified, comprobados antes de cargar el objeto y el contexto."""
+
+    @abstractmethod
+    def version(self) -> versiones.Version | None:
+        """Versión de lo que muestra la página, resuelta sin cargar el objeto."""
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        version = self.version()
+        if version is None:
+            return super().get(request, *args, **kwargs)
+        # La página depende de los permisos del usuario y lleva un token derivado de su secreto CSRF;
+        # get_token() lo fija desde la primera visita para que la siguiente ya pueda revalidar.
+        # La generación de fragmentos cambia al editar un catálogo, cuyos nombres y opciones también se muestran;
+        # se lee una vez por petición y los fragmentos de la página la reutilizan.
+        get_token(request)
+        etag = version.etag(request.user.pk, request.META["CSRF_COOKIE"], fragmentos.generacion())
+        self.version_vigente = version
+        return _responder_condicional(request, version, etag, partial(super().get, request, *args, **kwargs))
+
+
+class RetrieveCondicionalMixin:
+    """`retrieve` de la API con ETag/Last-Modified según `actualizado_en` del registro."""
+
+    def retrieve(self, request, *args, **kwargs):
+        version = versiones.version_registro(
+            self.filter_queryset(self.get_queryset()),
+            **{self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]},
+        )
+        if version is None:
+            return super().retrieve(request, *args, **kwargs)
+        etag = version.etag(request.accepted_renderer.format)
+        return _responder_condicional(request, version, etag, partial(super().retrieve, request, *args, **kwargs))
+
+
 # --------------------------------------------------------------------------- #
 # Vistas HTML (Django templates + HTMX)
 # --------------------------------------------------------------------------- #
@@ -121,8 +245,93 @@ class TramiteEligibilityToolView(LoginRequiredMixin, TemplateView):
                     {"value": "issste", "label": "ISSSTE · 60 días requeridos", "days": 60},
                     {"value": "imss", "label": "IMSS · 90 días requeridos", "days": 90},
                 ],
+                "analisis_guardado": None,
             }
         )
+        analisis_pk = self.request.GET.get("analisis")
+        if analisis_pk and analisis_pk.isdigit():
+            # El análisis guardado trae datos personales del docente; la calculadora sola no.
+            if not self.request.user.has_perm("licencias.view_analisiselegibilidad"):
+                raise DjangoPermissionDenied
+            analisis = get_object_or_404(models.AnalisisElegibilidad, pk=analisis_pk)
+            ctx["analisis_guardado"] = serializers.AnalisisElegibilidadSerializer(analisis).data
+        return ctx
+
+
+class TableroView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
+    """Tablero de supervisión con conteos precalculados de trámites."""
+
+    permission_required = "licencias.view_casointerno"
+    usa_replica = True
+    template_name = "tramites/tablero/tablero.html"
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        ctx = super().get_context_data(**kwargs)
+        resumen = tablero.resumen_tablero()
+        ctx["secciones"] = [
+            {"clave": clave, "titulo": titulo, "filas": resumen[clave]}
+            for clave, titulo in models.DIMENSIONES_TABLERO_CHOICES
+        ]
+        ctx["total_abiertos"] = sum(fila["abiertos"] for fila in resumen[models.DIMENSION_ESTATUS])
+        ctx["total_casos"] = sum(fila["total"] for fila in resumen[models.DIMENSION_ESTATUS])
+        return ctx
+
+
+class TableroResumenView(AsyncPermisoMixin, View):
+    """Conteos del tablero en JSON (para widgets o consultas externas)."""
+
+    permission_required = "licencias.view_casointerno"
+    usa_replica = True
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        return JsonResponse(await tablero.aresumen_tablero())
+
+
+def _parametros_vencimiento(params) -> tuple[int, bool]:
+    """Lee `dias` e `incluir_vencidos` de la query string con valores por defecto."""
+    try:
+        dias = max(0, min(int(params.get("dias", "")), 365))
+    except ValueError:
+        dias = vencimientos.DIAS_ALERTA_DEFAULT
+    incluir_vencidos = params.get("incluir_vencidos", "1") not in {"0", "false", "no"}
+    return dias, incluir_vencidos
+
+
+class VencimientosResumenView(AsyncPermisoMixin, View):
+    """Alertas de vencimiento por asesor en JSON."""
+
+    permission_required = "licencias.view_casointerno"
+    usa_replica = True
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        dias, _ = _parametros_vencimiento(request.GET)
+        alertas = await vencimientos.aresumen_por_asesor(dias)
+        return JsonResponse({"dias": dias, "asesores": [alerta.as_dict() for alerta in alertas]})
+
+
+class VencimientosListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+    """Trámites abiertos cuya fecha de término está vencida o próxima."""
+
+    permission_required = "licencias.view_casointerno"
+    usa_replica = True
+    paginate_by = 25
+    template_name = "tramites/vencimientos/vencimientos_list.html"
+    context_object_name = "casos"
+
+    def get_queryset(self):
+        self.dias, self.incluir_vencidos = _parametros_vencimiento(self.request.GET)
+        self.asesor = (self.request.GET.get("asesor") or "").strip()
+        qs = vencimientos.casos_por_vencer(self.dias, incluir_vencidos=self.incluir_vencidos)
+        return vencimientos.filtrar_asesor(qs, self.asesor).select_related("cct", "estatus")
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        ctx = super().get_context_data(**kwargs)
+        ctx.update(
+            dias=self.dias,
+            incluir_vencidos=self.incluir_vencidos,
+            asesor=self.asesor,
+            alertas=vencimientos.resumen_por_asesor(self.dias),
+        )
         return ctx
 
 
@@ -132,23 +341,17 @@ class CCTCatalogContextMixin:
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
         ensure_cct_catalog_loaded()
-        catalogo = list(
-            models.CCTSecundaria.objects.order_by("cct").values(
-                "cct", "nombre", "servicio", "asesor", "sostenimiento"
-            )
-        )
-        for item in catalogo:
-            item["sostenimiento"] = normalise_sistema(item.get("sostenimiento"))
-        ctx["cct_catalogo"] = catalogo
+        ctx["cct_catalogo"] = catalogo_cct.catalogo_formulario()
         ctx["cct_lookup_url"] = reverse_lazy("tramites:cct-lookup")
         ctx["cct_api_url"] = reverse_lazy("tramites_api:cct-list")
-        ctx["prefijos_oficio"] = list(models.PrefijoOficio.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["cct_sugerencias_url"] = reverse_lazy("tramites:cct-sugerencias")
+        ctx["prefijos_oficio"] = catalogos.activos(models.PrefijoOficio)
         ctx["prefijos_oficio_api_url"] = reverse_lazy("tramites_api:prefijo-oficio-list")
-        ctx["tipos_violencia"] = list(models.TipoViolencia.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["tipos_violencia"] = catalogos.activos(models.TipoViolencia)
         ctx["tipos_violencia_api_url"] = reverse_lazy("tramites_api:tipo-violencia-list")
-        ctx["solicitantes"] = list(models.Solicitante.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["solicitantes"] = catalogos.activos(models.Solicitante)
         ctx["solicitantes_api_url"] = reverse_lazy("tramites_api:solicitante-list")
-        ctx["destinatarios"] = list(models.Destinatario.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["destinatarios"] = catalogos.activos(models.Destinatario)
         ctx["destinatarios_api_url"] = reverse_lazy("tramites_api:destinatario-list")
         return ctx
 
@@ -161,6 +364,7 @@ class CasoInternoListView(LoginRequiredMixin, PermissionRequiredMixin, FilterVie
     """Listado principal de trámites registrados."""
 
     permission_required = "licencias.view_casointerno"
+    usa_replica = True
     model = models.CasoInterno
     paginate_by = 25
     filterset_class = filters.CasoInternoFilter
@@ -175,6 +379,13 @@ class CasoInternoListView(LoginRequiredMixin, PermissionRequiredMixin, FilterVie
             .select_related("cct", "estatus", "tipo_inicial", "area_origen_inicial")
         )
 
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        ctx = super().get_context_data(**kwargs)
+        ctx["casos_version"] = fragmentos.huella_registros(ctx["casos"])
+        if self.request.user.has_perm("licencias.change_casointerno"):
+            ctx["estatus_masivo_form"] = forms.EstatusMasivoForm()
+        return ctx
+
 
 class CasoInternoCreateView(
     CasoInternoFormMixin, LoginRequiredMixin, PermissionRequiredMixin, CreateView
@@ -228,17 +439,23 @@ class CasoInternoUpdateView(
 
 
 class CasoInternoDetailView(
-    CasoInternoFormMixin, LoginRequiredMixin, PermissionRequiredMixin, DetailView
+    CasoInternoFormMixin, LoginRequiredMixin, PermissionRequiredMixin, DetalleCondicionalMixin, DetailView
 ):
     """Detalle de un trámite registrado."""
 
     permission_required = "licencias.view_casointerno"
+    usa_replica = True
     model = models.CasoInterno
     template_name = "tramites/tramites/tramites_detail.html"
     context_object_name = "caso"
 
+    def version(self) -> versiones.Version | None:
+        return versiones.version_caso(self.kwargs["pk"])
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
+        # Bitácora y trámites se cargan solo si su fragmento no está en caché.
+        ctx["caso_version"] = self.version_vigente.huella
         ctx["historial_estatus"] = self.object.historial_estatus.select_related(
             "estatus_anterior", "estatus_nuevo", "usuario"
         )
@@ -248,17 +465,276 @@ class CasoInternoDetailView(
         ctx["tramite_caso_form"] = forms.TramiteCasoForm(prefix="tramite_caso")
         ctx["estatus_tramite_form"] = forms.HistorialEstatusTramiteCasoForm()
         ctx["estatus_caso_form"] = forms.HistorialEstatusCasoForm()
-        ctx["prefijos_oficio"] = list(models.PrefijoOficio.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["prefijos_oficio"] = catalogos.activos(models.PrefijoOficio)
         return ctx
 
 
-class TramiteCasoCreateView(LoginRequiredMixin, PermissionRequiredMixin, CreateView):
+def _tarea_payload(tarea: models.TareaSegundoPlano) -> Dict[str, Any]:
+    return {
+        "id": tarea.pk,
+        "tipo": tarea.tipo,
+        "estatus": tarea.estatus,
+        "estatus_display": tarea.get_estatus_display(),
+        "terminada": tarea.terminada,
+        "creado_en": tarea.creado_en.isoformat() if tarea.creado_en else None,
+        "terminado_en": tarea.terminado_en.isoformat() if tarea.terminado_en else None,
+        "error": tarea.mensaje_error,
+        "estado_url": str(reverse_lazy("tramites:tarea-estado", kwargs={"pk": tarea.pk})),
+        "resultado_url": _url_resultado(tarea),
+    }
+
+
+def _url_resultado(tarea: models.TareaSegundoPlano) -> str | None:
+    if tarea.estatus != models.TAREA_COMPLETADA:
+        return None
+    if tarea.tipo == "expediente_pdf":
+        # El expediente no se copia a la tarea: se sirve desde su caché en disco.
+        url = reverse_lazy("tramites:casointerno-expediente-pdf", kwargs={"pk": tarea.parametros["caso"]})
+        return f"{url}?descargar=1"
+    return str(reverse_lazy("tramites:tarea-descargar", kwargs={"pk": tarea.pk}))
+
+
+class EncolarTareaMixin:
+    """Encola una tarea y responde JSON (202) o redirige con mensaje si no es AJAX."""
+
+    def responder_tarea(self, request: HttpRequest, tarea: models.TareaSegundoPlano, fallback_url: str):
+        if "application/json" in request.headers.get("Accept", ""):
+            return JsonResponse(_tarea_payload(tarea), status=202)
+        messages.info(
+            request,
+            _("La solicitud se está procesando en segundo plano (tarea #%(pk)s).") % {"pk": tarea.pk},
+        )
+        return redirect(fallback_url)
+
+
+class CasoInternoExpedientePDFView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """Descarga el expediente en PDF si ya está generado; si no, ofrece solicitarlo.
+
+    Un GET no encola nada: rastreadores, precargas y dobles clics no deben generar
+    PDFs, y la vista lee de la réplica. La generación se pide con POST a
+    `CasoInternoExpedienteSolicitarView`.
+    """
+
+    permission_required = "licencias.view_casointerno"
+    usa_replica = True
+    template_name = "tramites/tramites/expediente_pendiente.html"
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        caso = get_object_or_404(models.CasoInterno, pk=kwargs.get("pk"))
+        ruta = expediente_pdf.expediente_path(caso)
+        if not ruta.exists():
+            solicitar_url = str(reverse_lazy("tramites:casointerno-expediente-solicitar", kwargs={"pk": caso.pk}))
+            if "application/json" in request.headers.get("Accept", ""):
+                return JsonResponse(
+                    {"detail": "El expediente aún no se ha generado.", "solicitar_url": solicitar_url}, status=202
+                )
+            return render(request, self.template_name, {"caso": caso, "solicitar_url": solicitar_url}, status=202)
+        return FileResponse(
+            ruta.open("rb"),
+            content_type="application/pdf",
+            as_attachment=request.GET.get("descargar") == "1",
+            filename=f"expediente-{caso.pk}.pdf",
+        )
+
+
+class CasoInternoExpedienteSolicitarView(
+    EncolarTareaMixin, LoginRequiredMixin, PermissionRequiredMixin, View
+):
+    """Encola la generación del expediente en PDF para no ocupar el worker web."""
+
+    permission_required = "licencias.view_casointerno"
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        caso = get_object_or_404(models.CasoInterno, pk=kwargs.get("pk"))
+        tarea = tareas.encolar_tarea("expediente_pdf", {"caso": caso.pk}, usuario=request.user, reutilizar=True)
+        return self.responder_tarea(
+            request, tarea, str(reverse_lazy("tramites:casointerno-detail", kwargs={"pk": caso.pk}))
+        )
+
+
+class CasoInternoExportarView(EncolarTareaMixin, LoginRequiredMixin, PermissionRequiredMixin, View):
+    """Encola la exportación a CSV del listado con los filtros actuales."""
+
+    permission_required = "licencias.view_casointerno"
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        filtros = request.GET.urlencode()
+        tarea = tareas.encolar_tarea("exportar_tramites", {"filtros": filtros}, usuario=request.user)
+        listado = str(reverse_lazy("tramites:casointerno-list"))
+        return self.responder_tarea(request, tarea, f"{listado}?{filtros}" if filtros else listado)
+
+
+class CasoInternoEstatusMasivoView(LoginRequiredMixin, PermissionRequiredMixin, FormView):
+    """Cambia el estatus de los trámites seleccionados, o de todos los filtrados, en una sola operación."""
+
+    permission_required = "licencias.change_casointerno"
+    form_class = forms.EstatusMasivoForm
+    http_method_names = ["post"]
+
+    def form_valid(self, form):
+        if form.cleaned_data["todos"]:
+            filtro = filters.CasoInternoFilter(self.request.GET, queryset=models.CasoInterno.objects.all())
+            if not filtro.is_valid():
+                # Un filtro inválido se ignoraría y el cambio alcanzaría más trámites de los que se ven.
+                messages.error(self.request, _("Corrige los filtros antes de aplicar el cambio a todos."))
+                return redirect(self.get_success_url())
+            casos = filtro.qs
+        else:
+            casos = form.cleaned_data["casos"]
+        resultado = estatus_masivo.cambiar_estatus(
+            casos,
+            form.cleaned_data["estatus"],
+            usuario=self.request.user,
+            comentario=form.cleaned_data["comentario"],
+        )
+        messages.success(
+            self.request,
+            _("Estatus actualizado en %(actualizados)s trámites (%(sin_cambio)s ya lo tenían).")
+            % {"actualizados": resultado.actualizados, "sin_cambio": resultado.sin_cambio},
+        )
+        return super().form_valid(form)
+
+    def form_invalid(self, form):
+        for error in form.non_field_errors() or [_("Selecciona el estatus nuevo.")]:
+            messages.error(self.request, error)
+        return redirect(self.get_success_url())
+
+    def get_success_url(self):
+        listado = str(reverse_lazy("tramites:casointerno-list"))
+        filtros = self.request.GET.urlencode()
+        return f"{listado}?{filtros}" if filtros else listado
+
+
+class CribadoElegibilidadView(EncolarTareaMixin, LoginRequiredMixin, PermissionRequiredMixin, View):
+    """Recibe la hoja de cálculo de RR. HH. y encola su evaluación masiva."""
+
+    permission_required = "licencias.view_analisiselegibilidad"
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        fallback = reverse_lazy("tramites:analizador-tramite")
+        archivo = request.FILES.get("archivo")
+        regimen = (request.POST.get("regimen") or elegibilidad.REGIMEN_DEFAULT).lower()
+        errores: list[str] = []
+        fecha_analisis = elegibilidad.parsear_fecha(request.POST.get("fecha_analisis"), "Fecha de análisis", errores)
+        if archivo is None or not cribado.extension_valida(archivo.name):
+            errores.append("Adjunta un archivo CSV o Excel (.csv, .xlsx).")
+        if regimen not in elegibilidad.DIAS_REQUERIDOS_POR_REGIMEN:
+            errores.append(f"Régimen desconocido: {regimen}.")
+        if errores:
+            if "application/json" in request.headers.get("Accept", ""):
+                return JsonResponse({"errores": errores}, status=400)
+            for error in errores:
+                messages.error(request, error)
+            return redirect(fallback)
+        ruta = default_storage.save(f"cribados/{uuid.uuid4().hex}{PurePath(archivo.name).suffix.lower()}", archivo)
+        tarea = tareas.encolar_tarea(
+            "cribado_elegibilidad",
+            {
+                "archivo": ruta,
+                "nombre": archivo.name,
+                "regimen": regimen,
+                "fecha_analisis": fecha_analisis.isoformat() if fecha_analisis else None,
+            },
+            usuario=request.user,
+        )
+        return self.responder_tarea(request, tarea, fallback)
+
+
+class TareaAccessMixin(LoginRequiredMixin):
+    """Solo quien solicitó la tarea (o personal staff) puede consultarla."""
+
+    def get_tarea(self, request: HttpRequest, pk: int) -> models.TareaSegundoPlano:
+        tarea = get_object_or_404(models.TareaSegundoPlano, pk=pk)
+        if tarea.creado_por_id != request.user.pk and not request.user.is_staff:
+            raise Http404
+        return tarea
+
+
+class TareaEstadoView(TareaAccessMixin, View):
+    """Estado de una tarea para que la interfaz consulte hasta que termine."""
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        tarea = self.get_tarea(request, kwargs.get("pk"))
+        return JsonResponse(_tarea_payload(tarea))
+
+
+class TareaDescargarView(TareaAccessMixin, View):
+    """Descarga el archivo generado por una tarea completada."""
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> FileResponse:
+        tarea = self.get_tarea(request, kwargs.get("pk"))
+        if tarea.estatus != models.TAREA_COMPLETADA or not tarea.resultado:
+            raise Http404
+        return FileResponse(tarea.resultado.open("rb"), as_attachment=True)
+
+
+class ParcialHtmxMixin(ABC):
+    """Con `HX-Request` responde solo con la tabla que cambió en lugar de redirigir.
+
+    Sin JavaScript las vistas siguen redirigiendo al detalle. Con HTMX se
+    renderiza `plantilla_parcial`, que incluye los mensajes fuera de banda, y la
+    página no se vuelve a cargar completa.
+    """
+
+    plantilla_parcial = ""
+    evento_htmx = ""
+
+    def es_htmx(self) -> bool:
+        return self.request.headers.get("HX-Request") == "true"
+
+    @abstractmethod
+    def get_contexto_parcial(self) -> Dict[str, Any]:
+        """Contexto de `plantilla_parcial` tras el cambio."""
+
+    def responder_parcial(self, respuesta: HttpResponse) -> HttpResponse:
+        if not self.es_htmx():
+            return respuesta
+        parcial = render(self.request, self.plantilla_parcial, self.get_contexto_parcial())
+        if self.evento_htmx:
+            parcial["HX-Trigger"] = self.evento_htmx
+        return parcial
+
+    def responder_mensajes(self) -> HttpResponse:
+        """Nada que actualizar: solo los mensajes pendientes, sin tocar la tabla."""
+        respuesta = render(self.request, "tramites/partials/mensajes_oob.html")
+        respuesta["HX-Reswap"] = "none"
+        return respuesta
+
+
+class HistorialCasoParcialMixin(ParcialHtmxMixin):
+    plantilla_parcial = "tramites/partials/respuesta_caso_historial.html"
+
+    def get_contexto_parcial(self) -> Dict[str, Any]:
+        return {
+            "caso": self.caso,
+            "caso_version": versiones.version_caso(self.caso.pk).huella,
+            "historial_estatus": self.caso.historial_estatus.select_related(
+                "estatus_anterior", "estatus_nuevo", "usuario"
+            ),
+        }
+
+
+class HistorialTramiteParcialMixin(ParcialHtmxMixin):
+    plantilla_parcial = "tramites/partials/respuesta_tramite_historial.html"
+
+    def get_contexto_parcial(self) -> Dict[str, Any]:
+        return {
+            "tramite": self.tramite,
+            "historial_estatus": self.tramite.historial_estatus.select_related(
+                "estatus_anterior", "estatus_nuevo", "usuario"
+            ),
+        }
+
+
+class TramiteCasoCreateView(ParcialHtmxMixin, LoginRequiredMixin, PermissionRequiredMixin, CreateView):
     """Permite agregar trámites adicionales a un caso."""
 
     permission_required = "licencias.add_tramitecaso"
     model = models.TramiteCaso
     form_class = forms.TramiteCasoForm
     template_name = "tramites/tramites/tramite_caso_form.html"
+    plantilla_parcial = "tramites/partials/respuesta_caso_tramites.html"
+    evento_htmx = "tramite-caso-agregado"
 
     def dispatch(self, request, *args, **kwargs):
         self.caso = get_object_or_404(models.CasoInterno, pk=kwargs.get("caso_pk"))
@@ -280,26 +756,44 @@ class TramiteCasoCreateView(LoginRequiredMixin, PermissionRequiredMixin, CreateV
             comentario=self.request.POST.get("comentario_estatus", ""),
         )
         messages.success(self.request, _("Trámite agregado al caso."))
-        return response
+        return self.responder_parcial(response)
+
+    def form_invalid(self, form):
+        if not self.es_htmx():
+            return super().form_invalid(form)
+        errores = " ".join(str(error) for errores in form.errors.values() for error in errores)
+        messages.error(self.request, _("No se pudo agregar el trámite. %(errores)s") % {"errores": errores})
+        return self.responder_mensajes()
 
     def get_success_url(self):
         return reverse_lazy("tramites:casointerno-detail", kwargs={"pk": self.caso.pk})
 
+    def get_contexto_parcial(self) -> Dict[str, Any]:
+        return {
+            "caso": self.caso,
+            "caso_version": versiones.version_caso(self.caso.pk).huella,
+            "tramites_caso": self.caso.tramites_relacionados.select_related("tipo", "estatus").order_by("-fecha"),
+        }
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
         ctx["caso"] = self.caso
-        ctx["prefijos_oficio"] = list(models.PrefijoOficio.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["prefijos_oficio"] = catalogos.activos(models.PrefijoOficio)
         return ctx
 
 
-class TramiteCasoDetailView(LoginRequiredMixin, PermissionRequiredMixin, DetailView):
+class TramiteCasoDetailView(LoginRequiredMixin, PermissionRequiredMixin, DetalleCondicionalMixin, DetailView):
     """Detalle de un trámite asociado a un caso."""
 
     permission_required = "licencias.view_tramitecaso"
+    usa_replica = True
     model = models.TramiteCaso
     template_name = "tramites/tramites/tramite_caso_detail.html"
     context_object_name = "tramite"
 
+    def version(self) -> versiones.Version | None:
+        return versiones.version_tramite(self.kwargs["pk"], self.kwargs.get("caso_pk"))
+
     def get_queryset(self):
         qs = (
             super()
@@ -357,7 +851,7 @@ class TramiteCasoUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateV
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
         ctx["caso"] = self.object.caso
-        ctx["prefijos_oficio"] = list(models.PrefijoOficio.objects.filter(esta_activo=True).order_by("nombre"))
+        ctx["prefijos_oficio"] = catalogos.activos(models.PrefijoOficio)
         return ctx
 
 
@@ -378,12 +872,14 @@ class TramiteCasoDeleteView(LoginRequiredMixin, PermissionRequiredMixin, DeleteV
     def get_success_url(self):
         return reverse_lazy("tramites:casointerno-detail", kwargs={"pk": self.object.caso_id})
 
-    def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        messages.success(request, _("Trámite eliminado."))
-        return super().delete(request, *args, **kwargs)
+    def form_valid(self, form):
+        # En Django 4 el POST de DeleteView pasa por form_valid, no por delete().
+        response = super().form_valid(form)
+        messages.success(self.request, _("Trámite eliminado."))
+        return response
 
 
-class TramiteCasoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin, FormView):
+class TramiteCasoEstatusCreateView(HistorialTramiteParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, FormView):
     """Agrega un cambio de estatus a un trámite y actualiza el estatus actual."""
 
     permission_required = "licencias.change_tramitecaso"
@@ -421,7 +917,7 @@ class TramiteCasoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin,
         self.tramite.estatus = nuevo_estatus
         self.tramite.save(update_fields=["estatus", "actualizado_en"])
         messages.success(self.request, _("Estatus del trámite actualizado."))
-        return super().form_valid(form)
+        return self.responder_parcial(super().form_valid(form))
 
     def get_success_url(self):
         return reverse_lazy(
@@ -431,6 +927,8 @@ class TramiteCasoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin,
 
     def form_invalid(self, form):
         messages.error(self.request, _("No se pudo registrar el cambio de estatus."))
+        if self.es_htmx():
+            return self.responder_mensajes()
         return redirect(
             "tramites:tramite-caso-detail",
             caso_pk=self.tramite.caso_id,
@@ -438,7 +936,7 @@ class TramiteCasoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin,
         )
 
 
-class TramiteCasoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class TramiteCasoEstatusUpdateView(HistorialTramiteParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
     """Edita el último cambio de estatus de un trámite."""
 
     permission_required = "licencias.change_tramitecaso"
@@ -470,7 +968,7 @@ class TramiteCasoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin,
         self.tramite.estatus = form.cleaned_data["estatus_nuevo"]
         self.tramite.save(update_fields=["estatus", "actualizado_en"])
         messages.success(self.request, _("Cambio de estatus actualizado."))
-        return response
+        return self.responder_parcial(response)
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
@@ -484,7 +982,7 @@ class TramiteCasoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin,
         )
 
 
-class TramiteCasoEstatusDeleteView(LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
+class TramiteCasoEstatusDeleteView(HistorialTramiteParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
     """Elimina el último cambio de estatus de un trámite y revierte el estatus si aplica."""
 
     permission_required = "licencias.change_tramitecaso"
@@ -510,14 +1008,12 @@ class TramiteCasoEstatusDeleteView(LoginRequiredMixin, PermissionRequiredMixin,
             raise Http404
         return obj
 
-    def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        obj = self.get_object()
-        response = super().delete(request, *args, **kwargs)
-        nuevo_estatus = obj.estatus_anterior
-        self.tramite.estatus = nuevo_estatus
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        self.tramite.estatus = self.object.estatus_anterior
         self.tramite.save(update_fields=["estatus", "actualizado_en"])
-        messages.success(request, _("Cambio de estatus eliminado y estatus del trámite actualizado."))
-        return response
+        messages.success(self.request, _("Cambio de estatus eliminado y estatus del trámite actualizado."))
+        return self.responder_parcial(response)
 
     def get_success_url(self):
         return reverse_lazy(
@@ -541,15 +1037,17 @@ class CasoInternoDeleteView(
     template_name = "tramites/tramites/tramites_confirm_delete.html"
     success_url = reverse_lazy("tramites:casointerno-list")
 
-    def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        messages.success(request, _("Trámite eliminado."))
-        return super().delete(request, *args, **kwargs)
+    def form_valid(self, form):
+        # En Django 4 el POST de DeleteView pasa por form_valid, no por delete().
+        response = super().form_valid(form)
+        messages.success(self.request, _("Trámite eliminado."))
+        return response
 
     def get_success_url(self):
         return self.request.GET.get("from_list") or str(self.success_url)
 
 
-class CasoInternoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin, FormView):
+class CasoInternoEstatusCreateView(HistorialCasoParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, FormView):
     """Agrega un cambio de estatus al trámite principal y actualiza su estatus actual."""
 
     permission_required = "licencias.change_casointerno"
@@ -585,17 +1083,19 @@ class CasoInternoEstatusCreateView(LoginRequiredMixin, PermissionRequiredMixin,
         self.caso.estatus = nuevo_estatus
         self.caso.save(update_fields=["estatus", "actualizado_en"])
         messages.success(self.request, _("Estatus del trámite actualizado."))
-        return super().form_valid(form)
+        return self.responder_parcial(super().form_valid(form))
 
     def form_invalid(self, form):
         messages.error(self.request, _("No se pudo registrar el cambio de estatus."))
+        if self.es_htmx():
+            return self.responder_mensajes()
         return redirect("tramites:casointerno-detail", pk=self.caso.pk)
 
     def get_success_url(self):
         return reverse_lazy("tramites:casointerno-detail", kwargs={"pk": self.caso.pk})
 
 
-class CasoInternoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class CasoInternoEstatusUpdateView(HistorialCasoParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
     """Permite editar el último cambio de estatus del trámite principal."""
 
     permission_required = "licencias.change_casointerno"
@@ -629,7 +1129,7 @@ class CasoInternoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin,
         self.caso.estatus = form.cleaned_data["estatus_nuevo"]
         self.caso.save(update_fields=["estatus", "actualizado_en"])
         messages.success(self.request, _("Cambio de estatus actualizado."))
-        return response
+        return self.responder_parcial(response)
 
     def get_success_url(self):
         return reverse_lazy("tramites:casointerno-detail", kwargs={"pk": self.caso.pk})
@@ -640,7 +1140,7 @@ class CasoInternoEstatusUpdateView(LoginRequiredMixin, PermissionRequiredMixin,
         return ctx
 
 
-class CasoInternoEstatusDeleteView(LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
+class CasoInternoEstatusDeleteView(HistorialCasoParcialMixin, LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
     """Elimina el último cambio de estatus del trámite principal y revierte el estatus si aplica."""
 
     permission_required = "licencias.change_casointerno"
@@ -668,13 +1168,12 @@ class CasoInternoEstatusDeleteView(LoginRequiredMixin, PermissionRequiredMixin,
             raise Http404
         return obj
 
-    def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        obj = self.get_object()
-        response = super().delete(request, *args, **kwargs)
-        self.caso.estatus = obj.estatus_anterior
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        self.caso.estatus = self.object.estatus_anterior
         self.caso.save(update_fields=["estatus", "actualizado_en"])
-        messages.success(request, _("Cambio de estatus eliminado y estatus del trámite actualizado."))
-        return response
+        messages.success(self.request, _("Cambio de estatus eliminado y estatus del trámite actualizado."))
+        return self.responder_parcial(response)
 
     def get_success_url(self):
         return reverse_lazy("tramites:casointerno-detail", kwargs={"pk": self.caso.pk})
@@ -685,33 +1184,58 @@ class CasoInternoEstatusDeleteView(LoginRequiredMixin, PermissionRequiredMixin,
         return ctx
 
 
-class CCTLookupView(LoginRequiredMixin, PermissionRequiredMixin, View):
+class CCTLookupView(AsyncPermisoMixin, View):
     """Devuelve información del CCT desde el catálogo de secundarias."""
 
     permission_required = "licencias.add_casointerno"
+    usa_replica = True
 
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         codigo = (request.GET.get("cct") or "").strip().upper()
         if len(codigo) < 5:
             return JsonResponse({"found": False, "error": "CCT demasiado corto."}, status=200)
-        ensure_cct_catalog_loaded()
+        await aensure_cct_catalog_loaded()
+        datos = await catalogo_cct.aconsultar_cct(codigo)
+        return JsonResponse(datos or {"found": False}, status=200)
+
+
+class CCTSugerenciasView(AsyncPermisoMixin, View):
+    """Sugerencias para el autocompletado de CCT (`?search=` y `page_size`, máximo 25)."""
+
+    usa_replica = True
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         try:
-            cct_obj = models.CCTSecundaria.objects.get(cct__iexact=codigo)
-        except models.CCTSecundaria.DoesNotExist:
-            return JsonResponse({"found": False}, status=200)
-        return JsonResponse(
-            {
-                "found": True,
-                "cct": cct_obj.cct,
-                "c_nombre": cct_obj.nombre,
-                "sostenimiento_c_subcontrol": normalise_sistema(cct_obj.sostenimiento),
-                "tiponivelsub_c_servicion3": cct_obj.servicio or "",
-                "asesor": cct_obj.asesor or "",
-            }
-        )
+            limite = max(1, min(int(request.GET.get("page_size", "")), 25))
+        except ValueError:
+            limite = 7
+        await aensure_cct_catalog_loaded()
+        resultados = await catalogo_cct.asugerencias(request.GET.get("search") or "", limite)
+        return JsonResponse({"results": resultados})
+
+
+class CatalogoActivosView(AsyncPermisoMixin, View):
+    """Registros activos de un catálogo (`prefijooficio`, `tipoviolencia`, `solicitante`, `destinatario`)."""
+
+    usa_replica = True
+
+    serializadores = {
+        "prefijooficio": serializers.PrefijoOficioSerializer,
+        "tipoviolencia": serializers.TipoViolenciaSerializer,
+        "solicitante": serializers.SolicitanteSerializer,
+        "destinatario": serializers.DestinatarioSerializer,
+    }
+
+    async def get(self, request: HttpRequest, catalogo: str, *args: Any, **kwargs: Any) -> JsonResponse:
+        modelo = catalogos.POR_NOMBRE.get(catalogo)
+        if modelo is None:
+            raise Http404
+        registros = await catalogos.aactivos(modelo)
+        return JsonResponse({"results": self.serializadores[catalogo](registros, many=True).data})
 
 
 class CCTSecundariaViewSet(viewsets.ModelViewSet):
+    usa_replica = True
     queryset = models.CCTSecundaria.objects.all().order_by("cct")
     serializer_class = serializers.CCTSecundariaSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -734,6 +1258,23 @@ class CCTSecundariaViewSet(viewsets.ModelViewSet):
         except models.CCTSecundaria.DoesNotExist as exc:
             raise Http404 from exc
 
+    @action(detail=False, methods=["post"])
+    def buscar(self, request, *args, **kwargs):
+        """Resuelve varias claves de una vez: `{"ccts": [...]}` → encontrados y no encontrados."""
+        entrada = serializers.CCTLoteSerializer(data=request.data)
+        entrada.is_valid(raise_exception=True)
+        resultado = catalogo_cct.buscar_ccts(entrada.validated_data["ccts"])
+        encontrados = [cct for cct in resultado.values() if cct is not None]
+        return Response(
+            {
+                "total": len(resultado),
+                "encontrados": {
+                    dato["cct"]: dato for dato in self.get_serializer(encontrados, many=True).data
+                },
+                "no_encontrados": [codigo for codigo, cct in resultado.items() if cct is None],
+            }
+        )
+
     def get_permissions(self):
         if self.action in {"create", "update", "partial_update", "destroy"}:
             return [
@@ -758,9 +1299,10 @@ class CCTSecundariaViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class TipoProcesoViewSet(viewsets.ModelViewSet):
+class TipoProcesoViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar tipos de trámite."""
 
+    usa_replica = True
     queryset = models.TipoProceso.objects.order_by("nombre")
     serializer_class = serializers.TipoProcesoSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -791,9 +1333,10 @@ class TipoProcesoViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class EstatusCasoViewSet(viewsets.ModelViewSet):
+class EstatusCasoViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar estatus de caso."""
 
+    usa_replica = True
     queryset = models.EstatusCaso.objects.order_by("orden", "nombre")
     serializer_class = serializers.EstatusCasoSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -829,9 +1372,10 @@ class EstatusCasoViewSet(viewsets.ModelViewSet):
             ) from exc
 
 
-class TipoViolenciaViewSet(viewsets.ModelViewSet):
+class TipoViolenciaViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar tipos de violencia (opcional en el trámite)."""
 
+    usa_replica = True
     queryset = models.TipoViolencia.objects.order_by("nombre")
     serializer_class = serializers.TipoViolenciaSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -862,9 +1406,10 @@ class TipoViolenciaViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class PrefijoOficioViewSet(viewsets.ModelViewSet):
+class PrefijoOficioViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar prefijos sugeridos del número de oficio."""
 
+    usa_replica = True
     queryset = models.PrefijoOficio.objects.order_by("nombre")
     serializer_class = serializers.PrefijoOficioSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -895,9 +1440,10 @@ class PrefijoOficioViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class SolicitanteViewSet(viewsets.ModelViewSet):
+class SolicitanteViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar solicitantes."""
 
+    usa_replica = True
     queryset = models.Solicitante.objects.order_by("nombre")
     serializer_class = serializers.SolicitanteSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -928,9 +1474,10 @@ class SolicitanteViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class DestinatarioViewSet(viewsets.ModelViewSet):
+class DestinatarioViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar destinatarios (dirigido a)."""
 
+    usa_replica = True
     queryset = models.Destinatario.objects.order_by("nombre")
     serializer_class = serializers.DestinatarioSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -961,9 +1508,10 @@ class DestinatarioViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class TramiteCasoViewSet(viewsets.ModelViewSet):
+class TramiteCasoViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar trámites adicionales de un caso."""
 
+    usa_replica = True
     queryset = models.TramiteCaso.objects.select_related("caso", "tipo", "estatus").order_by("-fecha", "-creado_en")
     serializer_class = serializers.TramiteCasoSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -1001,9 +1549,10 @@ class TramiteCasoViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class EstatusTramiteViewSet(viewsets.ModelViewSet):
+class EstatusTramiteViewSet(RetrieveCondicionalMixin, viewsets.ModelViewSet):
     """API para gestionar estatus de trámites asociados a casos."""
 
+    usa_replica = True
     queryset = models.EstatusTramite.objects.order_by("orden", "nombre")
     serializer_class = serializers.EstatusTramiteSerializer
     permission_classes = (permissions.IsAuthenticated,)
@@ -1032,3 +1581,157 @@ class EstatusTramiteViewSet(viewsets.ModelViewSet):
         if not self.request.user.has_perm("licencias.delete_estatustramite"):
             raise PermissionDenied("No tienes permisos para eliminar estatus de trámite.")
         instance.delete()
+
+
+class VencimientoViewSet(viewsets.ReadOnlyModelViewSet):
+    """API de casos (y en `tramites/`, trámites asociados) vencidos o próximos a vencer (`?dias=7&asesor=...`)."""
+
+    usa_replica = True
+    serializer_class = serializers.CasoVencimientoSerializer
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get_queryset(self):
+        dias, incluir_vencidos = _parametros_vencimiento(self.request.query_params)
+        qs = vencimientos.casos_por_vencer(dias, incluir_vencidos=incluir_vencidos).select_related("estatus")
+        return vencimientos.filtrar_asesor(qs, self.request.query_params.get("asesor"))
+
+    @action(detail=False)
+    def resumen(self, request, *args, **kwargs):
+        dias, _incluir = _parametros_vencimiento(request.query_params)
+        alertas = vencimientos.resumen_por_asesor(dias)
+        return Response({"dias": dias, "asesores": [alerta.as_dict() for alerta in alertas]})
+
+    @action(detail=False)
+    def tramites(self, request, *args, **kwargs):
+        """Trámites asociados abiertos que vencen en la ventana, con la misma paginación."""
+        dias, incluir_vencidos = _parametros_vencimiento(request.query_params)
+        qs = vencimientos.tramites_por_vencer(dias, incluir_vencidos=incluir_vencidos).select_related(
+            "caso", "tipo", "estatus"
+        )
+        qs = vencimientos.filtrar_asesor(qs, request.query_params.get("asesor"), campo="caso__asesor_cct")
+        pagina = self.paginate_queryset(qs)
+        if pagina is not None:
+            return self.get_paginated_response(serializers.TramiteVencimientoSerializer(pagina, many=True).data)
+        return Response(serializers.TramiteVencimientoSerializer(qs, many=True).data)
+
+
+class PermisosModeloConLectura(permissions.DjangoModelPermissions):
+    """Como `DjangoModelPermissions`, pero listar y consultar también exigen el permiso `view`."""
+
+    perms_map = {
+        **permissions.DjangoModelPermissions.perms_map,
+        "GET": ["%(app_label)s.view_%(model_name)s"],
+        "HEAD": ["%(app_label)s.view_%(model_name)s"],
+    }
+
+
+class AnalisisElegibilidadViewSet(viewsets.ModelViewSet):
+    """API de análisis guardados; el resultado se guarda al crear, editar o recalcular, nunca en un GET.
+
+    Contienen el identificador y las licencias médicas del docente: todo acceso exige el permiso del modelo.
+    """
+
+    usa_replica = True
+    queryset = models.AnalisisElegibilidad.objects.order_by("-actualizado_en")
+    serializer_class = serializers.AnalisisElegibilidadSerializer
+    permission_classes = (permissions.IsAuthenticated, PermisosModeloConLectura)
+    search_fields = ("docente", "identificador")
+    ordering_fields = ("actualizado_en", "fecha_ingreso")
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        caso_id = self.request.query_params.get("caso")
+        if caso_id:
+            qs = qs.filter(caso_id=caso_id)
+        identificador = self.request.query_params.get("identificador")
+        if identificador:
+            qs = qs.filter(identificador__iexact=identificador.strip())
+        return qs
+
+    def _guardar_resultado(self, analisis: models.AnalisisElegibilidad) -> None:
+        try:
+            elegibilidad.guardar_resultado(analisis)
+        except elegibilidad.LoteInvalido:
+            # Solo con entradas guardadas por otra vía (un PATCH valida lo que envía); la respuesta
+            # las reporta en `errores_resultado`.
+            pass
+
+    def perform_create(self, serializer):
+        if not self.request.user.has_perm("licencias.add_analisiselegibilidad"):
+            raise PermissionDenied("No tienes permisos para guardar análisis.")
+        self._guardar_resultado(serializer.save(creado_por=self.request.user))
+
+    def perform_update(self, serializer):
+        if not self.request.user.has_perm("licencias.change_analisiselegibilidad"):
+            raise PermissionDenied("No tienes permisos para editar análisis.")
+        self._guardar_resultado(serializer.save())
+
+    def perform_destroy(self, instance):
+        if not self.request.user.has_perm("licencias.delete_analisiselegibilidad"):
+            raise PermissionDenied("No tienes permisos para eliminar análisis.")
+        instance.delete()
+
+    # Un POST pediría el permiso `add`; recalcular es una edición y pide `change`.
+    @action(detail=True, methods=["post"], permission_classes=(permissions.IsAuthenticated,))
+    def recalcular(self, request, *args, **kwargs):
+        if not request.user.has_perm("licencias.change_analisiselegibilidad"):
+            raise PermissionDenied("No tienes permisos para recalcular análisis.")
+        analisis = self.get_object()
+        try:
+            elegibilidad.guardar_resultado(analisis, forzar=True)
+        except elegibilidad.LoteInvalido as exc:
+            return Response({"errores": exc.errores}, status=400)
+        return Response(self.get_serializer(analisis).data)
+
+
+class EstatusMasivoAPIView(APIView):
+    """Cambia el estatus de varios casos: `{"casos": [...], "estatus": id, "comentario": ""}`."""
+
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def post(self, request, *args, **kwargs):
+        if not request.user.has_perm("licencias.change_casointerno"):
+            raise PermissionDenied("No tienes permisos para cambiar el estatus de los casos.")
+        entrada = serializers.EstatusMasivoSerializer(data=request.data)
+        entrada.is_valid(raise_exception=True)
+        resultado = estatus_masivo.cambiar_estatus_por_ids(
+            entrada.validated_data["casos"],
+            entrada.validated_data["estatus"],
+            usuario=request.user,
+            comentario=entrada.validated_data["comentario"],
+        )
+        return Response(resultado.as_dict())
+
+
+class ElegibilidadLoteAPIView(APIView):
+    """Evalúa en lote los requisitos del analizador (JSON `personas` o CSV en `archivo`)."""
+
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def post(self, request, *args, **kwargs):
+        regimen = request.data.get("regimen") or None
+        errores: list[str] = []
+        fecha_analisis = elegibilidad.parsear_fecha(request.data.get("fecha_analisis"), "fecha_analisis", errores)
+        if errores:
+            return Response({"errores": errores}, status=400)
+        try:
+            archivo = request.FILES.get("archivo")
+            if archivo is not None:
+                personas = elegibilidad.personas_desde_csv(archivo.read(), regimen=regimen)
+            else:
+                registros = request.data.get("personas")
+                if not isinstance(registros, list):
+                    return Response(
+                        {"errores": ["Envía una lista `personas` o un archivo CSV en `archivo`."]}, status=400
+                    )
+                personas = elegibilidad.personas_desde_datos(registros, regimen=regimen)
+        except elegibilidad.LoteInvalido as exc:
+            return Response({"errores": exc.errores}, status=400)
+        resultados = elegibilidad.evaluar_lote(personas, fecha_analisis=fecha_analisis)
+        return Response(
+            {
+                "total": len(resultados),
+                "cumplen": sum(resultado.cumple for resultado in resultados),
+                "resultados": [resultado.as_dict() for resultado in resultados],
+            }
+        )